@@ -7,6 +7,13 @@ from typing import Optional, Dict, Any, List
 from contextlib import contextmanager
 from loguru import logger
 import streamlit as st
+from mangetamain_data_utils.data_utils_recipe_stats import (
+    RATING_LEVELS,
+    RATING_STATS_METRICS,
+)
+
+# Nombre maximum de résultats de requêtes gardés en cache (LRU Streamlit)
+QUERY_CACHE_ENTRIES = 32
 
 
 class DatabaseManager:
@@ -44,7 +51,7 @@ class DatabaseManager:
                 conn.close()
                 logger.debug("Database connection closed")
     
-    @st.cache_data
+    @st.cache_data(ttl=3600, max_entries=QUERY_CACHE_ENTRIES)
     def load_csv_to_db(_self, csv_path: str, table_name: str, **kwargs) -> bool:
         """
         Charge un fichier CSV dans la base de données.
@@ -106,7 +113,7 @@ class DatabaseManager:
         except Exception as e:
             logger.warning(f"Error creating indexes for {table_name}: {e}")
     
-    @st.cache_data
+    @st.cache_data(ttl=3600, max_entries=QUERY_CACHE_ENTRIES)
     def execute_query(_self, query: str, **params) -> pd.DataFrame:
         """
         Exécute une requête SQL et retourne un DataFrame pandas.
@@ -214,12 +221,39 @@ class DatabaseManager:
             else:
                 logger.warning(f"CSV file not found: {csv_path}")
         
+        if "interactions_train" in self.list_tables():
+            self.materialize_recipe_stats()
+        
         if success:
             logger.info("Database initialization completed successfully")
         else:
             logger.error("Database initialization completed with errors")
             
         return success
+    
+    def materialize_recipe_stats(self) -> bool:
+        """
+        (Re)construit la table recipe_stats à partir de interactions_train.
+        
+        Les requêtes de popularité lisent ensuite cette table au lieu de
+        regrouper toutes les interactions à chaque appel.
+        
+        Returns:
+            True si la matérialisation a réussi
+        """
+        try:
+            with self.get_connection() as conn:
+                conn.execute(QueryTemplates.create_recipe_stats())
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_recipe_stats_recipe_id ON recipe_stats(recipe_id)"
+                )
+                count = conn.execute("SELECT COUNT(*) FROM recipe_stats").fetchone()[0]
+                logger.info(f"Materialized recipe_stats with {count} recipes")
+                return True
+                
+        except Exception as e:
+            logger.error(f"Error materializing recipe_stats: {e}")
+            return False
 
 
 # Instance globale avec cache Streamlit
@@ -246,20 +280,57 @@ class QueryTemplates:
         """
     
     @staticmethod
-    def get_recipe_popularity() -> str:
-        """Popularité des recettes."""
+    def create_recipe_stats() -> str:
+        """
+        Matérialise les statistiques par recette (table recipe_stats).
+
+        Mêmes colonnes et même filtre (notes 1-5, date renseignée) que les
+        statistiques de notes de la table Parquet de l'ETL
+        (RATING_STATS_METRICS), sans les attributs des recettes :
+        count_1..count_5 somment à n_interactions.
+        """
         return """
+        CREATE OR REPLACE TABLE recipe_stats AS
         SELECT 
             recipe_id,
-            COUNT(*) as interaction_count,
-            AVG(rating) as avg_rating,
-            MIN(date) as first_interaction,
-            MAX(date) as last_interaction
+            COUNT(*) as n_interactions,
+            AVG(rating) as mean_rating,
+            MEDIAN(rating) as median_rating,
+            CAST(MIN(date) AS DATE) as first_date,
+            CAST(MAX(date) AS DATE) as last_date,
+            """ + ",\n            ".join(
+            f"COUNT(*) FILTER (WHERE rating = {level}) as count_{level}"
+            for level in RATING_LEVELS
+        ) + """
         FROM interactions_train
-        WHERE rating IS NOT NULL
+        WHERE rating BETWEEN 1 AND 5
+          AND date IS NOT NULL
         GROUP BY recipe_id
-        ORDER BY interaction_count DESC
-        LIMIT 100
+        ORDER BY recipe_id
+        """
+    
+    @staticmethod
+    def get_recipe_popularity(order_by: str = "n_interactions", limit: int = 100) -> str:
+        """
+        Top des recettes lu dans la table recipe_stats matérialisée.
+        
+        Args:
+            order_by: Colonne de classement (une de RATING_STATS_METRICS)
+            limit: Nombre de recettes retournées
+            
+        Returns:
+            Requête SQL
+            
+        Raises:
+            ValueError: Si order_by n'est pas une colonne de recipe_stats
+        """
+        if order_by not in RATING_STATS_METRICS:
+            raise ValueError(f"Colonne de classement inconnue: {order_by}")
+        return f"""
+        SELECT *
+        FROM recipe_stats
+        ORDER BY {order_by} DESC NULLS LAST, recipe_id
+        LIMIT {int(limit)}
         """
     
     @staticmethod
@@ -0,0 +1,177 @@
+"""
+Détection de ruptures (change points) par l'algorithme PELT.
+
+PELT (Pruned Exact Linear Time, Killick et al. 2012) trouve la segmentation
+minimisant la somme des coûts de segments plus une pénalité par rupture.
+Le coût utilisé est la somme des carrés des écarts à la moyenne du segment
+(changement de niveau), calculé en O(1) par sommes cumulées ; l'élagage des
+candidats rend la recherche quasi linéaire en pratique.
+
+Les segments servent à remplacer l'hypothèse d'une tendance unique 1999-2018
+sur les pages long terme (volumes de recettes et d'interactions, ratings).
+"""
+
+import hashlib
+from typing import Optional, Sequence
+
+import numpy as np
+import polars as pl
+
+# Longueur minimale d'un segment (en points de la série)
+DEFAULT_MIN_SIZE = 6
+
+
+def default_penalty(values: np.ndarray) -> float:
+    """
+    Pénalité de type BIC : 2 σ² log(n).
+
+    σ est estimé de façon robuste par la MAD des différences premières, pour
+    que les ruptures elles-mêmes ne gonflent pas la variance de référence.
+
+    Args:
+        values: Série 1D
+
+    Returns:
+        Pénalité par rupture (même unité que le coût quadratique)
+    """
+    diffs = np.diff(values)
+    if len(diffs) == 0:
+        return 0.0
+    mad = np.median(np.abs(diffs - np.median(diffs)))
+    sigma = 1.4826 * mad / np.sqrt(2)
+    if sigma == 0:
+        sigma = np.std(values) or 1.0
+    return float(2 * sigma**2 * np.log(len(values)))
+
+
+def pelt(
+    values: Sequence[float],
+    penalty: Optional[float] = None,
+    min_size: int = DEFAULT_MIN_SIZE,
+) -> list[int]:
+    """
+    Segmentation optimale d'une série par PELT (coût quadratique).
+
+    Args:
+        values: Série 1D sans valeur manquante
+        penalty: Pénalité par rupture (défaut: default_penalty)
+        min_size: Longueur minimale d'un segment
+
+    Returns:
+        Indices de fin (exclus) de chaque segment, le dernier valant len(values)
+
+    Examples:
+        >>> pelt([0.0] * 10 + [5.0] * 10, penalty=1.0, min_size=2)
+        [10, 20]
+    """
+    x = np.asarray(values, dtype=np.float64)
+    n = len(x)
+    if np.isnan(x).any():
+        raise ValueError("La série contient des valeurs manquantes")
+    if n < 2 * min_size:
+        return [n]
+    if penalty is None:
+        penalty = default_penalty(x)
+
+    cumsum = np.concatenate([[0.0], np.cumsum(x)])
+    cumsum_sq = np.concatenate([[0.0], np.cumsum(x**2)])
+
+    def segment_cost(starts: np.ndarray, end: int) -> np.ndarray:
+        length = end - starts
+        total = cumsum[end] - cumsum[starts]
+        return cumsum_sq[end] - cumsum_sq[starts] - total**2 / length
+
+    best = np.full(n + 1, np.inf)
+    best[0] = -penalty
+    previous = np.zeros(n + 1, dtype=np.int64)
+    candidates = np.array([0], dtype=np.int64)
+
+    for end in range(min_size, n + 1):
+        # Le point end - min_size devient un début de segment admissible
+        if end >= 2 * min_size:
+            candidates = np.append(candidates, end - min_size)
+
+        totals = best[candidates] + segment_cost(candidates, end)
+        i = int(np.argmin(totals))
+        best[end] = totals[i] + penalty
+        previous[end] = candidates[i]
+
+        # Élagage : un début qui fait déjà pire que l'optimum ne redeviendra
+        # jamais optimal (coût quadratique, constante K = 0)
+        candidates = candidates[totals <= best[end]]
+
+    ends = []
+    end = n
+    while end > 0:
+        ends.append(end)
+        end = int(previous[end])
+    return ends[::-1]
+
+
+def segments_frame(
+    values: Sequence[float],
+    ends: Sequence[int],
+    times: Optional[Sequence] = None,
+) -> pl.DataFrame:
+    """
+    Résumé des segments d'une segmentation.
+
+    Args:
+        values: Série 1D
+        ends: Indices de fin des segments (sortie de pelt)
+        times: Instants associés aux points (défaut: index)
+
+    Returns:
+        DataFrame (segment, start, end, n_points, mean) ; start et end sont
+        les instants du premier et du dernier point du segment
+    """
+    x = np.asarray(values, dtype=np.float64)
+    times = list(range(len(x))) if times is None else list(times)
+    starts = [0] + list(ends[:-1])
+
+    return pl.DataFrame(
+        {
+            "segment": list(range(1, len(ends) + 1)),
+            "start": [times[s] for s in starts],
+            "end": [times[e - 1] for e in ends],
+            "n_points": [e - s for s, e in zip(starts, ends)],
+            "mean": [float(x[s:e].mean()) for s, e in zip(starts, ends)],
+        }
+    )
+
+
+def detect_change_points(
+    values: Sequence[float],
+    times: Optional[Sequence] = None,
+    penalty: Optional[float] = None,
+    min_size: int = DEFAULT_MIN_SIZE,
+) -> pl.DataFrame:
+    """
+    Détecte les ruptures d'une série et retourne ses segments.
+
+    Args:
+        values: Série 1D sans valeur manquante
+        times: Instants associés aux points (défaut: index)
+        penalty: Pénalité par rupture (défaut: default_penalty)
+        min_size: Longueur minimale d'un segment
+
+    Returns:
+        DataFrame des segments (voir segments_frame)
+    """
+    return segments_frame(values, pelt(values, penalty, min_size), times)
+
+
+def series_version(*arrays: Sequence) -> str:
+    """
+    Empreinte courte du contenu d'une ou plusieurs séries.
+
+    Sert de version du jeu de données pour les caches : elle change dès que
+    les données sources changent.
+
+    Returns:
+        Empreinte hexadécimale (16 caractères)
+    """
+    digest = hashlib.sha1()
+    for array in arrays:
+        digest.update(np.ascontiguousarray(np.asarray(array)).tobytes())
+    return digest.hexdigest()[:16]
@@ -0,0 +1,87 @@
+"""
+Concentration de l'activité (courbe de Lorenz, Gini, part du top).
+
+Mesure à quel point les notes sont concentrées sur une minorité
+d'utilisateurs très actifs (« power users »). Les calculs reposent sur un
+unique tri des effectifs par utilisateur et leurs sommes cumulées.
+"""
+
+from typing import Optional, Sequence
+
+import numpy as np
+
+
+def _sorted_counts(values: Sequence[float]) -> np.ndarray:
+    """Effectifs triés par ordre croissant, validés."""
+    counts = np.sort(np.asarray(values, dtype=np.float64))
+    if counts.size == 0:
+        raise ValueError("Aucune valeur")
+    if counts[0] < 0 or counts.sum() == 0:
+        raise ValueError("Les valeurs doivent être positives, de somme non nulle")
+    return counts
+
+
+def lorenz_curve(
+    values: Sequence[float], n_points: Optional[int] = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Courbe de Lorenz : part cumulée de l'activité selon la part de la population.
+
+    Args:
+        values: Activité de chaque individu (ex. nombre de notes par utilisateur)
+        n_points: Nombre de segments conservés pour l'affichage (défaut: tous)
+
+    Returns:
+        (part de la population, part de l'activité), de (0, 0) à (1, 1)
+
+    Raises:
+        ValueError: Si values est vide, négatif ou de somme nulle
+    """
+    counts = _sorted_counts(values)
+    n = counts.size
+    cumulative = np.concatenate([[0.0], np.cumsum(counts)]) / counts.sum()
+
+    positions = np.arange(n + 1)
+    if n_points is not None and n > n_points:
+        positions = np.unique(np.linspace(0, n, n_points + 1).round().astype(int))
+    return positions / n, cumulative[positions]
+
+
+def gini(values: Sequence[float]) -> float:
+    """
+    Coefficient de Gini (0 = activité également répartie, → 1 = concentrée).
+
+    Args:
+        values: Activité de chaque individu
+
+    Returns:
+        Coefficient de Gini
+
+    Raises:
+        ValueError: Si values est vide, négatif ou de somme nulle
+    """
+    counts = _sorted_counts(values)
+    n = counts.size
+    ranks = np.arange(1, n + 1)
+    return float(2 * (ranks @ counts) / (n * counts.sum()) - (n + 1) / n)
+
+
+def top_share(values: Sequence[float], fraction: float) -> float:
+    """
+    Part de l'activité réalisée par les individus les plus actifs.
+
+    Args:
+        values: Activité de chaque individu
+        fraction: Part de la population retenue (ex. 0.01 pour le top 1 %)
+
+    Returns:
+        Part de l'activité totale (entre 0 et 1)
+
+    Raises:
+        ValueError: Si fraction n'est pas dans ]0, 1] ou values invalide
+    """
+    if not 0 < fraction <= 1:
+        raise ValueError(f"fraction doit être dans ]0, 1], reçu {fraction}")
+    counts = _sorted_counts(values)
+    k = max(1, int(np.ceil(fraction * counts.size)))
+    return float(counts[-k:].sum() / counts.sum())
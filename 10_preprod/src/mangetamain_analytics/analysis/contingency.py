@@ -0,0 +1,110 @@
+"""
+Tests du Chi-2 en lot sur des tables de présence terme × groupe.
+
+Pour chaque terme (ingrédient, tag), la table de contingence k × 2 croise
+les k groupes (saisons, semaine/week-end) avec présence/absence du terme.
+Toutes les tables sont évaluées en une seule opération NumPy, puis les
+p-values sont corrigées par la procédure de Benjamini-Hochberg (contrôle
+du taux de fausses découvertes sur des milliers de tests simultanés).
+"""
+
+from typing import Mapping, Sequence
+
+import numpy as np
+import polars as pl
+from scipy.stats import chi2
+
+
+def presence_chi2(
+    counts: np.ndarray, totals: Sequence[int], correction: bool = True
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Chi-2 d'indépendance de n tables présence/absence k × 2.
+
+    Équivalent vectorisé de scipy.stats.chi2_contingency appliqué ligne à
+    ligne à [[c_1, N_1 - c_1], ..., [c_k, N_k - c_k]].
+
+    Args:
+        counts: Matrice (n_termes, k) du nombre de recettes contenant le terme
+        totals: Nombre de recettes par groupe (k valeurs)
+        correction: Correction de continuité de Yates (appliquée si k = 2)
+
+    Returns:
+        (statistiques, p-values), NaN pour les tables dégénérées (terme
+        absent ou présent partout, groupe vide)
+    """
+    present = np.atleast_2d(np.asarray(counts, dtype=np.float64))
+    n_group = np.asarray(totals, dtype=np.float64)
+    if present.shape[1] != len(n_group):
+        raise ValueError(
+            f"{present.shape[1]} colonnes d'effectifs pour {len(n_group)} groupes"
+        )
+
+    observed = np.stack([present, n_group - present], axis=2)  # (n, k, 2)
+    n_total = n_group.sum()
+    col_totals = observed.sum(axis=1, keepdims=True)  # (n, 1, 2)
+    expected = n_group[None, :, None] * col_totals / n_total
+
+    dof = len(n_group) - 1
+    if correction and dof == 1:
+        diff = expected - observed
+        observed = observed + np.sign(diff) * np.minimum(0.5, np.abs(diff))
+
+    degenerate = (expected == 0).any(axis=(1, 2))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        stat = ((observed - expected) ** 2 / expected).sum(axis=(1, 2))
+    stat[degenerate] = np.nan
+    return stat, chi2.sf(stat, dof)
+
+
+def benjamini_hochberg(p_values: Sequence[float]) -> np.ndarray:
+    """
+    q-values de Benjamini-Hochberg (Benjamini & Hochberg, 1995).
+
+    Rejeter les tests de q-value < alpha contrôle le taux de fausses
+    découvertes à alpha. Les p-values manquantes sont ignorées et restent NaN.
+
+    Args:
+        p_values: P-values brutes
+
+    Returns:
+        q-values dans le même ordre
+    """
+    p = np.asarray(p_values, dtype=np.float64)
+    q = np.full_like(p, np.nan)
+    valid = np.flatnonzero(~np.isnan(p))
+    if len(valid) == 0:
+        return q
+
+    order = valid[np.argsort(p[valid])]
+    ranked = p[order] * len(valid) / np.arange(1, len(valid) + 1)
+    # Minimum cumulé depuis la plus grande p-value : q-values monotones
+    q[order] = np.minimum(np.minimum.accumulate(ranked[::-1])[::-1], 1.0)
+    return q
+
+
+def presence_tests(
+    frequencies: pl.DataFrame,
+    sizes: Mapping[str, int],
+    correction: bool = True,
+) -> pl.DataFrame:
+    """
+    Ajoute Chi-2, p-value et q-value BH à une table terme × groupe.
+
+    Args:
+        frequencies: Sortie de term_group_frequencies (colonnes count_<groupe>)
+        sizes: Nombre de recettes par groupe (voir group_sizes), dans l'ordre
+            des groupes testés
+        correction: Correction de Yates pour les tables 2 × 2
+
+    Returns:
+        frequencies avec les colonnes chi2, p_value et q_value
+    """
+    groups = list(sizes)
+    counts = frequencies.select(f"count_{g}" for g in groups).to_numpy()
+    stat, p_values = presence_chi2(counts, [sizes[g] for g in groups], correction)
+    return frequencies.with_columns(
+        pl.Series("chi2", stat, dtype=pl.Float64),
+        pl.Series("p_value", p_values, dtype=pl.Float64),
+        pl.Series("q_value", benjamini_hochberg(p_values), dtype=pl.Float64),
+    )
@@ -0,0 +1,88 @@
+"""
+Matrices de corrélation pondérées (Pearson, Spearman, Kendall).
+
+Les variables sont les colonnes d'une matrice (n_observations × n_variables)
+et partagent un même vecteur de poids (ex. racine du volume mensuel) : toute
+la matrice de corrélation est obtenue en une passe, au lieu d'un calcul de
+covariances par paire de variables.
+
+- Pearson : covariance pondérée des valeurs centrées (moyenne pondérée)
+- Spearman : Pearson pondéré sur les rangs moyens (ex-aequo)
+- Kendall : tau-b où chaque paire d'observations (i, j) pèse w_i × w_j ;
+  sans poids, identique à scipy.stats.kendalltau
+"""
+
+from typing import Optional, Sequence
+
+import numpy as np
+from scipy.stats import rankdata
+
+METHODS = ("pearson", "spearman", "kendall")
+
+# Nombre maximum de signes (variables × paires) matérialisés à la fois
+_KENDALL_PAIR_BUDGET = 5_000_000
+
+
+def _weighted_pearson(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Matrice de Pearson pondérée des colonnes de values."""
+    centered = values - weights @ values / weights.sum()
+    cov = (centered * weights[:, None]).T @ centered
+    scale = np.sqrt(np.diag(cov))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return cov / np.outer(scale, scale)
+
+
+def _weighted_kendall(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Matrice tau-b de Kendall, paires pondérées par w_i × w_j, par blocs de lignes."""
+    n_obs, n_vars = values.shape
+    block = max(1, _KENDALL_PAIR_BUDGET // max(1, n_obs * n_vars))
+    concordance = np.zeros((n_vars, n_vars))
+    for start in range(0, n_obs, block):
+        rows = slice(start, start + block)
+        # signs[v, i, j] = sign(x_v[i] - x_v[j]) pour les lignes i du bloc
+        signs = np.sign(values[rows, None, :] - values[None, :, :]).transpose(2, 0, 1)
+        pair_weights = weights[rows, None] * weights[None, :]
+        concordance += np.einsum("aij,bij,ij->ab", signs, signs, pair_weights)
+    scale = np.sqrt(np.diag(concordance))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return concordance / np.outer(scale, scale)
+
+
+def weighted_correlation(
+    values: np.ndarray,
+    weights: Optional[Sequence[float]] = None,
+    method: str = "spearman",
+) -> np.ndarray:
+    """
+    Matrice de corrélation pondérée de toutes les paires de variables.
+
+    Args:
+        values: Matrice (n_observations, n_variables), sans valeur manquante
+        weights: Poids positifs des observations (défaut: poids égaux)
+        method: 'spearman', 'pearson' ou 'kendall'
+
+    Returns:
+        Matrice (n_variables, n_variables), NaN pour une variable constante
+
+    Raises:
+        ValueError: Si method est inconnue, si les dimensions ne concordent
+            pas ou si les poids sont négatifs ou de somme nulle
+    """
+    if method not in METHODS:
+        raise ValueError(f"Méthode inconnue: {method} (attendu: {', '.join(METHODS)})")
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim != 2 or values.shape[0] < 2:
+        raise ValueError("values doit être une matrice d'au moins 2 observations")
+    if weights is None:
+        weights = np.ones(values.shape[0])
+    weights = np.asarray(weights, dtype=np.float64)
+    if weights.shape != (values.shape[0],):
+        raise ValueError(f"{weights.size} poids pour {values.shape[0]} observations")
+    if (weights < 0).any() or weights.sum() == 0:
+        raise ValueError("Les poids doivent être positifs, de somme non nulle")
+
+    if method == "kendall":
+        return _weighted_kendall(values, weights)
+    if method == "spearman":
+        values = rankdata(values, axis=0)
+    return _weighted_pearson(values, weights)
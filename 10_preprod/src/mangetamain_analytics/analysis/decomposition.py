@@ -0,0 +1,116 @@
+"""
+Décomposition saisonnière STL des séries mensuelles.
+
+STL (Seasonal-Trend decomposition using Loess, Cleveland et al. 1990, via
+statsmodels) sépare une série en tendance, composante saisonnière et
+résidu. Contrairement aux quatre saisons agrégées, la composante
+saisonnière est réestimée localement : son amplitude peut évoluer d'une
+année à l'autre.
+"""
+
+from typing import Optional, Sequence
+
+import numpy as np
+import polars as pl
+from statsmodels.tsa.seasonal import STL
+
+# Période saisonnière des séries mensuelles
+MONTHLY_PERIOD = 12
+
+
+def stl_decompose(
+    values: Sequence[float],
+    times: Optional[Sequence] = None,
+    period: int = MONTHLY_PERIOD,
+    robust: bool = True,
+) -> pl.DataFrame:
+    """
+    Décompose une série régulière en tendance + saisonnalité + résidu.
+
+    Args:
+        values: Série 1D régulière, sans valeur manquante
+        times: Instants associés (défaut: index)
+        period: Période saisonnière (12 pour des mois)
+        robust: Pondération robuste des valeurs aberrantes
+
+    Returns:
+        DataFrame (time, observed, trend, seasonal, resid)
+
+    Raises:
+        ValueError: Si la série couvre moins de deux périodes complètes
+    """
+    x = np.asarray(values, dtype=np.float64)
+    if len(x) < 2 * period + 1:
+        raise ValueError(
+            f"Série trop courte pour STL : {len(x)} points, "
+            f"{2 * period + 1} requis (période {period})"
+        )
+
+    result = STL(x, period=period, robust=robust).fit()
+    return pl.DataFrame(
+        {
+            "time": list(range(len(x))) if times is None else list(times),
+            "observed": x,
+            "trend": result.trend,
+            "seasonal": result.seasonal,
+            "resid": result.resid,
+        }
+    )
+
+
+def seasonal_strength(components: pl.DataFrame) -> float:
+    """
+    Force de la saisonnalité : max(0, 1 - Var(résidu) / Var(saison + résidu)).
+
+    Vaut 0 sans saisonnalité et tend vers 1 quand la saisonnalité domine
+    le bruit (Wang, Smith & Hyndman, 2006).
+
+    Args:
+        components: Sortie de stl_decompose
+
+    Returns:
+        Force saisonnière dans [0, 1]
+    """
+    resid = components["resid"].to_numpy()
+    detrended = components["seasonal"].to_numpy() + resid
+    # Série sans variation hors tendance (au bruit numérique près)
+    scale = max(1.0, float(np.abs(components["observed"].to_numpy()).max()))
+    if np.allclose(detrended, 0, atol=1e-9 * scale):
+        return 0.0
+    return float(max(0.0, 1 - np.var(resid) / np.var(detrended)))
+
+
+def seasonal_amplitude_by_year(components: pl.DataFrame) -> pl.DataFrame:
+    """
+    Amplitude de la composante saisonnière année par année.
+
+    Args:
+        components: Sortie de stl_decompose avec 'time' de type Date
+
+    Returns:
+        DataFrame (year, amplitude, relative_amplitude, peak_month) : écart
+        max - min de la saison, ce même écart en % du niveau de tendance
+        moyen et mois du pic saisonnier ; années incomplètes exclues
+    """
+    return (
+        components.with_columns(
+            pl.col("time").dt.year().alias("year"),
+            pl.col("time").dt.month().alias("month"),
+        )
+        .group_by("year")
+        .agg(
+            pl.len().alias("_n"),
+            (pl.col("seasonal").max() - pl.col("seasonal").min()).alias("amplitude"),
+            pl.col("trend").mean().alias("_level"),
+            pl.col("month").sort_by("seasonal").last().alias("peak_month"),
+        )
+        .filter(pl.col("_n") == MONTHLY_PERIOD)
+        .with_columns(
+            pl.when(pl.col("_level") > 0)
+            .then(pl.col("amplitude") / pl.col("_level") * 100)
+            .otherwise(None)
+            .alias("relative_amplitude")
+        )
+        .select("year", "amplitude", "relative_amplitude", "peak_month")
+        .sort("year")
+    )
@@ -0,0 +1,336 @@
+"""
+Tests par permutation et intervalles bootstrap sans hypothèse de loi.
+
+Les valeurs nutritionnelles sont très asymétriques : plutôt que de supposer
+la normalité (t de Student, ANOVA), la loi nulle de la statistique est
+obtenue en permutant les étiquettes de groupe (semaine/week-end, saisons).
+Les permutations sont générées par blocs vectorisés (une matrice
+d'étiquettes permutées par bloc, sommes par groupe par produit matriciel) ;
+au-delà de PARALLEL_MIN_WORK, les blocs sont répartis sur un pool de
+processus. Chaque bloc a sa propre graine dérivée de ``seed`` : le résultat
+est identique quel que soit le nombre de processus.
+
+Pour des notes discrètes, l'histogramme de chaque période suffit au
+bootstrap : un rééchantillonnage avec remise d'un mois est un tirage
+multinomial de ses effectifs par note, toutes les périodes à la fois.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Optional, Sequence
+
+import numpy as np
+import polars as pl
+
+# Nombre de permutations par défaut (résolution des p-values : 1/1000)
+DEFAULT_PERMUTATIONS = 999
+
+# Travail total (permutations × observations) à partir duquel les blocs
+# sont répartis sur plusieurs processus
+PARALLEL_MIN_WORK = 200_000_000
+
+# Nombre maximal d'étiquettes permutées matérialisées par bloc
+_BLOCK_BUDGET = 5_000_000
+
+
+def encode_groups(
+    labels: Sequence, groups: Optional[Sequence] = None
+) -> tuple[np.ndarray, list]:
+    """
+    Code les étiquettes de groupe en entiers 0..k-1.
+
+    Args:
+        labels: Étiquette de groupe de chaque observation
+        groups: Ordre des groupes (défaut: ordre trié des valeurs)
+
+    Returns:
+        (codes, groupes)
+
+    Raises:
+        ValueError: Si une étiquette n'appartient pas à groups, ou moins de
+            deux groupes
+    """
+    labels = np.asarray(labels)
+    groups = list(np.unique(labels)) if groups is None else list(groups)
+    if len(groups) < 2:
+        raise ValueError("Au moins deux groupes sont nécessaires")
+
+    lookup = {g: i for i, g in enumerate(groups)}
+    try:
+        codes = np.array([lookup[label] for label in labels.tolist()], dtype=np.int64)
+    except KeyError as e:
+        raise ValueError(f"Étiquette hors des groupes {groups}: {e}") from None
+    return codes, groups
+
+
+def _group_sums(values: np.ndarray, codes: np.ndarray, k: int) -> np.ndarray:
+    """Sommes par groupe de chaque ligne de codes : (b, k, m)."""
+    return np.stack(
+        [(codes == g).astype(np.float64) @ values for g in range(k)], axis=1
+    )
+
+
+def _statistic(
+    sums: np.ndarray, counts: np.ndarray, sum_squares: np.ndarray
+) -> np.ndarray:
+    """
+    Statistique de test à partir des sommes par groupe (b, k, m).
+
+    Deux groupes : différence des moyennes (groupe 2 - groupe 1).
+    Au-delà : F de l'ANOVA à un facteur, fonction croissante de la somme
+    des carrés inter-groupes (la somme totale est fixe sous permutation).
+    """
+    n = counts.sum()
+    k = len(counts)
+    means = sums / counts[None, :, None]
+    if k == 2:
+        return means[:, 1, :] - means[:, 0, :]
+
+    grand = sums.sum(axis=1) / n
+    between = (counts[None, :, None] * (means - grand[:, None, :]) ** 2).sum(axis=1)
+    total = sum_squares[None, :] - n * grand**2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (between / (k - 1)) / ((total - between) / (n - k))
+
+
+def _permutation_chunk(
+    values: np.ndarray,
+    codes: np.ndarray,
+    block_sizes: list[int],
+    seeds: list[np.random.SeedSequence],
+) -> np.ndarray:
+    """Statistiques de permutation d'une liste de blocs : (Σ blocs, m)."""
+    k = int(codes.max()) + 1
+    counts = np.bincount(codes, minlength=k).astype(np.float64)
+    sum_squares = (values**2).sum(axis=0)
+    results = []
+    for size, seed in zip(block_sizes, seeds):
+        rng = np.random.default_rng(seed)
+        permuted = rng.permuted(np.tile(codes, (size, 1)), axis=1)
+        results.append(
+            _statistic(_group_sums(values, permuted, k), counts, sum_squares)
+        )
+    return np.vstack(results)
+
+
+def permutation_tests(
+    values: np.ndarray,
+    labels: Sequence,
+    groups: Optional[Sequence] = None,
+    names: Optional[Sequence[str]] = None,
+    n_permutations: int = DEFAULT_PERMUTATIONS,
+    seed: int = 0,
+    n_jobs: Optional[int] = None,
+) -> pl.DataFrame:
+    """
+    Tests par permutation des étiquettes de groupe, pour plusieurs variables.
+
+    Les mêmes permutations servent à toutes les variables (colonnes).
+
+    Args:
+        values: Matrice (n_observations, n_variables) sans valeur manquante
+        labels: Groupe de chaque observation
+        groups: Ordre des groupes ; à deux groupes, statistique =
+            moyenne(groups[1]) - moyenne(groups[0])
+        names: Noms des variables (défaut: indices)
+        n_permutations: Nombre de permutations
+        seed: Graine (résultats reproductibles)
+        n_jobs: Nombre de processus (défaut: tous les cœurs au-delà de
+            PARALLEL_MIN_WORK, 1 = toujours séquentiel)
+
+    Returns:
+        DataFrame (variable, statistic, p_value) ; p-value bilatérale à deux
+        groupes, unilatérale (F) au-delà, estimée par (1 + #extrêmes) /
+        (1 + n_permutations)
+
+    Raises:
+        ValueError: Si values contient des NaN ou ne correspond pas à labels
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim == 1:
+        values = values[:, None]
+    n_obs, n_vars = values.shape
+    codes, groups = encode_groups(labels, groups)
+    if len(codes) != n_obs:
+        raise ValueError(f"{len(codes)} étiquettes pour {n_obs} observations")
+    if np.isnan(values).any():
+        raise ValueError("Les valeurs ne doivent pas contenir de NaN")
+
+    names = (
+        [str(i) for i in range(n_vars)] if names is None else [str(n) for n in names]
+    )
+
+    k = len(groups)
+    counts = np.bincount(codes, minlength=k).astype(np.float64)
+    observed = _statistic(
+        _group_sums(values, codes[None, :], k), counts, (values**2).sum(axis=0)
+    )[0]
+
+    # Découpage en blocs et graines indépendantes, fixés avant répartition
+    block = max(1, min(n_permutations, _BLOCK_BUDGET // max(n_obs, 1)))
+    block_sizes = [
+        min(block, n_permutations - start) for start in range(0, n_permutations, block)
+    ]
+    seeds = np.random.SeedSequence(seed).spawn(len(block_sizes))
+
+    workers = n_jobs if n_jobs is not None else (os.cpu_count() or 1)
+    if (
+        n_permutations * n_obs >= PARALLEL_MIN_WORK
+        and workers > 1
+        and len(block_sizes) > 1
+    ):
+        parts = np.array_split(
+            np.arange(len(block_sizes)), min(workers, len(block_sizes))
+        )
+        with ProcessPoolExecutor(max_workers=len(parts)) as pool:
+            results = list(
+                pool.map(
+                    _permutation_chunk,
+                    repeat(values),
+                    repeat(codes),
+                    [[block_sizes[i] for i in part] for part in parts],
+                    [[seeds[i] for i in part] for part in parts],
+                )
+            )
+        null = np.vstack(results)
+    else:
+        null = _permutation_chunk(values, codes, block_sizes, seeds)
+
+    if k == 2:
+        extreme = np.abs(null) >= np.abs(observed) - 1e-12
+    else:
+        extreme = null >= observed - 1e-12
+    p_values = (1 + extreme.sum(axis=0)) / (1 + n_permutations)
+
+    return pl.DataFrame(
+        {"variable": names, "statistic": observed, "p_value": p_values}
+    ).fill_nan(None)
+
+
+def bootstrap_mean_diff(
+    values: np.ndarray,
+    labels: Sequence,
+    groups: Optional[Sequence] = None,
+    names: Optional[Sequence[str]] = None,
+    n_resamples: int = DEFAULT_PERMUTATIONS,
+    confidence: float = 0.95,
+    seed: int = 0,
+) -> pl.DataFrame:
+    """
+    Intervalle de confiance bootstrap (percentiles) d'une différence de moyennes.
+
+    Chaque groupe est rééchantillonné avec remise séparément, par blocs
+    vectorisés d'indices tirés au hasard.
+
+    Args:
+        values: Matrice (n_observations, n_variables) sans valeur manquante
+        labels: Groupe de chaque observation (exactement deux groupes)
+        groups: Ordre des groupes ; différence = groups[1] - groups[0]
+        names: Noms des variables (défaut: indices)
+        n_resamples: Nombre de rééchantillonnages
+        confidence: Niveau de confiance
+        seed: Graine (résultats reproductibles)
+
+    Returns:
+        DataFrame (variable, diff, ci_low, ci_high)
+
+    Raises:
+        ValueError: Si le nombre de groupes n'est pas 2
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim == 1:
+        values = values[:, None]
+    codes, groups = encode_groups(labels, groups)
+    if len(groups) != 2:
+        raise ValueError(f"Deux groupes attendus, {len(groups)} reçus")
+
+    names = (
+        [str(i) for i in range(values.shape[1])]
+        if names is None
+        else [str(n) for n in names]
+    )
+    rng = np.random.default_rng(seed)
+
+    # Un tirage avec remise = effectifs de tirage de chaque observation :
+    # la moyenne rééchantillonnée est un produit matriciel
+    group_means = []
+    for code in (0, 1):
+        sample = values[codes == code]
+        n = len(sample)
+        block = max(1, min(n_resamples, _BLOCK_BUDGET // max(n, 1)))
+        means = []
+        for start in range(0, n_resamples, block):
+            size = min(block, n_resamples - start)
+            draws = rng.integers(0, n, size=(size, n)) + n * np.arange(size)[:, None]
+            weights = np.bincount(draws.ravel(), minlength=size * n).reshape(size, n)
+            means.append(weights @ sample / n)
+        group_means.append(np.vstack(means))
+
+    replicates = group_means[1] - group_means[0]
+    tail = (1 - confidence) / 2 * 100
+    low, high = np.percentile(replicates, [tail, 100 - tail], axis=0)
+    diff = values[codes == 1].mean(axis=0) - values[codes == 0].mean(axis=0)
+
+    return pl.DataFrame(
+        {"variable": names, "diff": diff, "ci_low": low, "ci_high": high}
+    )
+
+
+def histogram_bootstrap_means(
+    histograms: np.ndarray,
+    levels: Sequence[float],
+    n_resamples: int = DEFAULT_PERMUTATIONS,
+    confidence: float = 0.95,
+    seed: int = 0,
+) -> pl.DataFrame:
+    """
+    IC bootstrap (percentiles) de la moyenne de chaque période, par tirages multinomiaux.
+
+    Rééchantillonner avec remise les n notes d'une période revient à tirer
+    ses effectifs par niveau selon une loi multinomiale (n, fréquences
+    observées) : toutes les périodes et tous les rééchantillonnages d'un
+    bloc sont tirés en une seule opération.
+
+    Args:
+        histograms: Matrice (n_périodes, n_niveaux) des effectifs par niveau
+        levels: Valeur de chaque niveau (ex. notes 1 à 5)
+        n_resamples: Nombre de rééchantillonnages
+        confidence: Niveau de confiance
+        seed: Graine (résultats reproductibles)
+
+    Returns:
+        DataFrame (mean, ci_low, ci_high), une ligne par période ; null pour
+        une période sans observation
+
+    Raises:
+        ValueError: Si histograms ne correspond pas à levels
+    """
+    counts = np.atleast_2d(np.asarray(histograms, dtype=np.int64))
+    levels = np.asarray(levels, dtype=np.float64)
+    if counts.shape[1] != len(levels):
+        raise ValueError(
+            f"{counts.shape[1]} colonnes d'effectifs pour {len(levels)} niveaux"
+        )
+
+    n = counts.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        freqs = np.where(n[:, None] > 0, counts / n[:, None], 1 / len(levels))
+        observed = counts @ levels / n
+
+    rng = np.random.default_rng(seed)
+    block = max(1, min(n_resamples, _BLOCK_BUDGET // max(counts.size, 1)))
+    means = []
+    for start in range(0, n_resamples, block):
+        size = min(block, n_resamples - start)
+        draws = rng.multinomial(n, freqs, size=(size, len(n)))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            means.append(draws @ levels / n)
+    replicates = np.vstack(means)
+
+    tail = (1 - confidence) / 2 * 100
+    low, high = np.percentile(replicates, [tail, 100 - tail], axis=0)
+
+    return pl.DataFrame({"mean": observed, "ci_low": low, "ci_high": high}).fill_nan(
+        None
+    )
@@ -0,0 +1,221 @@
+"""
+Tests d'hypothèse à partir de statistiques suffisantes.
+
+Les tests t (Student, Welch) et l'ANOVA à un facteur ne dépendent des
+données qu'à travers les effectifs, moyennes et variances de chaque groupe ;
+pour des notes discrètes 1-5, l'histogramme par groupe suffit aussi au test
+de Kruskal-Wallis (rangs moyens par niveau, correction des ex-aequo). Ces
+statistiques s'obtiennent par une agrégation Polars : aucune colonne brute
+n'est matérialisée en NumPy ou en listes Python.
+
+rating_histograms produit ces agrégats (effectifs par note, par saison ou
+par mois) une fois pour toutes à partir des interactions.
+"""
+
+from typing import Optional, Sequence
+
+import numpy as np
+import polars as pl
+from scipy import stats
+
+# Niveaux de note des interactions nettoyées
+RATING_LEVELS = (1, 2, 3, 4, 5)
+
+
+def group_moments(
+    df: pl.DataFrame,
+    group_col: str,
+    value_cols: Sequence[str],
+    groups: Optional[Sequence] = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Effectifs, moyennes et variances (ddof=1) par groupe, en une agrégation.
+
+    Les valeurs manquantes sont ignorées, variable par variable.
+
+    Args:
+        df: Données brutes
+        group_col: Colonne de groupe
+        value_cols: Variables numériques
+        groups: Ordre des groupes (défaut: ordre trié)
+
+    Returns:
+        (n, mean, var), matrices (n_groupes, n_variables)
+    """
+    moments = df.group_by(group_col).agg(
+        *[pl.col(c).count().alias(f"n_{i}") for i, c in enumerate(value_cols)],
+        *[pl.col(c).mean().alias(f"mean_{i}") for i, c in enumerate(value_cols)],
+        *[pl.col(c).var().alias(f"var_{i}") for i, c in enumerate(value_cols)],
+    )
+    if groups is None:
+        moments = moments.sort(group_col)
+    else:
+        order = pl.DataFrame({group_col: list(groups)}).cast(
+            {group_col: df.schema[group_col]}
+        )
+        moments = order.join(moments, on=group_col, how="left")
+
+    def block(prefix: str) -> np.ndarray:
+        columns = [f"{prefix}_{i}" for i in range(len(value_cols))]
+        return moments.select(columns).fill_null(np.nan).to_numpy().astype(np.float64)
+
+    return np.nan_to_num(block("n")), block("mean"), block("var")
+
+
+def rating_histograms(
+    df: pl.DataFrame,
+    by: Sequence[str],
+    rating_col: str = "rating",
+    levels: Sequence[int] = RATING_LEVELS,
+) -> pl.DataFrame:
+    """
+    Histogramme des notes par période (saison, mois...), en une agrégation.
+
+    Args:
+        df: Interactions (rating_col, user_id, recipe_id et colonnes de by)
+        by: Colonnes de regroupement, ex. ["season"] ou ["year", "month"]
+        rating_col: Colonne des notes
+        levels: Niveaux de note
+
+    Returns:
+        Une ligne par période : colonnes de by, count_<niveau> pour chaque
+        niveau, n_interactions, n_users, n_recipes ; triée selon by
+    """
+    return (
+        df.group_by(by)
+        .agg(
+            *[
+                (pl.col(rating_col) == level).sum().alias(f"count_{level}")
+                for level in levels
+            ],
+            pl.len().alias("n_interactions"),
+            pl.col("user_id").n_unique().alias("n_users"),
+            pl.col("recipe_id").n_unique().alias("n_recipes"),
+        )
+        .sort(by)
+    )
+
+
+def histogram_columns(levels: Sequence[int] = RATING_LEVELS) -> list[str]:
+    """Colonnes d'effectifs produites par rating_histograms."""
+    return [f"count_{level}" for level in levels]
+
+
+def histogram_moments(
+    histogram: np.ndarray, levels: Sequence[float]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Effectifs, moyennes et variances (ddof=1) de groupes décrits par histogramme.
+
+    Args:
+        histogram: Matrice (n_groupes, n_niveaux) des effectifs par niveau
+        levels: Valeur de chaque niveau (ex. notes 1 à 5)
+
+    Returns:
+        (n, mean, var), vecteurs (n_groupes,)
+    """
+    counts = np.atleast_2d(np.asarray(histogram, dtype=np.float64))
+    levels = np.asarray(levels, dtype=np.float64)
+    n = counts.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = counts @ levels / n
+        var = (counts * (levels[None, :] - mean[:, None]) ** 2).sum(axis=1) / (n - 1)
+    return n, mean, var
+
+
+def ttest_from_moments(
+    n1: np.ndarray,
+    mean1: np.ndarray,
+    var1: np.ndarray,
+    n2: np.ndarray,
+    mean2: np.ndarray,
+    var2: np.ndarray,
+    equal_var: bool = True,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Test t bilatéral de deux échantillons indépendants (Student ou Welch).
+
+    Équivalent à scipy.stats.ttest_ind(a, b, equal_var=...) sur les données
+    brutes ; vectorisé sur plusieurs variables.
+
+    Args:
+        n1, mean1, var1: Effectif, moyenne, variance (ddof=1) du groupe 1
+        n2, mean2, var2: Idem pour le groupe 2
+        equal_var: True = Student (variance poolée), False = Welch
+
+    Returns:
+        (t, p_value)
+    """
+    n1, mean1, var1, n2, mean2, var2 = (
+        np.asarray(a, dtype=np.float64) for a in (n1, mean1, var1, n2, mean2, var2)
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if equal_var:
+            dof = n1 + n2 - 2
+            pooled = ((n1 - 1) * var1 + (n2 - 1) * var2) / dof
+            se2 = pooled * (1 / n1 + 1 / n2)
+        else:
+            v1, v2 = var1 / n1, var2 / n2
+            se2 = v1 + v2
+            # Degrés de liberté de Welch-Satterthwaite
+            dof = se2**2 / (v1**2 / (n1 - 1) + v2**2 / (n2 - 1))
+        t_stat = (mean1 - mean2) / np.sqrt(se2)
+    return t_stat, 2 * stats.t.sf(np.abs(t_stat), dof)
+
+
+def anova_from_moments(
+    n: np.ndarray, mean: np.ndarray, var: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    ANOVA à un facteur à partir des moments par groupe.
+
+    Équivalent à scipy.stats.f_oneway ; les groupes sont sur l'axe 0, les
+    variables éventuelles sur l'axe 1.
+
+    Args:
+        n: Effectifs par groupe
+        mean: Moyennes par groupe
+        var: Variances (ddof=1) par groupe
+
+    Returns:
+        (F, p_value)
+    """
+    n, mean, var = (np.asarray(a, dtype=np.float64) for a in (n, mean, var))
+    k = n.shape[0]
+    n_total = n.sum(axis=0)
+    grand = (n * mean).sum(axis=0) / n_total
+    between = (n * (mean - grand) ** 2).sum(axis=0)
+    within = ((n - 1) * var).sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        f_stat = (between / (k - 1)) / (within / (n_total - k))
+    return f_stat, stats.f.sf(f_stat, k - 1, n_total - k)
+
+
+def kruskal_from_histogram(histogram: np.ndarray) -> tuple[float, float]:
+    """
+    Test de Kruskal-Wallis pour une variable ordinale discrète (notes 1-5).
+
+    Tous les individus d'un même niveau sont ex-aequo : ils reçoivent le
+    rang moyen du niveau, et H est corrigé des ex-aequo comme dans
+    scipy.stats.kruskal.
+
+    Args:
+        histogram: Matrice (n_groupes, n_niveaux) des effectifs, niveaux
+            dans l'ordre croissant
+
+    Returns:
+        (H, p_value)
+    """
+    counts = np.asarray(histogram, dtype=np.float64)
+    n_group = counts.sum(axis=1)
+    ties = counts.sum(axis=0)
+    n_total = ties.sum()
+
+    # Rang moyen de chaque niveau
+    midranks = np.cumsum(ties) - (ties - 1) / 2
+    rank_sums = counts @ midranks
+    h_stat = 12 / (n_total * (n_total + 1)) * (rank_sums**2 / n_group).sum() - 3 * (
+        n_total + 1
+    )
+    h_stat /= 1 - (ties**3 - ties).sum() / (n_total**3 - n_total)
+    return float(h_stat), float(stats.chi2.sf(h_stat, len(n_group) - 1))
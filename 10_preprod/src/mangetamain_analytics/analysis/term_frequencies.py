@@ -0,0 +1,107 @@
+"""
+Fréquences terme × groupe en une seule passe (ingrédients, tags).
+
+Un unique group_by([groupe, terme]) suivi d'un pivot remplace les boucles
+« filtrer une période, exploser, compter, construire des dicts » des analyses
+saisonnalité et week-end. Le même moteur sert toute vue ingrédient/tag ×
+(saison | weekend | mois | année) ; les termes peuvent être des chaînes ou
+des ids de vocabulaire (le décodage reste à la charge de l'appelant).
+"""
+
+from typing import Optional, Sequence
+
+import polars as pl
+
+
+def group_sizes(
+    df: pl.DataFrame, group_col: str, groups: Optional[Sequence] = None
+) -> dict[str, int]:
+    """
+    Nombre de lignes (recettes) par groupe.
+
+    Args:
+        df: DataFrame source
+        group_col: Colonne de regroupement
+        groups: Groupes attendus (défaut: valeurs présentes, triées)
+
+    Returns:
+        Dictionnaire {groupe (str): effectif}, 0 pour un groupe absent
+    """
+    counts = df.group_by(pl.col(group_col).cast(pl.String)).len()
+    sizes = dict(zip(counts[group_col].to_list(), counts["len"].to_list()))
+    if groups is None:
+        groups = sorted(sizes)
+    return {str(g): int(sizes.get(str(g), 0)) for g in groups}
+
+
+def term_group_frequencies(
+    df: pl.DataFrame,
+    term_col: str,
+    group_col: str,
+    groups: Optional[Sequence] = None,
+    term_alias: Optional[str] = None,
+) -> pl.DataFrame:
+    """
+    Matrice terme × groupe des fréquences de présence (%).
+
+    Chaque terme n'est compté qu'une fois par ligne (présence/absence).
+
+    Args:
+        df: DataFrame avec une colonne liste de termes et une colonne groupe
+        term_col: Colonne liste ('ingredients', 'tags')
+        group_col: Colonne de regroupement ('season', 'week_period', 'month'...)
+        groups: Ordre des groupes en colonnes (défaut: valeurs présentes, triées)
+        term_alias: Nom de la colonne terme en sortie (défaut: term_col)
+
+    Returns:
+        Une ligne par terme : colonne terme, une colonne de fréquence (%) par
+        groupe (nommée d'après le groupe), count_<groupe> (effectifs bruts),
+        puis mean_freq, std, cv (%) et range (points de %) entre groupes
+    """
+    sizes = group_sizes(df, group_col, groups)
+    group_names = list(sizes)
+    term_name = term_alias or term_col
+
+    counts = (
+        df.select(
+            pl.col(group_col).cast(pl.String),
+            pl.col(term_col).list.unique().alias(term_name),
+        )
+        .explode(term_name)
+        .drop_nulls(term_name)
+        .group_by([group_col, term_name])
+        .agg(pl.len().alias("count"))
+        .pivot(on=group_col, index=term_name, values="count")
+    )
+
+    count_cols = [f"count_{g}" for g in group_names]
+    counts = counts.with_columns(
+        [
+            (pl.col(g).fill_null(0) if g in counts.columns else pl.lit(0))
+            .cast(pl.UInt32)
+            .alias(f"count_{g}")
+            for g in group_names
+        ]
+    ).select(term_name, *count_cols)
+
+    freq_cols = [
+        (pl.col(f"count_{g}") / sizes[g] * 100 if sizes[g] > 0 else pl.lit(0.0)).alias(
+            g
+        )
+        for g in group_names
+    ]
+    return (
+        counts.with_columns(freq_cols)
+        .with_columns(pl.concat_list(group_names).alias("_values"))
+        .with_columns(
+            pl.col("_values").list.mean().alias("mean_freq"),
+            pl.col("_values").list.std().alias("std"),
+            (pl.col("_values").list.std() / pl.col("_values").list.mean() * 100).alias(
+                "cv"
+            ),
+            (pl.max_horizontal(group_names) - pl.min_horizontal(group_names)).alias(
+                "range"
+            ),
+        )
+        .select(term_name, *group_names, *count_cols, "mean_freq", "std", "cv", "range")
+    )
@@ -0,0 +1,57 @@
+"""
+Séries mensuelles régulières à partir d'événements datés.
+
+Les analyses temporelles (ruptures, décomposition STL) supposent une série
+sans trou : les mois sans événement sont donc comptés à 0.
+"""
+
+import polars as pl
+
+
+def complete_months(
+    df: pl.DataFrame, period_col: str = "period", fill_value: float = 0
+) -> pl.DataFrame:
+    """
+    Complète une série mensuelle avec les mois manquants.
+
+    Args:
+        df: Une ligne par mois (colonne période de type Date, 1er du mois)
+        period_col: Colonne période
+        fill_value: Valeur des mois ajoutés
+
+    Returns:
+        DataFrame trié couvrant tous les mois entre le premier et le dernier
+    """
+    if df.is_empty():
+        return df
+    months = pl.date_range(
+        df[period_col].min(), df[period_col].max(), "1mo", eager=True
+    ).alias(period_col)
+    return (
+        pl.DataFrame(months)
+        .join(df, on=period_col, how="left")
+        .fill_null(fill_value)
+        .sort(period_col)
+    )
+
+
+def monthly_counts(
+    df: pl.DataFrame, date_col: str = "submitted", count_col: str = "n"
+) -> pl.DataFrame:
+    """
+    Nombre de lignes par mois calendaire, mois vides compris.
+
+    Args:
+        df: DataFrame avec une colonne Date ou Datetime
+        date_col: Colonne date
+        count_col: Nom de la colonne effectif
+
+    Returns:
+        DataFrame (period, count_col) trié, period au 1er du mois
+    """
+    counts = (
+        df.drop_nulls(date_col)
+        .group_by(pl.col(date_col).cast(pl.Date).dt.truncate("1mo").alias("period"))
+        .agg(pl.len().alias(count_col))
+    )
+    return complete_months(counts)
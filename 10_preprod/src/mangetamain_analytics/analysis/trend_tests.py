@@ -0,0 +1,208 @@
+"""
+Tests de tendance non paramétriques vectorisés (Mann-Kendall, pente de Sen).
+
+Ce module applique le test de Mann-Kendall (avec correction des ex-aequo) et
+l'estimateur de pente de Sen à des milliers de séries en une seule passe
+NumPy : les séries sont les lignes d'une matrice (n_séries × n_instants),
+les valeurs manquantes (NaN) sont ignorées série par série.
+
+Au-delà de PARALLEL_MIN_SERIES séries, les blocs de lignes sont répartis sur
+un pool de processus. Le même moteur sert aux pages Streamlit (séries
+mensuelles des ratings) et aux notebooks d'EDA (une série par ingrédient,
+tag ou nutriment).
+"""
+
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Optional, Sequence
+
+import numpy as np
+import polars as pl
+from scipy.stats import norm
+
+# Nombre de séries à partir duquel les blocs sont traités en parallèle
+PARALLEL_MIN_SERIES = 5000
+
+# Nombre de séries par bloc (borne la mémoire des pentes de Sen)
+DEFAULT_CHUNK_SIZE = 1000
+
+# Nombre maximum de pentes (séries × paires) matérialisées à la fois
+_SEN_PAIR_BUDGET = 5_000_000
+
+
+def _mann_kendall_s(values: np.ndarray) -> np.ndarray:
+    """Statistique S de Mann-Kendall, une boucle par décalage vectorisée sur les séries."""
+    n_times = values.shape[1]
+    s = np.zeros(values.shape[0])
+    for lag in range(1, n_times):
+        # sign(NaN) = NaN : les paires incomplètes sont ignorées par nansum
+        s += np.nansum(np.sign(values[:, lag:] - values[:, :-lag]), axis=1)
+    return s
+
+
+def _tie_correction(values: np.ndarray) -> np.ndarray:
+    """Somme des t(t-1)(2t+5) sur les groupes d'ex-aequo de chaque série."""
+    n_series, n_times = values.shape
+    if n_series == 0 or n_times == 0:
+        return np.zeros(n_series)
+
+    flat = np.sort(values, axis=1).ravel()
+    # Un nouveau groupe commence à chaque changement de valeur et à chaque
+    # début de ligne ; NaN != NaN place chaque valeur manquante seule.
+    starts = np.ones(flat.shape, dtype=bool)
+    starts[1:] = flat[1:] != flat[:-1]
+    starts[::n_times] = True
+
+    sizes = np.bincount(np.cumsum(starts) - 1).astype(np.float64)
+    rows = np.flatnonzero(starts) // n_times
+    return np.bincount(
+        rows, weights=sizes * (sizes - 1) * (2 * sizes + 5), minlength=n_series
+    )
+
+
+def _sen_slope(values: np.ndarray, times: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Pente de Sen (médiane des pentes deux à deux) et ordonnée à l'origine.
+
+    L'ordonnée suit la convention de Conover : médiane(y) - pente × médiane(t).
+    """
+    n_series, n_times = values.shape
+    left, right = np.triu_indices(n_times, k=1)
+    dt = times[right] - times[left]
+
+    slopes = np.full(n_series, np.nan)
+    rows_per_block = max(1, _SEN_PAIR_BUDGET // max(1, len(left)))
+
+    with warnings.catch_warnings():
+        # Séries sans paire valide : médiane d'une tranche entièrement NaN
+        warnings.simplefilter("ignore", RuntimeWarning)
+        for start in range(0, n_series, rows_per_block):
+            block = values[start : start + rows_per_block]
+            pairwise = (block[:, right] - block[:, left]) / dt
+            slopes[start : start + rows_per_block] = np.nanmedian(pairwise, axis=1)
+        valid_times = np.where(np.isnan(values), np.nan, times)
+        intercepts = np.nanmedian(values, axis=1) - slopes * np.nanmedian(
+            valid_times, axis=1
+        )
+
+    return slopes, intercepts
+
+
+def _trend_chunk(values: np.ndarray, times: np.ndarray) -> np.ndarray:
+    """
+    Mann-Kendall et pente de Sen sur un bloc de séries.
+
+    Fonction de niveau module pour pouvoir être envoyée au pool de processus.
+
+    Returns:
+        Matrice (n_séries × 8) : n, s, var_s, z, p_value, tau, slope, intercept
+    """
+    n = np.sum(~np.isnan(values), axis=1).astype(np.float64)
+    s = _mann_kendall_s(values)
+    var_s = (n * (n - 1) * (2 * n + 5) - _tie_correction(values)) / 18.0
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Correction de continuité : S est ramené d'une unité vers zéro
+        z = np.where(var_s > 0, (s - np.sign(s)) / np.sqrt(var_s), 0.0)
+        tau = s / (n * (n - 1) / 2)
+    p_value = 2 * norm.sf(np.abs(z))
+
+    slope, intercept = _sen_slope(values, times)
+
+    # Moins de 3 observations : test non défini
+    undefined = n < 3
+    z[undefined] = np.nan
+    p_value[undefined] = np.nan
+    tau[undefined] = np.nan
+    slope[undefined] = np.nan
+    intercept[undefined] = np.nan
+
+    return np.column_stack([n, s, var_s, z, p_value, tau, slope, intercept])
+
+
+def trend_tests(
+    values: np.ndarray,
+    times: Optional[Sequence[float]] = None,
+    labels: Optional[Sequence[str]] = None,
+    alpha: float = 0.05,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    n_jobs: Optional[int] = None,
+) -> pl.DataFrame:
+    """
+    Test de Mann-Kendall et pente de Sen sur un lot de séries.
+
+    Args:
+        values: Matrice (n_séries × n_instants) ou série unique 1D ; NaN = manquant
+        times: Abscisses strictement croissantes (défaut: 0..n_instants-1)
+        labels: Nom de chaque série (défaut: index de ligne)
+        alpha: Seuil de significativité pour la colonne 'trend'
+        chunk_size: Nombre de séries par bloc
+        n_jobs: Nombre de processus (défaut: tous les cœurs au-delà de
+            PARALLEL_MIN_SERIES séries, 1 = toujours séquentiel)
+
+    Returns:
+        DataFrame (series, n, s, var_s, z, p_value, tau, slope, intercept,
+        trend) ; tau = S / (n(n-1)/2) et trend ∈ {'increasing',
+        'decreasing', 'no trend'} selon p_value < alpha
+
+    Examples:
+        >>> trend_tests(np.array([[1.0, 2.0, 3.0, 4.0]]))["trend"][0]
+        'no trend'
+    """
+    values = np.atleast_2d(np.asarray(values, dtype=np.float64))
+    n_series, n_times = values.shape
+
+    times = (
+        np.arange(n_times, dtype=np.float64)
+        if times is None
+        else np.asarray(times, dtype=np.float64)
+    )
+    if times.shape != (n_times,):
+        raise ValueError(
+            f"times doit contenir {n_times} valeurs, reçu {times.shape[0]}"
+        )
+    if n_times > 1 and np.any(np.diff(times) <= 0):
+        raise ValueError("times doit être strictement croissant")
+
+    labels = (
+        [str(i) for i in range(n_series)]
+        if labels is None
+        else [str(label) for label in labels]
+    )
+    if len(labels) != n_series:
+        raise ValueError(f"labels doit contenir {n_series} valeurs, reçu {len(labels)}")
+
+    chunks = [
+        values[start : start + chunk_size] for start in range(0, n_series, chunk_size)
+    ]
+    workers = n_jobs if n_jobs is not None else (os.cpu_count() or 1)
+    if n_series >= PARALLEL_MIN_SERIES and workers > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            results = list(pool.map(_trend_chunk, chunks, repeat(times)))
+    else:
+        results = [_trend_chunk(chunk, times) for chunk in chunks]
+
+    stats = np.vstack(results) if results else np.empty((0, 8))
+    significant = stats[:, 4] < alpha
+
+    return pl.DataFrame(
+        {
+            "series": labels,
+            "n": stats[:, 0].astype(np.int64),
+            "s": stats[:, 1].astype(np.int64),
+            "var_s": stats[:, 2],
+            "z": stats[:, 3],
+            "p_value": stats[:, 4],
+            "tau": stats[:, 5],
+            "slope": stats[:, 6],
+            "intercept": stats[:, 7],
+            "trend": np.where(
+                significant,
+                np.where(stats[:, 1] > 0, "increasing", "decreasing"),
+                "no trend",
+            ),
+        },
+        schema_overrides={"trend": pl.String},
+    ).fill_nan(None)
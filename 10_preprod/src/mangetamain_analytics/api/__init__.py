@@ -0,0 +1 @@
+"""API HTTP des résultats d'analyse (JSON ou Arrow), sans Streamlit."""
@@ -0,0 +1,271 @@
+"""Résultats d'analyse exposés par l'API, sans interface Streamlit.
+
+Chaque résultat reprend le calcul de la page correspondante avec les mêmes
+fonctions en cache de data.cached_loaders et les mêmes clés (nom du test,
+version du jeu de données) : un test déjà calculé par l'application n'est
+pas recalculé par l'API, et inversement dans un même processus.
+
+Un résultat est un AnalysisResult : des tables Polars (agrégats,
+statistiques par variable) et des statistiques scalaires (coefficients,
+statistiques de test). Son ResultSpec déclare aussi la version de chacune
+de ses entrées (recettes, interactions), qui forme la clé de l'ETag.
+"""
+
+from typing import Any, Callable, NamedTuple
+
+import numpy as np
+import polars as pl
+from scipy.stats import linregress
+
+from analysis.change_points import series_version
+from analysis.sufficient_stats import (
+    RATING_LEVELS,
+    anova_from_moments,
+    group_moments,
+    histogram_columns,
+    histogram_moments,
+    kruskal_from_histogram,
+    ttest_from_moments,
+)
+from analysis.trend_tests import trend_tests
+from data.cached_loaders import (
+    get_bootstrap_mean_diff,
+    get_interactions_version,
+    get_permutation_tests,
+    get_rating_histograms,
+    get_recipes_clean,
+    get_recipes_version,
+)
+
+# Variables nutritionnelles testées (mêmes colonnes et ordre que les pages)
+WEEKEND_NUTRIENTS = (
+    "calories",
+    "protein_pct",
+    "total_fat_pct",
+    "sat_fat_pct",
+    "sugar_pct",
+    "sodium_pct",
+)
+SEASON_NUTRIENTS = (
+    "calories",
+    "total_fat_pct",
+    "sugar_pct",
+    "sodium_pct",
+    "protein_pct",
+    "sat_fat_pct",
+)
+NUTRITION_SEASONS = ("Winter", "Spring", "Summer", "Autumn")
+RATING_SEASONS = ("Spring", "Summer", "Autumn", "Winter")
+
+
+class AnalysisResult(NamedTuple):
+    """Résultat d'une analyse : tables nommées et statistiques scalaires."""
+
+    tables: dict[str, pl.DataFrame]
+    statistics: dict[str, Any]
+
+
+class ResultSpec(NamedTuple):
+    """Résultat publié : fonction de calcul, description et versions des entrées."""
+
+    compute: Callable[..., AnalysisResult]
+    description: str
+    versions: tuple[Callable[[], str], ...] = (get_recipes_version,)
+
+    def dataset_version(self) -> str:
+        """Version des données du résultat (versions de ses entrées, jointes par +)."""
+        return "+".join(version() for version in self.versions)
+
+
+def trends_volume() -> AnalysisResult:
+    """
+    Volume de recettes par année : régression, Mann-Kendall et régimes PELT.
+
+    Returns:
+        Tables 'per_year' (year, n_recipes) et 'segments' (voir
+        compute_volume_segments) ; statistiques de la régression linéaire
+        (slope, intercept, r_squared, p_value) et du test de Mann-Kendall
+        (pente de Sen)
+    """
+    from visualization.analyse_trendlines_v2 import (
+        compute_volume_segments,
+        load_and_prepare_data,
+    )
+
+    df = load_and_prepare_data()
+    per_year = df.group_by("year").agg(pl.len().alias("n_recipes")).sort("year")
+    years = per_year["year"].to_numpy().astype(np.float64)
+    counts = per_year["n_recipes"].to_numpy().astype(np.float64)
+
+    regression = linregress(years, counts)
+    mann_kendall = trend_tests(counts, years, labels=["n_recipes"]).row(0, named=True)
+
+    return AnalysisResult(
+        tables={"per_year": per_year, "segments": compute_volume_segments(df)},
+        statistics={
+            "linear": {
+                "slope": regression.slope,
+                "intercept": regression.intercept,
+                "r_squared": regression.rvalue**2,
+                "p_value": regression.pvalue,
+            },
+            "mann_kendall": {
+                key: mann_kendall[key]
+                for key in ("n", "s", "z", "p_value", "tau", "slope", "trend")
+            },
+        },
+    )
+
+
+def seasonality_nutrition() -> AnalysisResult:
+    """
+    Profil nutritionnel par saison et tests par permutation (F de l'ANOVA).
+
+    Returns:
+        Tables 'means' (season, n_recipes, une moyenne par nutriment) et
+        'permutation' (variable, statistic, p_value)
+    """
+    cols = list(SEASON_NUTRIENTS)
+    tested = (
+        get_recipes_clean()
+        .select(["season", *cols])
+        .drop_nulls()
+        .filter(pl.col("season").is_in(NUTRITION_SEASONS))
+    )
+    values = tested.select(cols).to_numpy()
+    labels = (
+        tested["season"]
+        .replace_strict(
+            {season: i for i, season in enumerate(NUTRITION_SEASONS)},
+            return_dtype=pl.Int8,
+        )
+        .to_numpy()
+    )
+    permutation = get_permutation_tests(
+        "seasonality_nutrition",
+        series_version(values, labels),
+        values,
+        labels,
+        tuple(range(len(NUTRITION_SEASONS))),
+        tuple(cols),
+    )
+    means = (
+        pl.DataFrame({"season": NUTRITION_SEASONS})
+        .join(
+            tested.group_by("season").agg(
+                pl.len().alias("n_recipes"), *[pl.mean(col) for col in cols]
+            ),
+            on="season",
+            how="left",
+        )
+        .with_columns(pl.col("n_recipes").fill_null(0))
+    )
+    return AnalysisResult(
+        tables={"means": means, "permutation": permutation},
+        statistics={"n_recipes": tested.height},
+    )
+
+
+def weekend_nutrition() -> AnalysisResult:
+    """
+    Nutrition en semaine et le week-end : Student, permutation et bootstrap.
+
+    Returns:
+        Table 'tests' (variable, weekday, weekend, diff_pct, p_student,
+        p_perm, diff, ci_low, ci_high) ; effectifs des recettes testées
+    """
+    cols = list(WEEKEND_NUTRIENTS)
+    df = get_recipes_clean().with_columns(
+        pl.when(pl.col("is_weekend") == 1)
+        .then(pl.lit("Weekend"))
+        .otherwise(pl.lit("Weekday"))
+        .alias("week_period")
+    )
+    n, means, variances = group_moments(df, "week_period", cols, ["Weekday", "Weekend"])
+    _, p_student = ttest_from_moments(
+        n[0], means[0], variances[0], n[1], means[1], variances[1]
+    )
+
+    tested = df.select(["is_weekend", *cols]).drop_nulls()
+    values = tested.select(cols).to_numpy()
+    labels = tested["is_weekend"].cast(pl.Int8).to_numpy()
+    version = series_version(values, labels)
+    permutation = get_permutation_tests(
+        "weekend_nutrition", version, values, labels, (0, 1), tuple(cols)
+    )
+    bootstrap = get_bootstrap_mean_diff(
+        "weekend_nutrition", version, values, labels, (0, 1), tuple(cols)
+    )
+
+    tests = pl.DataFrame(
+        {
+            "variable": cols,
+            "weekday": means[0],
+            "weekend": means[1],
+            "diff_pct": (means[1] - means[0]) / means[0] * 100,
+            "p_student": p_student,
+            "p_perm": permutation["p_value"],
+        }
+    ).hstack(bootstrap.select("diff", "ci_low", "ci_high"))
+    return AnalysisResult(
+        tables={"tests": tests},
+        statistics={
+            "n_weekday": int((labels == 0).sum()),
+            "n_weekend": int((labels == 1).sum()),
+        },
+    )
+
+
+def ratings_seasonal() -> AnalysisResult:
+    """
+    Notes par saison : histogramme, ANOVA et Kruskal-Wallis.
+
+    Returns:
+        Table 'seasons' (season, n_ratings, mean_rating, std_rating,
+        count_1..count_5) ; statistiques anova (F, p_value) et kruskal
+        (H, p_value)
+    """
+    season_hist = (
+        pl.DataFrame({"season": RATING_SEASONS})
+        .join(get_rating_histograms(("season",)), on="season", how="left")
+        .fill_null(0)
+    )
+    counts = season_hist.select(histogram_columns()).to_numpy().astype(np.float64)
+    n_ratings, mean_rating, var_rating = histogram_moments(counts, RATING_LEVELS)
+    f_stat, p_anova = anova_from_moments(n_ratings, mean_rating, var_rating)
+    h_stat, p_kruskal = kruskal_from_histogram(counts)
+
+    seasons = pl.DataFrame(
+        {
+            "season": RATING_SEASONS,
+            "n_ratings": n_ratings.astype(np.int64),
+            "mean_rating": mean_rating,
+            "std_rating": np.sqrt(var_rating),
+        }
+    ).hstack(season_hist.select(histogram_columns()))
+    return AnalysisResult(
+        tables={"seasons": seasons},
+        statistics={
+            "anova": {"F": f_stat, "p_value": p_anova},
+            "kruskal": {"H": h_stat, "p_value": p_kruskal},
+        },
+    )
+
+
+# Résultats publiés par l'API (nom -> calcul) ; recettes en entrée par défaut
+RESULTS = {
+    "trends_volume": ResultSpec(
+        trends_volume, "Volume de recettes par année, tendance et ruptures"
+    ),
+    "seasonality_nutrition": ResultSpec(
+        seasonality_nutrition, "Nutrition par saison, tests par permutation"
+    ),
+    "weekend_nutrition": ResultSpec(
+        weekend_nutrition, "Nutrition semaine / week-end, tests et IC bootstrap"
+    ),
+    "ratings_seasonal": ResultSpec(
+        ratings_seasonal,
+        "Notes par saison, ANOVA et Kruskal-Wallis",
+        (get_interactions_version,),
+    ),
+}
@@ -0,0 +1,252 @@
+"""Serveur HTTP des résultats d'analyse (Tornado, sans Streamlit).
+
+Routes :
+
+    GET /api/v1/results                 liste des résultats et version des données
+    GET /api/v1/results/<nom>           résultat en JSON (tables et statistiques)
+    GET /api/v1/results/<nom>?format=arrow&table=<table>
+                                        une table en flux Arrow IPC
+
+Le format Arrow est aussi choisi par l'en-tête Accept
+(application/vnd.apache.arrow.stream).
+
+L'ETag d'une réponse dépend du résultat, du format, de la table, des
+versions des données dont dépend le résultat (ResultSpec.versions : manifeste
+des recettes, empreinte des interactions) et de l'empreinte du code
+(code_version), pas du contenu calculé : une requête If-None-Match à jour
+reçoit un 304 sans aucun calcul, et un déploiement qui modifie un calcul
+invalide les ETag. Les calculs s'exécutent hors de la boucle d'événements
+(pool de threads).
+"""
+
+import datetime as dt
+import hashlib
+import io
+import json
+import math
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import numpy as np
+import tornado.web
+from loguru import logger
+from tornado.ioloop import IOLoop
+
+from api.results import RESULTS, AnalysisResult
+from data.cached_loaders import get_recipes_version
+from data.loaders import DataLoadError
+
+API_PREFIX = "/api/v1"
+
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+JSON_MEDIA_TYPE = "application/json; charset=utf-8"
+FORMATS = ("json", "arrow")
+
+# Sources de l'application, dont l'empreinte entre dans les ETag
+CODE_ROOT = Path(__file__).resolve().parents[1]
+
+
+@lru_cache(maxsize=1)
+def code_version() -> str:
+    """
+    Empreinte des sources de l'application, calculée une fois par processus.
+
+    Un déploiement qui modifie un calcul ou le format d'un résultat change
+    cette empreinte, donc tous les ETag.
+
+    Returns:
+        Empreinte hexadécimale (16 caractères)
+    """
+    digest = hashlib.sha1()
+    for path in sorted(CODE_ROOT.rglob("*.py")):
+        digest.update(path.relative_to(CODE_ROOT).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def result_etag(name: str, dataset_version: str, *parts: Optional[str]) -> str:
+    """
+    ETag d'une représentation, connue avant tout calcul.
+
+    Args:
+        name: Nom du résultat (ou de la route)
+        dataset_version: Version des données du résultat
+        *parts: Éléments de la représentation (format, table)
+
+    Returns:
+        ETag fort entre guillemets (dépend aussi de code_version)
+    """
+    key = "\x1f".join(
+        [name, dataset_version, code_version(), *(part or "" for part in parts)]
+    )
+    return '"' + hashlib.sha1(key.encode()).hexdigest()[:20] + '"'
+
+
+def jsonable(value: Any) -> Any:
+    """
+    Valeur sérialisable en JSON strict.
+
+    Scalaires NumPy convertis, NaN et infinis en null, dates au format ISO.
+    """
+    if isinstance(value, dict):
+        return {str(k): jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [jsonable(v) for v in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if isinstance(value, (dt.date, dt.datetime, dt.time)):
+        return value.isoformat()
+    if isinstance(value, dt.timedelta):
+        return value.total_seconds()
+    return value
+
+
+def result_json(name: str, dataset_version: str, result: AnalysisResult) -> str:
+    """Document JSON d'un résultat : tables en lignes et statistiques."""
+    return json.dumps(
+        {
+            "analysis": name,
+            "dataset_version": dataset_version,
+            "tables": {
+                table: jsonable(df.to_dicts()) for table, df in result.tables.items()
+            },
+            "statistics": jsonable(result.statistics),
+        },
+        allow_nan=False,
+    )
+
+
+class ApiHandler(tornado.web.RequestHandler):
+    """Base des routes : ETag précalculé et erreurs en JSON."""
+
+    etag: Optional[str] = None
+
+    def compute_etag(self) -> Optional[str]:
+        """ETag fixé par la route (et non empreinte du corps de la réponse)."""
+        return self.etag
+
+    def not_modified(self, etag: str) -> bool:
+        """Fixe l'ETag ; vrai (réponse 304 prête) si If-None-Match correspond."""
+        self.etag = etag
+        self.set_etag_header()
+        self.set_header("Cache-Control", "no-cache")
+        if self.check_etag_header():
+            self.set_status(304)
+            return True
+        return False
+
+    async def dataset_version(self, version: Optional[Callable[[], str]] = None) -> str:
+        """
+        Version des données, hors de la boucle d'événements.
+
+        Args:
+            version: Fonction de version (défaut: get_recipes_version,
+                manifeste des recettes en cache)
+        """
+        return await IOLoop.current().run_in_executor(
+            None, version or get_recipes_version
+        )
+
+    def write_error(self, status_code: int, **kwargs: Any) -> None:
+        """Erreur au format JSON."""
+        self.set_header("Content-Type", JSON_MEDIA_TYPE)
+        self.finish(json.dumps({"status": status_code, "error": self._reason}))
+
+
+class ResultsIndexHandler(ApiHandler):
+    """Liste des résultats disponibles."""
+
+    async def get(self) -> None:
+        """GET /api/v1/results"""
+        version = await self.dataset_version()
+        if self.not_modified(result_etag("index", version)):
+            return
+        self.set_header("Content-Type", JSON_MEDIA_TYPE)
+        self.write(
+            json.dumps(
+                {
+                    "dataset_version": version,
+                    "formats": list(FORMATS),
+                    "results": [
+                        {
+                            "name": name,
+                            "description": spec.description,
+                            "url": f"{API_PREFIX}/results/{name}",
+                        }
+                        for name, spec in RESULTS.items()
+                    ],
+                }
+            )
+        )
+
+
+class ResultHandler(ApiHandler):
+    """Un résultat d'analyse, en JSON ou en Arrow."""
+
+    def response_format(self) -> str:
+        """Format demandé : paramètre format, sinon en-tête Accept."""
+        fmt = self.get_query_argument("format", None)
+        if fmt is None:
+            accept = self.request.headers.get("Accept", "")
+            fmt = "arrow" if ARROW_MEDIA_TYPE in accept else "json"
+        if fmt not in FORMATS:
+            raise tornado.web.HTTPError(
+                400, reason=f"Format inconnu '{fmt}' (attendu: {', '.join(FORMATS)})"
+            )
+        return fmt
+
+    async def get(self, name: str) -> None:
+        """GET /api/v1/results/<nom>"""
+        spec = RESULTS.get(name)
+        if spec is None:
+            raise tornado.web.HTTPError(404, reason=f"Résultat inconnu '{name}'")
+        fmt = self.response_format()
+        table = self.get_query_argument("table", None)
+
+        try:
+            version = await self.dataset_version(spec.dataset_version)
+            if self.not_modified(result_etag(name, version, fmt, table)):
+                return
+            result = await IOLoop.current().run_in_executor(None, spec.compute)
+        except DataLoadError as e:
+            logger.error(f"API {name}: {e}")
+            raise tornado.web.HTTPError(503, reason="Données indisponibles") from e
+
+        if fmt == "json":
+            self.set_header("Content-Type", JSON_MEDIA_TYPE)
+            self.write(result_json(name, version, result))
+            return
+
+        table = table or next(iter(result.tables))
+        if table not in result.tables:
+            raise tornado.web.HTTPError(
+                404,
+                reason=f"Table inconnue '{table}' "
+                f"(disponibles: {', '.join(result.tables)})",
+            )
+        buffer = io.BytesIO()
+        result.tables[table].write_ipc_stream(buffer)
+        self.set_header("Content-Type", ARROW_MEDIA_TYPE)
+        self.write(buffer.getvalue())
+
+
+def make_app(**settings: Any) -> tornado.web.Application:
+    """
+    Application Tornado de l'API.
+
+    Args:
+        **settings: Réglages Tornado (ex. debug=True)
+
+    Returns:
+        Application à lancer avec app.listen(port)
+    """
+    return tornado.web.Application(
+        [
+            (rf"{API_PREFIX}/results/?", ResultsIndexHandler),
+            (rf"{API_PREFIX}/results/([a-z_]+)", ResultHandler),
+        ],
+        **settings,
+    )
@@ -0,0 +1,46 @@
+"""Construit les instantanés des vues par défaut (à lancer au déploiement).
+
+Usage:
+    python src/mangetamain_analytics/build_snapshots.py [--output DIR] [--workers N]
+
+Voir utils.snapshot : les vues par défaut déclarées dans SNAPSHOT_FIGURES
+(toutes les pages d'analyse, une page par processus) sont calculées une fois
+et relues par l'application sans calcul. --dataset-version impose une même
+version à toutes les pages (défaut : version de chaque jeu de données).
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional
+
+from loguru import logger
+
+from utils.snapshot import SNAPSHOT_DIR, build_snapshots
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Point d'entrée en ligne de commande.
+
+    Returns:
+        Code de sortie (0 si succès, 1 en cas d'échec)
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, default=SNAPSHOT_DIR)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--dataset-version", default=None)
+    args = parser.parse_args(argv)
+
+    try:
+        built = build_snapshots(args.output, args.dataset_version, args.workers)
+    except Exception as e:
+        logger.error(f"Échec de la construction des instantanés: {e}")
+        return 1
+    for page, analyses in built.items():
+        print(f"✅ {page}: {', '.join(analyses)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,21 +3,105 @@
 Ce module wrapper les fonctions de chargement avec le décorateur @st.cache_data
 pour améliorer les performances. La logique de chargement et de gestion
 d'erreurs est déléguée à la classe DataLoader.
+
+Les calculs dérivés coûteux (ruptures, décomposition STL, tests par permutation) sont mis en cache de la même façon,
+avec la version du jeu de données comme clé. Pour les recettes, cette version
+est l'empreinte publiée dans le manifeste de l'ETL (lu sans charger les données),
+qui est aussi la clé du cache des recettes : données et version changent ensemble.
+
+Les tables volumineuses (recettes, interactions, comptages quotidiens, table
+par recette, histogrammes de notes) sont mémorisées par utils.memory.memory_cache :
+un seul exemplaire partagé entre sessions, sans copie à chaque lecture, dans un
+cache borné en octets et visible dans la page d'administration. Les pages ne
+lisent des interactions que des agrégats en cache, comme les histogrammes de
+notes par saison ou par mois.
 """
 
-from typing import Any
+from typing import Any, Optional, Sequence
 import streamlit as st
-from .loaders import DataLoader
-
+from loguru import logger
+from analysis.change_points import (
+    DEFAULT_MIN_SIZE,
+    detect_change_points,
+    series_version,
+)
+from analysis.decomposition import MONTHLY_PERIOD, stl_decompose
+from analysis.resampling import (
+    DEFAULT_PERMUTATIONS,
+    bootstrap_mean_diff,
+    histogram_bootstrap_means,
+    permutation_tests,
+)
+from analysis.sufficient_stats import (
+    RATING_LEVELS,
+    histogram_columns,
+    rating_histograms,
+)
+from utils.memory import memory_cache
+from .loaders import DataLoader, DataLoadError
 
 # Instance globale du loader
 _loader = DataLoader()
 
+# Durée de cache du manifeste (secondes) : lecture de quelques Ko, une
+# nouvelle publication de l'ETL est prise en compte en 5 minutes
+MANIFEST_TTL = 300
+
+
+@st.cache_data(ttl=MANIFEST_TTL, show_spinner=False)
+def get_recipes_manifest() -> Any:
+    """Charge le manifeste des recettes (métadonnées seules) avec cache (5 min)."""
+    return _loader.load_recipes_manifest()
+
+
+@st.cache_data(ttl=MANIFEST_TTL, show_spinner=False)
+def get_recipes_manifest_hash() -> Optional[str]:
+    """Empreinte du Parquet publiée dans le manifeste, None si indisponible (5 min)."""
+    try:
+        return get_recipes_manifest()["content_hash"]
+    except (DataLoadError, KeyError) as e:
+        logger.warning(f"Manifeste des recettes indisponible: {e}")
+        return None
+
+
+@memory_cache("recipes", ttl=3600, spinner="🔄 Chargement des recettes depuis S3...")
+def load_versioned_recipes(manifest_hash: Optional[str]) -> tuple[Any, str]:
+    """
+    Recettes et leur version, en cache partagé par empreinte du manifeste.
+
+    Une nouvelle publication de l'ETL change la clé : données et version
+    changent ensemble. Sans manifeste (None), la version est l'empreinte
+    des id et années, calculée une fois sur les recettes chargées.
+
+    Returns:
+        (recettes, version)
+    """
+    recipes = _loader.load_recipes()
+    if manifest_hash is not None:
+        return recipes, manifest_hash
+    return recipes, series_version(recipes["id"].to_numpy(), recipes["year"].to_numpy())
+
 
-@st.cache_data(ttl=3600, show_spinner="🔄 Chargement des recettes depuis S3...")
 def get_recipes_clean() -> Any:
-    """Charge les recettes depuis S3 avec cache (1h)."""
-    return _loader.load_recipes()
+    """
+    Recettes de la version courante (voir load_versioned_recipes).
+
+    Un seul exemplaire pour toutes les sessions : ne pas le modifier.
+    """
+    return load_versioned_recipes(get_recipes_manifest_hash())[0]
+
+
+def get_recipes_version() -> str:
+    """
+    Version des recettes, clé des caches de figures.
+
+    Empreinte du Parquet publiée dans le manifeste (sans charger les
+    données) ; à défaut, celle des recettes servies par get_recipes_clean.
+    """
+    manifest_hash = get_recipes_manifest_hash()
+    if manifest_hash is not None:
+        return manifest_hash
+    return load_versioned_recipes(None)[1]
 
 
 # @st.cache_data(ttl=3600, show_spinner="🔄 Chargement des interactions depuis S3...")
@@ -37,3 +121,198 @@ def get_ratings_longterm(
 ) -> Any:
     """Charge les ratings pour analyse long-terme depuis S3 avec cache (1h)."""
     return _loader.load_ratings(min_interactions, return_metadata, verbose)
+
+
+@st.cache_data(ttl=3600, show_spinner="🔄 Chargement des associations depuis S3...")
+def get_ingredient_pairs() -> Any:
+    """Charge les associations d'ingrédients précalculées depuis S3 avec cache (1h)."""
+    return _loader.load_ingredient_pairs()
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_vocabulary(col_name: str) -> Any:
+    """Charge le vocabulaire d'une colonne liste encodée depuis S3 avec cache (1h)."""
+    return _loader.load_vocabulary(col_name)
+
+
+@memory_cache("daily_counts", ttl=3600)
+def get_daily_counts(year: Optional[int] = None) -> Any:
+    """Charge les comptages quotidiens (une année ou toutes) depuis S3 avec cache partagé (1h)."""
+    return _loader.load_daily_counts(year)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_user_stats() -> Any:
+    """Charge la table précalculée par utilisateur depuis S3 avec cache (1h)."""
+    return _loader.load_user_stats()
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_monthly_active_users() -> Any:
+    """Charge les comptes mensuels d'utilisateurs actifs depuis S3 avec cache (1h)."""
+    return _loader.load_monthly_active_users()
+
+
+@memory_cache("recipe_stats", ttl=3600)
+def get_recipe_stats(
+    order_by: Optional[str] = None, k: Optional[int] = None, min_interactions: int = 0
+) -> Any:
+    """Charge la table par recette (ou son top-k) depuis S3 avec cache partagé (1h)."""
+    return _loader.load_recipe_stats(order_by, k, min_interactions)
+
+
+@memory_cache(
+    "interactions", ttl=3600, spinner="🔄 Chargement des interactions depuis S3..."
+)
+def get_clean_interactions() -> Any:
+    """
+    Interactions nettoyées, chargées une seule fois depuis S3 (1h).
+
+    Partagées entre sessions sans copie : ne pas modifier le DataFrame
+    retourné (les opérations Polars renvoient de nouveaux DataFrames).
+    """
+    return _loader.load_clean_interactions()
+
+
+@memory_cache("rating_histograms", ttl=3600)
+def get_rating_histograms(by: tuple = ("season",)) -> Any:
+    """
+    Histogramme des notes 1-5 par période, en cache partagé (1h).
+
+    Args:
+        by: Colonnes de regroupement, ex. ("season",) ou ("year", "month")
+
+    Returns:
+        Une ligne par période (count_1..count_5, n_interactions, n_users,
+        n_recipes), voir analysis.sufficient_stats.rating_histograms
+    """
+    return rating_histograms(get_clean_interactions(), list(by))
+
+
+def get_interactions_version() -> str:
+    """
+    Version des interactions, clé des résultats qui en dépendent.
+
+    Le CSV des interactions n'a pas de manifeste : la version est
+    l'empreinte de l'histogramme mensuel des notes (en cache), qui change
+    avec les interactions chargées.
+    """
+    hist = get_rating_histograms(("year", "month"))
+    return series_version(
+        hist["year"].to_numpy(),
+        hist["month"].to_numpy(),
+        hist.select(histogram_columns()).to_numpy(),
+    )
+
+
+def get_users_version() -> str:
+    """
+    Version des tables utilisateurs, clé des figures de la page Utilisateurs.
+
+    Les tables utilisateurs n'ont pas de manifeste : la version est
+    l'empreinte des comptes mensuels (quelques centaines de lignes), que
+    l'ETL recalcule avec la table par utilisateur.
+    """
+    monthly = get_monthly_active_users()
+    return series_version(
+        monthly["month"].to_physical().to_numpy(),
+        monthly["n_active_users"].to_numpy(),
+        monthly["n_new_users"].to_numpy(),
+    )
+
+
+@st.cache_data(show_spinner=False)
+def get_change_points(
+    series_name: str,
+    dataset_version: str,
+    _values: Sequence[float],
+    _times: Optional[Sequence] = None,
+    min_size: int = DEFAULT_MIN_SIZE,
+) -> Any:
+    """
+    Segments PELT d'une série, en cache par version du jeu de données.
+
+    Les séries elles-mêmes (préfixe _) ne sont pas hachées par Streamlit :
+    la clé de cache est (series_name, dataset_version, min_size).
+    """
+    return detect_change_points(_values, _times, min_size=min_size)
+
+
+@st.cache_data(show_spinner=False)
+def get_stl_decomposition(
+    series_name: str,
+    dataset_version: str,
+    _values: Sequence[float],
+    _times: Optional[Sequence] = None,
+    period: int = MONTHLY_PERIOD,
+) -> Any:
+    """
+    Composantes STL d'une série, en cache par version du jeu de données.
+
+    Même clé de cache que get_change_points : (series_name, dataset_version,
+    period), la série elle-même n'étant pas hachée.
+    """
+    return stl_decompose(_values, _times, period=period)
+
+
+@st.cache_data(show_spinner=False)
+def get_permutation_tests(
+    test_name: str,
+    dataset_version: str,
+    _values: Any,
+    _labels: Sequence,
+    groups: tuple,
+    names: tuple,
+    n_permutations: int = DEFAULT_PERMUTATIONS,
+    seed: int = 0,
+) -> Any:
+    """
+    Tests par permutation (une ligne par variable), en cache par version du jeu de données.
+
+    Clé de cache : (test_name, dataset_version, groups, names, n_permutations,
+    seed) ; la graine fixe rend le résultat reproductible d'un rechargement à l'autre.
+    """
+    return permutation_tests(
+        _values, _labels, groups, names, n_permutations=n_permutations, seed=seed
+    )
+
+
+@st.cache_data(show_spinner=False)
+def get_bootstrap_mean_diff(
+    test_name: str,
+    dataset_version: str,
+    _values: Any,
+    _labels: Sequence,
+    groups: tuple,
+    names: tuple,
+    n_resamples: int = DEFAULT_PERMUTATIONS,
+    seed: int = 0,
+) -> Any:
+    """
+    IC bootstrap des différences de moyennes, en cache par version du jeu de données.
+
+    Même clé de cache que get_permutation_tests.
+    """
+    return bootstrap_mean_diff(
+        _values, _labels, groups, names, n_resamples=n_resamples, seed=seed
+    )
+
+
+@st.cache_data(show_spinner=False)
+def get_histogram_bootstrap_means(
+    series_name: str,
+    dataset_version: str,
+    _histograms: Any,
+    levels: tuple = RATING_LEVELS,
+    n_resamples: int = DEFAULT_PERMUTATIONS,
+    seed: int = 0,
+) -> Any:
+    """
+    IC bootstrap multinomial de la moyenne de chaque période, en cache par version du jeu de données.
+
+    Clé de cache : (series_name, dataset_version, levels, n_resamples, seed) ;
+    la matrice des histogrammes elle-même n'est pas hachée.
+    """
+    return histogram_bootstrap_means(
+        _histograms, levels, n_resamples=n_resamples, seed=seed
+    )
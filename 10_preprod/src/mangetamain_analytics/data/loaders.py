@@ -4,7 +4,7 @@ Ce module contient les classes pour charger les données depuis S3/DuckDB
 avec une gestion robuste des exceptions personnalisées.
 """
 
-from typing import Any
+from typing import Any, Optional
 from loguru import logger
 
 try:
@@ -104,3 +104,279 @@ class DataLoader:
             raise DataLoadError(
                 source="S3 (ratings)", detail=f"Échec chargement ratings: {e}"
             )
+
+    def load_ingredient_pairs(self) -> Any:
+        """Charge la liste d'arêtes précalculée des associations d'ingrédients.
+
+        Returns:
+            DataFrame Polars (ingredient, neighbor, season, n_recipes, support,
+            lift, shift, rank)
+
+        Raises:
+            DataLoadError: Si le module est introuvable ou si le chargement échoue
+        """
+        try:
+            from mangetamain_data_utils.data_utils_pairings import (
+                load_ingredient_pairs,
+            )
+        except ImportError as e:
+            logger.error(f"Module mangetamain_data_utils introuvable: {e}")
+            raise DataLoadError(
+                source="module mangetamain_data_utils",
+                detail=f"Module introuvable: {e}",
+            )
+
+        try:
+            logger.info("Chargement associations d'ingrédients depuis S3 (Parquet)")
+            pairs = load_ingredient_pairs()
+            logger.info(f"Associations chargées: {len(pairs)} arêtes")
+            return pairs
+        except Exception as e:
+            logger.error(f"Échec chargement associations depuis S3: {e}")
+            raise DataLoadError(
+                source="S3 (pairings)",
+                detail=f"Échec chargement associations: {e}",
+            )
+
+    def load_vocabulary(self, col_name: str) -> Any:
+        """Charge le vocabulaire (id -> terme) d'une colonne liste encodée.
+
+        Args:
+            col_name: 'ingredients' ou 'tags'
+
+        Returns:
+            DataFrame Polars (id, term, n_recipes, first_year)
+
+        Raises:
+            DataLoadError: Si le module est introuvable ou si le chargement échoue
+        """
+        try:
+            from mangetamain_data_utils.data_utils_recipes import load_vocabulary
+        except ImportError as e:
+            logger.error(f"Module mangetamain_data_utils introuvable: {e}")
+            raise DataLoadError(
+                source="module mangetamain_data_utils",
+                detail=f"Module introuvable: {e}",
+            )
+
+        try:
+            logger.info(f"Chargement vocabulaire {col_name} depuis S3 (Parquet)")
+            vocabulary = load_vocabulary(col_name)
+            logger.info(f"Vocabulaire {col_name} chargé: {len(vocabulary)} termes")
+            return vocabulary
+        except Exception as e:
+            logger.error(f"Échec chargement vocabulaire {col_name} depuis S3: {e}")
+            raise DataLoadError(
+                source=f"S3 (vocab {col_name})",
+                detail=f"Échec chargement vocabulaire: {e}",
+            )
+
+    def load_daily_counts(self, year: Optional[int] = None) -> Any:
+        """Charge la table précalculée des comptages quotidiens.
+
+        Args:
+            year: Année à charger (toutes si None)
+
+        Returns:
+            DataFrame Polars (date, year, n_recipes, n_interactions, mean_rating)
+
+        Raises:
+            DataLoadError: Si le module est introuvable ou si le chargement échoue
+        """
+        try:
+            from mangetamain_data_utils.data_utils_daily import load_daily_counts
+        except ImportError as e:
+            logger.error(f"Module mangetamain_data_utils introuvable: {e}")
+            raise DataLoadError(
+                source="module mangetamain_data_utils",
+                detail=f"Module introuvable: {e}",
+            )
+
+        try:
+            logger.info(f"Chargement comptages quotidiens depuis S3 (année {year})")
+            daily = load_daily_counts(year)
+            logger.info(f"Comptages quotidiens chargés: {len(daily)} jours")
+            return daily
+        except Exception as e:
+            logger.error(f"Échec chargement comptages quotidiens depuis S3: {e}")
+            raise DataLoadError(
+                source="S3 (daily counts)",
+                detail=f"Échec chargement comptages quotidiens: {e}",
+            )
+
+    def load_recipe_stats(
+        self,
+        order_by: Optional[str] = None,
+        k: Optional[int] = None,
+        min_interactions: int = 0,
+    ) -> Any:
+        """Charge la table précalculée par recette, éventuellement le top-k.
+
+        Args:
+            order_by: Colonne de classement (ex. n_interactions, mean_rating),
+                None pour l'ordre des recipe_id
+            k: Nombre de recettes retournées (toutes si None)
+            min_interactions: Nombre minimal d'interactions par recette
+
+        Returns:
+            DataFrame Polars (recipe_id, name, minutes, n_steps, n_ingredients,
+            complexity_score, n_interactions, mean_rating, median_rating,
+            count_1..count_5, first_date, last_date)
+
+        Raises:
+            DataLoadError: Si le module est introuvable ou si le chargement échoue
+        """
+        try:
+            from mangetamain_data_utils.data_utils_recipe_stats import (
+                load_recipe_stats,
+            )
+        except ImportError as e:
+            logger.error(f"Module mangetamain_data_utils introuvable: {e}")
+            raise DataLoadError(
+                source="module mangetamain_data_utils",
+                detail=f"Module introuvable: {e}",
+            )
+
+        try:
+            logger.info(
+                f"Chargement statistiques par recette depuis S3 (tri {order_by}, k={k})"
+            )
+            stats = load_recipe_stats(order_by, k, min_interactions)
+            logger.info(f"Statistiques par recette chargées: {len(stats)} recettes")
+            return stats
+        except Exception as e:
+            logger.error(f"Échec chargement statistiques par recette depuis S3: {e}")
+            raise DataLoadError(
+                source="S3 (recipe stats)",
+                detail=f"Échec chargement statistiques par recette: {e}",
+            )
+
+    def load_clean_interactions(self) -> Any:
+        """Charge les interactions nettoyées et enrichies depuis S3.
+
+        Returns:
+            DataFrame Polars (une ligne par interaction notée 1-5, avec
+            year, month, season, is_weekend...)
+
+        Raises:
+            DataLoadError: Si le module est introuvable ou si le chargement échoue
+        """
+        try:
+            from mangetamain_data_utils.data_utils_ratings import (
+                load_clean_interactions,
+            )
+        except ImportError as e:
+            logger.error(f"Module mangetamain_data_utils introuvable: {e}")
+            raise DataLoadError(
+                source="module mangetamain_data_utils",
+                detail=f"Module introuvable: {e}",
+            )
+
+        try:
+            logger.info("Chargement interactions nettoyées depuis S3")
+            interactions = load_clean_interactions()
+            logger.info(f"Interactions chargées: {len(interactions)} lignes")
+            return interactions
+        except Exception as e:
+            logger.error(f"Échec chargement interactions depuis S3: {e}")
+            raise DataLoadError(
+                source="S3 (interactions)",
+                detail=f"Échec chargement interactions: {e}",
+            )
+
+    def load_user_stats(self) -> Any:
+        """Charge la table précalculée par utilisateur.
+
+        Returns:
+            DataFrame Polars (user_id, first_date, last_date, tenure_days,
+            n_ratings, mean_rating, rating_bias)
+
+        Raises:
+            DataLoadError: Si le module est introuvable ou si le chargement échoue
+        """
+        try:
+            from mangetamain_data_utils.data_utils_users import load_user_stats
+        except ImportError as e:
+            logger.error(f"Module mangetamain_data_utils introuvable: {e}")
+            raise DataLoadError(
+                source="module mangetamain_data_utils",
+                detail=f"Module introuvable: {e}",
+            )
+
+        try:
+            logger.info("Chargement statistiques utilisateurs depuis S3")
+            users = load_user_stats()
+            logger.info(
+                f"Statistiques utilisateurs chargées: {len(users)} utilisateurs"
+            )
+            return users
+        except Exception as e:
+            logger.error(f"Échec chargement statistiques utilisateurs depuis S3: {e}")
+            raise DataLoadError(
+                source="S3 (user stats)",
+                detail=f"Échec chargement statistiques utilisateurs: {e}",
+            )
+
+    def load_monthly_active_users(self) -> Any:
+        """Charge les comptes mensuels précalculés d'utilisateurs actifs.
+
+        Returns:
+            DataFrame Polars (month, n_active_users, n_new_users, n_interactions)
+
+        Raises:
+            DataLoadError: Si le module est introuvable ou si le chargement échoue
+        """
+        try:
+            from mangetamain_data_utils.data_utils_users import (
+                load_monthly_active_users,
+            )
+        except ImportError as e:
+            logger.error(f"Module mangetamain_data_utils introuvable: {e}")
+            raise DataLoadError(
+                source="module mangetamain_data_utils",
+                detail=f"Module introuvable: {e}",
+            )
+
+        try:
+            logger.info("Chargement utilisateurs actifs mensuels depuis S3")
+            monthly = load_monthly_active_users()
+            logger.info(f"Utilisateurs actifs mensuels chargés: {len(monthly)} mois")
+            return monthly
+        except Exception as e:
+            logger.error(f"Échec chargement utilisateurs actifs depuis S3: {e}")
+            raise DataLoadError(
+                source="S3 (monthly active users)",
+                detail=f"Échec chargement utilisateurs actifs: {e}",
+            )
+
+    def load_recipes_manifest(self) -> Any:
+        """Charge le manifeste du Parquet des recettes (sans lire les données).
+
+        Returns:
+            Dict (rows, bytes, content_hash, columns, date_ranges), voir
+            mangetamain_data_utils.data_utils_manifest.compute_manifest
+
+        Raises:
+            DataLoadError: Si le module est introuvable ou si le chargement échoue
+        """
+        try:
+            from mangetamain_data_utils.data_utils_manifest import load_manifest
+            from mangetamain_data_utils.data_utils_recipes import RECIPES_S3_PATH
+        except ImportError as e:
+            logger.error(f"Module mangetamain_data_utils introuvable: {e}")
+            raise DataLoadError(
+                source="module mangetamain_data_utils",
+                detail=f"Module introuvable: {e}",
+            )
+
+        try:
+            logger.info("Chargement manifeste recettes depuis S3")
+            manifest = load_manifest(RECIPES_S3_PATH)
+            logger.info(f"Manifeste recettes chargé: {manifest['rows']} lignes")
+            return manifest
+        except Exception as e:
+            logger.error(f"Échec chargement manifeste recettes depuis S3: {e}")
+            raise DataLoadError(
+                source="S3 (manifest)",
+                detail=f"Échec chargement manifeste: {e}",
+            )
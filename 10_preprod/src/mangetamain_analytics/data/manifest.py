@@ -0,0 +1,87 @@
+"""Métriques d'en-tête lues dans le manifeste des recettes.
+
+L'ETL publie à côté de chaque Parquet un manifeste JSON (lignes, bornes
+min/max par colonne, plages de dates, taille, empreinte). Les cartouches
+de la page Tendances en sont tirés en quelques millisecondes, sans charger
+les recettes. Si le manifeste est indisponible, les valeurs de la dernière
+publication connue sont affichées.
+"""
+
+from typing import Any, NamedTuple, Optional
+
+from loguru import logger
+
+from .cached_loaders import get_recipes_manifest
+from .loaders import DataLoadError
+
+
+class HeadlineMetrics(NamedTuple):
+    """Chiffres clés du jeu de recettes."""
+
+    n_recipes: int
+    first_year: int
+    last_year: int
+
+    @property
+    def n_years(self) -> int:
+        """Nombre d'années couvertes (bornes incluses)."""
+        return self.last_year - self.first_year + 1
+
+    @property
+    def period(self) -> str:
+        """Période affichée, ex. '1999-2018'."""
+        return f"{self.first_year}-{self.last_year}"
+
+
+# Valeurs de la dernière publication connue (manifeste indisponible)
+FALLBACK_METRICS = HeadlineMetrics(n_recipes=178265, first_year=1999, last_year=2018)
+
+
+def _year_bounds(manifest: dict[str, Any]) -> Optional[tuple[int, int]]:
+    """Années min/max : colonne year, sinon plage de la colonne date 'submitted'."""
+    year = manifest.get("columns", {}).get("year", {})
+    if year.get("min") is not None and year.get("max") is not None:
+        return int(year["min"]), int(year["max"])
+    submitted = manifest.get("date_ranges", {}).get("submitted")
+    if submitted and None not in submitted:
+        return int(str(submitted[0])[:4]), int(str(submitted[1])[:4])
+    return None
+
+
+def headline_metrics(manifest: dict[str, Any]) -> HeadlineMetrics:
+    """
+    Chiffres clés tirés d'un manifeste.
+
+    Args:
+        manifest: Manifeste du Parquet des recettes (voir l'ETL
+            data_utils_manifest.compute_manifest)
+
+    Returns:
+        HeadlineMetrics ; les champs absents du manifeste prennent les
+        valeurs de FALLBACK_METRICS
+    """
+    bounds = _year_bounds(manifest)
+    first_year, last_year = bounds or (
+        FALLBACK_METRICS.first_year,
+        FALLBACK_METRICS.last_year,
+    )
+    return HeadlineMetrics(
+        n_recipes=int(manifest.get("rows", FALLBACK_METRICS.n_recipes)),
+        first_year=first_year,
+        last_year=last_year,
+    )
+
+
+def recipes_headline() -> HeadlineMetrics:
+    """
+    Chiffres clés des recettes pour les cartouches de la page Tendances.
+
+    Returns:
+        HeadlineMetrics du manifeste en cache, FALLBACK_METRICS s'il est
+        indisponible
+    """
+    try:
+        return headline_metrics(get_recipes_manifest())
+    except DataLoadError as e:
+        logger.warning(f"Manifeste des recettes indisponible: {e}")
+        return FALLBACK_METRICS
@@ -0,0 +1,69 @@
+"""Helpers pour les colonnes liste encodées par dictionnaire (ingredients, tags).
+
+Le pipeline de nettoyage stocke 'ingredients' et 'tags' en List[UInt32]
+(ids d'un vocabulaire global publié à côté du Parquet final). Les analyses
+regroupent directement sur ces entiers et ne décodent en chaînes que les
+agrégats à afficher. Les données non encodées (List[String]) restent
+supportées : les termes sont alors normalisés à la volée.
+"""
+
+import polars as pl
+
+from .cached_loaders import get_vocabulary
+
+
+def is_encoded(df: pl.DataFrame, col_name: str) -> bool:
+    """Indique si une colonne (liste ou explosée) contient des ids entiers.
+
+    Args:
+        df: DataFrame Polars
+        col_name: Nom de la colonne
+
+    Returns:
+        True si la colonne est List[entier] ou entière
+    """
+    dtype = df.schema[col_name]
+    if isinstance(dtype, pl.List):
+        dtype = dtype.inner
+    return dtype.is_integer()
+
+
+def term_key(df: pl.DataFrame, col_name: str) -> pl.Expr:
+    """Expression de regroupement sur une colonne de termes explosée.
+
+    Args:
+        df: DataFrame contenant la colonne explosée
+        col_name: Nom de la colonne
+
+    Returns:
+        L'id tel quel si la colonne est encodée, sinon le terme normalisé
+        (minuscules, espaces retirés)
+    """
+    if is_encoded(df, col_name):
+        return pl.col(col_name)
+    return pl.col(col_name).str.to_lowercase().str.strip_chars()
+
+
+def decode_terms(df: pl.DataFrame, col_name: str, vocabulary: str) -> pl.DataFrame:
+    """Remplace les ids d'une colonne agrégée par les termes du vocabulaire.
+
+    Args:
+        df: Agrégat (une ligne par terme) issu d'un regroupement sur ids
+        col_name: Colonne contenant les ids
+        vocabulary: Nom du vocabulaire ('ingredients' ou 'tags')
+
+    Returns:
+        DataFrame avec la colonne en chaînes (inchangé si déjà décodé)
+    """
+    if not is_encoded(df, col_name):
+        return df
+
+    terms = get_vocabulary(vocabulary).select(
+        pl.col("id").cast(df.schema[col_name]).alias(col_name),
+        pl.col("term").alias("_term"),
+    )
+    return (
+        df.join(terms, on=col_name, how="left", maintain_order="left")
+        .with_columns(pl.col("_term").alias(col_name))
+        .drop("_term")
+    )
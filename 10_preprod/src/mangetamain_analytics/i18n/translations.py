@@ -12,6 +12,7 @@ Structure:
 - seasonality: Analyses saisonnières
 - weekend: Analyses effet jour/week-end
 - ratings: Analyses des notes et évaluations
+- pairings: Réseau d'associations d'ingrédients
 - seasons: Valeurs des saisons (données)
 - days: Valeurs des jours de la semaine (données)
 
@@ -34,6 +35,12 @@ TRANSLATIONS = {
         },
         "s3_ready": {"en": "S3 Ready", "fr": "S3 Ready"},
         "s3_error": {"en": "S3 Error", "fr": "S3 Error"},
+        "s3_checking": {"en": "S3 check…", "fr": "Vérification S3…"},
+        "show_section": {"en": "Show this analysis", "fr": "Afficher cette analyse"},
+        "section_deferred": {
+            "en": "Computed only when opened.",
+            "fr": "Calculée uniquement à l'ouverture.",
+        },
         "last_update": {"en": "Last update", "fr": "Dernière màj"},
         "version": {"en": "Version", "fr": "Version"},
         "documentation": {"en": "Documentation", "fr": "Documentation"},
@@ -223,6 +230,9 @@ TRANSLATIONS = {
         "seasonality": {"en": "Seasonal Analyses", "fr": "Analyses Saisonnières"},
         "weekend": {"en": "Day/Weekend Effect", "fr": "Effet Jour/Week-end"},
         "ratings": {"en": "Ratings Analyses", "fr": "Analyses Ratings"},
+        "pairings": {"en": "Ingredient Pairings", "fr": "Associations d'ingrédients"},
+        "users": {"en": "User Behaviour", "fr": "Comportement utilisateurs"},
+        "memory": {"en": "Memory (admin)", "fr": "Mémoire (admin)"},
     },
     # ===== TRENDS (analyse_trendlines_v2.py) =====
     "trends": {
@@ -239,7 +249,7 @@ sur la période 1999-2018, en utilisant des **régressions WLS (Weighted Least S
 pour identifier les évolutions significatives.""",
         },
         "metric_period": {"en": "Period", "fr": "Période"},
-        "metric_period_value": {"en": "20 years", "fr": "20 années"},
+        "metric_period_value": {"en": "{n} years", "fr": "{n} années"},
         "metric_recipes": {"en": "Recipes", "fr": "Recettes"},
         "metric_recipes_value": {"en": "Total analyzed", "fr": "Total analysées"},
         "metric_analyses": {"en": "Analyses", "fr": "Analyses"},
@@ -316,6 +326,21 @@ Les **tests de normalité** et les **Q-Q plots** montrent que la distribution du
 **nombre de recettes par an** **n'est pas parfaitement normale**, avec des **écarts visibles**
 par rapport à la **loi normale théorique**.""",
         },
+        "change_points_title": {
+            "en": "Detected regimes (PELT change points)",
+            "fr": "Régimes détectés (ruptures PELT)",
+        },
+        "change_points_caption": {
+            "en": "Segmentation of submission volumes minimizing within-segment variance plus a BIC-type penalty per change point (PELT). Dotted lines on the chart mark the start of each new regime.",
+            "fr": "Segmentation des volumes de soumission minimisant la variance intra-segment plus une pénalité de type BIC par rupture (PELT). Les lignes pointillées du graphique marquent le début de chaque nouveau régime.",
+        },
+        "col_segment": {"en": "Regime", "fr": "Régime"},
+        "col_start": {"en": "Start", "fr": "Début"},
+        "col_end": {"en": "End", "fr": "Fin"},
+        "col_period_mean": {
+            "en": "Mean recipes per period",
+            "fr": "Recettes moyennes par période",
+        },
         # Durée
         "duration_title": {"en": "Preparation Time", "fr": "Durée de préparation"},
         "duration_show_bubbles": {
@@ -555,6 +580,7 @@ in the **average complexity score** (slope = **{slope:+.4f}**, R² = **{r2:.2f}*
             "en": "Duration Evolution (minutes)",
             "fr": "Évolution de la durée (minutes)",
         },
+        "unit_min_per_year": {"en": "min/year", "fr": "min/an"},
         "info_blue_zone": {
             "fr": """💡 **Zone bleue ({quantile})** : Représente la dispersion des durées de recettes.
 
@@ -673,7 +699,7 @@ Cette **saisonnalité marquée** reflète les habitudes culinaires :
         },
         "nutrition_interpretation": {
             "en": """💡 **Statistical interpretation**
-The **Kruskal-Wallis tests** reveal **significant nutritional differences** between seasons (p < 0.05).
+**Permutation tests** (ANOVA F statistic, no normality assumption) reveal **significant nutritional differences** between seasons (p < 0.05).
 
 Recipes posted in **Autumn** are the most **caloric** (492 kcal on average)
 and rich in **fats**, **sugars**, and **saturated fats**.
@@ -685,7 +711,7 @@ with 446 kcal on average.
 - **Autumn/Winter:** Comforting, rich recipes (creamy soups, stews, pastries)
 - **Spring/Summer:** Fresh, light recipes (salads, grills, fruits)""",
             "fr": """💡 **Interprétation statistique**
-Les **tests de Kruskal-Wallis** révèlent des **différences nutritionnelles significatives** entre les saisons (p < 0.05).
+Les **tests par permutation** (statistique F de l'ANOVA, sans hypothèse de normalité) révèlent des **différences nutritionnelles significatives** entre les saisons (p < 0.05).
 
 Les recettes postées en **Automne** sont les plus **caloriques** (492 kcal en moyenne)
 et riches en **lipides**, **sucres** et **graisses saturées**.
@@ -704,7 +730,7 @@ avec 446 kcal en moyenne.
         },
         "ingredients_interpretation": {
             "en": """💡 **Statistical interpretation**
-The **Chi-squared tests** reveal **significant seasonal variability (p < 0.05)** among the most
+The **Chi-squared tests** reveal **significant seasonal variability (Benjamini-Hochberg q < 0.05)** among the most
 variable ingredients (**top 20**), confirming that **posted recipes clearly vary by season**.
 
 These differences reflect **marked culinary habits** and adaptation to **available products**
@@ -716,7 +742,7 @@ throughout the year.
 - **Winter:** Stews and soups
 - **Spring:** Renewal and spring vegetables""",
             "fr": """💡 **Interprétation statistique**
-Les **tests du Chi-2** révèlent une **variabilité saisonnière significative (p < 0.05)** parmi les ingrédients
+Les **tests du Chi-2** révèlent une **variabilité saisonnière significative (q de Benjamini-Hochberg < 0.05)** parmi les ingrédients
 les plus variables (**top 20**), confirmant que les **recettes postées varient clairement selon les saisons**.
 
 Ces différences traduisent des **habitudes culinaires marquées** et une adaptation aux **produits disponibles**
@@ -761,6 +787,69 @@ confirmant des **tendances cohérentes avec les périodes de l'année**.
 Ces différences confirment que les **recettes postées varient clairement selon les saisons**, en cohérence
 avec les événements calendaires et les habitudes culinaires saisonnières.""",
         },
+        # Décomposition STL
+        "decomposition_title": {
+            "en": "Monthly seasonal decomposition (STL)",
+            "fr": "Décomposition saisonnière mensuelle (STL)",
+        },
+        "decomposition_series": {"en": "Series", "fr": "Série"},
+        "decomposition_recipes": {
+            "en": "Recipe submissions",
+            "fr": "Recettes publiées",
+        },
+        "decomposition_interactions": {
+            "en": "Interactions (reviews)",
+            "fr": "Interactions (avis)",
+        },
+        "decomposition_unavailable": {
+            "en": "Not enough monthly data for a seasonal decomposition.",
+            "fr": "Données mensuelles insuffisantes pour une décomposition saisonnière.",
+        },
+        "component_observed": {"en": "Observed", "fr": "Observé"},
+        "component_trend": {"en": "Trend", "fr": "Tendance"},
+        "component_seasonal": {"en": "Seasonal", "fr": "Saisonnalité"},
+        "component_resid": {"en": "Residual", "fr": "Résidu"},
+        "seasonal_strength": {
+            "en": "Seasonal strength",
+            "fr": "Force saisonnière",
+        },
+        "usual_peak_month": {"en": "Usual peak month", "fr": "Mois de pic habituel"},
+        "amplitude_change": {
+            "en": "Relative amplitude {first} → {last}",
+            "fr": "Amplitude relative {first} → {last}",
+        },
+        "amplitude_chart_title": {
+            "en": "Seasonal amplitude by year (% of trend level)",
+            "fr": "Amplitude saisonnière par année (% du niveau de tendance)",
+        },
+        "relative_amplitude": {
+            "en": "Relative amplitude (%)",
+            "fr": "Amplitude relative (%)",
+        },
+        "decomposition_interpretation": {
+            "en": """💡 **Reading the decomposition**
+STL splits the monthly series into a **trend** (long-term level), a **seasonal** component
+re-estimated locally each year, and a **residual**. The seasonal strength (0 = none, 1 = pure
+seasonality) summarizes how much of the detrended variation is seasonal, and the amplitude
+chart shows whether the yearly cycle **grows or fades** relative to the activity level.""",
+            "fr": """💡 **Lecture de la décomposition**
+STL sépare la série mensuelle en une **tendance** (niveau de long terme), une composante
+**saisonnière** réestimée localement chaque année et un **résidu**. La force saisonnière
+(0 = aucune, 1 = saisonnalité pure) résume la part saisonnière des variations hors tendance,
+et le graphique d'amplitude montre si le cycle annuel **s'amplifie ou s'estompe** par rapport
+au niveau d'activité.""",
+        },
+        # Tests par permutation
+        "permutation_expander": {
+            "en": "🎲 Permutation tests by nutrient",
+            "fr": "🎲 Tests par permutation par nutriment",
+        },
+        "col_nutrient": {"en": "Nutrient", "fr": "Nutriment"},
+        "col_p_perm": {"en": "Permutation p-value", "fr": "p-value (permutation)"},
+        "permutation_caption": {
+            "en": "One-way ANOVA F statistic compared with 999 random permutations of the seasons (fixed seed): the p-value makes no assumption about the distribution of nutritional values.",
+            "fr": "Statistique F de l'ANOVA comparée à 999 permutations aléatoires des saisons (graine fixe) : la p-value ne fait aucune hypothèse sur la loi des valeurs nutritionnelles.",
+        },
         # Metric labels
         "season_most_steps": {
             "en": "{season} (+ complex)",
@@ -862,11 +951,11 @@ La complexité des recettes publiées reste **constante indépendamment de la p
         "nutrition_title": {"en": "Nutritional profile", "fr": "Profil nutritionnel"},
         "nutrition_interpretation": {
             "en": """💡 **Statistical interpretation**
-**Student's t-tests** reveal **globally similar nutritional profiles**
+**Permutation tests** (no normality assumption) reveal **globally similar nutritional profiles**
 between Weekday and Weekend.
 Only one significant difference emerges: **proteins** (p < 0.01), with slightly more protein-rich recipes published during the week (about -3% on weekends).""",
             "fr": """💡 **Interprétation statistique**
-Les **tests t de Student** révèlent des **profils nutritionnels globalement similaires**
+Les **tests par permutation** (sans hypothèse de normalité) révèlent des **profils nutritionnels globalement similaires**
 entre Weekday et Weekend.
 Une seule différence significative émerge: les **protéines** (p < 0.01), avec des recettes publiées légèrement plus protéinées en semaine (environ -3% le week-end).""",
         },
@@ -878,44 +967,48 @@ Une seule différence significative émerge: les **protéines** (p < 0.01), avec
         "ingredients_interpretation": {
             "en": """💡 **Statistical interpretation**
 Out of all ingredients analyzed, a **strict filtering** was applied
-to keep only ingredients with frequency ≥ 1%, absolute difference ≥ 0.2pp, and statistical significance (p < 0.05).
+to keep only ingredients with frequency ≥ 1%, absolute difference ≥ 0.2pp, and statistical significance
+(Benjamini-Hochberg q < 0.05, controlling false discoveries across all ingredients tested).
 
 **Chi-squared tests** identify few ingredients with significant variations depending on posting time
-(weekday vs weekend). **Weekend**: slight increase for `ground cinnamon`, `canola oil`.
-**Weekday**: slight increase for `mozzarella cheese`, `boneless skinless chicken breasts`, `honey`.
+(weekday vs weekend). **Weekend**: slight increase for {weekend}.
+**Weekday**: slight increase for {weekday}.
 
-**Gaps remain small (<0.4pp) and interpretation is debatable.**""",
+**Gaps remain small (≤ {max_gap:.2f}pp) and interpretation is debatable.**""",
             "fr": """💡 **Interprétation statistique**
 Sur tous les ingrédients analysés, un **filtrage strict** a été appliqué
-pour ne conserver que les ingrédients avec fréquence ≥ 1%, différence absolue ≥ 0.2pp, et significativité statistique (p < 0.05).
+pour ne conserver que les ingrédients avec fréquence ≥ 1%, différence absolue ≥ 0.2pp, et significativité statistique
+(q de Benjamini-Hochberg < 0.05, qui contrôle les fausses découvertes sur l'ensemble des ingrédients testés).
 
 Les tests **Chi-2** identifient peu d'ingrédients avec variations significatives selon le moment posté
-(weekday vs weekend). **Week-end**: légère hausse pour `ground cinnamon`, `canola oil`.
-**Semaine**: légère hausse pour `mozzarella cheese`, `boneless skinless chicken breasts`, `honey`.
+(weekday vs weekend). **Week-end**: légère hausse pour {weekend}.
+**Semaine**: légère hausse pour {weekday}.
 
-**Les écarts restent faibles (<0.4pp) et l'interprétation est sujette à débat.**""",
+**Les écarts restent faibles (≤ {max_gap:.2f}pp) et l'interprétation est sujette à débat.**""",
         },
         # Tags
         "tags_title": {"en": "Most variable tags", "fr": "Tags les plus variables"},
         "tags_interpretation": {
             "en": """💡 **Statistical interpretation**
 Out of all tags analyzed, a **strict filtering** was applied
-to keep only tags with frequency ≥ 1%, absolute difference ≥ 0.2pp, and statistical significance (p < 0.05).
+to keep only tags with frequency ≥ 1%, absolute difference ≥ 0.2pp, and statistical significance
+(Benjamini-Hochberg q < 0.05, controlling false discoveries across all tags tested).
 
 **Chi-squared tests** reveal significant differences on few tags.
-**Weekend (+)**: `vegetarian`, `christmas`, `from-scratch`, `breakfast`, `eggs`.
-**Weekday (−)**: `one-dish-meal`, `beginner-cook`, `mexican`.
+**Weekend (+)**: {weekend}.
+**Weekday (−)**: {weekday}.
 
-**Gaps remain small (<0.5pp) and interpretation is debatable.**""",
+**Gaps remain small (≤ {max_gap:.2f}pp) and interpretation is debatable.**""",
             "fr": """💡 **Interprétation statistique**
 Sur tous les tags analysés, un **filtrage strict** a été appliqué
-pour ne conserver que les tags avec fréquence ≥ 1%, différence absolue ≥ 0.2pp, et significativité statistique (p < 0.05).
+pour ne conserver que les tags avec fréquence ≥ 1%, différence absolue ≥ 0.2pp, et significativité statistique
+(q de Benjamini-Hochberg < 0.05, qui contrôle les fausses découvertes sur l'ensemble des tags testés).
 
 Les **tests Chi-2** révèlent des différences significatives sur peu de tags.
-**Week-end (+)**: `vegetarian`, `christmas`, `from-scratch`, `breakfast`, `eggs`.
-**Semaine (−)**: `one-dish-meal`, `beginner-cook`, `mexican`.
+**Week-end (+)**: {weekend}.
+**Semaine (−)**: {weekday}.
 
-**Les écarts restent faibles (<0.5pp) et l'interprétation est sujette à débat.**""",
+**Les écarts restent faibles (≤ {max_gap:.2f}pp) et l'interprétation est sujette à débat.**""",
         },
         # Stats labels for regression details
         "stat_slope": {
@@ -1184,6 +1277,72 @@ The weighted volume-quality correlation (ρ={corr:.3f}) indicates {interpretatio
 
 **Conclusion**: {conclusion}""",
         },
+        # Calendrier quotidien
+        "calendar_title": {
+            "en": "Daily calendar",
+            "fr": "Calendrier quotidien",
+        },
+        "calendar_year": {
+            "en": "Year",
+            "fr": "Année",
+        },
+        "calendar_metric": {
+            "en": "Metric",
+            "fr": "Métrique",
+        },
+        "calendar_metric_n_recipes": {
+            "en": "Recipes",
+            "fr": "Recettes",
+        },
+        "calendar_metric_n_interactions": {
+            "en": "Interactions",
+            "fr": "Interactions",
+        },
+        "calendar_metric_mean_rating": {
+            "en": "Mean rating",
+            "fr": "Note moyenne",
+        },
+        "calendar_active_days": {
+            "en": "Active days",
+            "fr": "Jours actifs",
+        },
+        "calendar_daily_mean": {
+            "en": "Daily mean",
+            "fr": "Moyenne quotidienne",
+        },
+        "calendar_peak_day": {
+            "en": "Peak day: {day}",
+            "fr": "Jour max : {day}",
+        },
+        "calendar_chart_title": {
+            "en": "Daily activity - {year}",
+            "fr": "Activité quotidienne - {year}",
+        },
+        "calendar_interpretation": {
+            "en": """💡 **Reading the calendar**
+Each cell is one day (rows = days of the week, columns = weeks). The weekday/weekend pattern
+appears as lighter Saturday and Sunday rows, and holidays or site events stand out as isolated cells.
+The values come from a daily table computed once in the ETL: displaying a year only reads its ~365 rows.""",
+            "fr": """💡 **Lecture du calendrier**
+Chaque case est un jour (lignes = jours de la semaine, colonnes = semaines). L'effet semaine/week-end
+apparaît sous forme de lignes samedi et dimanche plus claires ; jours fériés et événements du site ressortent en cases isolées.
+Les valeurs proviennent d'une table quotidienne calculée une fois dans l'ETL : afficher une année ne lit que ses ~365 lignes.""",
+        },
+        # Tests par permutation
+        "permutation_expander": {
+            "en": "🎲 Distribution-free tests (permutation and bootstrap)",
+            "fr": "🎲 Tests sans hypothèse de loi (permutation et bootstrap)",
+        },
+        "col_nutrient": {"en": "Nutrient", "fr": "Nutriment"},
+        "col_diff": {"en": "Weekend - Weekday", "fr": "Weekend - Weekday"},
+        "col_ci_low": {"en": "95% CI low", "fr": "IC 95% bas"},
+        "col_ci_high": {"en": "95% CI high", "fr": "IC 95% haut"},
+        "col_p_ttest": {"en": "Student p-value", "fr": "p-value (Student)"},
+        "col_p_perm": {"en": "Permutation p-value", "fr": "p-value (permutation)"},
+        "permutation_caption": {
+            "en": "Difference of means compared with 999 random permutations of the Weekday/Weekend labels; the 95% interval comes from 999 bootstrap resamples of each period (fixed seed). Significance markers (*) use the permutation p-value.",
+            "fr": "Différence de moyennes comparée à 999 permutations aléatoires des étiquettes Weekday/Weekend ; l'intervalle à 95% provient de 999 rééchantillonnages bootstrap de chaque période (graine fixe). Les marqueurs de significativité (*) utilisent la p-value de permutation.",
+        },
         # Metric labels
         "complexity_weekday": {
             "en": "Weekday (Mon-Fri)",
@@ -1232,6 +1391,28 @@ entre les notes et les caractéristiques des recettes.""",
             "en": "Seasonal Variations",
             "fr": "Variations saisonnières",
         },
+        "notes_complexite": {
+            "en": "Ratings and Complexity",
+            "fr": "Notes et complexité",
+        },
+        # Notes et complexité des recettes (table par recette)
+        "complexity_desc": {
+            "en": "Mean rating by **recipe complexity decile** (`complexity_score`), over recipes with at least {min_ratings} ratings. The {n_bins} classes hold the same number of recipes; error bars are 95% confidence intervals.",
+            "fr": "Rating moyen par **décile de complexité** des recettes (`complexity_score`), sur les recettes d'au moins {min_ratings} notes. Les {n_bins} classes ont le même nombre de recettes ; les barres d'erreur sont des IC à 95 %.",
+        },
+        "complexity_axis": {
+            "en": "Complexity score (decile range)",
+            "fr": "Score de complexité (bornes du décile)",
+        },
+        "complexity_hover": {
+            "en": "%{customdata[0]} recipes, %{customdata[1]:,} ratings",
+            "fr": "%{customdata[0]} recettes, %{customdata[1]:,} notes",
+        },
+        "complexity_recipes": {"en": "Recipes", "fr": "Recettes"},
+        "complexity_interpretation": {
+            "en": "📊 **Interpretation**: weighted Spearman correlation between complexity and mean rating ρ = {rho:.3f}; gap between deciles {gap:.3f} stars (ANOVA F = {f_stat:.2f}, p = {p_anova:.2e}). With this many ratings even a small gap is significant: the effect size matters more than p.",
+            "fr": "📊 **Interprétation** : corrélation de Spearman pondérée entre complexité et rating moyen ρ = {rho:.3f} ; écart entre déciles {gap:.3f} étoile (ANOVA F = {f_stat:.2f}, p = {p_anova:.2e}). Avec autant de notes, même un faible écart est significatif : la taille d'effet compte plus que p.",
+        },
         # Descriptions
         "ratings_methodology_desc": {
             "en": "Comparison of **weighted** vs **unweighted** methods for analyzing rating evolution over time. This analysis demonstrates the importance of weighting by interaction volume.",
@@ -1352,6 +1533,42 @@ entre les notes et les caractéristiques des recettes.""",
             "en": "View detailed statistics",
             "fr": "Voir les statistiques détaillées",
         },
+        "mann_kendall_expander": {
+            "en": "Non-parametric trend tests (Mann-Kendall, Sen's slope)",
+            "fr": "Tests de tendance non paramétriques (Mann-Kendall, pente de Sen)",
+        },
+        "mann_kendall_caption": {
+            "en": "Mann-Kendall test with tie correction and Sen's slope (median of pairwise slopes), unweighted: robust to outliers and free of any linearity assumption.",
+            "fr": "Test de Mann-Kendall avec correction des ex-aequo et pente de Sen (médiane des pentes deux à deux), non pondérés : robustes aux valeurs extrêmes et sans hypothèse de linéarité.",
+        },
+        "col_series": {"en": "Series", "fr": "Série"},
+        "col_sen_slope": {"en": "Sen's slope / month", "fr": "Pente de Sen / mois"},
+        "col_trend": {"en": "Trend", "fr": "Tendance"},
+        "trend_increasing": {"en": "Increasing", "fr": "Hausse"},
+        "trend_decreasing": {"en": "Decreasing", "fr": "Baisse"},
+        "trend_none": {"en": "No trend", "fr": "Pas de tendance"},
+        "correlation_expander": {
+            "en": "Weighted correlations of the average rating (Spearman, Pearson, Kendall)",
+            "fr": "Corrélations pondérées du rating moyen (Spearman, Pearson, Kendall)",
+        },
+        "correlation_caption": {
+            "en": "Each month is weighted by the square root of its volume; Kendall weights each pair of months by the product of their weights.",
+            "fr": "Chaque mois est pondéré par la racine de son volume ; Kendall pondère chaque paire de mois par le produit de leurs poids.",
+        },
+        "col_variable": {"en": "Variable", "fr": "Variable"},
+        "time_months": {"en": "Time (months)", "fr": "Temps (mois)"},
+        "change_points_ratings_caption": {
+            "en": "Dotted lines: regime changes (PELT change points) of the average rating and of the interaction volume.",
+            "fr": "Lignes pointillées : changements de régime (ruptures PELT) du rating moyen et du volume d'interactions.",
+        },
+        "legend_bootstrap_ci": {
+            "fr": "IC 95 % bootstrap (par mois)",
+            "en": "95% bootstrap CI (per month)",
+        },
+        "bootstrap_ci_caption": {
+            "en": "Shaded band: 95% confidence interval of each month's average rating, from 999 bootstrap resamples of its 1-5 rating histogram (multinomial draws).",
+            "fr": "Bande colorée : intervalle de confiance à 95 % du rating moyen de chaque mois, par 999 rééchantillonnages bootstrap de son histogramme de notes 1-5 (tirages multinomiaux).",
+        },
         # Graph titles
         "temporal_evolution_overview": {
             "fr": "Évolution temporelle - Vue d'ensemble",
@@ -1453,6 +1670,159 @@ The **Coefficient of Variation ({cv_volumes:.3f})** and **max/min ratio ({ratio_
 indicating that no season unduly weighs on the analysis. Comparisons between seasons will therefore be **reliable and robust**.""",
         },
     },
+    # ===== PAIRINGS (analyse_pairings.py) =====
+    "pairings": {
+        "main_title": {
+            "en": "Ingredient Pairing Network",
+            "fr": "Réseau d'associations d'ingrédients",
+        },
+        "main_description": {
+            "en": """This section answers the question **"what goes with what?"** from the ingredient lists of Food.com recipes.
+
+Pairs are **precomputed** (co-occurrences, minimum support, best neighbors by **lift**) and tracked season by season.""",
+            "fr": """Cette section répond à la question **« qu'est-ce qui va avec quoi ? »** à partir des listes d'ingrédients des recettes Food.com.
+
+Les paires sont **précalculées** (co-occurrences, support minimum, meilleurs voisins par **lift**) et suivies saison par saison.""",
+        },
+        "select_ingredient": {"en": "🥕 Ingredient", "fr": "🥕 Ingrédient"},
+        "metric_ingredients": {"en": "Ingredients", "fr": "Ingrédients"},
+        "metric_edges": {"en": "Pairs", "fr": "Paires"},
+        "metric_neighbors": {"en": "Neighbors", "fr": "Voisins"},
+        "neighbors_title": {"en": "Best pairings", "fr": "Meilleures associations"},
+        "neighbors_chart_title": {
+            "en": "Top {n} pairings for « {ingredient} »",
+            "fr": "Top {n} associations pour « {ingredient} »",
+        },
+        "lift_axis": {
+            "en": "Lift (co-occurrence / independence)",
+            "fr": "Lift (co-occurrence / indépendance)",
+        },
+        "recipes_label": {"en": "Recipes", "fr": "Recettes"},
+        "seasons_title": {"en": "Seasonal shifts", "fr": "Glissements saisonniers"},
+        "seasons_chart_title": {
+            "en": "Seasonal support vs overall support (%)",
+            "fr": "Support saisonnier vs support global (%)",
+        },
+        "shift_label": {"en": "Shift", "fr": "Écart"},
+        "lift_interpretation": {
+            "en": """💡 **Reading the lift**
+A lift **above 1** means both ingredients appear together more often than if they were independent.
+Only pairs present in enough recipes (**minimum support**) are kept.""",
+            "fr": """💡 **Lecture du lift**
+Un lift **supérieur à 1** signifie que les deux ingrédients apparaissent ensemble plus souvent que s'ils étaient indépendants.
+Seules les paires présentes dans suffisamment de recettes (**support minimum**) sont conservées.""",
+        },
+        "no_pairs": {
+            "en": "⚠️ No precomputed pairing for this ingredient.",
+            "fr": "⚠️ Aucune association précalculée pour cet ingrédient.",
+        },
+    },
+    # ===== USERS (analyse_users.py) =====
+    "users": {
+        "main_title": {
+            "en": "User Behaviour",
+            "fr": "Comportement des utilisateurs",
+        },
+        "main_description": {
+            "en": "Activity of Food.com users, computed once by the ETL into a per-user table (first/last rating, number of ratings, mean rating, rating bias) and monthly active-user counts.",
+            "fr": "Activité des utilisateurs Food.com, calculée une fois par l'ETL dans une table par utilisateur (première/dernière note, nombre de notes, note moyenne, biais de notation) et des comptes mensuels d'utilisateurs actifs.",
+        },
+        "activity_title": {
+            "en": "Ratings per user",
+            "fr": "Notes par utilisateur",
+        },
+        "activity_chart_title": {
+            "en": "Users and ratings by activity level",
+            "fr": "Utilisateurs et notes par niveau d'activité",
+        },
+        "activity_axis": {
+            "en": "Number of ratings per user",
+            "fr": "Nombre de notes par utilisateur",
+        },
+        "pct_users": {"en": "% of users", "fr": "% des utilisateurs"},
+        "pct_ratings": {"en": "% of ratings", "fr": "% des notes"},
+        "metric_users": {"en": "Users", "fr": "Utilisateurs"},
+        "metric_median_ratings": {
+            "en": "Median ratings / user",
+            "fr": "Notes médianes / utilisateur",
+        },
+        "metric_one_timers": {
+            "en": "Single-rating users",
+            "fr": "Utilisateurs à une note",
+        },
+        "activity_interpretation": {
+            "en": "💡 **{pct:.1f}%** of users left a single rating: most of the activity comes from a small core of regular users.",
+            "fr": "💡 **{pct:.1f}%** des utilisateurs n'ont laissé qu'une seule note : l'essentiel de l'activité vient d'un petit noyau d'habitués.",
+        },
+        "concentration_title": {
+            "en": "Power-user concentration",
+            "fr": "Concentration sur les power users",
+        },
+        "concentration_chart_title": {
+            "en": "Lorenz curve of ratings per user",
+            "fr": "Courbe de Lorenz des notes par utilisateur",
+        },
+        "lorenz_curve": {"en": "Lorenz curve", "fr": "Courbe de Lorenz"},
+        "equality_line": {"en": "Perfect equality", "fr": "Égalité parfaite"},
+        "lorenz_x_axis": {
+            "en": "Share of users, least to most active (%)",
+            "fr": "Part des utilisateurs, du moins au plus actif (%)",
+        },
+        "lorenz_y_axis": {
+            "en": "Cumulative share of ratings (%)",
+            "fr": "Part cumulée des notes (%)",
+        },
+        "metric_top_1": {
+            "en": "Ratings by top 1%",
+            "fr": "Notes du top 1 %",
+        },
+        "metric_top_10": {
+            "en": "Ratings by top 10%",
+            "fr": "Notes du top 10 %",
+        },
+        "concentration_interpretation": {
+            "en": "💡 The most active 1% of users account for **{top_1:.1f}%** of all ratings, the top 10% for **{top_10:.1f}%** (Gini = {gini:.2f}).",
+            "fr": "💡 Le 1 % d'utilisateurs les plus actifs totalise **{top_1:.1f}%** des notes, le top 10 % **{top_10:.1f}%** (Gini = {gini:.2f}).",
+        },
+        "monthly_title": {
+            "en": "Monthly active users",
+            "fr": "Utilisateurs actifs par mois",
+        },
+        "monthly_chart_title": {
+            "en": "Active and new users per month",
+            "fr": "Utilisateurs actifs et nouveaux par mois",
+        },
+        "active_users": {"en": "Active users", "fr": "Utilisateurs actifs"},
+        "new_users": {"en": "New users", "fr": "Nouveaux utilisateurs"},
+        "users_axis": {"en": "Users", "fr": "Utilisateurs"},
+        "metric_peak_month": {"en": "Peak month", "fr": "Mois record"},
+        "metric_peak_users": {
+            "en": "Active users at peak",
+            "fr": "Utilisateurs actifs au pic",
+        },
+        "bias_title": {"en": "Rating bias", "fr": "Biais de notation"},
+        "bias_chart_title": {
+            "en": "Mean rating bias of users with at least {n} ratings",
+            "fr": "Biais moyen des utilisateurs ayant au moins {n} notes",
+        },
+        "bias_axis": {
+            "en": "Rating − mean of other ratings of the recipe",
+            "fr": "Note − moyenne des autres notes de la recette",
+        },
+        "metric_median_bias": {"en": "Median bias", "fr": "Biais médian"},
+        "metric_stricter": {
+            "en": "Stricter than others",
+            "fr": "Plus sévères que les autres",
+        },
+        "bias_interpretation": {
+            "en": "💡 The bias compares each rating with the mean of the other users' ratings on the same recipe: a negative bias marks a stricter user. Recipes rated by a single user are ignored.",
+            "fr": "💡 Le biais compare chaque note à la moyenne des notes des autres utilisateurs sur la même recette : un biais négatif signale un utilisateur plus sévère. Les recettes notées par un seul utilisateur sont ignorées.",
+        },
+        "no_users": {
+            "en": "⚠️ No precomputed user data available.",
+            "fr": "⚠️ Aucune donnée utilisateur précalculée disponible.",
+        },
+    },
     # ===== SEASONS (valeurs des saisons - données) =====
     "seasons": {
         "winter": {"en": "Winter", "fr": "Hiver"},
@@ -1478,4 +1848,65 @@ indicating that no season unduly weighs on the analysis. Comparisons between sea
         "sat": {"en": "Sat", "fr": "Sam"},
         "sun": {"en": "Sun", "fr": "Dim"},
     },
+    # ===== MONTHS (valeurs des mois - données) =====
+    "months": {
+        "january": {"en": "January", "fr": "Janvier"},
+        "february": {"en": "February", "fr": "Février"},
+        "march": {"en": "March", "fr": "Mars"},
+        "april": {"en": "April", "fr": "Avril"},
+        "may": {"en": "May", "fr": "Mai"},
+        "june": {"en": "June", "fr": "Juin"},
+        "july": {"en": "July", "fr": "Juillet"},
+        "august": {"en": "August", "fr": "Août"},
+        "september": {"en": "September", "fr": "Septembre"},
+        "october": {"en": "October", "fr": "Octobre"},
+        "november": {"en": "November", "fr": "Novembre"},
+        "december": {"en": "December", "fr": "Décembre"},
+        # Abréviations (pour les graphiques)
+        "jan": {"en": "Jan", "fr": "Janv"},
+        "feb": {"en": "Feb", "fr": "Févr"},
+        "mar": {"en": "Mar", "fr": "Mars"},
+        "apr": {"en": "Apr", "fr": "Avr"},
+        "may_short": {"en": "May", "fr": "Mai"},
+        "jun": {"en": "Jun", "fr": "Juin"},
+        "jul": {"en": "Jul", "fr": "Juil"},
+        "aug": {"en": "Aug", "fr": "Août"},
+        "sep": {"en": "Sep", "fr": "Sept"},
+        "oct": {"en": "Oct", "fr": "Oct"},
+        "nov": {"en": "Nov", "fr": "Nov"},
+        "dec": {"en": "Dec", "fr": "Déc"},
+    },
+    # ===== MEMORY (admin_memory.py) =====
+    "memory": {
+        "main_title": {"en": "Memory usage", "fr": "Utilisation mémoire"},
+        "main_description": {
+            "en": "Memory held by the process, the bounded caches (shared across sessions) and each active session's state. Limits are set with the APP_CACHE_MAX_MB, APP_FIGURE_CACHE_MAX_MB and APP_SESSION_MAX_MB environment variables.",
+            "fr": "Mémoire occupée par le processus, les caches bornés (partagés entre sessions) et l'état de chaque session active. Les limites se règlent par les variables d'environnement APP_CACHE_MAX_MB, APP_FIGURE_CACHE_MAX_MB et APP_SESSION_MAX_MB.",
+        },
+        "metric_rss": {"en": "Process (RSS)", "fr": "Processus (RSS)"},
+        "metric_caches": {"en": "Caches", "fr": "Caches"},
+        "metric_sessions": {"en": "Active sessions", "fr": "Sessions actives"},
+        "metric_sessions_mb": {"en": "Session state", "fr": "État des sessions"},
+        "caches_title": {"en": "Bounded caches", "fr": "Caches bornés"},
+        "no_caches": {
+            "en": "No cache populated yet.",
+            "fr": "Aucun cache rempli pour l'instant.",
+        },
+        "clear_caches": {"en": "Clear caches", "fr": "Vider les caches"},
+        "sessions_title": {"en": "Sessions", "fr": "Sessions"},
+        "sessions_caption": {
+            "en": "Size of st.session_state per session, measured at each rerun (alert above {limit} MB).",
+            "fr": "Taille de st.session_state par session, mesurée à chaque rerun (alerte au-delà de {limit} Mo).",
+        },
+        "col_cache": {"en": "Cache", "fr": "Cache"},
+        "col_entries": {"en": "Entries", "fr": "Entrées"},
+        "col_mb": {"en": "MB", "fr": "Mo"},
+        "col_limit_mb": {"en": "Limit (MB)", "fr": "Limite (Mo)"},
+        "col_hit_rate": {"en": "Hit rate", "fr": "Taux de succès"},
+        "col_evictions": {"en": "Evictions", "fr": "Évictions"},
+        "col_session": {"en": "Session", "fr": "Session"},
+        "col_keys": {"en": "Keys", "fr": "Clés"},
+        "col_idle_s": {"en": "Idle (s)", "fr": "Inactivité (s)"},
+        "col_over_budget": {"en": "Alert", "fr": "Alerte"},
+    },
 }
@@ -5,33 +5,56 @@ Data is loaded from S3 Parquet files via mangetamain_data_utils package.
 """
 
 import streamlit as st
-import pandas as pd
 from pathlib import Path
 from loguru import logger
 import sys
-import plotly.express as px
 from utils.environment import EnvironmentDetector
+from utils.memory import admin_allowed, clear_caches, record_session
+from utils.s3_health import S3HealthMonitor
+from utils.sections import Section, render_sections
 from i18n import init_language, render_language_selector
 from utils.i18n_helper import t
-from visualization.custom_charts import (
-    create_correlation_heatmap,
-    create_distribution_plot,
-    create_time_series_plot,
-    create_custom_scatter_plot,
+from utils.lazy_import import lazy_function
+from utils.color_theme import ColorTheme
+from exceptions import DatabaseError, AnalysisError
+
+# Pages d'analyse importées à leur première ouverture (statsmodels, scipy,
+# pandas, polars... hors du démarrage de l'application)
+_CUSTOM_CHARTS = "visualization.custom_charts"
+create_correlation_heatmap = lazy_function(_CUSTOM_CHARTS, "create_correlation_heatmap")
+create_distribution_plot = lazy_function(_CUSTOM_CHARTS, "create_distribution_plot")
+create_time_series_plot = lazy_function(_CUSTOM_CHARTS, "create_time_series_plot")
+create_custom_scatter_plot = lazy_function(_CUSTOM_CHARTS, "create_custom_scatter_plot")
+
+_TRENDLINES = "visualization.analyse_trendlines_v2"
+analyse_trendline_volume = lazy_function(_TRENDLINES, "analyse_trendline_volume")
+analyse_trendline_duree = lazy_function(_TRENDLINES, "analyse_trendline_duree")
+analyse_trendline_complexite = lazy_function(
+    _TRENDLINES, "analyse_trendline_complexite"
 )
-from visualization.analyse_trendlines_v2 import (
-    analyse_trendline_volume,
-    analyse_trendline_duree,
-    analyse_trendline_complexite,
-    analyse_trendline_nutrition,
-    analyse_trendline_ingredients,
-    analyse_trendline_tags,
+analyse_trendline_nutrition = lazy_function(_TRENDLINES, "analyse_trendline_nutrition")
+analyse_trendline_ingredients = lazy_function(
+    _TRENDLINES, "analyse_trendline_ingredients"
 )
-from visualization.analyse_seasonality import render_seasonality_analysis
-from visualization.analyse_weekend import render_weekend_analysis
-from visualization.analyse_ratings import render_ratings_analysis
-from utils.color_theme import ColorTheme
-from exceptions import DataLoadError, DatabaseError, AnalysisError, ConfigurationError
+analyse_trendline_tags = lazy_function(_TRENDLINES, "analyse_trendline_tags")
+
+render_seasonality_analysis = lazy_function(
+    "visualization.analyse_seasonality", "render_seasonality_analysis"
+)
+render_weekend_analysis = lazy_function(
+    "visualization.analyse_weekend", "render_weekend_analysis"
+)
+render_ratings_analysis = lazy_function(
+    "visualization.analyse_ratings", "render_ratings_analysis"
+)
+render_pairings_analysis = lazy_function(
+    "visualization.analyse_pairings", "render_pairings_analysis"
+)
+render_users_analysis = lazy_function(
+    "visualization.analyse_users", "render_users_analysis"
+)
+render_memory_admin = lazy_function("visualization.admin_memory", "render_memory_admin")
+recipes_headline = lazy_function("data.manifest", "recipes_headline")
 
 # Configuration des chemins relatifs (fonctionne en PREPROD et PROD)
 SCRIPT_DIR = Path(__file__).parent
@@ -47,6 +70,7 @@ def create_nav_option_with_icon(icon_name, text) -> str:
         "sun": '<svg xmlns="http://www.w3.org/2000/svg" width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><circle cx="12" cy="12" r="4"/><path d="M12 2v2"/><path d="M12 20v2"/><path d="m4.93 4.93 1.41 1.41"/><path d="m17.66 17.66 1.41 1.41"/><path d="M2 12h2"/><path d="M20 12h2"/><path d="m6.34 17.66-1.41 1.41"/><path d="m19.07 4.93-1.41 1.41"/></svg>',
         "sparkles": '<svg xmlns="http://www.w3.org/2000/svg" width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="m12 3-1.912 5.813a2 2 0 0 1-1.275 1.275L3 12l5.813 1.912a2 2 0 0 1 1.275 1.275L12 21l1.912-5.813a2 2 0 0 1 1.275-1.275L21 12l-5.813-1.912a2 2 0 0 1-1.275-1.275L12 3Z"/><path d="M5 3v4"/><path d="M19 17v4"/><path d="M3 5h4"/><path d="M17 19h4"/></svg>',
         "bar-chart-2": '<svg xmlns="http://www.w3.org/2000/svg" width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><line x1="18" x2="18" y1="20" y2="10"/><line x1="12" x2="12" y1="20" y2="4"/><line x1="6" x2="6" y1="20" y2="14"/></svg>',
+        "users": '<svg xmlns="http://www.w3.org/2000/svg" width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M16 21v-2a4 4 0 0 0-4-4H6a4 4 0 0 0-4 4v2"/><circle cx="9" cy="7" r="4"/><path d="M22 21v-2a4 4 0 0 0-3-3.87"/><path d="M16 3.13a4 4 0 0 1 0 7.75"/></svg>',
         "refresh-cw": '<svg xmlns="http://www.w3.org/2000/svg" width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M3 12a9 9 0 0 1 9-9 9.75 9.75 0 0 1 6.74 2.74L21 8"/><path d="M21 3v5h-5"/><path d="M21 12a9 9 0 0 1-9 9 9.75 9.75 0 0 1-6.74-2.74L3 16"/><path d="M8 16H3v5"/></svg>',
     }
 
@@ -54,6 +78,18 @@ def create_nav_option_with_icon(icon_name, text) -> str:
     return f'<div style="display: flex; align-items: center; gap: 10px;">{icon_svg}<span>{text}</span></div>'
 
 
+def render_trends_ingredients() -> None:
+    """Section Ingrédients de la page Tendances (top 10)."""
+    st.info(f"💡 {t('ingredients_info', category='trends')}")
+    analyse_trendline_ingredients(top_n=10)
+
+
+def render_trends_tags() -> None:
+    """Section Tags de la page Tendances (top 10)."""
+    st.info(f"💡 {t('tags_info', category='trends')}")
+    analyse_trendline_tags(top_n=10)
+
+
 def display_environment_badge() -> None:
     """Display environment badge in sidebar."""
     env = EnvironmentDetector.get_name()
@@ -134,6 +170,9 @@ init_language()
 
 def _OBSOLETE_create_tables_overview(conn) -> None:
     """Create interactive overview of all tables."""
+    import pandas as pd
+    import plotly.express as px
+
     st.subheader("📊 Vue d'ensemble des tables")
 
     # Get table statistics
@@ -184,6 +223,8 @@ def _OBSOLETE_create_tables_overview(conn) -> None:
 
 def create_rating_analysis(conn) -> None:
     """Enhanced rating distribution analysis."""
+    import plotly.express as px
+
     st.subheader("⭐ Analyse des notes")
 
     # Try different interaction tables
@@ -256,6 +297,9 @@ def create_rating_analysis(conn) -> None:
 
 def create_temporal_analysis(conn) -> None:
     """Analyze temporal patterns in interactions."""
+    import pandas as pd
+    import plotly.express as px
+
     st.subheader("📅 Analyse temporelle")
 
     # Look for date columns in interaction tables
@@ -330,6 +374,9 @@ def create_temporal_analysis(conn) -> None:
 
 def create_user_analysis(conn) -> None:
     """Enhanced user activity analysis."""
+    import plotly.express as px
+    from utils.chart_payload import lean_figure
+
     st.subheader("👥 Analyse des utilisateurs")
 
     try:
@@ -358,7 +405,7 @@ def create_user_analysis(conn) -> None:
                 opacity=0.6,
             )
 
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(lean_figure(fig), use_container_width=True)
 
             # Statistics
             col1, col2, col3, col4 = st.columns(4)
@@ -568,7 +615,12 @@ def main() -> None:
             ("calendar-days", "seasonality"),
             ("sun", "weekend"),
             ("star", "ratings"),
+            ("sparkles", "pairings"),
+            ("users", "users"),
         ]
+        # Page d'administration mémoire, visible avec ?admin=<APP_ADMIN_TOKEN>
+        if admin_allowed(st.query_params.get("admin")):
+            menu_options.append(("cpu", "memory"))
 
         # Options pour st.radio (texte traduit)
         menu_labels = [t(opt[1], category="pages") for opt in menu_options]
@@ -610,51 +662,27 @@ def main() -> None:
         ):
             st.cache_data.clear()
             st.cache_resource.clear()
+            clear_caches()
             st.toast(f"✅ {t('refresh_toast')}", icon="🔄")
             st.rerun()
 
         # Spacer pour pousser les badges en bas (via CSS flexbox)
         st.markdown('<div class="spacer"></div>', unsafe_allow_html=True)
 
-        # BADGE STATUT S3 - Style pill avec icône
-        s3_ready = False
-        try:
-            # Test S3 simplifié
-            import boto3
-            from configparser import ConfigParser
-
-            config = ConfigParser()
-            possible_paths = [
-                Path("/app/96_keys/credentials"),
-                Path("../../96_keys/credentials"),
-                Path("/home/dataia25/mangetamain/96_keys/credentials"),
-            ]
-
-            credentials_path = next((p for p in possible_paths if p.exists()), None)
-
-            if credentials_path:
-                config.read(str(credentials_path))
-                s3 = boto3.client(
-                    "s3",
-                    endpoint_url="http://s3fast.lafrance.io",
-                    aws_access_key_id=config["s3fast"]["aws_access_key_id"],
-                    aws_secret_access_key=config["s3fast"]["aws_secret_access_key"],
-                    region_name="garage-fast",
-                )
-                response = s3.list_objects_v2(Bucket="mangetamain", MaxKeys=1)
-                s3_ready = "Contents" in response
-        except (ConfigurationError, DataLoadError) as e:
-            logger.warning(f"S3 not accessible: {e}")
-            s3_ready = False
-        except Exception as e:
-            logger.warning(f"Unexpected error checking S3: {e}")
-            s3_ready = False
+        # BADGE STATUT S3 - Style pill avec icône (état sondé en tâche de fond)
+        s3_health = S3HealthMonitor.shared().status()
+        if s3_health.pending:
+            s3_status, s3_class = t("s3_checking"), ""
+        elif s3_health.ready:
+            s3_status = f"{t('s3_ready')} · {s3_health.latency_ms:.0f} ms"
+            s3_class = ""
+        else:
+            s3_status, s3_class = t("s3_error"), " error"
 
         # Indicateur S3 Ready avec classe CSS
-        s3_status = t("s3_ready") if s3_ready else t("s3_error")
         st.markdown(
             f"""
-            <div class="s3-ready-indicator">
+            <div class="s3-ready-indicator{s3_class}">
                 <svg xmlns="http://www.w3.org/2000/svg" width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
                     <path d="M22 11.08V12a10 10 0 1 1-5.93-9.14"/><polyline points="22 4 12 14.01 9 11.01"/>
                 </svg>
@@ -696,7 +724,8 @@ def main() -> None:
         )
         st.markdown(t("main_description", category="trends"))
 
-        # Métriques clés en cartouches stylés
+        # Métriques clés en cartouches stylés (manifeste de l'ETL, sans chargement)
+        headline = recipes_headline()
         col1, col2, col3, col4 = st.columns(4)
 
         with col1:
@@ -704,8 +733,8 @@ def main() -> None:
                 f"""
                 <div style="background-color: {ColorTheme.BACKGROUND_CARD}; padding: 20px; border-radius: 8px; text-align: center; border: 1px solid {ColorTheme.CARD_BORDER};">
                     <div style="color: {ColorTheme.TEXT_SECONDARY}; font-size: 0.875rem; text-transform: uppercase; margin-bottom: 8px;">📅 {t("metric_period", category="trends")}</div>
-                    <div style="color: {ColorTheme.TEXT_WHITE}; font-size: 1.75rem; font-weight: 700;">1999-2018</div>
-                    <div style="color: {ColorTheme.TEXT_SECONDARY}; font-size: 0.75rem; margin-top: 4px;">{t("metric_period_value", category="trends")}</div>
+                    <div style="color: {ColorTheme.TEXT_WHITE}; font-size: 1.75rem; font-weight: 700;">{headline.period}</div>
+                    <div style="color: {ColorTheme.TEXT_SECONDARY}; font-size: 0.75rem; margin-top: 4px;">{t("metric_period_value", category="trends", n=headline.n_years)}</div>
                 </div>
                 """,
                 unsafe_allow_html=True,
@@ -716,7 +745,7 @@ def main() -> None:
                 f"""
                 <div style="background-color: {ColorTheme.BACKGROUND_CARD}; padding: 20px; border-radius: 8px; text-align: center; border: 1px solid {ColorTheme.CARD_BORDER};">
                     <div style="color: {ColorTheme.TEXT_SECONDARY}; font-size: 0.875rem; text-transform: uppercase; margin-bottom: 8px;">🍽️ {t("metric_recipes", category="trends")}</div>
-                    <div style="color: {ColorTheme.TEXT_WHITE}; font-size: 1.75rem; font-weight: 700;">178,265</div>
+                    <div style="color: {ColorTheme.TEXT_WHITE}; font-size: 1.75rem; font-weight: 700;">{headline.n_recipes:,}</div>
                     <div style="color: {ColorTheme.TEXT_SECONDARY}; font-size: 0.75rem; margin-top: 4px;">{t("metric_recipes_value", category="trends")}</div>
                 </div>
                 """,
@@ -749,31 +778,43 @@ def main() -> None:
 
         st.markdown("---")
 
-        # Display all 6 analyses without dropdown
-        st.subheader(f"📊 {t('volume_title', category='trends')}")
-        analyse_trendline_volume()
-        st.markdown("---")
-
-        st.subheader(f"⏱️ {t('duration_title', category='trends')}")
-        analyse_trendline_duree()
-        st.markdown("---")
-
-        st.subheader(f"🔧 {t('complexity_title', category='trends')}")
-        analyse_trendline_complexite()
-        st.markdown("---")
-
-        st.subheader(f"🥗 {t('nutrition_title', category='trends')}")
-        analyse_trendline_nutrition()
-        st.markdown("---")
-
-        st.subheader(f"🥘 {t('ingredients_title', category='trends')}")
-        st.info(f"💡 {t('ingredients_info', category='trends')}")
-        analyse_trendline_ingredients(top_n=10)
-        st.markdown("---")
-
-        st.subheader(f"🏷️ {t('tags_title', category='trends')}")
-        st.info(f"💡 {t('tags_info', category='trends')}")
-        analyse_trendline_tags(top_n=10)
+        # 6 analyses en sections isolées (fragments), calculées à l'ouverture
+        # au-delà de la première
+        render_sections(
+            "trends",
+            [
+                Section(
+                    "volume",
+                    f"📊 {t('volume_title', category='trends')}",
+                    analyse_trendline_volume,
+                ),
+                Section(
+                    "duration",
+                    f"⏱️ {t('duration_title', category='trends')}",
+                    analyse_trendline_duree,
+                ),
+                Section(
+                    "complexity",
+                    f"🔧 {t('complexity_title', category='trends')}",
+                    analyse_trendline_complexite,
+                ),
+                Section(
+                    "nutrition",
+                    f"🥗 {t('nutrition_title', category='trends')}",
+                    analyse_trendline_nutrition,
+                ),
+                Section(
+                    "ingredients",
+                    f"🥘 {t('ingredients_title', category='trends')}",
+                    render_trends_ingredients,
+                ),
+                Section(
+                    "tags",
+                    f"🏷️ {t('tags_title', category='trends')}",
+                    render_trends_tags,
+                ),
+            ],
+        )
 
     elif st.session_state.current_page == "seasonality":
         # Appel du module d'analyse saisonnière avec charte graphique
@@ -787,6 +828,20 @@ def main() -> None:
         # Appel du module d'analyse ratings avec charte graphique
         render_ratings_analysis()
 
+    elif st.session_state.current_page == "pairings":
+        # Réseau d'associations d'ingrédients (arêtes précalculées par l'ETL)
+        render_pairings_analysis()
+
+    elif st.session_state.current_page == "users":
+        # Comportement des utilisateurs (tables d'activité précalculées par l'ETL)
+        render_users_analysis()
+
+    elif st.session_state.current_page == "memory" and admin_allowed(
+        st.query_params.get("admin")
+    ):
+        # Administration : mémoire des caches et des sessions
+        render_memory_admin()
+
     else:
         # Fallback
         st.markdown(
@@ -837,6 +892,9 @@ def main() -> None:
             unsafe_allow_html=True,
         )
 
+    # Comptabilité mémoire de la session (page d'administration)
+    record_session()
+
     logger.info("✅ Application fully loaded")
 
 
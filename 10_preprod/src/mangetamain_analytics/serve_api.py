@@ -0,0 +1,55 @@
+"""Lance l'API HTTP des résultats d'analyse (JSON ou Arrow, sans Streamlit).
+
+Usage:
+    python src/mangetamain_analytics/serve_api.py [--port PORT] [--address ADDR]
+
+Voir api.server : les résultats sont calculés par les mêmes fonctions en
+cache que les pages et servis avec un ETag (If-None-Match -> 304).
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from typing import Optional
+
+from loguru import logger
+
+from api.server import API_PREFIX, make_app
+
+# Port et adresse d'écoute, APP_API_PORT / APP_API_ADDRESS
+API_PORT = int(os.getenv("APP_API_PORT", "8502"))
+API_ADDRESS = os.getenv("APP_API_ADDRESS", "0.0.0.0")
+
+
+async def serve(port: int, address: str) -> None:
+    """Écoute sur address:port jusqu'à l'arrêt du processus."""
+    make_app().listen(port, address)
+    logger.info(f"API des résultats sur http://{address}:{port}{API_PREFIX}/results")
+    await asyncio.Event().wait()
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Point d'entrée en ligne de commande.
+
+    Returns:
+        Code de sortie (0 à l'arrêt, 1 si le port ne peut être ouvert)
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=API_PORT)
+    parser.add_argument("--address", default=API_ADDRESS)
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(serve(args.port, args.address))
+    except KeyboardInterrupt:
+        return 0
+    except OSError as e:
+        logger.error(f"Impossible d'ouvrir {args.address}:{args.port}: {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
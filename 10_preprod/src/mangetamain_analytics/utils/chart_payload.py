@@ -0,0 +1,198 @@
+"""Allègement des figures Plotly avant envoi au navigateur.
+
+Une figure est transmise au navigateur en JSON par le websocket Streamlit,
+puis dessinée en SVG point par point. Pour les grandes séries, lean_figure :
+
+- réduit les traces scatter au-delà de max_points par LTTB (Largest
+  Triangle Three Buckets), qui conserve la forme visuelle et les extrêmes
+  de la série ;
+- passe en Scattergl (rendu WebGL) les traces d'au moins webgl_min_points ;
+- convertit les tableaux numériques (listes Python) en tableaux NumPy, que
+  Plotly sérialise en tableaux typés base64 au lieu de listes JSON.
+
+Les courbes ne sont réduites que si x est trié ; les nuages de points
+(mode 'markers') sont réduits après tri par x, sans changer leur ordre.
+Les traces remplies (fill, bandes de confiance) sont laissées intactes.
+"""
+
+from typing import Any, Callable, Optional
+
+import numpy as np
+import plotly.graph_objects as go
+
+# Nombre maximal de points par trace scatter transmis au navigateur
+POINT_BUDGET = 2000
+
+# Nombre de points à partir duquel une trace scatter passe en WebGL
+WEBGL_MIN_POINTS = 1000
+
+# Propriétés imbriquées pouvant porter un tableau par point
+PER_POINT_GROUPS = ("marker", "error_x", "error_y")
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Indices des points retenus par Largest Triangle Three Buckets.
+
+    Le premier et le dernier point sont conservés ; dans chaque tranche
+    intermédiaire, le point retenu forme le plus grand triangle avec le
+    point précédemment retenu et la moyenne de la tranche suivante.
+
+    Args:
+        x: Abscisses numériques triées
+        y: Ordonnées (les NaN ne sont jamais préférés)
+        n_out: Nombre de points à conserver
+
+    Returns:
+        Indices croissants (tous les indices si n_out >= len(x) ou n_out < 3)
+
+    Raises:
+        ValueError: Si x et y n'ont pas la même longueur
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if len(y) != n:
+        raise ValueError(f"x et y de longueurs différentes ({n} != {len(y)})")
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.floor(np.arange(n_out - 1) * (n - 2) / (n_out - 2)).astype(int) + 1
+    edges = np.append(edges, n)
+    indices = np.empty(n_out, dtype=int)
+    indices[0], indices[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2]
+        avg_x = x[end:next_end].mean()
+        avg_y = (
+            np.nanmean(y[end:next_end]) if np.isfinite(y[end:next_end]).any() else y[a]
+        )
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(np.nan_to_num(area, nan=-1.0)))
+        indices[i + 1] = a
+    return indices
+
+
+def _as_numeric(values: Any) -> Optional[np.ndarray]:
+    """Abscisses numériques (dates en ns), None si non numériques."""
+    array = np.asarray(values)
+    if array.dtype.kind in "iufb":
+        return array.astype(float)
+    if array.dtype.kind == "M":
+        return array.astype("datetime64[ns]").astype(np.int64).astype(float)
+    try:
+        return array.astype("datetime64[ns]").astype(np.int64).astype(float)
+    except (ValueError, TypeError):
+        return None
+
+
+def _typed(values: Any) -> Any:
+    """Tableau NumPy si les valeurs sont numériques (int64 réduit en int32 si possible)."""
+    if not isinstance(values, (list, tuple, np.ndarray)):
+        return values
+    array = np.asarray(values)
+    if array.dtype.kind not in "iuf" or array.ndim != 1:
+        return values
+    if array.dtype == np.int64 and len(array):
+        info = np.iinfo(np.int32)
+        if info.min <= array.min() and array.max() <= info.max:
+            array = array.astype(np.int32)
+    return array
+
+
+def _is_per_point(value: Any, n: int) -> bool:
+    """Vrai pour un tableau d'un élément par point."""
+    return isinstance(value, (list, tuple, np.ndarray)) and len(value) == n
+
+
+def _map_arrays(props: dict, n: int, func: Callable[[Any], Any]) -> dict:
+    """Applique func aux tableaux par point d'une trace (et de marker, error_x/y)."""
+    out = {}
+    for key, value in props.items():
+        if key in PER_POINT_GROUPS and isinstance(value, dict):
+            out[key] = _map_arrays(value, n, func)
+        elif _is_per_point(value, n):
+            out[key] = func(value)
+        else:
+            out[key] = value
+    return out
+
+
+def _take(values: Any, keep: np.ndarray) -> Any:
+    """Sous-ensemble des valeurs aux indices keep (type d'origine conservé)."""
+    if isinstance(values, np.ndarray):
+        return values[keep]
+    return [values[i] for i in keep]
+
+
+def lean_trace(
+    trace: Any,
+    max_points: int = POINT_BUDGET,
+    webgl_min_points: int = WEBGL_MIN_POINTS,
+) -> Any:
+    """
+    Version allégée d'une trace (réduite, WebGL, tableaux typés).
+
+    Args:
+        trace: Trace Plotly
+        max_points: Nombre maximal de points d'une trace scatter
+        webgl_min_points: Seuil de passage en Scattergl
+
+    Returns:
+        Nouvelle trace ; la trace d'origine n'est pas modifiée
+    """
+    props = trace.to_plotly_json()
+    trace_type = props.pop("type", None)
+    x, y = props.get("x"), props.get("y")
+    reference = x if x is not None else y
+    n = len(reference) if reference is not None else -1
+
+    if (
+        trace_type in ("scatter", "scattergl")
+        and n > max_points
+        and not props.get("fill")
+    ):
+        xs, ys = _as_numeric(x), _as_numeric(y) if y is not None else None
+        keep = None
+        if xs is not None and ys is not None and len(ys) == n:
+            if "lines" in props.get("mode", "lines"):
+                if np.all(np.diff(xs) >= 0):
+                    keep = lttb_indices(xs, ys, max_points)
+            else:
+                order = np.argsort(xs, kind="stable")
+                keep = np.sort(order[lttb_indices(xs[order], ys[order], max_points)])
+        if keep is not None:
+            props = _map_arrays(props, n, lambda values: _take(values, keep))
+            n = len(keep)
+
+    props = _map_arrays(props, n, _typed)
+    if trace_type == "scatter" and n >= webgl_min_points:
+        return go.Scattergl(props, skip_invalid=True)
+    return type(trace)(props)
+
+
+def lean_figure(
+    fig: go.Figure,
+    max_points: int = POINT_BUDGET,
+    webgl_min_points: int = WEBGL_MIN_POINTS,
+) -> go.Figure:
+    """
+    Allège toutes les traces d'une figure avant st.plotly_chart.
+
+    Args:
+        fig: Figure Plotly (modifiée sur place, subplots conservés)
+        max_points: Nombre maximal de points par trace scatter
+        webgl_min_points: Seuil de passage en Scattergl
+
+    Returns:
+        La même figure
+    """
+    traces = [lean_trace(trace, max_points, webgl_min_points) for trace in fig.data]
+    fig.data = ()
+    fig.add_traces(traces)
+    return fig
@@ -0,0 +1,191 @@
+"""Cache des figures Plotly sérialisées (LRU borné en octets).
+
+Une figure est mémorisée sous la clé (analyse, paramètres des widgets,
+version des données), sérialisée en JSON compressé (zlib). Une vue répétée
+relit la figure sans recalculer les agrégats ni reconstruire les subplots.
+Les entrées les moins récemment lues sont évincées dès que la taille totale
+dépasse la limite.
+
+La langue ne fait pas partie de la clé : les figures sont construites avec
+des libellés différés (jetons [[catégorie.clé]], voir
+utils.i18n_helper.deferred_labels) traduits à la relecture. Changer de
+langue ne relance aucun calcul.
+"""
+
+import threading
+import zlib
+from typing import Any, Callable, Hashable, Optional
+
+import plotly.graph_objects as go
+import plotly.io as pio
+from loguru import logger
+
+from i18n import get_current_language
+from utils.chart_payload import lean_figure
+from utils.i18n_helper import deferred_labels, localize_labels
+from utils.memory import BoundedCache, env_megabytes, register_cache
+
+# Taille maximale du cache (octets compressés), APP_FIGURE_CACHE_MAX_MB
+DEFAULT_MAX_BYTES = env_megabytes("APP_FIGURE_CACHE_MAX_MB", 64)
+
+# Niveau de compression zlib (rapide, ~5-10x sur le JSON Plotly)
+COMPRESSION_LEVEL = 1
+
+
+def figure_key(analysis: str, dataset_version: str, **params: Hashable) -> tuple:
+    """
+    Clé de cache d'une figure, indépendante de la langue.
+
+    Args:
+        analysis: Identifiant de l'analyse (ex. 'trends_ingredients')
+        dataset_version: Version des données sources
+        **params: Paramètres des widgets (valeurs hachables)
+
+    Returns:
+        Tuple (analyse, paramètres triés, version)
+    """
+    return (analysis, tuple(sorted(params.items())), dataset_version)
+
+
+def serialize_figure(fig: go.Figure) -> bytes:
+    """Sérialise une figure en JSON compressé (jetons de libellés conservés)."""
+    return zlib.compress(fig.to_json().encode(), COMPRESSION_LEVEL)
+
+
+def deserialize_figure(payload: bytes, language: Optional[str] = None) -> go.Figure:
+    """
+    Reconstruit une figure, libellés traduits dans la langue demandée.
+
+    Args:
+        payload: Figure sérialisée par serialize_figure
+        language: Langue des libellés (défaut: langue courante)
+
+    Returns:
+        Figure Plotly
+    """
+    text = zlib.decompress(payload).decode()
+    language = language or get_current_language()
+    return pio.from_json(localize_labels(text, language, json_escape=True))
+
+
+class FigureCache(BoundedCache):
+    """Cache LRU de figures Plotly sérialisées (get retourne les octets)."""
+
+    _shared: Optional["FigureCache"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """
+        Initialise un cache vide.
+
+        Args:
+            max_bytes: Taille maximale des figures compressées
+        """
+        super().__init__("figures", max_bytes)
+
+    def put(self, key: tuple, payload: bytes) -> int:  # type: ignore[override]
+        """
+        Mémorise une figure sérialisée, puis évince les plus anciennes.
+
+        Une figure plus grande que max_bytes n'est pas mémorisée.
+
+        Returns:
+            Taille compressée de la figure (octets)
+        """
+        return super().put(key, payload, len(payload))
+
+    @classmethod
+    def shared(cls) -> "FigureCache":
+        """Cache unique du processus, partagé entre sessions."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = register_cache(cls())
+            return cls._shared
+
+    @classmethod
+    def reset_shared(cls) -> None:
+        """Oublie le cache partagé (utile pour les tests)."""
+        with cls._shared_lock:
+            cls._shared = None
+
+
+def figure_stats(fig: go.Figure) -> dict:
+    """
+    Statistiques d'interprétation mémorisées avec une figure.
+
+    Un constructeur passé à cached_figure range dans layout.meta les valeurs
+    que la page affiche à côté de la figure (pentes, R², effectifs) : elles
+    sont relues du cache ou de l'instantané avec la figure, sans recalcul.
+
+    Le JSON ne connaît pas NaN : une statistique indéfinie (NaN, sérialisée
+    en null) est relue en NaN.
+
+    Args:
+        fig: Figure retournée par cached_figure
+
+    Returns:
+        Dict des statistiques (vide si la figure n'en porte pas)
+    """
+
+    def restore(value: Any) -> Any:
+        if value is None:
+            return float("nan")
+        if isinstance(value, dict):
+            return {key: restore(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [restore(item) for item in value]
+        return value
+
+    return restore(dict(fig.layout.meta or {}))
+
+
+def cached_figure(
+    analysis: str,
+    dataset_version: str,
+    build: Callable[..., go.Figure],
+    **params: Hashable,
+) -> go.Figure:
+    """
+    Figure d'une analyse, relue depuis le cache partagé ou construite.
+
+    build est appelé sous deferred_labels : les libellés produits par t()
+    sont traduits à chaque relecture, une figure sert toutes les langues.
+    La figure est allégée (utils.chart_payload.lean_figure) avant d'être
+    mémorisée, avec ses statistiques d'interprétation (voir figure_stats).
+    Absente du cache, elle est d'abord cherchée dans les
+    instantanés pré-calculés au déploiement (utils.snapshot) ; un
+    instantané illisible est ignoré.
+
+    Args:
+        analysis: Identifiant de l'analyse
+        dataset_version: Version des données sources
+        build: Calcule et construit la figure à partir des paramètres
+            (appelé seulement si la figure est absente du cache)
+        **params: Paramètres des widgets, passés à build
+
+    Returns:
+        Figure Plotly
+    """
+    cache = FigureCache.shared()
+    key = figure_key(analysis, dataset_version, **params)
+    payload = cache.get(key)
+    if payload is not None:
+        return deserialize_figure(payload)
+
+    from utils.snapshot import read_snapshot
+
+    # Instantané illisible (fichier corrompu) : traité comme absent
+    payload = read_snapshot(key)
+    if payload is not None:
+        try:
+            fig = deserialize_figure(payload)
+        except (zlib.error, ValueError) as e:
+            logger.warning(f"Instantané {analysis} illisible, figure recalculée: {e}")
+        else:
+            cache.put(key, payload)
+            return fig
+
+    with deferred_labels():
+        payload = serialize_figure(lean_figure(build(**params)))
+    cache.put(key, payload)
+    return deserialize_figure(payload)
@@ -1,9 +1,98 @@
-"""i18n helper functions for translations."""
-
-from typing import Any
+"""i18n helper functions for translations.
+
+Labels can also be deferred: inside ``deferred_labels()``, ``t`` returns a
+language-independent token such as ``[[trends.axis_year]]``, which
+``localize_labels`` later replaces by the translation. Cached figures are
+built once with tokens and re-labelled for each language.
+"""
+
+import json
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from string import Formatter
+from typing import Any, Iterator, Optional
 from mangetamain_analytics.i18n.translations import TRANSLATIONS
 from mangetamain_analytics.i18n.language_selector import get_current_language
 
+# Deferred label token: [[category.key|field=value|...]]
+LABEL_TOKEN = re.compile(r"\[\[(\w+)\.(\w+)((?:\|\w+=[^|\]]*)*)\]\]")
+
+_deferred: ContextVar[bool] = ContextVar("deferred_labels", default=False)
+
+
+@contextmanager
+def deferred_labels() -> Iterator[None]:
+    """Make ``t`` and ``translate_list`` return label tokens in this block.
+
+    Example:
+        >>> with deferred_labels():
+        ...     t("axis_year", category="trends")
+        "[[trends.axis_year]]"
+    """
+    previous = _deferred.set(True)
+    try:
+        yield
+    finally:
+        _deferred.reset(previous)
+
+
+def _label_token(key: str, category: str, **kwargs: Any) -> str:
+    """Build the deferred token of a translation key.
+
+    Format fields are kept in the token with their conversion and format
+    spec (``|r2={r2:.4f}``), so that a later ``.format(r2=0.1234)`` on the
+    token formats the value as the translation would. Specs are the same
+    in every language.
+    """
+    translation = TRANSLATIONS[category][key]["en"]
+    fields = {
+        name: (f"!{conversion}" if conversion else "") + (f":{spec}" if spec else "")
+        for _, name, spec, conversion in Formatter().parse(translation)
+        if name
+    }
+    token = (
+        f"[[{category}.{key}"
+        + "".join(f"|{name}={{{name}{fmt}}}" for name, fmt in fields.items())
+        + "]]"
+    )
+    return token.format(**kwargs) if kwargs else token
+
+
+def _render_translation(translation: str, values: dict[str, str]) -> str:
+    """Substitute already formatted values into a translation's fields."""
+    return "".join(
+        literal + (values.get(name, "") if name else "")
+        for literal, name, _, _ in Formatter().parse(translation)
+    )
+
+
+def localize_labels(
+    text: str, lang: Optional[str] = None, json_escape: bool = False
+) -> str:
+    """Replace deferred label tokens by their translation.
+
+    Args:
+        text: Text (or serialized JSON) containing tokens
+        lang: Target language (default: current language)
+        json_escape: Escape translations for insertion in a JSON string
+
+    Returns:
+        Text with every token translated
+    """
+    lang = lang or get_current_language()
+
+    def replace(match: re.Match) -> str:
+        category, key, args = match.groups()
+        values = dict(arg.split("=", 1) for arg in args.split("|")[1:])
+        try:
+            translation = _render_translation(TRANSLATIONS[category][key][lang], values)
+        except KeyError:
+            translation = f"[{category}.{key}]"
+        return json.dumps(translation)[1:-1] if json_escape else translation
+
+    return LABEL_TOKEN.sub(replace, text)
+
 
 def t(key: str, category: str = "common", **kwargs: Any) -> str:
     """Translate a key to current language.
@@ -29,6 +118,8 @@ def t(key: str, category: str = "common", **kwargs: Any) -> str:
     lang = get_current_language()
 
     try:
+        if _deferred.get():
+            return _label_token(key, category, **kwargs)
         translation = TRANSLATIONS[category][key][lang]
         if kwargs:
             return translation.format(**kwargs)
@@ -52,6 +143,9 @@ def translate_list(items: list[str], category: str) -> list[str]:
         >>> translate_list(["autumn", "winter", "spring", "summer"], "seasons")
         ["Automne", "Hiver", "Printemps", "Été"]
     """
+    if _deferred.get():
+        return [t(item, category) for item in items]
+
     lang = get_current_language()
     translated = []
     for item in items:
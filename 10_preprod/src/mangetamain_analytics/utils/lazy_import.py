@@ -0,0 +1,39 @@
+"""Import différé des modules d'analyse.
+
+Les pages de visualisation importent statsmodels, scipy, pandas, polars et
+plotly.subplots. Importées au démarrage de main.py, elles retardent le
+premier affichage de chaque nouveau processus (redémarrage du conteneur,
+rechargement du script). Une fonction différée n'importe son module qu'au
+premier appel, c'est-à-dire à la première ouverture de la page concernée.
+"""
+
+import importlib
+from typing import Any, Callable
+
+
+def lazy_function(module: str, name: str) -> Callable[..., Any]:
+    """
+    Fonction de module importée au premier appel.
+
+    Args:
+        module: Chemin du module (ex. 'visualization.analyse_ratings')
+        name: Nom de la fonction dans le module
+
+    Returns:
+        Fonction de même nom qui importe le module puis délègue l'appel
+
+    Example:
+        >>> render = lazy_function("visualization.analyse_users", "render_users_analysis")
+        >>> render()  # import de visualization.analyse_users ici
+    """
+    target: list[Callable[..., Any]] = []
+
+    def call(*args: Any, **kwargs: Any) -> Any:
+        if not target:
+            target.append(getattr(importlib.import_module(module), name))
+        return target[0](*args, **kwargs)
+
+    call.__name__ = call.__qualname__ = name
+    call.__module__ = module
+    call.__doc__ = f"Appel différé de {module}.{name}."
+    return call
@@ -0,0 +1,394 @@
+"""Comptabilité mémoire : caches bornés en octets et suivi par session.
+
+Les DataFrames chargés par les pages sont les plus gros objets du
+processus. Ce module fournit :
+
+- estimate_bytes : taille estimée d'un objet (Polars, pandas, NumPy...)
+- BoundedCache : cache LRU borné en octets, avec expiration optionnelle
+- memory_cache : décorateur de fonction sur un BoundedCache partagé entre
+  sessions (un seul exemplaire du résultat, sans copie par appel)
+- record_session / session_stats : taille de st.session_state par session
+
+Les limites sont configurables par variables d'environnement (en Mo) :
+APP_CACHE_MAX_MB pour chaque cache de données, APP_SESSION_MAX_MB pour le
+seuil d'alerte d'une session. La page d'administration affiche les totaux ;
+elle n'existe que si APP_ADMIN_TOKEN est défini côté serveur et s'ouvre avec
+?admin=<jeton> (voir admin_allowed).
+"""
+
+import hmac
+import inspect
+import os
+import resource
+import sys
+import threading
+import time
+from collections import OrderedDict
+from contextlib import nullcontext
+from functools import wraps
+from typing import Any, Callable, ContextManager, Hashable, NamedTuple, Optional
+
+from loguru import logger
+
+MB = 1024 * 1024
+
+
+def env_megabytes(name: str, default_mb: int) -> int:
+    """
+    Limite en octets lue dans une variable d'environnement exprimée en Mo.
+
+    Args:
+        name: Nom de la variable (ex. 'APP_CACHE_MAX_MB')
+        default_mb: Valeur par défaut (Mo) si absente ou invalide
+
+    Returns:
+        Limite en octets
+    """
+    try:
+        return int(float(os.getenv(name, default_mb)) * MB)
+    except ValueError:
+        logger.warning(f"{name} invalide, {default_mb} Mo utilisés")
+        return default_mb * MB
+
+
+def admin_allowed(token: Optional[str]) -> bool:
+    """
+    Vrai si le jeton fourni ouvre la page d'administration.
+
+    Le jeton attendu est lu dans APP_ADMIN_TOKEN (variable d'environnement du
+    serveur) ; sans cette variable, la page est désactivée.
+
+    Args:
+        token: Jeton fourni par l'utilisateur (paramètre d'URL ?admin=)
+
+    Returns:
+        True si APP_ADMIN_TOKEN est défini et égal au jeton
+    """
+    expected = os.getenv("APP_ADMIN_TOKEN", "")
+    if not expected or not token:
+        return False
+    return hmac.compare_digest(token.encode(), expected.encode())
+
+
+# Taille maximale de chaque cache de données (octets)
+CACHE_MAX_BYTES = env_megabytes("APP_CACHE_MAX_MB", 512)
+
+# Taille de st.session_state au-delà de laquelle une session est signalée
+SESSION_MAX_BYTES = env_megabytes("APP_SESSION_MAX_MB", 64)
+
+# Durée après laquelle une session inactive n'est plus comptée (secondes)
+SESSION_IDLE_S = 3600.0
+
+
+def estimate_bytes(obj: Any) -> int:
+    """
+    Taille estimée d'un objet en mémoire.
+
+    Polars (estimated_size), pandas (memory_usage profond) et NumPy (nbytes)
+    sont mesurés sans importer ces bibliothèques ; les conteneurs sont
+    parcourus récursivement.
+
+    Returns:
+        Taille en octets
+    """
+    if hasattr(obj, "estimated_size"):
+        return int(obj.estimated_size())
+    if hasattr(obj, "memory_usage") and hasattr(obj, "dtypes"):
+        usage = obj.memory_usage(deep=True)
+        return int(usage.sum() if hasattr(usage, "sum") else usage)
+    if hasattr(obj, "nbytes") and not isinstance(obj, (bytes, bytearray)):
+        return int(obj.nbytes)
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(
+            estimate_bytes(k) + estimate_bytes(v) for k, v in obj.items()
+        )
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return sys.getsizeof(obj) + sum(estimate_bytes(item) for item in obj)
+    return sys.getsizeof(obj)
+
+
+def process_rss_bytes() -> int:
+    """
+    Mémoire résidente du processus.
+
+    Returns:
+        RSS courant (Linux, /proc/self/statm), sinon pic de RSS
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class BoundedCache:
+    """Cache LRU borné en octets, avec expiration optionnelle des entrées."""
+
+    def __init__(
+        self, name: str, max_bytes: int = CACHE_MAX_BYTES, ttl: Optional[float] = None
+    ) -> None:
+        """
+        Initialise un cache vide.
+
+        Args:
+            name: Nom affiché dans la page d'administration
+            max_bytes: Taille maximale cumulée des entrées
+            ttl: Durée de vie d'une entrée (secondes), None pour illimitée
+        """
+        self.name = name
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        # clé -> (valeur, taille, date d'insertion)
+        self._entries: OrderedDict[Hashable, tuple[Any, int, float]] = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Relit une entrée (et la marque comme récemment utilisée).
+
+        Returns:
+            Valeur mémorisée, None si absente ou expirée
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None:
+                if time.monotonic() - entry[2] > self.ttl:
+                    self._remove(key)
+                    entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, nbytes: Optional[int] = None) -> int:
+        """
+        Mémorise une entrée, puis évince les moins récemment utilisées.
+
+        Une entrée plus grande que max_bytes n'est pas mémorisée.
+
+        Args:
+            key: Clé hachable
+            value: Valeur mémorisée (partagée, non copiée)
+            nbytes: Taille de la valeur (défaut: estimate_bytes)
+
+        Returns:
+            Taille de l'entrée (octets)
+        """
+        nbytes = estimate_bytes(value) if nbytes is None else nbytes
+        if nbytes > self.max_bytes:
+            logger.warning(
+                f"Cache {self.name}: entrée de {nbytes / MB:.1f} Mo non mémorisée "
+                f"(limite {self.max_bytes / MB:.0f} Mo)"
+            )
+            return nbytes
+
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (value, nbytes, time.monotonic())
+            self._size += nbytes
+            while self._size > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._evictions += 1
+        return nbytes
+
+    def _remove(self, key: Hashable) -> None:
+        """Retire une entrée (verrou déjà pris)."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry[1]
+
+    def clear(self) -> None:
+        """Vide le cache."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> dict[str, Any]:
+        """
+        État du cache.
+
+        Returns:
+            Dict (name, entries, bytes, max_bytes, hits, misses, evictions)
+        """
+        with self._lock:
+            return {
+                "name": self.name,
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+
+# Caches affichés dans la page d'administration (nom -> cache)
+_registry: dict[str, BoundedCache] = {}
+_registry_lock = threading.Lock()
+
+
+def register_cache(cache: BoundedCache) -> BoundedCache:
+    """Inscrit un cache dans la comptabilité (remplace un cache de même nom)."""
+    with _registry_lock:
+        _registry[cache.name] = cache
+    return cache
+
+
+def registered_caches() -> list[BoundedCache]:
+    """Caches inscrits, par ordre d'inscription."""
+    with _registry_lock:
+        return list(_registry.values())
+
+
+def clear_caches() -> None:
+    """Vide tous les caches inscrits (ex. bouton Rafraîchir)."""
+    for cache in registered_caches():
+        cache.clear()
+
+
+def _spinner(message: Optional[str]) -> ContextManager[Any]:
+    """st.spinner(message), ou contexte vide sans message."""
+    if not message:
+        return nullcontext()
+    import streamlit as st
+
+    return st.spinner(message)
+
+
+def memory_cache(
+    name: str,
+    max_bytes: int = CACHE_MAX_BYTES,
+    ttl: Optional[float] = None,
+    spinner: Optional[str] = None,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Décorateur : résultats mémorisés dans un BoundedCache partagé entre sessions.
+
+    Comme st.cache_resource, le résultat est partagé sans copie : ne pas le
+    modifier (les opérations Polars renvoient de nouveaux DataFrames). Comme
+    avec st.cache_data, les paramètres préfixés par _ ne font pas partie de
+    la clé.
+
+    Args:
+        name: Nom du cache (page d'administration)
+        max_bytes: Taille maximale cumulée des résultats
+        ttl: Durée de vie d'un résultat (secondes)
+        spinner: Message affiché (st.spinner) pendant le calcul d'un résultat
+            absent du cache
+
+    Returns:
+        Décorateur ; la fonction décorée expose .cache et .clear()
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        cache = register_cache(BoundedCache(name, max_bytes, ttl))
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = tuple(
+                (k, v) for k, v in bound.arguments.items() if not k.startswith("_")
+            )
+            value = cache.get(key)
+            if value is None:
+                with _spinner(spinner):
+                    value = func(*args, **kwargs)
+                cache.put(key, value)
+            return value
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        wrapper.clear = cache.clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+class SessionUsage(NamedTuple):
+    """Taille mesurée de st.session_state d'une session."""
+
+    session_id: str
+    bytes: int
+    n_keys: int
+    seen_at: float
+
+    @property
+    def over_budget(self) -> bool:
+        """True si la session dépasse SESSION_MAX_BYTES."""
+        return self.bytes > SESSION_MAX_BYTES
+
+
+_sessions: dict[str, SessionUsage] = {}
+_sessions_lock = threading.Lock()
+
+
+def current_session_id() -> Optional[str]:
+    """Identifiant de la session Streamlit courante (None hors runtime)."""
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx(suppress_warning=True)
+    return ctx.session_id if ctx is not None else None
+
+
+def record_session(
+    state: Optional[dict] = None, session_id: Optional[str] = None
+) -> Optional[SessionUsage]:
+    """
+    Mesure st.session_state de la session courante (à appeler à chaque rerun).
+
+    Args:
+        state: État mesuré (défaut: st.session_state)
+        session_id: Identifiant de session (défaut: session courante)
+
+    Returns:
+        Mesure enregistrée, None hors runtime Streamlit
+    """
+    session_id = session_id or current_session_id()
+    if session_id is None:
+        return None
+    if state is None:
+        import streamlit as st
+
+        state = st.session_state.to_dict()
+
+    usage = SessionUsage(
+        session_id=session_id,
+        bytes=sum(estimate_bytes(v) for v in state.values()),
+        n_keys=len(state),
+        seen_at=time.time(),
+    )
+    if usage.over_budget:
+        logger.warning(
+            f"Session {session_id[:8]}: {usage.bytes / MB:.1f} Mo en session_state "
+            f"(seuil {SESSION_MAX_BYTES / MB:.0f} Mo)"
+        )
+    with _sessions_lock:
+        _sessions[session_id] = usage
+    return usage
+
+
+def session_stats(idle: float = SESSION_IDLE_S) -> list[SessionUsage]:
+    """
+    Mesures des sessions actives, les plus lourdes d'abord.
+
+    Les sessions inactives depuis plus de idle secondes sont oubliées.
+
+    Returns:
+        Liste de SessionUsage
+    """
+    now = time.time()
+    with _sessions_lock:
+        for session_id in [
+            s for s, usage in _sessions.items() if now - usage.seen_at > idle
+        ]:
+            del _sessions[session_id]
+        return sorted(_sessions.values(), key=lambda u: u.bytes, reverse=True)
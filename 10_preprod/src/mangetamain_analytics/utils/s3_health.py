@@ -0,0 +1,183 @@
+"""Surveillance de la disponibilité S3 en tâche de fond.
+
+Un thread démon sonde le bucket à intervalle régulier et mémorise le
+dernier état (disponibilité, latence, erreur). La sidebar lit cet état sans
+appel réseau : un rerun Streamlit ne construit plus de client boto3.
+"""
+
+import threading
+import time
+from configparser import ConfigParser
+from pathlib import Path
+from typing import Callable, NamedTuple, Optional
+
+from loguru import logger
+
+from exceptions import ConfigurationError
+
+# Intervalle entre deux sondes (secondes)
+PROBE_INTERVAL_S = 60.0
+
+# Délai maximum de connexion / lecture d'une sonde (secondes)
+PROBE_TIMEOUT_S = 3.0
+
+# Emplacements possibles du fichier de credentials S3
+CREDENTIALS_PATHS = [
+    Path("/app/96_keys/credentials"),
+    Path("../../96_keys/credentials"),
+    Path("/home/dataia25/mangetamain/96_keys/credentials"),
+]
+
+
+class S3Status(NamedTuple):
+    """Dernier résultat de sonde S3."""
+
+    ready: bool = False
+    latency_ms: Optional[float] = None
+    checked_at: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def pending(self) -> bool:
+        """True tant qu'aucune sonde n'a abouti."""
+        return self.checked_at is None
+
+
+def create_s3_client():
+    """
+    Construit le client boto3 du bucket mangetamain.
+
+    Returns:
+        Client boto3 S3 (délais courts, une seule tentative)
+
+    Raises:
+        ConfigurationError: Si aucun fichier de credentials n'est trouvé
+    """
+    import boto3
+    from botocore.config import Config
+
+    credentials_path = next((p for p in CREDENTIALS_PATHS if p.exists()), None)
+    if credentials_path is None:
+        raise ConfigurationError("Fichier de credentials S3 introuvable")
+
+    config = ConfigParser()
+    config.read(str(credentials_path))
+    return boto3.client(
+        "s3",
+        endpoint_url="http://s3fast.lafrance.io",
+        aws_access_key_id=config["s3fast"]["aws_access_key_id"],
+        aws_secret_access_key=config["s3fast"]["aws_secret_access_key"],
+        region_name="garage-fast",
+        config=Config(
+            connect_timeout=PROBE_TIMEOUT_S,
+            read_timeout=PROBE_TIMEOUT_S,
+            retries={"max_attempts": 1},
+        ),
+    )
+
+
+class S3HealthMonitor:
+    """Sonde S3 périodique dont l'état se lit en O(1)."""
+
+    _shared: Optional["S3HealthMonitor"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        client_factory: Callable = create_s3_client,
+        interval: float = PROBE_INTERVAL_S,
+        bucket: str = "mangetamain",
+    ) -> None:
+        """
+        Initialise le moniteur (sans lancer de sonde).
+
+        Args:
+            client_factory: Construit le client S3 (appelé une fois, puis
+                après chaque échec)
+            interval: Intervalle entre deux sondes (secondes)
+            bucket: Bucket sondé
+        """
+        self.interval = interval
+        self.bucket = bucket
+        self._client_factory = client_factory
+        self._client = None
+        self._status = S3Status()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def status(self) -> S3Status:
+        """Dernier état connu, sans appel réseau."""
+        with self._lock:
+            return self._status
+
+    def probe(self) -> S3Status:
+        """
+        Sonde S3 immédiatement (list_objects_v2, une clé) et mémorise le résultat.
+
+        Returns:
+            Nouvel état
+        """
+        start = time.perf_counter()
+        try:
+            if self._client is None:
+                self._client = self._client_factory()
+            response = self._client.list_objects_v2(Bucket=self.bucket, MaxKeys=1)
+            status = S3Status(
+                ready="Contents" in response,
+                latency_ms=(time.perf_counter() - start) * 1000,
+                checked_at=time.time(),
+            )
+        except Exception as e:
+            logger.warning(f"S3 not accessible: {e}")
+            # Client reconstruit à la prochaine sonde (credentials modifiés...)
+            self._client = None
+            status = S3Status(checked_at=time.time(), error=str(e))
+
+        with self._lock:
+            self._status = status
+        return status
+
+    def _run(self) -> None:
+        """Boucle du thread : une sonde puis attente de l'intervalle."""
+        while not self._stop.is_set():
+            self.probe()
+            self._stop.wait(self.interval)
+
+    def start(self) -> None:
+        """Lance le thread de sonde s'il ne tourne pas déjà."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="s3-health-monitor", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Arrête le thread de sonde."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    @classmethod
+    def shared(cls) -> "S3HealthMonitor":
+        """
+        Moniteur unique du processus, démarré au premier appel.
+
+        Indépendant des caches Streamlit : le bouton Rafraîchir ne crée pas
+        de second thread.
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+                cls._shared.start()
+            return cls._shared
+
+    @classmethod
+    def reset_shared(cls) -> None:
+        """Arrête et oublie le moniteur partagé (utile pour les tests)."""
+        with cls._shared_lock:
+            if cls._shared is not None:
+                cls._shared.stop(timeout=0)
+            cls._shared = None
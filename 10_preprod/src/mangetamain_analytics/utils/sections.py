@@ -0,0 +1,68 @@
+"""Rendu différé et isolé des sections des pages multi-analyses.
+
+Chaque section est rendue dans un fragment Streamlit (st.fragment) : un
+widget de la section (case à cocher, slider...) ne relance que cette
+section, pas toute la page. Au-delà des premières sections, le calcul est
+différé derrière un interrupteur « Afficher cette analyse » : une section
+jamais ouverte n'est jamais calculée.
+"""
+
+from typing import Callable, NamedTuple, Optional, Sequence
+
+import streamlit as st
+
+from utils.i18n_helper import t
+
+# Nombre de sections calculées dès l'ouverture de la page
+DEFAULT_EAGER_SECTIONS = 1
+
+
+class Section(NamedTuple):
+    """Section d'une page : identifiant, titre affiché, fonction de rendu."""
+
+    key: str
+    title: str
+    render: Callable[[], None]
+
+
+@st.fragment
+def _render_section(render: Callable[[], None], toggle_key: Optional[str]) -> None:
+    """
+    Corps d'une section, isolé dans un fragment.
+
+    Args:
+        render: Fonction de rendu de la section
+        toggle_key: Clé de l'interrupteur d'ouverture, None pour un rendu
+            immédiat
+    """
+    if toggle_key is not None and not st.toggle(t("show_section"), key=toggle_key):
+        st.caption(t("section_deferred"))
+        return
+    render()
+
+
+def render_sections(
+    page: str,
+    sections: Sequence[Section],
+    eager: int = DEFAULT_EAGER_SECTIONS,
+) -> None:
+    """
+    Affiche les sections d'une page, séparées par un trait horizontal.
+
+    L'état d'ouverture est un widget de clé section_<page>_<section> : une
+    section ouverte le reste pendant les reruns de la page.
+
+    Args:
+        page: Identifiant de la page (préfixe des clés de widgets)
+        sections: Sections dans l'ordre d'affichage
+        eager: Nombre de premières sections calculées sans ouverture
+    """
+    for i, section in enumerate(sections):
+        if i > 0:
+            st.markdown("---")
+        st.subheader(section.title)
+        toggle_key = None if i < eager else f"section_{page}_{section.key}"
+        # Un conteneur par section : l'identifiant d'un fragment dépend de son
+        # conteneur, deux sections du même conteneur se confondraient
+        with st.container():
+            _render_section(section.render, toggle_key)
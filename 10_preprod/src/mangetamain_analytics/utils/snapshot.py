@@ -0,0 +1,367 @@
+"""Instantanés pré-calculés des vues par défaut des figures en cache.
+
+Au déploiement, build_snapshots construit les figures de SNAPSHOT_FIGURES
+avec les valeurs par défaut des widgets (une page par processus) et les
+écrit sur disque, sous la version du jeu de données de chaque page
+(recettes, interactions ou utilisateurs, voir DATASET_VERSIONS) :
+
+    data/snapshots/<version>/figures/<analyse>-<paramètres>.json.zlib
+    data/snapshots/<version>/json/<langue>/<analyse>.json
+    data/snapshots/<version>/html/<langue>/<page>.html
+    data/snapshots/<version>/index.json
+
+Les figures .json.zlib sont au format de utils.figure_cache (libellés
+différés, une figure pour toutes les langues) : cached_figure les relit
+avant de calculer, la vue par défaut s'affiche donc sans calcul. Un widget
+modifié donne une autre clé, calculée en direct. Les bundles json/ et html/
+(FR et EN) sont des exports statiques, consultables sans Streamlit.
+
+Toutes les pages d'analyse construisent leurs figures via cached_figure
+(constructeurs build_*) : chacune déclare ses vues par défaut dans
+SNAPSHOT_FIGURES. Seul le calendrier quotidien (page Week-end) n'est pas
+pré-calculé : sa version est l'empreinte de la table de l'année affichée.
+"""
+
+import hashlib
+import html
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from importlib import import_module
+from pathlib import Path
+from typing import Any, NamedTuple, Optional
+
+import plotly.io as pio
+from loguru import logger
+
+from i18n import TRANSLATIONS
+from utils.chart_payload import lean_figure
+from utils.figure_cache import deserialize_figure, figure_key, serialize_figure
+from utils.i18n_helper import deferred_labels
+
+# Dossier des instantanés, APP_SNAPSHOT_DIR (relatif au dossier de lancement)
+SNAPSHOT_DIR = Path(os.getenv("APP_SNAPSHOT_DIR", "data/snapshots"))
+
+# Langues des bundles statiques
+SNAPSHOT_LANGUAGES = ("fr", "en")
+
+# Fonction de version (data.cached_loaders) de chaque jeu de données
+DATASET_VERSIONS = {
+    "recipes": "get_recipes_version",
+    "interactions": "get_interactions_version",
+    "users": "get_users_version",
+}
+
+_TRENDLINES = "visualization.analyse_trendlines_v2"
+_SEASONALITY = "visualization.analyse_seasonality"
+_WEEKEND = "visualization.analyse_weekend"
+_RATINGS = "visualization.analyse_ratings"
+_USERS = "visualization.analyse_users"
+
+
+class SnapshotFigure(NamedTuple):
+    """Figure pré-calculée : page, analyse, constructeur, paramètres et données."""
+
+    page: str
+    analysis: str
+    module: str
+    builder: str
+    params: tuple = ()
+    dataset: str = "recipes"
+
+    def key(self, dataset_version: str) -> tuple:
+        """Clé utils.figure_cache de la vue par défaut."""
+        return figure_key(self.analysis, dataset_version, **dict(self.params))
+
+
+# Vues par défaut pré-calculées (mêmes paramètres que les appels des pages,
+# plage d'années complète = None)
+SNAPSHOT_FIGURES = (
+    SnapshotFigure(
+        "trends",
+        "trends_volume",
+        _TRENDLINES,
+        "build_volume_figure",
+        (("year_range", None), ("show_values", True)),
+    ),
+    SnapshotFigure(
+        "trends",
+        "trends_duration",
+        _TRENDLINES,
+        "build_duration_figure",
+        (("year_range", None), ("show_bubbles", True), ("quantiles", (0.25, 0.75))),
+    ),
+    SnapshotFigure(
+        "trends", "trends_complexity", _TRENDLINES, "build_complexity_figure"
+    ),
+    SnapshotFigure("trends", "trends_nutrition", _TRENDLINES, "build_nutrition_figure"),
+    SnapshotFigure(
+        "trends",
+        "trends_ingredients",
+        _TRENDLINES,
+        "build_ingredients_figure",
+        (("top_n", 10),),
+    ),
+    SnapshotFigure(
+        "trends", "trends_tags", _TRENDLINES, "build_tags_figure", (("top_n", 10),)
+    ),
+    *(
+        SnapshotFigure("seasonality", f"seasonality_{name}", _SEASONALITY, builder)
+        for name, builder in [
+            ("volume", "build_volume_figure"),
+            ("duration", "build_duration_figure"),
+            ("complexity", "build_complexity_figure"),
+            ("nutrition", "build_nutrition_figure"),
+            ("ingredients", "build_ingredients_figure"),
+            ("tags", "build_tags_figure"),
+        ]
+    ),
+    SnapshotFigure(
+        "seasonality",
+        "seasonality_decomposition",
+        _SEASONALITY,
+        "build_decomposition_figure",
+        (("series_key", "recipes"),),
+    ),
+    SnapshotFigure(
+        "seasonality",
+        "seasonality_amplitude",
+        _SEASONALITY,
+        "build_amplitude_figure",
+        (("series_key", "recipes"),),
+    ),
+    *(
+        SnapshotFigure("weekend", f"weekend_{name}", _WEEKEND, builder)
+        for name, builder in [
+            ("volume", "build_volume_figure"),
+            ("duration", "build_duration_figure"),
+            ("complexity", "build_complexity_figure"),
+            ("nutrition", "build_nutrition_figure"),
+            ("ingredients", "build_ingredients_figure"),
+            ("tags", "build_tags_figure"),
+        ]
+    ),
+    *(
+        SnapshotFigure(
+            "ratings", f"ratings_{name}", _RATINGS, builder, dataset="interactions"
+        )
+        for name, builder in [
+            ("validation", "build_validation_figure"),
+            ("trend", "build_trend_figure"),
+            ("distribution", "build_distribution_figure"),
+            ("season_stats", "build_season_stats_figure"),
+            ("season_variations", "build_season_variations_figure"),
+            ("complexity", "build_complexity_figure"),
+        ]
+    ),
+    *(
+        SnapshotFigure("users", f"users_{name}", _USERS, builder, dataset="users")
+        for name, builder in [
+            ("activity", "build_activity_figure"),
+            ("concentration", "build_concentration_figure"),
+            ("monthly", "build_monthly_figure"),
+            ("bias", "build_bias_figure"),
+        ]
+    ),
+)
+
+
+def current_version(dataset: str) -> str:
+    """
+    Version courante d'un jeu de données (clé des figures qui en dépendent).
+
+    Args:
+        dataset: Nom du jeu de données (clé de DATASET_VERSIONS)
+
+    Returns:
+        Version lue par la fonction de data.cached_loaders correspondante
+    """
+    loaders = import_module("data.cached_loaders")
+    return getattr(loaders, DATASET_VERSIONS[dataset])()
+
+
+def snapshot_file(key: tuple, root: Optional[Path] = None) -> Path:
+    """
+    Fichier de l'instantané d'une clé de figure.
+
+    Args:
+        key: Clé (analyse, paramètres, version) de utils.figure_cache.figure_key
+        root: Dossier des instantanés (défaut: SNAPSHOT_DIR)
+
+    Returns:
+        Chemin <root>/<version>/figures/<analyse>-<empreinte des paramètres>.json.zlib
+    """
+    analysis, params, dataset_version = key
+    digest = hashlib.sha1(repr(params).encode()).hexdigest()[:12]
+    root = SNAPSHOT_DIR if root is None else root
+    return root / dataset_version / "figures" / f"{analysis}-{digest}.json.zlib"
+
+
+def read_snapshot(key: tuple, root: Optional[Path] = None) -> Optional[bytes]:
+    """
+    Figure sérialisée pré-calculée pour cette clé.
+
+    Returns:
+        Octets au format serialize_figure, None si absente ou illisible
+    """
+    path = snapshot_file(key, root)
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning(f"Instantané illisible {path}: {e}")
+        return None
+
+
+def _write(path: Path, data: Any) -> None:
+    """
+    Écrit un fichier (texte ou octets), dossiers parents compris.
+
+    L'écriture est atomique : fichier temporaire du même dossier puis
+    os.replace, l'application (lancée pendant la construction) ne lit
+    donc jamais un fichier partiel.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        if isinstance(data, bytes):
+            tmp.write_bytes(data)
+        else:
+            tmp.write_text(data, encoding="utf-8")
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _page_html(page: str, language: str, figures: list[Any]) -> str:
+    """Page HTML autonome (Plotly chargé depuis le CDN) regroupant les figures."""
+    title = html.escape(TRANSLATIONS["pages"].get(page, {}).get(language, page))
+    body = "\n".join(
+        pio.to_html(fig, full_html=False, include_plotlyjs="cdn" if i == 0 else False)
+        for i, fig in enumerate(figures)
+    )
+    return (
+        f'<!DOCTYPE html>\n<html lang="{language}">\n<head>\n'
+        f'<meta charset="utf-8">\n<title>{title}</title>\n</head>\n'
+        f"<body>\n<h1>{title}</h1>\n{body}\n</body>\n</html>\n"
+    )
+
+
+def build_page(
+    page: str, figures: list[SnapshotFigure], dataset_version: str, root: Path
+) -> list[str]:
+    """
+    Construit et écrit les instantanés d'une page (exécuté dans un processus).
+
+    Args:
+        page: Nom de la page (ex. 'trends')
+        figures: Figures de la page (un même jeu de données)
+        dataset_version: Version de ce jeu de données (clé des figures)
+        root: Dossier des instantanés
+
+    Returns:
+        Analyses écrites
+    """
+    localized: dict[str, list[Any]] = {lang: [] for lang in SNAPSHOT_LANGUAGES}
+    for spec in figures:
+        start = time.perf_counter()
+        build = getattr(import_module(spec.module), spec.builder)
+        with deferred_labels():
+            payload = serialize_figure(lean_figure(build(**dict(spec.params))))
+        _write(snapshot_file(spec.key(dataset_version), root), payload)
+        for lang in SNAPSHOT_LANGUAGES:
+            fig = deserialize_figure(payload, language=lang)
+            localized[lang].append(fig)
+            _write(
+                root / dataset_version / "json" / lang / f"{spec.analysis}.json",
+                fig.to_json(),
+            )
+        logger.info(
+            f"Instantané {spec.analysis}: {len(payload) / 1024:.0f} Ko "
+            f"en {time.perf_counter() - start:.1f} s"
+        )
+    for lang, figs in localized.items():
+        _write(
+            root / dataset_version / "html" / lang / f"{page}.html",
+            _page_html(page, lang, figs),
+        )
+    return [spec.analysis for spec in figures]
+
+
+def build_snapshots(
+    root: Optional[Path] = None,
+    dataset_version: Optional[str] = None,
+    workers: Optional[int] = None,
+    figures: Optional[tuple[SnapshotFigure, ...]] = None,
+) -> dict[str, list[str]]:
+    """
+    Construit les instantanés des figures déclarées, une page par processus.
+
+    Chaque page est écrite sous la version de son jeu de données (voir
+    DATASET_VERSIONS) ; index.json liste les pages de chaque version.
+
+    Args:
+        root: Dossier des instantanés (défaut: SNAPSHOT_DIR)
+        dataset_version: Version imposée à toutes les pages (défaut: version
+            courante du jeu de données de chaque page)
+        workers: Nombre de processus (défaut: un par page)
+        figures: Figures à construire (défaut: SNAPSHOT_FIGURES)
+
+    Returns:
+        Dict page -> analyses écrites
+
+    Raises:
+        ValueError: Si les figures d'une page dépendent de jeux de données
+            différents
+    """
+    root = SNAPSHOT_DIR if root is None else Path(root)
+
+    pages: dict[str, list[SnapshotFigure]] = {}
+    for spec in figures or SNAPSHOT_FIGURES:
+        pages.setdefault(spec.page, []).append(spec)
+
+    # Version de chaque page, lue une fois par jeu de données
+    versions: dict[str, str] = {}
+    page_versions: dict[str, str] = {}
+    for page, specs in pages.items():
+        datasets = {spec.dataset for spec in specs}
+        if len(datasets) != 1:
+            raise ValueError(f"Page {page}: jeux de données mélangés {datasets}")
+        (dataset,) = datasets
+        if dataset not in versions:
+            versions[dataset] = dataset_version or current_version(dataset)
+        page_versions[page] = versions[dataset]
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers or len(pages)) as pool:
+        futures = {
+            page: pool.submit(build_page, page, specs, page_versions[page], root)
+            for page, specs in pages.items()
+        }
+        built = {page: future.result() for page, future in futures.items()}
+
+    for version in dict.fromkeys(page_versions.values()):
+        _write(
+            root / version / "index.json",
+            json.dumps(
+                {
+                    "dataset_version": version,
+                    "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                    "languages": list(SNAPSHOT_LANGUAGES),
+                    "pages": {
+                        page: analyses
+                        for page, analyses in built.items()
+                        if page_versions[page] == version
+                    },
+                },
+                indent=2,
+            ),
+        )
+    logger.info(
+        f"Instantanés {', '.join(dict.fromkeys(page_versions.values()))}: "
+        f"{sum(map(len, built.values()))} figures, "
+        f"{len(pages)} pages en {time.perf_counter() - start:.1f} s"
+    )
+    return built
@@ -0,0 +1,112 @@
+"""
+Page d'administration : mémoire du processus, des caches et des sessions.
+
+Accessible par le menu lorsque APP_ADMIN_TOKEN est défini sur le serveur et
+que l'URL contient ?admin=<jeton> (utils.memory.admin_allowed). Les chiffres
+viennent de utils.memory : taille de chaque cache borné (données, figures),
+taille de st.session_state par session active et RSS du processus.
+"""
+
+import time
+
+import streamlit as st
+
+from utils.i18n_helper import t
+from utils.memory import (
+    MB,
+    SESSION_MAX_BYTES,
+    clear_caches,
+    process_rss_bytes,
+    registered_caches,
+    session_stats,
+)
+
+
+def cache_rows() -> list[dict]:
+    """
+    Une ligne par cache inscrit, pour st.dataframe.
+
+    Returns:
+        Liste de dicts (cache, entrées, Mo, limite Mo, taux de succès, évictions)
+    """
+    rows = []
+    for stats in (cache.stats() for cache in registered_caches()):
+        lookups = stats["hits"] + stats["misses"]
+        rows.append(
+            {
+                t("col_cache", category="memory"): stats["name"],
+                t("col_entries", category="memory"): stats["entries"],
+                t("col_mb", category="memory"): round(stats["bytes"] / MB, 1),
+                t("col_limit_mb", category="memory"): round(stats["max_bytes"] / MB),
+                t("col_hit_rate", category="memory"): (
+                    f"{stats['hits'] / lookups:.0%}" if lookups else "-"
+                ),
+                t("col_evictions", category="memory"): stats["evictions"],
+            }
+        )
+    return rows
+
+
+def session_rows() -> list[dict]:
+    """
+    Une ligne par session active, les plus lourdes d'abord.
+
+    Returns:
+        Liste de dicts (session, clés, Mo, inactivité en secondes, alerte)
+    """
+    now = time.time()
+    return [
+        {
+            t("col_session", category="memory"): usage.session_id[:8],
+            t("col_keys", category="memory"): usage.n_keys,
+            t("col_mb", category="memory"): round(usage.bytes / MB, 2),
+            t("col_idle_s", category="memory"): round(now - usage.seen_at),
+            t("col_over_budget", category="memory"): "⚠️" if usage.over_budget else "",
+        }
+        for usage in session_stats()
+    ]
+
+
+def render_memory_admin() -> None:
+    """Point d'entrée de la page d'administration mémoire."""
+    st.markdown(
+        f'<h1 style="margin-top: 0; padding-top: 0;">🧠 {t("main_title", category="memory")}</h1>',
+        unsafe_allow_html=True,
+    )
+    st.markdown(t("main_description", category="memory"))
+
+    caches = cache_rows()
+    sessions = session_rows()
+    cached_mb = sum(c.stats()["bytes"] for c in registered_caches()) / MB
+    sessions_mb = sum(u.bytes for u in session_stats()) / MB
+    unit = t("col_mb", category="memory")
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric(
+            t("metric_rss", category="memory"),
+            f"{process_rss_bytes() / MB:,.0f} {unit}",
+        )
+    with col2:
+        st.metric(t("metric_caches", category="memory"), f"{cached_mb:,.1f} {unit}")
+    with col3:
+        st.metric(t("metric_sessions", category="memory"), len(sessions))
+    with col4:
+        st.metric(
+            t("metric_sessions_mb", category="memory"), f"{sessions_mb:,.2f} {unit}"
+        )
+
+    st.subheader(f"🗄️ {t('caches_title', category='memory')}")
+    if caches:
+        st.dataframe(caches, hide_index=True, use_container_width=True)
+    else:
+        st.info(t("no_caches", category="memory"))
+    if st.button(t("clear_caches", category="memory"), key="btn_clear_memory"):
+        clear_caches()
+        st.rerun()
+
+    st.subheader(f"👤 {t('sessions_title', category='memory')}")
+    st.caption(
+        t("sessions_caption", category="memory", limit=round(SESSION_MAX_BYTES / MB))
+    )
+    st.dataframe(sessions, hide_index=True, use_container_width=True)
@@ -0,0 +1,242 @@
+"""
+Réseau d'associations d'ingrédients ("what goes with what").
+
+Ce module affiche les associations d'ingrédients précalculées par l'ETL
+(mangetamain_data_utils.data_utils_pairings) : la page ne lit que la liste
+d'arêtes Parquet, aucun comptage de co-occurrences n'est fait au rendu.
+
+Analyses disponibles:
+1. Meilleurs voisins d'un ingrédient (lift)
+2. Glissements saisonniers des associations
+"""
+
+import streamlit as st
+import polars as pl
+import numpy as np
+import plotly.graph_objects as go
+
+from data.cached_loaders import get_ingredient_pairs as load_ingredient_pairs
+from utils import chart_theme
+from utils.color_theme import ColorTheme
+from utils.i18n_helper import t, translate_list
+
+ALL_SEASONS = "All"
+SEASON_ORDER = ["Winter", "Spring", "Summer", "Autumn"]
+
+
+def get_ingredient_choices(pairs: pl.DataFrame) -> list[str]:
+    """
+    Liste des ingrédients disponibles, du plus au moins connecté.
+
+    Args:
+        pairs: Liste d'arêtes précalculée
+
+    Returns:
+        Ingrédients triés par nombre total de recettes partagées
+    """
+    return (
+        pairs.filter(pl.col("season") == ALL_SEASONS)
+        .group_by("ingredient")
+        .agg(pl.col("n_recipes").sum().alias("weight"))
+        .sort(["weight", "ingredient"], descending=[True, False])["ingredient"]
+        .to_list()
+    )
+
+
+# ============================================================================
+# ANALYSE 1: MEILLEURS VOISINS
+# ============================================================================
+
+
+def analyse_pairings_voisins(pairs: pl.DataFrame, ingredient: str) -> None:
+    """
+    Meilleurs voisins d'un ingrédient classés par lift.
+
+    Graphique:
+    - Bar chart horizontal: lift des top-k voisins (hover: nombre de recettes)
+    """
+    neighbors = pairs.filter(
+        (pl.col("ingredient") == ingredient) & (pl.col("season") == ALL_SEASONS)
+    ).sort("rank")
+
+    if neighbors.is_empty():
+        st.warning(t("no_pairs", category="pairings"))
+        return
+
+    fig = go.Figure()
+    fig.add_trace(
+        go.Bar(
+            y=neighbors["neighbor"].to_list(),
+            x=neighbors["lift"].to_list(),
+            orientation="h",
+            marker=dict(
+                color=ColorTheme.ORANGE_PRIMARY,
+                line=dict(color=ColorTheme.TEXT_SECONDARY, width=1),
+            ),
+            customdata=neighbors["n_recipes"].to_list(),
+            text=[f"{val:.2f}" for val in neighbors["lift"]],
+            textposition="outside",
+            textfont=dict(size=11, color=ColorTheme.TEXT_PRIMARY),
+            showlegend=False,
+            hovertemplate=(
+                "<b>%{y}</b><br>Lift: %{x:.2f}<br>"
+                f"{t('recipes_label', category='pairings')}: "
+                "%{customdata:,}<extra></extra>"
+            ),
+        )
+    )
+
+    # Ligne d'indépendance (lift = 1)
+    fig.add_vline(x=1, line=dict(color=ColorTheme.TEXT_PRIMARY, width=1.5, dash="dash"))
+
+    fig.update_xaxes(title_text=t("lift_axis", category="pairings"))
+    fig.update_yaxes(autorange="reversed")
+
+    chart_theme.apply_chart_theme(
+        fig,
+        title=t(
+            "neighbors_chart_title",
+            category="pairings",
+            n=neighbors.height,
+            ingredient=ingredient,
+        ),
+    )
+    fig.update_layout(height=max(400, neighbors.height * 30))
+
+    st.plotly_chart(fig, use_container_width=True)
+    st.info(t("lift_interpretation", category="pairings"))
+
+
+# ============================================================================
+# ANALYSE 2: GLISSEMENTS SAISONNIERS
+# ============================================================================
+
+
+def analyse_pairings_saisons(pairs: pl.DataFrame, ingredient: str) -> None:
+    """
+    Glissements saisonniers des associations d'un ingrédient.
+
+    Graphique:
+    - Heatmap voisins × saisons: écart relatif (%) du support saisonnier
+      au support global
+    """
+    seasonal = pairs.filter(
+        (pl.col("ingredient") == ingredient) & (pl.col("season") != ALL_SEASONS)
+    )
+
+    if seasonal.is_empty():
+        st.warning(t("no_pairs", category="pairings"))
+        return
+
+    shifts = seasonal.pivot(
+        on="season", index=["neighbor", "rank"], values="shift"
+    ).sort("rank")
+    seasons = [s for s in SEASON_ORDER if s in shifts.columns]
+    z = shifts.select(seasons).fill_null(0.0).to_numpy() * 100
+
+    season_labels = translate_list([s.lower() for s in seasons], "seasons")
+    limit = float(np.abs(z).max()) or 1.0
+
+    fig = go.Figure(
+        data=go.Heatmap(
+            z=z,
+            x=season_labels,
+            y=shifts["neighbor"].to_list(),
+            colorscale="RdBu",
+            zmid=0,
+            zmin=-limit,
+            zmax=limit,
+            text=np.round(z, 0),
+            texttemplate="%{text:+.0f}%",
+            textfont=dict(size=10),
+            hovertemplate=(
+                "<b>%{y}</b><br>%{x}<br>"
+                f"{t('shift_label', category='pairings')}: "
+                "%{z:+.1f}%<extra></extra>"
+            ),
+            colorbar=dict(
+                title=dict(
+                    text=t("shift_label", category="pairings"),
+                    side="right",
+                    font=dict(color=ColorTheme.TEXT_PRIMARY),
+                ),
+                tickfont=dict(color=ColorTheme.TEXT_PRIMARY),
+            ),
+        )
+    )
+
+    chart_theme.apply_chart_theme(
+        fig, title=t("seasons_chart_title", category="pairings")
+    )
+    fig.update_yaxes(autorange="reversed")
+    fig.update_layout(height=max(400, shifts.height * 30))
+
+    st.plotly_chart(fig, use_container_width=True)
+
+
+def render_pairings_analysis() -> None:
+    """
+    Point d'entrée principal pour le réseau d'associations d'ingrédients.
+
+    Format: sélection d'un ingrédient puis affichage de ses voisins et de
+    leurs glissements saisonniers.
+    """
+    st.markdown(
+        f'<h1 style="margin-top: 0; padding-top: 0;">🥕 {t("main_title", category="pairings")}</h1>',
+        unsafe_allow_html=True,
+    )
+    st.markdown(t("main_description", category="pairings"))
+
+    pairs = load_ingredient_pairs()
+    choices = get_ingredient_choices(pairs)
+
+    if not choices:
+        st.warning(t("no_pairs", category="pairings"))
+        return
+
+    overall = pairs.filter(pl.col("season") == ALL_SEASONS)
+    n_edges = (
+        overall.select(
+            pl.min_horizontal("ingredient", "neighbor").alias("a"),
+            pl.max_horizontal("ingredient", "neighbor").alias("b"),
+        )
+        .unique()
+        .height
+    )
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric(t("metric_ingredients", category="pairings"), f"{len(choices):,}")
+    with col2:
+        st.metric(t("metric_edges", category="pairings"), f"{n_edges:,}")
+    with col3:
+        st.metric(
+            t("metric_neighbors", category="pairings"),
+            f"{int(overall['rank'].max())}",
+        )
+
+    ingredient = st.selectbox(
+        t("select_ingredient", category="pairings"),
+        options=choices,
+        index=0,
+        key="pairings_ingredient",
+    )
+
+    st.subheader(f"🤝 {t('neighbors_title', category='pairings')}")
+    analyse_pairings_voisins(pairs, ingredient)
+    st.markdown("---")
+
+    st.subheader(f"📅 {t('seasons_title', category='pairings')}")
+    analyse_pairings_saisons(pairs, ingredient)
+
+
+# ============================================================================
+# MÉTADONNÉES DU MODULE (pour integration_strategies.md)
+# ============================================================================
+
+MODULE_INFO = {
+    "name": "Associations d'ingrédients",
+    "icon": "🥕",
+    "description": "Réseau d'associations d'ingrédients précalculé (lift, saisons)",
+    "num_analyses": 2,
+    "status": "completed",
+}
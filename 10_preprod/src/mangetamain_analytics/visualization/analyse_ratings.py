@@ -11,72 +11,166 @@ import polars as pl
 import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-from scipy.stats import kendalltau, linregress, f_oneway, kruskal
+from scipy.stats import linregress
 import statsmodels.api as sm
 
+from analysis.change_points import series_version
+from analysis.correlation import weighted_correlation
+from analysis.sufficient_stats import (
+    RATING_LEVELS,
+    anova_from_moments,
+    histogram_columns,
+    histogram_moments,
+    kruskal_from_histogram,
+)
+from analysis.trend_tests import trend_tests
+
 # Import du thème graphique
 from utils import chart_theme
 from utils.color_theme import ColorTheme
+from utils.figure_cache import cached_figure, figure_stats
 from utils.i18n_helper import t
+from utils.sections import Section, render_sections
 
 # Import des utilitaires de chargement avec cache
 from data.cached_loaders import (
+    get_change_points,
+    get_histogram_bootstrap_means,
+    get_interactions_version,
+    get_rating_histograms,
     get_ratings_longterm as load_ratings_for_longterm_analysis,
+    get_recipe_stats,
 )
 
-# Import direct sans cache (utilisé rarement)
-from mangetamain_data_utils.data_utils_ratings import load_clean_interactions
 
+# Variables corrélées au rating moyen mensuel (colonne -> clé de traduction)
+CORRELATION_VARIABLES = {
+    "n_interactions": "volume_interactions",
+    "month_index": "time_months",
+    "std_rating": "ecart_type",
+}
+
+# Séries mensuelles testées par Mann-Kendall (colonne -> clé de traduction)
+TREND_SERIES = {
+    "mean_rating": "rating_moyen",
+    "std_rating": "ecart_type",
+    "n_interactions": "volume_interactions",
+}
 
-def weighted_spearman(x, y, w):
-    """Calcule le coefficient de corrélation de Spearman pondéré.
+# Notes en fonction de la complexité : recettes retenues et nombre de classes
+COMPLEXITY_MIN_RATINGS = 5
+COMPLEXITY_BINS = 10
+
+
+def rating_correlations(monthly_df: pd.DataFrame, weights: np.ndarray) -> pl.DataFrame:
+    """
+    Corrélations pondérées du rating moyen mensuel avec volume, temps et dispersion.
+
+    Chaque méthode calcule toute la matrice de corrélation en un appel ;
+    seule la ligne du rating moyen est conservée.
 
     Args:
-        x: Variable X
-        y: Variable Y
-        w: Poids pour chaque observation
+        monthly_df: Statistiques mensuelles triées (mean_rating, n_interactions,
+            std_rating)
+        weights: Poids de chaque mois
 
     Returns:
-        float: Coefficient de Spearman pondéré
+        DataFrame (variable, spearman, pearson, kendall), une ligne par
+        variable de CORRELATION_VARIABLES
     """
-    # Rang pondéré
-    rank_x = pd.Series(x).rank(method="average").values
-    rank_y = pd.Series(y).rank(method="average").values
+    values = np.column_stack(
+        [
+            monthly_df["mean_rating"].to_numpy(dtype=float),
+            monthly_df["n_interactions"].to_numpy(dtype=float),
+            np.arange(len(monthly_df), dtype=float),
+            monthly_df["std_rating"].to_numpy(dtype=float),
+        ]
+    )
+    return pl.DataFrame(
+        {
+            "variable": list(CORRELATION_VARIABLES),
+            **{
+                method: weighted_correlation(values, weights, method)[0, 1:]
+                for method in ("spearman", "pearson", "kendall")
+            },
+        }
+    )
+
+
+def rating_by_complexity(
+    stats: pl.DataFrame, n_bins: int = COMPLEXITY_BINS
+) -> pl.DataFrame:
+    """
+    Histogramme des notes par classe de complexité des recettes.
 
-    # Corrélation pondérée entre les rangs
-    cov_matrix = np.cov(rank_x, rank_y, aweights=w)
-    cov_xy = cov_matrix[0, 1]
-    var_x = np.cov(rank_x, aweights=w)
-    var_y = np.cov(rank_y, aweights=w)
+    Les recettes sont réparties en n_bins classes d'effectifs égaux selon
+    complexity_score ; les effectifs par note de leurs recettes sont sommés.
 
-    # Gestion du cas où np.cov retourne un scalaire
-    if np.ndim(var_x) == 0:
-        std_x = np.sqrt(var_x)
-    else:
-        std_x = np.sqrt(var_x[0, 0])
+    Args:
+        stats: Table par recette (complexity_score, count_1..count_5)
+        n_bins: Nombre de classes (déciles par défaut)
 
-    if np.ndim(var_y) == 0:
-        std_y = np.sqrt(var_y)
-    else:
-        std_y = np.sqrt(var_y[0, 0])
+    Returns:
+        DataFrame trié par classe (complexity_bin, n_recipes, complexity_min,
+        complexity_max, count_1..count_5)
+    """
+    return (
+        stats.drop_nulls("complexity_score")
+        .with_columns(
+            complexity_bin=(
+                (pl.col("complexity_score").rank("ordinal") - 1) * n_bins // pl.len()
+                + 1
+            )
+        )
+        .group_by("complexity_bin")
+        .agg(
+            pl.len().alias("n_recipes"),
+            pl.col("complexity_score").min().alias("complexity_min"),
+            pl.col("complexity_score").max().alias("complexity_max"),
+            *[pl.col(c).sum() for c in histogram_columns()],
+        )
+        .sort("complexity_bin")
+    )
 
-    weighted_corr = cov_xy / (std_x * std_y)
-    return weighted_corr
 
+def monthly_rating_ci(dates: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """
+    IC 95 % bootstrap du rating moyen de chaque mois.
+
+    Les IC sont obtenus par tirages multinomiaux des histogrammes mensuels
+    de notes 1-5 (agrégat en cache), sans relire les interactions.
+
+    Args:
+        dates: Premier jour de chaque mois affiché
+
+    Returns:
+        (ci_low, ci_high), NaN pour un mois absent des histogrammes
+    """
+    hist = get_rating_histograms(("year", "month"))
+    counts = hist.select(histogram_columns()).to_numpy()
+    version = series_version(hist["year"].to_numpy(), hist["month"].to_numpy(), counts)
+    ci = hist.select("year", "month").hstack(
+        get_histogram_bootstrap_means("ratings_monthly", version, counts)
+    )
+
+    months = pd.DataFrame({"year": dates.dt.year, "month": dates.dt.month})
+    months = months.merge(ci.to_pandas(), on=["year", "month"], how="left")
+    return (
+        months["ci_low"].to_numpy(dtype=float),
+        months["ci_high"].to_numpy(dtype=float),
+    )
 
-def analyse_ratings_validation_ponderee() -> None:
-    """Analyse 1: Validation méthodologique - Tests pondérés vs non-pondérés."""
-    st.markdown(t("ratings_methodology_desc", category="ratings"))
 
+def build_validation_figure() -> go.Figure:
+    """Compare les tests pondérés et non pondérés et construit leur figure (2×2)."""
     # Chargement des données
-    with st.spinner("Chargement des statistiques mensuelles..."):
-        monthly_stats, metadata = load_ratings_for_longterm_analysis(
-            min_interactions=100, return_metadata=True, verbose=False
-        )
+    monthly_stats, metadata = load_ratings_for_longterm_analysis(
+        min_interactions=100, return_metadata=True, verbose=False
+    )
 
+    # Figure vide, sans statistiques : la page signale l'absence de données
     if monthly_stats.empty:
-        st.error(t("no_data_available"))
-        return
+        return go.Figure()
 
     # Préparation du DataFrame
     monthly_df = monthly_stats.copy()
@@ -242,10 +336,7 @@ def analyse_ratings_validation_ponderee() -> None:
     # Application du thème "Back to the Kitchen"
     chart_theme.apply_subplot_theme(fig, num_rows=2, num_cols=2)
 
-    st.plotly_chart(fig, use_container_width=True)
-
     # Tests statistiques
-    tau, p_value_kendall = kendalltau(time_index, ratings)
     slope, intercept, r_value, p_value_reg, std_err = linregress(time_index, ratings)
 
     # Tests pondérés
@@ -267,6 +358,41 @@ def analyse_ratings_validation_ponderee() -> None:
         abs(wls_result.params[1] - slope) / abs(slope) * 100 if slope != 0 else 0
     )
 
+    # Statistiques affichées par la page (voir figure_stats)
+    fig.update_layout(
+        meta=dict(
+            cv_volumes=cv_volumes,
+            bias_slope=bias_slope,
+            r2_weighted=r2_weighted,
+            p_value_wls=wls_result.pvalues[1],
+        )
+    )
+
+    return fig
+
+
+def analyse_ratings_validation_ponderee() -> None:
+    """Analyse 1: Validation méthodologique - Tests pondérés vs non-pondérés."""
+    st.markdown(t("ratings_methodology_desc", category="ratings"))
+
+    with st.spinner("Chargement des statistiques mensuelles..."):
+        # Figure et statistiques en cache (voir utils.figure_cache)
+        fig = cached_figure(
+            "ratings_validation", get_interactions_version(), build_validation_figure
+        )
+        figure_data = figure_stats(fig)
+
+    if not figure_data:
+        st.error(t("no_data_available"))
+        return
+
+    cv_volumes = figure_data["cv_volumes"]
+    bias_slope = figure_data["bias_slope"]
+    r2_weighted = figure_data["r2_weighted"]
+    p_value_wls = figure_data["p_value_wls"]
+
+    st.plotly_chart(fig, use_container_width=True)
+
     # Métriques
     col1, col2, col3, col4 = st.columns(4)
     with col1:
@@ -276,7 +402,7 @@ def analyse_ratings_validation_ponderee() -> None:
     with col3:  # noqa: F841
         st.metric(t("r2_pondere", category="ratings"), f"{r2_weighted:.4f}")
     with col4:
-        st.metric(t("p_value_wls", category="ratings"), f"{wls_result.pvalues[1]:.4f}")
+        st.metric(t("p_value_wls", category="ratings"), f"{p_value_wls:.4f}")
 
     # Interprétation
     st.info(
@@ -286,19 +412,16 @@ def analyse_ratings_validation_ponderee() -> None:
     )
 
 
-def analyse_ratings_tendance_temporelle() -> None:
-    """Analyse 2: Tendance temporelle des ratings (Méthodes pondérées)."""
-    st.markdown(t("analyse_evolution_wls", category="ratings"))
-
+def build_trend_figure() -> go.Figure:
+    """Ajuste les tendances pondérées des ratings et construit leur figure (2×2)."""
     # Chargement des données
-    with st.spinner("Chargement des statistiques mensuelles..."):
-        monthly_stats, _ = load_ratings_for_longterm_analysis(
-            min_interactions=100, return_metadata=True
-        )
+    monthly_stats, _ = load_ratings_for_longterm_analysis(
+        min_interactions=100, return_metadata=True
+    )
 
+    # Figure vide, sans statistiques : la page signale l'absence de données
     if monthly_stats.empty:
-        st.error(t("no_data_available"))
-        return
+        return go.Figure()
 
     # Préparation du DataFrame
     monthly_df = monthly_stats.copy()
@@ -350,7 +473,21 @@ def analyse_ratings_tendance_temporelle() -> None:
         ),
     )
 
-    # (1) Tendance des ratings
+    # (1) Tendance des ratings, avec IC 95 % bootstrap de chaque mois
+    ci_low, ci_high = monthly_rating_ci(monthly_df["date"])
+    fig.add_trace(
+        go.Scatter(
+            x=monthly_df["date"].tolist() + monthly_df["date"].tolist()[::-1],
+            y=ci_high.tolist() + ci_low.tolist()[::-1],
+            fill="toself",
+            fillcolor=ColorTheme.to_rgba(ColorTheme.CHART_COLORS[3], 0.2),
+            line=dict(color="rgba(255,255,255,0)"),
+            name=t("legend_bootstrap_ci", category="ratings"),
+            showlegend=True,
+        ),
+        row=1,
+        col=1,
+    )
     fig.add_trace(
         go.Scatter(
             x=monthly_df["date"],
@@ -462,6 +599,22 @@ def analyse_ratings_tendance_temporelle() -> None:
         col=2,
     )
 
+    # Ruptures : début de chaque nouveau régime (ratings et volumes)
+    dates = monthly_df["date"].tolist()
+    version = series_version(ratings, volumes, monthly_df["date"].values)
+    for series_name, values, col in [
+        ("ratings_mean_monthly", ratings, 1),
+        ("ratings_volume_monthly", volumes, 2),
+    ]:
+        segments = get_change_points(series_name, version, values.astype(float), dates)
+        for start in segments["start"][1:]:
+            fig.add_vline(
+                x=start,
+                line=dict(color=ColorTheme.TEXT_PRIMARY, width=1.5, dash="dot"),
+                row=1,
+                col=col,
+            )
+
     # Axes
     fig.update_yaxes(title_text=t("rating_moyen", category="ratings"), row=1, col=1)
     fig.update_yaxes(title_text="Nombre d'interactions", row=1, col=2)
@@ -480,51 +633,141 @@ def analyse_ratings_tendance_temporelle() -> None:
     # Application du thème
     chart_theme.apply_subplot_theme(fig, num_rows=2, num_cols=2)
 
-    st.plotly_chart(fig, use_container_width=True)
+    # Corrélations pondérées (volume, temps, dispersion) en un appel par méthode
+    correlations = rating_correlations(monthly_df, weights)
+
+    # Tests non paramétriques : les trois séries mensuelles en un seul lot
+    mk_results = trend_tests(
+        monthly_df[list(TREND_SERIES)].to_numpy(dtype=float).T,
+        labels=list(TREND_SERIES),
+    )
+
+    # Statistiques affichées par la page (voir figure_stats)
+    fig.update_layout(
+        meta=dict(
+            slope=wls_trend_result.params[1],
+            p_value=wls_trend_result.pvalues[1],
+            r2_weighted=r2_weighted,
+            correlations=correlations.to_dict(as_series=False),
+            mann_kendall=mk_results.to_dict(as_series=False),
+        )
+    )
 
-    # Corrélation pondérée
-    vol_qual_weighted = weighted_spearman(volumes, ratings, weights)
+    return fig
+
+
+def analyse_ratings_tendance_temporelle() -> None:
+    """Analyse 2: Tendance temporelle des ratings (Méthodes pondérées)."""
+    st.markdown(t("analyse_evolution_wls", category="ratings"))
+
+    with st.spinner("Chargement des statistiques mensuelles..."):
+        # Figure et statistiques en cache (voir utils.figure_cache)
+        fig = cached_figure(
+            "ratings_trend", get_interactions_version(), build_trend_figure
+        )
+        figure_data = figure_stats(fig)
+
+    if not figure_data:
+        st.error(t("no_data_available"))
+        return
+
+    slope = figure_data["slope"]
+    p_value = figure_data["p_value"]
+    r2_weighted = figure_data["r2_weighted"]
+    correlations = pl.DataFrame(figure_data["correlations"])
+    mk_results = pl.DataFrame(figure_data["mann_kendall"])
+    vol_qual_weighted = correlations["spearman"][0]
+
+    st.plotly_chart(fig, use_container_width=True)
+    st.caption(t("change_points_ratings_caption", category="ratings"))
+    st.caption(t("bootstrap_ci_caption", category="ratings"))
 
     # Métriques
     col1, col2, col3, col4 = st.columns(4)
     with col1:
         st.metric(
             t("slope_weighted", category="ratings"),
-            f"{wls_trend_result.params[1]:.6f} pts/mois",
+            f"{slope:.6f} pts/mois",
         )
     with col2:
         st.metric(t("r2_weighted_metric", category="ratings"), f"{r2_weighted:.4f}")
     with col3:
-        st.metric("P-value", f"{wls_trend_result.pvalues[1]:.4f}")
+        st.metric("P-value", f"{p_value:.4f}")
     with col4:
         st.metric(
             t("corr_volume_qualite", category="ratings"), f"{vol_qual_weighted:.3f}"
         )
 
+    # Tests non paramétriques (Mann-Kendall) des trois séries mensuelles
+    trend_names = {
+        "increasing": t("trend_increasing", category="ratings"),
+        "decreasing": t("trend_decreasing", category="ratings"),
+        "no trend": t("trend_none", category="ratings"),
+    }
+    with st.expander(t("mann_kendall_expander", category="ratings")):
+        st.dataframe(
+            mk_results.select(
+                pl.col("series")
+                .replace_strict(
+                    {
+                        col: t(key, category="ratings")
+                        for col, key in TREND_SERIES.items()
+                    }
+                )
+                .alias(t("col_series", category="ratings")),
+                pl.col("tau").round(3).alias("Tau"),
+                pl.col("p_value").round(4).alias("P-value"),
+                pl.col("slope").alias(t("col_sen_slope", category="ratings")),
+                pl.col("trend")
+                .replace_strict(trend_names)
+                .alias(t("col_trend", category="ratings")),
+            ),
+            use_container_width=True,
+            hide_index=True,
+        )
+        st.caption(t("mann_kendall_caption", category="ratings"))
+
+    with st.expander(t("correlation_expander", category="ratings")):
+        st.dataframe(
+            correlations.select(
+                pl.col("variable")
+                .replace_strict(
+                    {
+                        col: t(key, category="ratings")
+                        for col, key in CORRELATION_VARIABLES.items()
+                    }
+                )
+                .alias(t("col_variable", category="ratings")),
+                pl.col("spearman").round(3).alias("Spearman"),
+                pl.col("pearson").round(3).alias("Pearson"),
+                pl.col("kendall").round(3).alias("Kendall"),
+            ),
+            use_container_width=True,
+            hide_index=True,
+        )
+        st.caption(t("correlation_caption", category="ratings"))
+
     # Interprétation
     st.info(
         t("ratings_info_temporal", category="ratings").format(
-            slope_year=wls_trend_result.params[1] * 12,
-            p_value=wls_trend_result.pvalues[1],
+            slope_year=slope * 12,
+            p_value=p_value,
             r2_weighted=r2_weighted,
             vol_qual_weighted=vol_qual_weighted,
         )
     )
 
 
-def analyse_ratings_distribution() -> None:
-    """Analyse 3: Évolution détaillée et corrélations (bandes de confiance)."""
-    st.markdown(t("ratings_detailed_overview", category="ratings"))
-
+def build_distribution_figure() -> go.Figure:
+    """Calcule moyenne, IC et corrélation pondérés et construit leur figure (3×1)."""
     # Chargement des données
-    with st.spinner("Chargement des statistiques mensuelles..."):
-        monthly_stats, _ = load_ratings_for_longterm_analysis(
-            min_interactions=100, return_metadata=True
-        )
+    monthly_stats, _ = load_ratings_for_longterm_analysis(
+        min_interactions=100, return_metadata=True
+    )
 
+    # Figure vide, sans statistiques : la page signale l'absence de données
     if monthly_stats.empty:
-        st.error(t("no_data_available"))
-        return
+        return go.Figure()
 
     # Préparation du DataFrame
     monthly_df = monthly_stats.copy()
@@ -564,7 +807,9 @@ def analyse_ratings_distribution() -> None:
     wls_vol_detailed = sm.WLS(ratings, X_vol_detailed, weights=weights)
     wls_vol_detailed_result = wls_vol_detailed.fit()
     vol_pred_detailed = wls_vol_detailed_result.predict(X_vol_detailed)
-    vol_qual_weighted = weighted_spearman(volumes, ratings, weights)
+    vol_qual_weighted = weighted_correlation(
+        np.column_stack([volumes, ratings]), weights
+    )[0, 1]
 
     # Création du graphique avec 3 subplots
     fig = make_subplots(
@@ -656,17 +901,17 @@ def analyse_ratings_distribution() -> None:
         col=1,
     )
 
-    # Bandes de confiance zoomées
+    # Bandes de confiance zoomées : IC 95 % bootstrap de chaque mois
+    ci_low, ci_high = monthly_rating_ci(monthly_df["date"])
     fig.add_trace(
         go.Scatter(
             x=monthly_df["date"].tolist() + monthly_df["date"].tolist()[::-1],
-            y=[upper_bound_weighted] * len(monthly_df)
-            + [lower_bound_weighted] * len(monthly_df),
+            y=ci_high.tolist() + ci_low.tolist()[::-1],
             fill="toself",
             fillcolor=ColorTheme.to_rgba(ColorTheme.ORANGE_SECONDARY, 0.3),
             line=dict(color="rgba(255,255,255,0)"),
-            name=f"IC 95% (±{1.96 * std_rating_weighted / np.sqrt(np.sum(weights)):.4f})",
-            showlegend=False,
+            name=t("legend_bootstrap_ci", category="ratings"),
+            showlegend=True,
         ),
         row=2,
         col=1,
@@ -764,7 +1009,41 @@ def analyse_ratings_distribution() -> None:
     # Application du thème
     chart_theme.apply_subplot_theme(fig, num_rows=3, num_cols=1)
 
+    # Statistiques affichées par la page (voir figure_stats)
+    fig.update_layout(
+        meta=dict(
+            mean_rating_weighted=mean_rating_weighted,
+            ci_95=1.96 * std_rating_weighted / np.sqrt(np.sum(weights)),
+            vol_qual_weighted=vol_qual_weighted,
+        )
+    )
+
+    return fig
+
+
+def analyse_ratings_distribution() -> None:
+    """Analyse 3: Évolution détaillée et corrélations (bandes de confiance)."""
+    st.markdown(t("ratings_detailed_overview", category="ratings"))
+
+    with st.spinner("Chargement des statistiques mensuelles..."):
+        # Figure et statistiques en cache (voir utils.figure_cache)
+        fig = cached_figure(
+            "ratings_distribution",
+            get_interactions_version(),
+            build_distribution_figure,
+        )
+        figure_data = figure_stats(fig)
+
+    if not figure_data:
+        st.error(t("no_data_available"))
+        return
+
+    mean_rating_weighted = figure_data["mean_rating_weighted"]
+    ci_95 = figure_data["ci_95"]
+    vol_qual_weighted = figure_data["vol_qual_weighted"]
+
     st.plotly_chart(fig, use_container_width=True)
+    st.caption(t("bootstrap_ci_caption", category="ratings"))
 
     # Métriques
     col1, col2, col3 = st.columns(3)
@@ -773,7 +1052,7 @@ def analyse_ratings_distribution() -> None:
     with col2:
         st.metric(
             t("ic_95", category="ratings"),
-            f"±{1.96 * std_rating_weighted / np.sqrt(np.sum(weights)):.4f}",
+            f"±{ci_95:.4f}",
         )
     with col3:
         st.metric(
@@ -784,53 +1063,42 @@ def analyse_ratings_distribution() -> None:
     st.info(
         t("ratings_info_detailed_full", category="ratings").format(
             mean_rating_weighted=mean_rating_weighted,
-            ci_95=1.96 * std_rating_weighted / np.sqrt(np.sum(weights)),
+            ci_95=ci_95,
         )
     )
 
 
-def analyse_ratings_seasonality_1() -> None:
-    """Analyse 4: Statistiques descriptives des données saisonnières."""
-    st.markdown(t("ratings_distribution_desc", category="ratings"))
-
-    # Chargement des données
-    with st.spinner("Chargement des interactions..."):
-        df_clean = load_clean_interactions()
-
-    if df_clean.shape[0] == 0:
-        st.error(t("no_data_available"))
-        return
-
-    df_pandas = df_clean.to_pandas()
+def build_season_stats_figure() -> go.Figure:
+    """Calcule les statistiques par saison et construit leur figure (1×2)."""
+    # Histogramme saison × note (agrégat en cache)
+    season_hist = get_rating_histograms(("season",))
 
-    # Calcul des statistiques par saison
-    seasonal_stats = (
-        df_pandas.groupby("season")
-        .agg(
-            {
-                "rating": ["mean", "std", "count"],
-                "user_id": "nunique",
-                "recipe_id": "nunique",
-            }
-        )
-        .round(4)
-    )
-
-    seasonal_stats.columns = [
-        "mean_rating",
-        "std_rating",
-        "count_ratings",
-        "unique_users",
-        "unique_recipes",
-    ]
-    seasonal_stats = seasonal_stats.reset_index()
+    # Figure vide, sans statistiques : la page signale l'absence de données
+    if season_hist.shape[0] == 0:
+        return go.Figure()
 
     # Ordre logique des saisons
     season_order = ["Spring", "Summer", "Autumn", "Winter"]
-    seasonal_stats["season_cat"] = pd.Categorical(
-        seasonal_stats["season"], categories=season_order, ordered=True
+    season_hist = (
+        pl.DataFrame({"season": season_order})
+        .join(season_hist, on="season", how="left")
+        .fill_null(0)
+    )
+
+    # Statistiques par saison à partir des effectifs par note
+    _, mean_rating, var_rating = histogram_moments(
+        season_hist.select(histogram_columns()).to_numpy(), RATING_LEVELS
+    )
+    seasonal_stats = pd.DataFrame(
+        {
+            "season": season_order,
+            "mean_rating": np.round(mean_rating, 4),
+            "std_rating": np.round(np.sqrt(var_rating), 4),
+            "count_ratings": season_hist["n_interactions"].to_numpy(),
+            "unique_users": season_hist["n_users"].to_numpy(),
+            "unique_recipes": season_hist["n_recipes"].to_numpy(),
+        }
     )
-    seasonal_stats = seasonal_stats.sort_values("season_cat")
 
     # Informations sur les volumes
     volumes = seasonal_stats["count_ratings"].values
@@ -901,6 +1169,41 @@ def analyse_ratings_seasonality_1() -> None:
     # Application du thème
     chart_theme.apply_subplot_theme(fig, num_rows=1, num_cols=2)
 
+    # Statistiques affichées par la page (voir figure_stats)
+    fig.update_layout(
+        meta=dict(
+            seasonal_stats=seasonal_stats.to_dict("records"),
+            cv_volumes=cv_volumes,
+            ratio_max_min=ratio_max_min,
+            volume_total=int(volume_total),
+        )
+    )
+
+    return fig
+
+
+def analyse_ratings_seasonality_1() -> None:
+    """Analyse 4: Statistiques descriptives des données saisonnières."""
+    st.markdown(t("ratings_distribution_desc", category="ratings"))
+
+    with st.spinner("Chargement des interactions..."):
+        # Figure et statistiques en cache (voir utils.figure_cache)
+        fig = cached_figure(
+            "ratings_season_stats",
+            get_interactions_version(),
+            build_season_stats_figure,
+        )
+        figure_data = figure_stats(fig)
+
+    if not figure_data:
+        st.error(t("no_data_available"))
+        return
+
+    seasonal_stats = pd.DataFrame(figure_data["seasonal_stats"])
+    cv_volumes = figure_data["cv_volumes"]
+    ratio_max_min = figure_data["ratio_max_min"]
+    volume_total = figure_data["volume_total"]
+
     st.plotly_chart(fig, use_container_width=True)
 
     # Affichage du tableau
@@ -937,75 +1240,43 @@ def analyse_ratings_seasonality_1() -> None:
     )
 
 
-def analyse_ratings_seasonality_2() -> None:
-    """Analyse 5: Variations saisonnières des ratings (Stats et Visualisations)."""
-    st.markdown(t("ratings_seasonal_dashboard_desc", category="ratings"))
+def build_season_variations_figure() -> go.Figure:
+    """Teste les variations saisonnières des ratings et construit leur figure (2×3)."""
+    # Histogramme saison × note (agrégat en cache)
+    season_hist = get_rating_histograms(("season",))
 
-    # Chargement des données
-    with st.spinner("Chargement des interactions..."):
-        df_clean = load_clean_interactions()
-
-    if df_clean.shape[0] == 0:
-        st.error(t("no_data_available"))
-        return
+    # Figure vide, sans statistiques : la page signale l'absence de données
+    if season_hist.shape[0] == 0:
+        return go.Figure()
 
     # --- PRÉPARATION ET STATS ---
-    seasonal_ratings = (
-        df_clean.group_by("season")
-        .agg(
-            [
-                pl.col("rating").mean().alias("mean_rating"),
-                pl.col("rating").median().alias("median_rating"),
-                pl.col("rating").std().alias("std_rating"),
-                pl.len().alias("n_interactions"),
-                pl.col("rating").quantile(0.25).alias("q25"),
-                pl.col("rating").quantile(0.75).alias("q75"),
-            ]
-        )
-        .to_pandas()
-    )
-
     # Ordre logique des saisons
     season_order = ["Spring", "Summer", "Autumn", "Winter"]
-    seasonal_ratings = (
-        seasonal_ratings.set_index("season").loc[season_order].reset_index()
+    season_hist = (
+        pl.DataFrame({"season": season_order})
+        .join(season_hist, on="season", how="left")
+        .fill_null(0)
     )
+    counts = season_hist.select(histogram_columns()).to_numpy().astype(np.float64)
+    n_ratings, mean_rating, var_rating = histogram_moments(counts, RATING_LEVELS)
 
-    # Tests statistiques
-    season_groups = [
-        df_clean.filter(pl.col("season") == season)["rating"].to_pandas().tolist()
-        for season in season_order
-    ]
-    f_stat, p_anova = f_oneway(*season_groups)
-    h_stat, p_kruskal = kruskal(*season_groups)
-
-    # Calcul % 5★ et % négatifs
-    seasonal_perfect = (
-        df_clean.group_by("season")
-        .agg([(pl.col("rating") == 5).sum().alias("count_5"), pl.len().alias("total")])
-        .with_columns((pl.col("count_5") / pl.col("total") * 100).alias("pct_5_stars"))
-        .to_pandas()
-        .set_index("season")
-        .loc[season_order]
-        .reset_index()
-    )
-
-    seasonal_negative = (
-        df_clean.group_by("season")
-        .agg(
-            [
-                (pl.col("rating") <= 2).sum().alias("count_negative"),
-                pl.len().alias("total"),
-            ]
-        )
-        .with_columns(
-            (pl.col("count_negative") / pl.col("total") * 100).alias("pct_negative")
-        )
-        .to_pandas()
-        .set_index("season")
-        .loc[season_order]
-        .reset_index()
+    # Moyenne, écart-type, volume, % 5★ et % négatifs (1-2★) par saison
+    seasonal_ratings = pd.DataFrame(
+        {
+            "season": season_order,
+            "mean_rating": mean_rating,
+            "std_rating": np.sqrt(var_rating),
+            "n_interactions": season_hist["n_interactions"].to_numpy(),
+            "pct_5_stars": counts[:, -1] / n_ratings * 100,
+            "pct_negative": counts[:, :2].sum(axis=1) / n_ratings * 100,
+        }
+    )
+
+    # Tests statistiques sur l'histogramme saison × note (notes entières 1-5)
+    f_stat, p_anova = (
+        float(v) for v in anova_from_moments(n_ratings, mean_rating, var_rating)
     )
+    h_stat, p_kruskal = kruskal_from_histogram(counts)
 
     # --- VISUALISATION : Dashboard Saisonnier (6 panels) ---
     fig = make_subplots(
@@ -1083,10 +1354,10 @@ def analyse_ratings_seasonality_2() -> None:
     # 3. % Ratings parfaits (5★)
     fig.add_trace(
         go.Bar(
-            x=seasonal_perfect["season"],
-            y=seasonal_perfect["pct_5_stars"],
+            x=seasonal_ratings["season"],
+            y=seasonal_ratings["pct_5_stars"],
             marker=dict(color=colors_season, opacity=0.8, line=dict(width=0)),
-            text=[f"{v:.2f}%" for v in seasonal_perfect["pct_5_stars"]],
+            text=[f"{v:.2f}%" for v in seasonal_ratings["pct_5_stars"]],
             textposition="outside",
             textfont=dict(size=9, color=ColorTheme.TEXT_PRIMARY),
             showlegend=False,
@@ -1099,10 +1370,10 @@ def analyse_ratings_seasonality_2() -> None:
     # 4. % Ratings négatifs (1-2★)
     fig.add_trace(
         go.Bar(
-            x=seasonal_negative["season"],
-            y=seasonal_negative["pct_negative"],
+            x=seasonal_ratings["season"],
+            y=seasonal_ratings["pct_negative"],
             marker=dict(color=colors_season, opacity=0.8, line=dict(width=0)),
-            text=[f"{v:.2f}%" for v in seasonal_negative["pct_negative"]],
+            text=[f"{v:.2f}%" for v in seasonal_ratings["pct_negative"]],
             textposition="outside",
             textfont=dict(size=9, color=ColorTheme.TEXT_PRIMARY),
             showlegend=False,
@@ -1156,6 +1427,41 @@ def analyse_ratings_seasonality_2() -> None:
     # Application du thème
     chart_theme.apply_subplot_theme(fig, num_rows=2, num_cols=3)
 
+    # Statistiques affichées par la page (voir figure_stats)
+    fig.update_layout(
+        meta=dict(
+            seasonal_ratings=seasonal_ratings.to_dict("records"),
+            f_stat=f_stat,
+            p_anova=p_anova,
+            h_stat=h_stat,
+        )
+    )
+
+    return fig
+
+
+def analyse_ratings_seasonality_2() -> None:
+    """Analyse 5: Variations saisonnières des ratings (Stats et Visualisations)."""
+    st.markdown(t("ratings_seasonal_dashboard_desc", category="ratings"))
+
+    with st.spinner("Chargement des interactions..."):
+        # Figure et statistiques en cache (voir utils.figure_cache)
+        fig = cached_figure(
+            "ratings_season_variations",
+            get_interactions_version(),
+            build_season_variations_figure,
+        )
+        figure_data = figure_stats(fig)
+
+    if not figure_data:
+        st.error(t("no_data_available"))
+        return
+
+    seasonal_ratings = pd.DataFrame(figure_data["seasonal_ratings"])
+    f_stat = figure_data["f_stat"]
+    p_anova = figure_data["p_anova"]
+    h_stat = figure_data["h_stat"]
+
     st.plotly_chart(fig, use_container_width=True)
 
     # Métriques
@@ -1193,33 +1499,161 @@ def analyse_ratings_seasonality_2() -> None:
     st.info(interpretation_text)
 
 
-def render_ratings_analysis() -> None:
-    """Point d'entrée principal pour les analyses de ratings."""
+def build_complexity_figure() -> go.Figure:
+    """Calcule le rating moyen par classe de complexité et construit sa figure."""
+    # Table précalculée par recette (ETL), recettes assez notées
+    stats = get_recipe_stats(None, None, COMPLEXITY_MIN_RATINGS)
+    bins = rating_by_complexity(stats)
+
+    # Figure vide, sans statistiques : la page signale l'absence de données
+    if bins.height < 2:
+        return go.Figure()
+
+    # Moyennes par classe et ANOVA sur l'histogramme classe × note
+    n_ratings, mean_rating, var_rating = histogram_moments(
+        bins.select(histogram_columns()).to_numpy(), RATING_LEVELS
+    )
+    half_width = 1.96 * np.sqrt(var_rating / n_ratings)
+    f_stat, p_anova = (
+        float(v) for v in anova_from_moments(n_ratings, mean_rating, var_rating)
+    )
+
+    # Corrélation recette par recette, pondérée par le nombre de notes
+    recipes = stats.drop_nulls(["complexity_score", "mean_rating"])
+    rho = float(
+        weighted_correlation(
+            recipes.select("complexity_score", "mean_rating").to_numpy(),
+            recipes["n_interactions"].to_numpy(),
+        )[0, 1]
+    )
+
+    labels = [
+        f"{low:.1f}–{high:.1f}"
+        for low, high in zip(bins["complexity_min"], bins["complexity_max"])
+    ]
+    fig = go.Figure(
+        go.Scatter(
+            x=labels,
+            y=mean_rating,
+            mode="lines+markers",
+            line=dict(color=ColorTheme.ORANGE_PRIMARY, width=2),
+            marker=dict(size=8),
+            error_y=dict(type="data", array=half_width, visible=True),
+            customdata=np.column_stack([bins["n_recipes"], n_ratings]),
+            hovertemplate="%{x}<br>%{y:.3f}<br>"
+            + t("complexity_hover", category="ratings")
+            + "<extra></extra>",
+        )
+    )
+    fig.update_layout(
+        height=450,
+        showlegend=False,
+        xaxis_title=t("complexity_axis", category="ratings"),
+        yaxis_title=t("rating_moyen", category="ratings"),
+    )
+    chart_theme.apply_chart_theme(fig)
+
+    # Statistiques affichées par la page (voir figure_stats)
+    fig.update_layout(
+        meta=dict(
+            n_recipes=stats.height,
+            rho=rho,
+            f_stat=f_stat,
+            p_anova=p_anova,
+            gap=float(mean_rating.max() - mean_rating.min()),
+        )
+    )
+
+    return fig
+
+
+def analyse_ratings_complexite() -> None:
+    """Analyse 6: Rating moyen selon la complexité des recettes (table par recette)."""
     st.markdown(
-        f'<h1 style="margin-top: 0; padding-top: 0;">⭐ {t("main_title", category="ratings")} (1999-2018)</h1>',
-        unsafe_allow_html=True,
+        t("complexity_desc", category="ratings").format(
+            min_ratings=COMPLEXITY_MIN_RATINGS, n_bins=COMPLEXITY_BINS
+        )
     )
 
-    st.markdown(t("main_description", category="ratings"))
+    # Figure et statistiques en cache (voir utils.figure_cache)
+    fig = cached_figure(
+        "ratings_complexity", get_interactions_version(), build_complexity_figure
+    )
+    figure_data = figure_stats(fig)
 
-    # Affichage de toutes les analyses en continu (comme page Saisonnalité)
+    if not figure_data:
+        st.error(t("no_data_available"))
+        return
 
-    st.subheader(f"🔬 {t('validation_methodologique', category='ratings')}")
-    analyse_ratings_validation_ponderee()
-    st.markdown("---")
+    rho = figure_data["rho"]
+    f_stat = figure_data["f_stat"]
 
-    st.subheader(f"📈 {t('tendance_temporelle', category='ratings')}")
-    analyse_ratings_tendance_temporelle()
-    st.markdown("---")
+    st.plotly_chart(fig, use_container_width=True)
+
+    # Métriques
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric(
+            t("complexity_recipes", category="ratings"), f"{figure_data['n_recipes']:,}"
+        )
+    with col2:
+        st.metric("Spearman ρ", f"{rho:.3f}")
+    with col3:
+        st.metric("ANOVA F-stat", f"{f_stat:.3f}")
 
-    st.subheader(f"📊 {t('distribution_stabilite', category='ratings')}")
-    analyse_ratings_distribution()
-    st.markdown("---")
+    # Interprétation
+    st.info(
+        t("complexity_interpretation", category="ratings").format(
+            rho=rho,
+            f_stat=f_stat,
+            p_anova=figure_data["p_anova"],
+            gap=figure_data["gap"],
+        )
+    )
 
-    st.subheader(f"🍂 {t('statistiques_saisonnieres', category='ratings')}")
-    analyse_ratings_seasonality_1()
-    st.markdown("---")
 
-    st.subheader(f"🌸 {t('variations_saisonnieres', category='ratings')}")
-    analyse_ratings_seasonality_2()
-    st.markdown("---")
+def render_ratings_analysis() -> None:
+    """Point d'entrée principal pour les analyses de ratings."""
+    st.markdown(
+        f'<h1 style="margin-top: 0; padding-top: 0;">⭐ {t("main_title", category="ratings")} (1999-2018)</h1>',
+        unsafe_allow_html=True,
+    )
+
+    st.markdown(t("main_description", category="ratings"))
+
+    # Sections isolées (fragments), calculées à l'ouverture au-delà de la première
+    render_sections(
+        "ratings",
+        [
+            Section(
+                "validation",
+                f"🔬 {t('validation_methodologique', category='ratings')}",
+                analyse_ratings_validation_ponderee,
+            ),
+            Section(
+                "trend",
+                f"📈 {t('tendance_temporelle', category='ratings')}",
+                analyse_ratings_tendance_temporelle,
+            ),
+            Section(
+                "distribution",
+                f"📊 {t('distribution_stabilite', category='ratings')}",
+                analyse_ratings_distribution,
+            ),
+            Section(
+                "seasonal_stats",
+                f"🍂 {t('statistiques_saisonnieres', category='ratings')}",
+                analyse_ratings_seasonality_1,
+            ),
+            Section(
+                "seasonal_variations",
+                f"🌸 {t('variations_saisonnieres', category='ratings')}",
+                analyse_ratings_seasonality_2,
+            ),
+            Section(
+                "complexity",
+                f"🧩 {t('notes_complexite', category='ratings')}",
+                analyse_ratings_complexite,
+            ),
+        ],
+    )
@@ -1,27 +1,64 @@
 """
 Analyses saisonnières des recettes - Version Preprod avec Plotly et charte graphique.
 
-Ce module contient 6 analyses sur la saisonnalité des recettes publiées :
+Ce module contient 7 analyses sur la saisonnalité des recettes publiées :
 1. Volume de recettes par saison
 2. Durée de préparation par saison
 3. Complexité (étapes/ingrédients) par saison
 4. Profil nutritionnel par saison
 5. Ingrédients fréquents par saison
 6. Tags populaires par saison
+7. Décomposition saisonnière mensuelle (STL)
 """
 
 import streamlit as st
 import polars as pl
+import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+from analysis.change_points import series_version
+from analysis.decomposition import (
+    MONTHLY_PERIOD,
+    seasonal_amplitude_by_year,
+    seasonal_strength,
+)
+from analysis.contingency import presence_tests
+from analysis.term_frequencies import group_sizes, term_group_frequencies
+from analysis.time_series import complete_months, monthly_counts
+
 # Import du module data_utils (installé via uv)
 from data.cached_loaders import get_recipes_clean as load_recipes_clean
+from data.cached_loaders import (
+    get_interactions_version,
+    get_permutation_tests,
+    get_rating_histograms,
+    get_recipes_version,
+    get_stl_decomposition,
+)
+from data.vocabulary import decode_terms
 
 # Import de la charte graphique
 from utils import chart_theme
 from utils.color_theme import ColorTheme
-from utils.i18n_helper import t
+from utils.figure_cache import cached_figure, figure_stats
+from utils.i18n_helper import t, translate_list
+from utils.sections import Section, render_sections
+
+MONTH_KEYS = [
+    "january",
+    "february",
+    "march",
+    "april",
+    "may",
+    "june",
+    "july",
+    "august",
+    "september",
+    "october",
+    "november",
+    "december",
+]
 
 
 # ============================================================================
@@ -29,18 +66,8 @@ from utils.i18n_helper import t
 # ============================================================================
 
 
-def analyse_seasonality_volume() -> None:
-    """
-    Analyse du volume de recettes publiées par saison.
-
-    Graphiques:
-    - Bar chart: Nombre de recettes par saison
-    - Pie chart: Répartition en pourcentages
-
-    Insight:
-    Le printemps montre une saisonnalité marquée (+8.7% au-dessus de la moyenne).
-    """
-
+def build_volume_figure() -> go.Figure:
+    """Calcule le volume de recettes par saison et construit sa figure (1×2)."""
     # Chargement des données
     df = load_recipes_clean()
 
@@ -72,11 +99,8 @@ def analyse_seasonality_volume() -> None:
         "Autumn": ColorTheme.ORANGE_SECONDARY,  # Rouge/Orange profond (#E24E1B)
     }
 
-    # Calcul des statistiques
-    total_recipes = recipes_per_season_pd["n_recipes"].sum()
-    mean_recipes = recipes_per_season_pd["n_recipes"].mean()
-
     # Écarts à la moyenne
+    mean_recipes = recipes_per_season_pd["n_recipes"].mean()
     recipes_per_season_pd["deviation"] = (
         recipes_per_season_pd["n_recipes"] - mean_recipes
     )
@@ -84,42 +108,6 @@ def analyse_seasonality_volume() -> None:
         recipes_per_season_pd["deviation"] / mean_recipes * 100
     )
 
-    # ========================================
-    # MÉTRIQUES EN BANNIÈRE
-    # ========================================
-
-    col_a, col_b, col_c, col_d = st.columns(4)
-
-    with col_a:
-        st.metric("📊 Total recettes", f"{total_recipes:,}")
-
-    with col_b:
-        st.metric(t("average_per_season"), f"{mean_recipes:,.0f}")
-
-    with col_c:
-        # Saison la plus active
-        max_season = recipes_per_season_pd.loc[
-            recipes_per_season_pd["n_recipes"].idxmax()
-        ]
-        st.metric(
-            f"🌸 {max_season['season']} (max)",
-            f"{max_season['n_recipes']:,}",
-            delta=f"+{max_season['deviation_pct']:.1f}%",
-        )
-
-    with col_d:
-        # Saison la moins active
-        min_season = recipes_per_season_pd.loc[
-            recipes_per_season_pd["n_recipes"].idxmin()
-        ]
-        st.metric(
-            f"☃️ {min_season['season']} (min)",
-            f"{min_season['n_recipes']:,}",
-            delta=f"{min_season['deviation_pct']:.1f}%",
-        )
-
-    st.markdown("---")
-
     # ========================================
     # GRAPHIQUES AVEC SUBPLOTS
     # ========================================
@@ -180,6 +168,69 @@ def analyse_seasonality_volume() -> None:
         showlegend=False,
     )
 
+    # Statistiques affichées par la page (voir figure_stats)
+    fig.update_layout(meta=dict(by_season=recipes_per_season_pd.to_dict("records")))
+
+    return fig
+
+
+def analyse_seasonality_volume() -> None:
+    """
+    Analyse du volume de recettes publiées par saison.
+
+    Graphiques:
+    - Bar chart: Nombre de recettes par saison
+    - Pie chart: Répartition en pourcentages
+
+    Insight:
+    Le printemps montre une saisonnalité marquée (+8.7% au-dessus de la moyenne).
+    """
+
+    # Figure et statistiques en cache (voir utils.figure_cache)
+    fig = cached_figure(
+        "seasonality_volume", get_recipes_version(), build_volume_figure
+    )
+    figure_data = figure_stats(fig)
+    recipes_per_season_pd = pl.DataFrame(figure_data["by_season"]).to_pandas()
+    total_recipes = recipes_per_season_pd["n_recipes"].sum()
+    mean_recipes = recipes_per_season_pd["n_recipes"].mean()
+
+    # ========================================
+    # MÉTRIQUES EN BANNIÈRE
+    # ========================================
+
+    col_a, col_b, col_c, col_d = st.columns(4)
+
+    with col_a:
+        st.metric("📊 Total recettes", f"{total_recipes:,}")
+
+    with col_b:
+        st.metric(t("average_per_season"), f"{mean_recipes:,.0f}")
+
+    with col_c:
+        # Saison la plus active
+        max_season = recipes_per_season_pd.loc[
+            recipes_per_season_pd["n_recipes"].idxmax()
+        ]
+        st.metric(
+            f"🌸 {max_season['season']} (max)",
+            f"{max_season['n_recipes']:,}",
+            delta=f"+{max_season['deviation_pct']:.1f}%",
+        )
+
+    with col_d:
+        # Saison la moins active
+        min_season = recipes_per_season_pd.loc[
+            recipes_per_season_pd["n_recipes"].idxmin()
+        ]
+        st.metric(
+            f"☃️ {min_season['season']} (min)",
+            f"{min_season['n_recipes']:,}",
+            delta=f"{min_season['deviation_pct']:.1f}%",
+        )
+
+    st.markdown("---")
+
     # Affichage
     st.plotly_chart(fig, use_container_width=True)
 
@@ -195,18 +246,8 @@ def analyse_seasonality_volume() -> None:
 # ============================================================================
 
 
-def analyse_seasonality_duree() -> None:
-    """
-    Analyse de la durée de préparation des recettes par saison.
-
-    Graphiques:
-    - Bar chart: Moyenne + Médiane + IQR par saison
-    - Box plot: Distribution complète des durées par saison
-
-    Insight:
-    Automne/Hiver plus long (~43-44 min) vs Été/Printemps (~41-42 min).
-    """
-
+def build_duration_figure() -> go.Figure:
+    """Calcule les durées par saison et construit leur figure (1×2)."""
     # Chargement des données
     df = load_recipes_clean()
 
@@ -250,40 +291,6 @@ def analyse_seasonality_duree() -> None:
         "Autumn": ColorTheme.ORANGE_SECONDARY,  # Rouge/Orange profond (#E24E1B)
     }
 
-    # ========================================
-    # MÉTRIQUES EN BANNIÈRE
-    # ========================================
-
-    col_a, col_b, col_c, col_d = st.columns(4)
-
-    with col_a:
-        max_season = minutes_by_season_pd.loc[
-            minutes_by_season_pd["mean_minutes"].idxmax()
-        ]
-        st.metric(
-            f"⏱️ {max_season['season']} (max)", f"{max_season['mean_minutes']:.1f} min"
-        )
-
-    with col_b:
-        min_season = minutes_by_season_pd.loc[
-            minutes_by_season_pd["mean_minutes"].idxmin()
-        ]
-        st.metric(
-            f"⚡ {min_season['season']} (min)", f"{min_season['mean_minutes']:.1f} min"
-        )
-
-    with col_c:
-        # Écart max-min
-        ecart = max_season["mean_minutes"] - min_season["mean_minutes"]
-        st.metric(t("ecart_max_min"), f"{ecart:.1f} min")
-
-    with col_d:
-        # Moyenne globale
-        mean_global = minutes_by_season_pd["mean_minutes"].mean()
-        st.metric(t("global_average"), f"{mean_global:.1f} min")
-
-    st.markdown("---")
-
     # ========================================
     # GRAPHIQUES AVEC SUBPLOTS
     # ========================================
@@ -383,6 +390,65 @@ def analyse_seasonality_duree() -> None:
         legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="left", x=0),
     )
 
+    # Statistiques affichées par la page (voir figure_stats)
+    fig.update_layout(meta=dict(by_season=minutes_by_season_pd.to_dict("records")))
+
+    return fig
+
+
+def analyse_seasonality_duree() -> None:
+    """
+    Analyse de la durée de préparation des recettes par saison.
+
+    Graphiques:
+    - Bar chart: Moyenne + Médiane + IQR par saison
+    - Box plot: Distribution complète des durées par saison
+
+    Insight:
+    Automne/Hiver plus long (~43-44 min) vs Été/Printemps (~41-42 min).
+    """
+
+    # Figure et statistiques en cache (voir utils.figure_cache)
+    fig = cached_figure(
+        "seasonality_duration", get_recipes_version(), build_duration_figure
+    )
+    figure_data = figure_stats(fig)
+    minutes_by_season_pd = pl.DataFrame(figure_data["by_season"]).to_pandas()
+
+    # ========================================
+    # MÉTRIQUES EN BANNIÈRE
+    # ========================================
+
+    col_a, col_b, col_c, col_d = st.columns(4)
+
+    with col_a:
+        max_season = minutes_by_season_pd.loc[
+            minutes_by_season_pd["mean_minutes"].idxmax()
+        ]
+        st.metric(
+            f"⏱️ {max_season['season']} (max)", f"{max_season['mean_minutes']:.1f} min"
+        )
+
+    with col_b:
+        min_season = minutes_by_season_pd.loc[
+            minutes_by_season_pd["mean_minutes"].idxmin()
+        ]
+        st.metric(
+            f"⚡ {min_season['season']} (min)", f"{min_season['mean_minutes']:.1f} min"
+        )
+
+    with col_c:
+        # Écart max-min
+        ecart = max_season["mean_minutes"] - min_season["mean_minutes"]
+        st.metric(t("ecart_max_min"), f"{ecart:.1f} min")
+
+    with col_d:
+        # Moyenne globale
+        mean_global = minutes_by_season_pd["mean_minutes"].mean()
+        st.metric(t("global_average"), f"{mean_global:.1f} min")
+
+    st.markdown("---")
+
     # Affichage
     st.plotly_chart(fig, use_container_width=True)
 
@@ -398,19 +464,8 @@ def analyse_seasonality_duree() -> None:
 # ============================================================================
 
 
-def analyse_seasonality_complexite() -> None:
-    """
-    Analyse de la complexité des recettes par saison.
-
-    Graphiques (3 panels):
-    - Score de complexité (moyen)
-    - Nombre d'étapes (moyen)
-    - Nombre d'ingrédients (moyen)
-
-    Insight:
-    Hiver/Automne plus élaboré vs Été simplifié (plats mijotés vs frais).
-    """
-
+def build_complexity_figure() -> go.Figure:
+    """Calcule la complexité par saison et construit sa figure (1×3)."""
     # Chargement des données
     df = load_recipes_clean()
 
@@ -455,72 +510,31 @@ def analyse_seasonality_complexite() -> None:
     }
 
     # ========================================
-    # MÉTRIQUES EN BANNIÈRE
+    # GRAPHIQUES AVEC SUBPLOTS (3 PANELS)
     # ========================================
 
-    col_a, col_b, col_c = st.columns(3)
+    fig = make_subplots(
+        rows=1,
+        cols=3,
+        subplot_titles=(
+            t("score_complexite"),
+            t("nombre_etapes"),
+            t("nombre_ingredients"),
+        ),
+        horizontal_spacing=0.10,
+    )
 
-    with col_a:
-        max_complexity = complexity_by_season_pd.loc[
-            complexity_by_season_pd["mean_complexity"].idxmax()
-        ]
-        st.metric(
-            f"🔬 {max_complexity['season']} (+ complexe)",
-            f"{max_complexity['mean_complexity']:.2f}",
-        )
+    colors_bars = [season_colors_btk[s] for s in complexity_by_season_pd["season"]]
 
-    with col_b:
-        max_steps = complexity_by_season_pd.loc[
-            complexity_by_season_pd["mean_steps"].idxmax()
-        ]
-        st.metric(
-            t("season_most_steps", category="seasonality").format(
-                season=max_steps["season"]
-            ),
-            t("steps_count", category="seasonality").format(
-                count=max_steps["mean_steps"]
-            ),
-        )
-
-    with col_c:
-        max_ingredients = complexity_by_season_pd.loc[
-            complexity_by_season_pd["mean_ingredients"].idxmax()
-        ]
-        st.metric(
-            t("season_most_ingredients", category="seasonality").format(
-                season=max_ingredients["season"]
-            ),
-            f"{max_ingredients['mean_ingredients']:.1f} ingr.",
-        )
-
-    st.markdown("---")
-
-    # ========================================
-    # GRAPHIQUES AVEC SUBPLOTS (3 PANELS)
-    # ========================================
-
-    fig = make_subplots(
-        rows=1,
-        cols=3,
-        subplot_titles=(
-            t("score_complexite"),
-            t("nombre_etapes"),
-            t("nombre_ingredients"),
-        ),
-        horizontal_spacing=0.10,
-    )
-
-    colors_bars = [season_colors_btk[s] for s in complexity_by_season_pd["season"]]
-
-    # PANEL 1: Complexity Score
-    fig.add_trace(
-        go.Bar(
-            x=complexity_by_season_pd["season"],
-            y=complexity_by_season_pd["mean_complexity"],
-            marker=dict(
-                color=colors_bars,
-                opacity=0.85,
-                line=dict(color=ColorTheme.TEXT_SECONDARY, width=1),
+    # PANEL 1: Complexity Score
+    fig.add_trace(
+        go.Bar(
+            x=complexity_by_season_pd["season"],
+            y=complexity_by_season_pd["mean_complexity"],
+            marker=dict(
+                color=colors_bars,
+                opacity=0.85,
+                line=dict(color=ColorTheme.TEXT_SECONDARY, width=1),
             ),
             name=t("label_average"),
             text=[f"{val:.2f}" for val in complexity_by_season_pd["mean_complexity"]],
@@ -588,6 +602,73 @@ def analyse_seasonality_complexite() -> None:
 
     fig.update_layout(height=500, showlegend=False)
 
+    # Statistiques affichées par la page (voir figure_stats)
+    fig.update_layout(meta=dict(by_season=complexity_by_season_pd.to_dict("records")))
+
+    return fig
+
+
+def analyse_seasonality_complexite() -> None:
+    """
+    Analyse de la complexité des recettes par saison.
+
+    Graphiques (3 panels):
+    - Score de complexité (moyen)
+    - Nombre d'étapes (moyen)
+    - Nombre d'ingrédients (moyen)
+
+    Insight:
+    Hiver/Automne plus élaboré vs Été simplifié (plats mijotés vs frais).
+    """
+
+    # Figure et statistiques en cache (voir utils.figure_cache)
+    fig = cached_figure(
+        "seasonality_complexity", get_recipes_version(), build_complexity_figure
+    )
+    figure_data = figure_stats(fig)
+    complexity_by_season_pd = pl.DataFrame(figure_data["by_season"]).to_pandas()
+
+    # ========================================
+    # MÉTRIQUES EN BANNIÈRE
+    # ========================================
+
+    col_a, col_b, col_c = st.columns(3)
+
+    with col_a:
+        max_complexity = complexity_by_season_pd.loc[
+            complexity_by_season_pd["mean_complexity"].idxmax()
+        ]
+        st.metric(
+            f"🔬 {max_complexity['season']} (+ complexe)",
+            f"{max_complexity['mean_complexity']:.2f}",
+        )
+
+    with col_b:
+        max_steps = complexity_by_season_pd.loc[
+            complexity_by_season_pd["mean_steps"].idxmax()
+        ]
+        st.metric(
+            t("season_most_steps", category="seasonality").format(
+                season=max_steps["season"]
+            ),
+            t("steps_count", category="seasonality").format(
+                count=max_steps["mean_steps"]
+            ),
+        )
+
+    with col_c:
+        max_ingredients = complexity_by_season_pd.loc[
+            complexity_by_season_pd["mean_ingredients"].idxmax()
+        ]
+        st.metric(
+            t("season_most_ingredients", category="seasonality").format(
+                season=max_ingredients["season"]
+            ),
+            f"{max_ingredients['mean_ingredients']:.1f} ingr.",
+        )
+
+    st.markdown("---")
+
     # Affichage
     st.plotly_chart(fig, use_container_width=True)
 
@@ -603,18 +684,8 @@ def analyse_seasonality_complexite() -> None:
 # ============================================================================
 
 
-def analyse_seasonality_nutrition() -> None:
-    """
-    Analyse du profil nutritionnel des recettes par saison.
-
-    Graphiques:
-    - Heatmap: Profil nutritionnel normalisé (z-scores)
-    - 6 nutriments: calories, fat, sugar, sodium, protein, sat_fat
-
-    Insight:
-    Automne le plus calorique (492 kcal) vs Été le plus léger (446 kcal).
-    """
-
+def build_nutrition_figure() -> go.Figure:
+    """Calcule le profil nutritionnel par saison et construit sa heatmap."""
     # Chargement des données
     df = load_recipes_clean()
 
@@ -647,40 +718,6 @@ def analyse_seasonality_nutrition() -> None:
     # Conversion en pandas
     nutrition_by_season_pd = nutrition_by_season.to_pandas()
 
-    # ========================================
-    # MÉTRIQUES EN BANNIÈRE
-    # ========================================
-
-    col_a, col_b, col_c = st.columns(3)
-
-    with col_a:
-        max_cal = nutrition_by_season_pd.loc[
-            nutrition_by_season_pd["mean_calories"].idxmax()
-        ]
-        st.metric(
-            f"🔥 {max_cal['season']} (+ calorique)",
-            f"{max_cal['mean_calories']:.0f} kcal",
-        )
-
-    with col_b:
-        min_cal = nutrition_by_season_pd.loc[
-            nutrition_by_season_pd["mean_calories"].idxmin()
-        ]
-        st.metric(
-            t("season_lightest", category="seasonality").format(
-                season=min_cal["season"]
-            ),
-            t("calories_count", category="seasonality").format(
-                calories=min_cal["mean_calories"]
-            ),
-        )
-
-    with col_c:
-        ecart_cal = max_cal["mean_calories"] - min_cal["mean_calories"]
-        st.metric(t("ecart_calorique"), f"{ecart_cal:.0f} kcal")
-
-    st.markdown("---")
-
     # ========================================
     # HEATMAP NUTRITIONNELLE (Z-SCORES NORMALISÉS)
     # ========================================
@@ -706,8 +743,6 @@ def analyse_seasonality_nutrition() -> None:
     nutrition_values = nutrition_by_season_pd[nutrient_cols].values
 
     # Normalisation z-score (par colonne = par nutriment)
-    import numpy as np
-
     nutrition_norm = (
         nutrition_values - nutrition_values.mean(axis=0)
     ) / nutrition_values.std(axis=0)
@@ -744,6 +779,113 @@ def analyse_seasonality_nutrition() -> None:
     fig.update_yaxes(title_text="Nutriments")
     fig.update_layout(height=500)
 
+    # ========================================
+    # TESTS PAR PERMUTATION (4 SAISONS)
+    # ========================================
+
+    # F de l'ANOVA sous permutation des saisons : aucune hypothèse de
+    # normalité sur des nutriments très asymétriques (résultat en cache)
+    raw_cols = [
+        "calories",
+        "total_fat_pct",
+        "sugar_pct",
+        "sodium_pct",
+        "protein_pct",
+        "sat_fat_pct",
+    ]
+    tested = (
+        df.select(["season", *raw_cols])
+        .drop_nulls()
+        .filter(pl.col("season").is_in(season_order))
+    )
+    values = tested.select(raw_cols).to_numpy()
+    labels = (
+        tested["season"]
+        .replace_strict(
+            {season: i for i, season in enumerate(season_order)}, return_dtype=pl.Int8
+        )
+        .to_numpy()
+    )
+    permutation = get_permutation_tests(
+        "seasonality_nutrition",
+        series_version(values, labels),
+        values,
+        labels,
+        tuple(range(len(season_order))),
+        tuple(raw_cols),
+    )
+
+    # Statistiques affichées par la page (voir figure_stats)
+    fig.update_layout(
+        meta=dict(
+            by_season=nutrition_by_season_pd.to_dict("records"),
+            nutrient_cols=nutrient_cols,
+            nutrient_labels=nutrient_labels,
+            permutation=permutation.select("statistic", "p_value").to_dict(
+                as_series=False
+            ),
+        )
+    )
+
+    return fig
+
+
+def analyse_seasonality_nutrition() -> None:
+    """
+    Analyse du profil nutritionnel des recettes par saison.
+
+    Graphiques:
+    - Heatmap: Profil nutritionnel normalisé (z-scores)
+    - 6 nutriments: calories, fat, sugar, sodium, protein, sat_fat
+
+    Insight:
+    Automne le plus calorique (492 kcal) vs Été le plus léger (446 kcal).
+    """
+
+    # Figure et statistiques en cache (voir utils.figure_cache)
+    fig = cached_figure(
+        "seasonality_nutrition", get_recipes_version(), build_nutrition_figure
+    )
+    figure_data = figure_stats(fig)
+    nutrition_by_season_pd = pl.DataFrame(figure_data["by_season"]).to_pandas()
+    nutrient_cols = figure_data["nutrient_cols"]
+    nutrient_labels = figure_data["nutrient_labels"]
+    permutation = pl.DataFrame(figure_data["permutation"])
+
+    # ========================================
+    # MÉTRIQUES EN BANNIÈRE
+    # ========================================
+
+    col_a, col_b, col_c = st.columns(3)
+
+    with col_a:
+        max_cal = nutrition_by_season_pd.loc[
+            nutrition_by_season_pd["mean_calories"].idxmax()
+        ]
+        st.metric(
+            f"🔥 {max_cal['season']} (+ calorique)",
+            f"{max_cal['mean_calories']:.0f} kcal",
+        )
+
+    with col_b:
+        min_cal = nutrition_by_season_pd.loc[
+            nutrition_by_season_pd["mean_calories"].idxmin()
+        ]
+        st.metric(
+            t("season_lightest", category="seasonality").format(
+                season=min_cal["season"]
+            ),
+            t("calories_count", category="seasonality").format(
+                calories=min_cal["mean_calories"]
+            ),
+        )
+
+    with col_c:
+        ecart_cal = max_cal["mean_calories"] - min_cal["mean_calories"]
+        st.metric(t("ecart_calorique"), f"{ecart_cal:.0f} kcal")
+
+    st.markdown("---")
+
     # Affichage
     st.plotly_chart(fig, use_container_width=True)
 
@@ -773,6 +915,22 @@ def analyse_seasonality_nutrition() -> None:
 
         st.dataframe(display_df, use_container_width=True, hide_index=True)
 
+    with st.expander(t("permutation_expander", category="seasonality")):
+        st.dataframe(
+            pl.DataFrame(
+                {
+                    t("col_nutrient", category="seasonality"): nutrient_labels,
+                    "F": permutation["statistic"].round(2),
+                    t("col_p_perm", category="seasonality"): permutation[
+                        "p_value"
+                    ].round(4),
+                }
+            ),
+            use_container_width=True,
+            hide_index=True,
+        )
+        st.caption(t("permutation_caption", category="seasonality"))
+
     # ========================================
     # INTERPRÉTATION
     # ========================================
@@ -785,109 +943,35 @@ def analyse_seasonality_nutrition() -> None:
 # ============================================================================
 
 
-def analyse_seasonality_ingredients() -> None:
-    """
-    Analyse des ingrédients les plus variables par saison.
-
-    Graphiques:
-    - Heatmap: Top 20 ingrédients avec plus grande variabilité saisonnière
-    - Fréquence % de présence par saison
-
-    Insight:
-    Été (légumes/herbes) vs Automne (baking/soupes/mijotés).
-    """
-
+def build_ingredients_figure() -> go.Figure:
+    """Sélectionne les ingrédients les plus saisonniers et construit leur heatmap."""
     # Chargement des données
     df = load_recipes_clean()
 
     # Ordre des saisons
     season_order = ["Winter", "Spring", "Summer", "Autumn"]
 
-    # Extraction des ingrédients par saison
-    ingredients_by_season = {}
-    n_recipes_by_season = {}
-
-    for season in season_order:
-        season_df = df.filter(pl.col("season") == season)
-        n_recipes_by_season[season] = season_df.height
-
-        ingredient_counts = (
-            season_df.select(pl.col("ingredients").explode())
-            .group_by("ingredients")
-            .agg(pl.count().alias("count"))
-        )
-        ingredients_by_season[season] = dict(
-            zip(ingredient_counts["ingredients"], ingredient_counts["count"])
-        )
-
-    # Tous les ingrédients uniques
-    all_ingredients = set().union(
-        *[set(ing.keys()) for ing in ingredients_by_season.values()]
+    # Fréquences (%) ingrédient × saison et variabilité, en une passe
+    ingredients_df = term_group_frequencies(
+        df, "ingredients", "season", season_order, term_alias="ingredient"
     )
-
-    # Construction matrice de fréquences (%)
-    ingredients_matrix = [
-        {
-            "ingredient": ing,
-            **{
-                s: (ingredients_by_season[s].get(ing, 0) / n_recipes_by_season[s]) * 100
-                for s in season_order
-            },
-        }
-        for ing in all_ingredients
-    ]
-    ingredients_df = pl.DataFrame(ingredients_matrix)
-
-    # Calcul métriques de variabilité
-    import numpy as np
-
-    ingredients_df = (
-        ingredients_df.with_columns(
-            [pl.concat_list([pl.col(s) for s in season_order]).alias("season_values")]
-        )
-        .with_columns(
-            [
-                pl.col("season_values").list.std().alias("std_seasonal"),
-                pl.col("season_values").list.mean().alias("mean_freq"),
-                (
-                    pl.col("season_values").list.std()
-                    / pl.col("season_values").list.mean()
-                    * 100
-                ).alias("cv"),
-                (
-                    pl.max_horizontal([pl.col(s) for s in season_order])
-                    - pl.min_horizontal([pl.col(s) for s in season_order])
-                ).alias("range"),
-            ]
-        )
-        .drop("season_values")
+    # Chi-2 saison × présence (4 × 2) de tous les ingrédients, q-values BH
+    ingredients_df = presence_tests(
+        ingredients_df, group_sizes(df, "season", season_order)
     )
+    all_ingredients = ingredients_df["ingredient"]
 
-    # Filtrage: fréquence >= 1%, range >= 0.5pp
-    FREQ_THRESHOLD, RANGE_THRESHOLD = 1.0, 0.5
+    # Filtrage: fréquence >= 1%, range >= 0.5pp, q-value BH < 0.05
+    FREQ_THRESHOLD, RANGE_THRESHOLD, FDR_ALPHA = 1.0, 0.5, 0.05
     ingredients_df_filtered = ingredients_df.filter(
-        (pl.col("mean_freq") >= FREQ_THRESHOLD) & (pl.col("range") >= RANGE_THRESHOLD)
+        (pl.col("mean_freq") >= FREQ_THRESHOLD)
+        & (pl.col("range") >= RANGE_THRESHOLD)
+        & (pl.col("q_value") < FDR_ALPHA)
     )
 
     # Top 20 par coefficient de variation
     top_variable = ingredients_df_filtered.sort("cv", descending=True).head(20)
-
-    # ========================================
-    # MÉTRIQUES EN BANNIÈRE
-    # ========================================
-
-    col_a, col_b, col_c = st.columns(3)
-
-    with col_a:
-        st.metric(t("ingredients_analyses"), f"{len(all_ingredients):,}")
-
-    with col_b:
-        st.metric(t("variables_filtres"), f"{len(ingredients_df_filtered):,}")
-
-    with col_c:
-        st.metric(t("top_affiches"), "20")
-
-    st.markdown("---")
+    top_variable = decode_terms(top_variable, "ingredient", "ingredients")
 
     # ========================================
     # HEATMAP TOP 20 INGRÉDIENTS
@@ -943,6 +1027,52 @@ def analyse_seasonality_ingredients() -> None:
     fig.update_yaxes(title_text=t("axis_ingredient"))
     fig.update_layout(height=700)
 
+    # Statistiques affichées par la page (voir figure_stats)
+    fig.update_layout(
+        meta=dict(
+            n_ingredients=len(all_ingredients),
+            n_filtered=len(ingredients_df_filtered),
+        )
+    )
+
+    return fig
+
+
+def analyse_seasonality_ingredients() -> None:
+    """
+    Analyse des ingrédients les plus variables par saison.
+
+    Graphiques:
+    - Heatmap: Top 20 ingrédients avec plus grande variabilité saisonnière
+    - Fréquence % de présence par saison
+
+    Insight:
+    Été (légumes/herbes) vs Automne (baking/soupes/mijotés).
+    """
+
+    # Figure et statistiques en cache (voir utils.figure_cache)
+    fig = cached_figure(
+        "seasonality_ingredients", get_recipes_version(), build_ingredients_figure
+    )
+    figure_data = figure_stats(fig)
+
+    # ========================================
+    # MÉTRIQUES EN BANNIÈRE
+    # ========================================
+
+    col_a, col_b, col_c = st.columns(3)
+
+    with col_a:
+        st.metric(t("ingredients_analyses"), f"{figure_data['n_ingredients']:,}")
+
+    with col_b:
+        st.metric(t("variables_filtres"), f"{figure_data['n_filtered']:,}")
+
+    with col_c:
+        st.metric(t("top_affiches"), "20")
+
+    st.markdown("---")
+
     # Affichage
     st.plotly_chart(fig, use_container_width=True)
 
@@ -958,105 +1088,33 @@ def analyse_seasonality_ingredients() -> None:
 # ============================================================================
 
 
-def analyse_seasonality_tags() -> None:
-    """
-    Analyse des tags les plus variables par saison.
-
-    Graphiques:
-    - Heatmap: Top 20 tags avec plus grande variabilité saisonnière
-    - Fréquence % de présence par saison
-
-    Insight:
-    Été (summer/BBQ/grilling) vs Automne/Hiver (thanksgiving/christmas/winter).
-    """
-
+def build_tags_figure() -> go.Figure:
+    """Sélectionne les tags les plus saisonniers et construit leur heatmap."""
     # Chargement des données
     df = load_recipes_clean()
 
     # Ordre des saisons
     season_order = ["Winter", "Spring", "Summer", "Autumn"]
 
-    # Extraction des tags par saison
-    tags_by_season = {}
-    n_recipes_by_season = {}
-
-    for season in season_order:
-        season_df = df.filter(pl.col("season") == season)
-        n_recipes_by_season[season] = season_df.height
-
-        tag_counts = (
-            season_df.select(pl.col("tags").explode())
-            .group_by("tags")
-            .agg(pl.count().alias("count"))
-        )
-        tags_by_season[season] = dict(zip(tag_counts["tags"], tag_counts["count"]))
-
-    # Tous les tags uniques
-    all_tags = set().union(*[set(tag.keys()) for tag in tags_by_season.values()])
-
-    # Construction matrice de fréquences (%)
-    tags_matrix = [
-        {
-            "tag": t,
-            **{
-                s: (tags_by_season[s].get(t, 0) / n_recipes_by_season[s]) * 100
-                for s in season_order
-            },
-        }
-        for t in all_tags
-    ]
-    tags_df = pl.DataFrame(tags_matrix)
-
-    # Calcul métriques de variabilité
-    import numpy as np
-
-    tags_df = (
-        tags_df.with_columns(
-            [pl.concat_list([pl.col(s) for s in season_order]).alias("season_values")]
-        )
-        .with_columns(
-            [
-                pl.col("season_values").list.std().alias("std_seasonal"),
-                pl.col("season_values").list.mean().alias("mean_freq"),
-                (
-                    pl.col("season_values").list.std()
-                    / pl.col("season_values").list.mean()
-                    * 100
-                ).alias("cv"),
-                (
-                    pl.max_horizontal([pl.col(s) for s in season_order])
-                    - pl.min_horizontal([pl.col(s) for s in season_order])
-                ).alias("range"),
-            ]
-        )
-        .drop("season_values")
+    # Fréquences (%) tag × saison et variabilité, en une passe
+    tags_df = term_group_frequencies(
+        df, "tags", "season", season_order, term_alias="tag"
     )
+    # Chi-2 saison × présence (4 × 2) de tous les tags, q-values BH
+    tags_df = presence_tests(tags_df, group_sizes(df, "season", season_order))
+    all_tags = tags_df["tag"]
 
-    # Filtrage: fréquence >= 1%, range >= 0.5pp
-    FREQ_THRESHOLD, RANGE_THRESHOLD = 1.0, 0.5
+    # Filtrage: fréquence >= 1%, range >= 0.5pp, q-value BH < 0.05
+    FREQ_THRESHOLD, RANGE_THRESHOLD, FDR_ALPHA = 1.0, 0.5, 0.05
     tags_df_filtered = tags_df.filter(
-        (pl.col("mean_freq") >= FREQ_THRESHOLD) & (pl.col("range") >= RANGE_THRESHOLD)
+        (pl.col("mean_freq") >= FREQ_THRESHOLD)
+        & (pl.col("range") >= RANGE_THRESHOLD)
+        & (pl.col("q_value") < FDR_ALPHA)
     )
 
     # Top 20 par coefficient de variation
     top_variable = tags_df_filtered.sort("cv", descending=True).head(20)
-
-    # ========================================
-    # MÉTRIQUES EN BANNIÈRE
-    # ========================================
-
-    col_a, col_b, col_c = st.columns(3)
-
-    with col_a:
-        st.metric(t("tags_analyses"), f"{len(all_tags):,}")
-
-    with col_b:
-        st.metric(t("variables_filtres"), f"{len(tags_df_filtered):,}")
-
-    with col_c:
-        st.metric(t("top_affiches"), "20")
-
-    st.markdown("---")
+    top_variable = decode_terms(top_variable, "tag", "tags")
 
     # ========================================
     # HEATMAP TOP 20 TAGS
@@ -1102,6 +1160,45 @@ def analyse_seasonality_tags() -> None:
     fig.update_yaxes(title_text="Tag")
     fig.update_layout(height=700)
 
+    # Statistiques affichées par la page (voir figure_stats)
+    fig.update_layout(meta=dict(n_tags=len(all_tags), n_filtered=len(tags_df_filtered)))
+
+    return fig
+
+
+def analyse_seasonality_tags() -> None:
+    """
+    Analyse des tags les plus variables par saison.
+
+    Graphiques:
+    - Heatmap: Top 20 tags avec plus grande variabilité saisonnière
+    - Fréquence % de présence par saison
+
+    Insight:
+    Été (summer/BBQ/grilling) vs Automne/Hiver (thanksgiving/christmas/winter).
+    """
+
+    # Figure et statistiques en cache (voir utils.figure_cache)
+    fig = cached_figure("seasonality_tags", get_recipes_version(), build_tags_figure)
+    figure_data = figure_stats(fig)
+
+    # ========================================
+    # MÉTRIQUES EN BANNIÈRE
+    # ========================================
+
+    col_a, col_b, col_c = st.columns(3)
+
+    with col_a:
+        st.metric(t("tags_analyses"), f"{figure_data['n_tags']:,}")
+
+    with col_b:
+        st.metric(t("variables_filtres"), f"{figure_data['n_filtered']:,}")
+
+    with col_c:
+        st.metric(t("top_affiches"), "20")
+
+    st.markdown("---")
+
     # Affichage
     st.plotly_chart(fig, use_container_width=True)
 
@@ -1112,6 +1209,243 @@ def analyse_seasonality_tags() -> None:
     st.info(t("tags_interpretation", category="seasonality"))
 
 
+# ============================================================================
+# ANALYSE 7: DÉCOMPOSITION SAISONNIÈRE MENSUELLE (STL)
+# ============================================================================
+
+
+def load_monthly_series(series_key: str) -> pl.DataFrame:
+    """
+    Série mensuelle complète (period, n) à décomposer.
+
+    Args:
+        series_key: 'recipes' (soumissions) ou 'interactions' (avis)
+
+    Returns:
+        DataFrame (period, n), mois vides à 0 ; vide si la date de
+        soumission des recettes n'est pas disponible
+    """
+    if series_key == "recipes":
+        df = load_recipes_clean()
+        if "submitted" not in df.columns:
+            return pl.DataFrame(schema={"period": pl.Date, "n": pl.UInt32})
+        return monthly_counts(df, "submitted", "n")
+
+    # Histogramme mensuel des notes déjà en cache (pas de relecture des interactions)
+    monthly = get_rating_histograms(("year", "month"))
+    return complete_months(
+        monthly.select(
+            pl.date(pl.col("year"), pl.col("month"), 1).alias("period"),
+            pl.col("n_interactions").alias("n"),
+        )
+    )
+
+
+def compute_monthly_decomposition(
+    series: pl.DataFrame, series_name: str
+) -> pl.DataFrame:
+    """
+    Composantes STL d'une série mensuelle, en cache par version des données.
+
+    Args:
+        series: DataFrame (period, n) issu de load_monthly_series
+        series_name: Nom de la série (clé de cache)
+
+    Returns:
+        DataFrame (time, observed, trend, seasonal, resid)
+    """
+    values = series["n"].to_numpy().astype(np.float64)
+    version = series_version(values, series["period"].to_physical().to_numpy())
+    return get_stl_decomposition(
+        series_name, version, values, series["period"].to_list()
+    )
+
+
+def build_decomposition_figure(series_key: str = "recipes") -> go.Figure:
+    """
+    Décompose la série mensuelle (STL) et construit ses 4 composantes.
+
+    La force saisonnière et l'amplitude par année sont rangées dans
+    layout.meta (voir figure_stats).
+
+    Args:
+        series_key: 'recipes' (soumissions) ou 'interactions' (avis)
+    """
+    series = load_monthly_series(series_key)
+    components = compute_monthly_decomposition(series, f"{series_key}_monthly")
+    amplitude = seasonal_amplitude_by_year(components)
+
+    component_cols = ["observed", "trend", "seasonal", "resid"]
+    fig = make_subplots(
+        rows=4,
+        cols=1,
+        shared_xaxes=True,
+        vertical_spacing=0.05,
+        subplot_titles=[
+            t(f"component_{col}", category="seasonality") for col in component_cols
+        ],
+    )
+    dates = components["time"].to_list()
+    for row, col in enumerate(component_cols, start=1):
+        if col == "resid":
+            trace = go.Bar(
+                x=dates,
+                y=components[col].to_list(),
+                marker=dict(color=ColorTheme.TEXT_SECONDARY),
+                showlegend=False,
+                hovertemplate="%{x|%Y-%m}<br>%{y:,.0f}<extra></extra>",
+            )
+        else:
+            trace = go.Scatter(
+                x=dates,
+                y=components[col].to_list(),
+                mode="lines",
+                line=dict(color=ColorTheme.CHART_COLORS[row - 1], width=2),
+                showlegend=False,
+                hovertemplate="%{x|%Y-%m}<br>%{y:,.0f}<extra></extra>",
+            )
+        fig.add_trace(trace, row=row, col=1)
+
+    chart_theme.apply_subplot_theme(fig, num_rows=4, num_cols=1)
+    fig.update_layout(
+        height=800,
+        showlegend=False,
+        # Statistiques affichées par la page (voir figure_stats)
+        meta=dict(
+            strength=seasonal_strength(components),
+            amplitude=amplitude.select(
+                "year", "relative_amplitude", "peak_month"
+            ).to_dict(as_series=False),
+        ),
+    )
+    return fig
+
+
+def build_amplitude_figure(series_key: str = "recipes") -> go.Figure:
+    """
+    Construit l'amplitude saisonnière annuelle (% du niveau de tendance).
+
+    Args:
+        series_key: 'recipes' (soumissions) ou 'interactions' (avis)
+    """
+    series = load_monthly_series(series_key)
+    components = compute_monthly_decomposition(series, f"{series_key}_monthly")
+    amplitude = seasonal_amplitude_by_year(components)
+    month_labels = translate_list(MONTH_KEYS, "months")
+
+    fig = go.Figure(
+        go.Bar(
+            x=amplitude["year"].to_list(),
+            y=amplitude["relative_amplitude"].to_list(),
+            marker=dict(color=chart_theme.get_bar_color(), line=dict(width=0)),
+            customdata=[month_labels[m - 1] for m in amplitude["peak_month"]],
+            hovertemplate=(
+                "<b>%{x}</b><br>%{y:.1f}%<br>"
+                f"{t('usual_peak_month', category='seasonality')}: "
+                "%{customdata}<extra></extra>"
+            ),
+            showlegend=False,
+        )
+    )
+    fig.update_xaxes(title_text=t("axis_year", category="trends"))
+    fig.update_yaxes(title_text=t("relative_amplitude", category="seasonality"))
+    chart_theme.apply_chart_theme(
+        fig, title=t("amplitude_chart_title", category="seasonality")
+    )
+    return fig
+
+
+def analyse_seasonality_decomposition() -> None:
+    """
+    Décomposition STL des volumes mensuels (recettes ou interactions).
+
+    Graphiques:
+    - 4 panneaux partagés: observé, tendance, saisonnalité, résidu
+    - Bar chart: amplitude saisonnière annuelle en % du niveau de tendance
+
+    Les composantes sont mises en cache par version des données : changer de
+    série ou relancer la page ne refait pas l'ajustement.
+    """
+    series_key = st.radio(
+        t("decomposition_series", category="seasonality"),
+        options=["recipes", "interactions"],
+        format_func=lambda key: t(f"decomposition_{key}", category="seasonality"),
+        horizontal=True,
+        key="seasonality_stl_series",
+    )
+
+    series = load_monthly_series(series_key)
+    if series.height < 2 * MONTHLY_PERIOD + 1:
+        st.warning(t("decomposition_unavailable", category="seasonality"))
+        return
+
+    # Figures et statistiques en cache (voir utils.figure_cache)
+    version = (
+        get_recipes_version() if series_key == "recipes" else get_interactions_version()
+    )
+    fig = cached_figure(
+        "seasonality_decomposition",
+        version,
+        build_decomposition_figure,
+        series_key=series_key,
+    )
+    fig_amplitude = cached_figure(
+        "seasonality_amplitude", version, build_amplitude_figure, series_key=series_key
+    )
+    figure_data = figure_stats(fig)
+    # Années sans amplitude : NaN relus en valeurs manquantes
+    amplitude = pl.DataFrame(figure_data["amplitude"]).fill_nan(None)
+    strength = figure_data["strength"]
+
+    # ========================================
+    # MÉTRIQUES EN BANNIÈRE
+    # ========================================
+
+    month_labels = translate_list(MONTH_KEYS, "months")
+    col_a, col_b, col_c = st.columns(3)
+
+    with col_a:
+        st.metric(t("seasonal_strength", category="seasonality"), f"{strength:.2f}")
+
+    with col_b:
+        usual_peak = amplitude["peak_month"].mode().sort()
+        st.metric(
+            t("usual_peak_month", category="seasonality"),
+            month_labels[int(usual_peak[0]) - 1] if len(usual_peak) else "-",
+        )
+
+    with col_c:
+        relative = amplitude.drop_nulls("relative_amplitude")
+        if relative.height >= 2:
+            first, last = relative.row(0, named=True), relative.row(-1, named=True)
+            st.metric(
+                t(
+                    "amplitude_change",
+                    category="seasonality",
+                    first=first["year"],
+                    last=last["year"],
+                ),
+                f"{last['relative_amplitude']:.1f}%",
+                delta=f"{last['relative_amplitude'] - first['relative_amplitude']:+.1f} pp",
+            )
+
+    st.markdown("---")
+
+    # ========================================
+    # COMPOSANTES STL
+    # ========================================
+
+    st.plotly_chart(fig, use_container_width=True)
+
+    # ========================================
+    # AMPLITUDE SAISONNIÈRE PAR ANNÉE
+    # ========================================
+
+    st.plotly_chart(fig_amplitude, use_container_width=True)
+
+    st.info(t("decomposition_interpretation", category="seasonality"))
+
+
 # ============================================================================
 # FONCTION PRINCIPALE DE RENDU
 # ============================================================================
@@ -1124,7 +1458,8 @@ def render_seasonality_analysis() -> None:
     Cette fonction sera appelée depuis main.py lors de la sélection du menu
     "📅 Analyses Saisonnières".
 
-    Format: Page continue affichant toutes les analyses d'un coup (comme Tendances).
+    Format: Page continue, une section par analyse ; seule la première est
+    calculée d'office, les autres à l'ouverture (voir utils.sections).
     """
 
     st.markdown(
@@ -1134,30 +1469,47 @@ def render_seasonality_analysis() -> None:
 
     st.markdown(t("main_description", category="seasonality"))
 
-    # Affichage de toutes les analyses en continu (comme page Tendances)
-
-    st.subheader(f"📊 {t('volume_title', category='seasonality')}")
-    analyse_seasonality_volume()
-    st.markdown("---")
-
-    st.subheader(f"⏱️ {t('duration_title', category='seasonality')}")
-    analyse_seasonality_duree()
-    st.markdown("---")
-
-    st.subheader(f"🔧 {t('complexity_title', category='seasonality')}")
-    analyse_seasonality_complexite()
-    st.markdown("---")
-
-    st.subheader(f"🥗 {t('nutrition_title', category='seasonality')}")
-    analyse_seasonality_nutrition()
-    st.markdown("---")
-
-    st.subheader(f"🥘 {t('ingredients_title', category='seasonality')}")
-    analyse_seasonality_ingredients()
-    st.markdown("---")
-
-    st.subheader(f"🏷️ {t('tags_title', category='seasonality')}")
-    analyse_seasonality_tags()
+    # Sections isolées (fragments), calculées à l'ouverture au-delà de la première
+    render_sections(
+        "seasonality",
+        [
+            Section(
+                "volume",
+                f"📊 {t('volume_title', category='seasonality')}",
+                analyse_seasonality_volume,
+            ),
+            Section(
+                "duration",
+                f"⏱️ {t('duration_title', category='seasonality')}",
+                analyse_seasonality_duree,
+            ),
+            Section(
+                "complexity",
+                f"🔧 {t('complexity_title', category='seasonality')}",
+                analyse_seasonality_complexite,
+            ),
+            Section(
+                "nutrition",
+                f"🥗 {t('nutrition_title', category='seasonality')}",
+                analyse_seasonality_nutrition,
+            ),
+            Section(
+                "ingredients",
+                f"🥘 {t('ingredients_title', category='seasonality')}",
+                analyse_seasonality_ingredients,
+            ),
+            Section(
+                "tags",
+                f"🏷️ {t('tags_title', category='seasonality')}",
+                analyse_seasonality_tags,
+            ),
+            Section(
+                "decomposition",
+                f"📈 {t('decomposition_title', category='seasonality')}",
+                analyse_seasonality_decomposition,
+            ),
+        ],
+    )
 
 
 # ============================================================================
@@ -1168,8 +1520,8 @@ MODULE_INFO = {
     "name": "Analyses Saisonnières",
     "icon": "📅",
     "description": "Analyse de la saisonnalité des recettes (Winter/Spring/Summer/Autumn)",
-    "num_analyses": 6,
-    "status": "completed",  # 6/6 COMPLET ✅
+    "num_analyses": 7,
+    "status": "completed",  # 7/7 COMPLET ✅
 }
 
 
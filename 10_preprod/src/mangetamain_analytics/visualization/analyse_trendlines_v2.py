@@ -5,6 +5,7 @@ Conversion propre Matplotlib → Plotly Express selon guide pratique.
 """
 
 import warnings
+from typing import Optional
 import numpy as np
 import polars as pl
 import plotly.graph_objects as go
@@ -14,11 +15,16 @@ import statsmodels.api as sm
 import streamlit as st
 import matplotlib.colors as mcolors
 
+from analysis.change_points import series_version
+from analysis.time_series import monthly_counts
+from data.cached_loaders import get_change_points
 from data.cached_loaders import get_recipes_clean as load_recipes_clean
+from data.cached_loaders import get_recipes_version
+from data.vocabulary import decode_terms, term_key
 from utils import chart_theme
 from utils.color_theme import ColorTheme
+from utils.figure_cache import cached_figure, figure_stats
 from utils.i18n_helper import t
-from i18n import get_current_language
 
 warnings.filterwarnings("ignore")
 
@@ -28,9 +34,13 @@ warnings.filterwarnings("ignore")
 # ============================================================================
 
 
-@st.cache_data
-def load_and_prepare_data() -> None:
-    """Charge et prépare les données depuis S3 (avec cache Streamlit)."""
+def load_and_prepare_data() -> pl.DataFrame:
+    """
+    Recettes en cache (get_recipes_clean), avec complexity_score.
+
+    Le score est dérivé à la volée s'il manque ; les autres colonnes sont
+    partagées avec le cache des recettes, qui n'est donc pas dupliqué.
+    """
     df = load_recipes_clean()
     # Ajouter complexity_score si nécessaire
     if "complexity_score" not in df.columns:
@@ -43,75 +53,74 @@ def load_and_prepare_data() -> None:
     return df
 
 
-# ============================================================================
-# ANALYSE 1: VOLUME DE RECETTES
-# ============================================================================
+def compute_volume_segments(df: pl.DataFrame) -> pl.DataFrame:
+    """
+    Régimes du volume de soumissions détectés par PELT.
 
+    La série est mensuelle (mois sans recette comptés à 0) si la colonne
+    'submitted' est disponible, annuelle sinon.
 
-def analyse_trendline_volume() -> None:
-    """
-    Analyse interactive du volume de recettes par année.
-    Version preprod avec filtres et statistiques.
-    """
+    Args:
+        df: Recettes (colonnes 'year' et optionnellement 'submitted')
 
-    # Chargement des données
-    df = load_and_prepare_data()
+    Returns:
+        DataFrame des segments (segment, start, end, n_points, mean) avec
+        une colonne 'position' : début du segment en année décimale
+    """
+    if "submitted" in df.columns:
+        counts = monthly_counts(df, "submitted", "n_recipes")
+        series_name, min_size = "recipes_monthly", 6
+        position = pl.col("start").dt.year() + (pl.col("start").dt.month() - 1) / 12
+    else:
+        counts = df.group_by(pl.col("year").alias("period")).agg(
+            pl.len().alias("n_recipes")
+        )
+        series_name, min_size = "recipes_yearly", 3
+        position = pl.col("start").cast(pl.Float64)
 
-    # ========================================
-    # WIDGETS INTERACTIFS
-    # ========================================
+    counts = counts.sort("period")
+    values = counts["n_recipes"].to_numpy().astype(np.float64)
+    times = counts["period"].to_list()
+    segments = get_change_points(
+        series_name,
+        series_version(values, counts["period"].to_physical().to_numpy()),
+        values,
+        times,
+        min_size=min_size,
+    )
+    return segments.with_columns(position.alias("position"))
 
-    col1, col2, col3 = st.columns(3)
 
-    with col1:
-        # Filtre années
-        all_years = sorted(df["year"].unique().to_list())
-        year_range = st.slider(
-            t("year_range"),
-            min_value=int(all_years[0]),
-            max_value=int(all_years[-1]),
-            value=(int(all_years[0]), int(all_years[-1])),
-        )
+# ============================================================================
+# ANALYSE 1: VOLUME DE RECETTES
+# ============================================================================
 
-    with col2:
-        # Choix couleur barres (utilise maintenant la charte)
-        bar_color = chart_theme.get_bar_color()
-        st.markdown("")  # Empty column
 
-    with col3:
-        # Afficher valeurs
-        show_values = st.checkbox(t("show_values"), value=True)
+def build_volume_figure(
+    year_range: Optional[tuple] = None, show_values: bool = True
+) -> go.Figure:
+    """
+    Construit la figure du volume annuel (barres, Q-Q plot).
 
-    # ========================================
-    # FILTRAGE DES DONNÉES
-    # ========================================
+    Les statistiques affichées à côté (série annuelle, régimes PELT, R² du
+    Q-Q plot) sont rangées dans layout.meta (voir figure_stats).
 
-    df_filtered = df.filter(
-        (pl.col("year") >= year_range[0]) & (pl.col("year") <= year_range[1])
-    )
+    Args:
+        year_range: (première, dernière) année, None pour toutes les années
+        show_values: Afficher le nombre de recettes au-dessus des barres
+    """
+    df = load_and_prepare_data()
+    if year_range is not None:
+        df = df.filter(
+            (pl.col("year") >= year_range[0]) & (pl.col("year") <= year_range[1])
+        )
 
     recipes_per_year = (
-        df_filtered.group_by("year")
-        .agg(pl.len().alias("n_recipes"))
-        .sort("year")
-        .to_pandas()
+        df.group_by("year").agg(pl.len().alias("n_recipes")).sort("year").to_pandas()
     )
 
     data = recipes_per_year["n_recipes"].values
 
-    # Stats en bannière
-    col_a, col_b, col_c = st.columns(3)
-    with col_a:
-        st.metric(t("years"), len(recipes_per_year))
-    with col_b:
-        st.metric("🍳 Total recettes", f"{data.sum():,}")
-    with col_c:
-        st.metric(t("average_per_year"), f"{data.mean():.0f}")
-
-    # ========================================
-    # GRAPHIQUE
-    # ========================================
-
     # Calcul Q-Q plot
     (osm, osr), (slope, intercept, r) = stats.probplot(data, dist="norm")
 
@@ -127,7 +136,9 @@ def analyse_trendline_volume() -> None:
         go.Bar(
             x=recipes_per_year["year"].astype(str),
             y=recipes_per_year["n_recipes"],
-            marker=dict(color=bar_color, opacity=0.85, line=dict(width=0)),
+            marker=dict(
+                color=chart_theme.get_bar_color(), opacity=0.85, line=dict(width=0)
+            ),
             text=[
                 f"{val:,}" if show_values else ""
                 for val in recipes_per_year["n_recipes"]
@@ -141,6 +152,18 @@ def analyse_trendline_volume() -> None:
         col=1,
     )
 
+    # Ruptures : une ligne verticale au début de chaque nouveau régime
+    segments = compute_volume_segments(df)
+    first_year = int(recipes_per_year["year"].iloc[0])
+    for position in segments["position"][1:]:
+        fig.add_vline(
+            # Axe catégoriel : la barre de l'année i est centrée sur i
+            x=position - first_year - 0.5,
+            line=dict(color=ColorTheme.TEXT_PRIMARY, width=1.5, dash="dot"),
+            row=1,
+            col=1,
+        )
+
     # SUBPLOT 2 : Q-Q plot - THÈME APPLIQUÉ
     fig.add_trace(
         go.Scatter(
@@ -193,7 +216,80 @@ def analyse_trendline_volume() -> None:
     fig.update_layout(
         height=600,
         showlegend=False,
+        meta=dict(
+            n_recipes=data.tolist(),
+            qq_r2=r**2,
+            segments=[
+                {
+                    "segment": row["segment"],
+                    "start": str(row["start"]),
+                    "end": str(row["end"]),
+                    "mean": row["mean"],
+                }
+                for row in segments.iter_rows(named=True)
+            ],
+        ),
+    )
+
+    return fig
+
+
+def analyse_trendline_volume() -> None:
+    """
+    Analyse interactive du volume de recettes par année.
+    Version preprod avec filtres et statistiques.
+    """
+
+    # Chargement des données
+    df = load_and_prepare_data()
+
+    # ========================================
+    # WIDGETS INTERACTIFS
+    # ========================================
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        # Filtre années
+        all_years = sorted(df["year"].unique().to_list())
+        full_range = (int(all_years[0]), int(all_years[-1]))
+        year_range = st.slider(
+            t("year_range"),
+            min_value=full_range[0],
+            max_value=full_range[1],
+            value=full_range,
+        )
+
+    with col2:
+        st.markdown("")  # Empty column
+
+    with col3:
+        # Afficher valeurs
+        show_values = st.checkbox(t("show_values"), value=True)
+
+    # ========================================
+    # GRAPHIQUE (EN CACHE)
+    # ========================================
+
+    # Plage complète : None, clé de la vue par défaut pré-calculée
+    fig = cached_figure(
+        "trends_volume",
+        get_recipes_version(),
+        build_volume_figure,
+        year_range=None if tuple(year_range) == full_range else tuple(year_range),
+        show_values=show_values,
     )
+    figure_data = figure_stats(fig)
+    data = np.array(figure_data["n_recipes"])
+
+    # Stats en bannière
+    col_a, col_b, col_c = st.columns(3)
+    with col_a:
+        st.metric(t("years"), len(data))
+    with col_b:
+        st.metric("🍳 Total recettes", f"{data.sum():,}")
+    with col_c:
+        st.metric(t("average_per_year"), f"{data.mean():.0f}")
 
     # Affichage
     st.plotly_chart(fig, use_container_width=True)
@@ -202,6 +298,9 @@ def analyse_trendline_volume() -> None:
     # STATISTIQUES DÉTAILLÉES (EXPANDER)
     # ========================================
 
+    segments = pl.DataFrame(figure_data["segments"])
+    r2 = figure_data["qq_r2"]
+
     with st.expander(t("detailed_statistics")):
         col1, col2, col3, col4 = st.columns(4)
 
@@ -222,11 +321,27 @@ def analyse_trendline_volume() -> None:
             st.metric("Coef. variation", f"{(data.std()/data.mean()*100):.1f}%")
 
         st.divider()
-        st.write(t("trends.stats_label_r2_normality").format(value=f"{r**2:.4f}"))
+        st.markdown(f"**{t('change_points_title', category='trends')}**")
+        st.dataframe(
+            segments.select(
+                pl.col("segment").alias(t("col_segment", category="trends")),
+                pl.col("start")
+                .cast(pl.String)
+                .alias(t("col_start", category="trends")),
+                pl.col("end").cast(pl.String).alias(t("col_end", category="trends")),
+                pl.col("mean").round(0).alias(t("col_period_mean", category="trends")),
+            ),
+            use_container_width=True,
+            hide_index=True,
+        )
+        st.caption(t("change_points_caption", category="trends"))
+
+        st.divider()
+        st.write(t("trends.stats_label_r2_normality").format(value=f"{r2:.4f}"))
 
-        if r**2 > 0.95:
+        if r2 > 0.95:
             st.success("✅ Distribution proche de la normale")
-        elif r**2 > 0.90:
+        elif r2 > 0.90:
             st.warning(t("distribution_slightly_non_normal", category="trends"))
         else:
             st.error("❌ Distribution non normale")
@@ -240,70 +355,36 @@ def analyse_trendline_volume() -> None:
 # ============================================================================
 
 
-def analyse_trendline_duree() -> None:
-    """
-    Analyse WLS de l'évolution de la durée - Version style professionnel.
-    MÊME ANALYSE que l'original matplotlib, juste un meilleur rendu visuel.
-    Conserve la logique: 2 courbes (moyenne/médiane), 2 régressions WLS, zone IQR, bulles.
+def build_duration_figure(
+    year_range: Optional[tuple] = None,
+    show_bubbles: bool = True,
+    quantiles: tuple = (0.25, 0.75),
+) -> go.Figure:
     """
+    Calcule les régressions WLS de la durée et construit leur figure.
 
-    # Chargement des données
-    df = load_and_prepare_data()
+    Les pentes, R² et la dispersion affichés à côté sont rangés dans
+    layout.meta (voir figure_stats).
 
-    # ========================================
-    # WIDGETS INTERACTIFS
-    # ========================================
-
-    col1, col2, col3 = st.columns(3)
-
-    with col1:
-        # Filtre années
-        all_years = sorted(df["year"].unique().to_list())
-        year_range = st.slider(
-            t("year_range"),
-            min_value=int(all_years[0]),
-            max_value=int(all_years[-1]),
-            value=(int(all_years[0]), int(all_years[-1])),
-            key="slider_duree_years_v2",
-        )
-
-    with col2:
-        # Option bulles
-        show_bubbles = st.checkbox(t("show_proportional_bubbles"), value=True)
-
-    with col3:
-        # Quantiles personnalisables
-        quantile_choice = st.selectbox(
-            t("dispersion_interval"),
-            [
-                "Q25-Q75 (IQR classique)",
-                "Q10-Q90 (Large)",
-                "Q5-Q95 (Très large)",
-                "Q33-Q66 (Étroit)",
-            ],
-            index=0,
-        )
-
-        # Extraction des valeurs de quantiles
-        if "Q25-Q75" in quantile_choice:
-            q_low, q_high = 0.25, 0.75
-        elif "Q10-Q90" in quantile_choice:
-            q_low, q_high = 0.10, 0.90
-        elif "Q5-Q95" in quantile_choice:
-            q_low, q_high = 0.05, 0.95
-        else:  # Q33-Q66
-            q_low, q_high = 0.33, 0.66
+    Args:
+        year_range: (première, dernière) année, None pour toutes les années
+        show_bubbles: Bulles proportionnelles au nombre de recettes
+        quantiles: (bas, haut) de l'intervalle de dispersion
+    """
+    df = load_and_prepare_data()
+    q_low, q_high = quantiles
 
     # ========================================
     # AGRÉGATION DURÉE PAR ANNÉE (IDENTIQUE À L'ORIGINAL)
     # ========================================
 
-    df_filtered = df.filter(
-        (pl.col("year") >= year_range[0]) & (pl.col("year") <= year_range[1])
-    )
+    if year_range is not None:
+        df = df.filter(
+            (pl.col("year") >= year_range[0]) & (pl.col("year") <= year_range[1])
+        )
 
     minutes_by_year = (
-        df_filtered.group_by("year")
+        df.group_by("year")
         .agg(
             [
                 pl.mean("minutes").alias("mean_minutes"),
@@ -362,43 +443,10 @@ def analyse_trendline_duree() -> None:
     # Taille des bulles (identique à l'original)
     sizes = minutes_by_year["n_recipes"] / minutes_by_year["n_recipes"].max() * 35
 
-    # ========================================
-    # MÉTRIQUES EN BANNIÈRE
-    # ========================================
-
-    col_a, col_b, col_c, col_d, col_e = st.columns(5)
-
-    with col_a:
-        st.metric(
-            t("current_average"), f"{minutes_by_year['mean_minutes'].iloc[-1]:.1f} min"
-        )
-
-    with col_b:
-        st.metric(
-            t("current_median"),
-            f"{minutes_by_year['median_minutes'].iloc[-1]:.1f} min",
-        )
-
-    with col_c:
-        trend_mean = regressions["mean_minutes"]["slope"]
-        st.metric(t("average_slope"), f"{trend_mean:+.4f} min/an")
-
-    with col_d:
-        trend_median = regressions["median_minutes"]["slope"]
-        st.metric(t("median_slope"), f"{trend_median:+.4f} min/an")
-
-    with col_e:
-        # Dispersion actuelle (écart interquantile)
-        dispersion_actuelle = (
-            minutes_by_year["q_high"].iloc[-1] - minutes_by_year["q_low"].iloc[-1]
-        )
-        st.metric(
-            t("current_dispersion"),
-            f"{dispersion_actuelle:.1f} min",
-            help=f"Écart entre Q{int(q_high*100)} et Q{int(q_low*100)}",
-        )
-
-    st.markdown("---")
+    # Dispersion actuelle (écart interquantile)
+    dispersion_actuelle = (
+        minutes_by_year["q_high"].iloc[-1] - minutes_by_year["q_low"].iloc[-1]
+    )
 
     # ========================================
     # GRAPHIQUE AVEC STYLE PROFESSIONNEL
@@ -532,7 +580,7 @@ def analyse_trendline_duree() -> None:
     # MISE EN FORME AVEC THÈME "BACK TO THE KITCHEN"
     # ========================================
 
-    unit_year = "min/year" if get_current_language() == "en" else "min/an"
+    unit_year = t("unit_min_per_year", category="trends")
     title_text = (
         f"{t('duration_evolution_title', category='trends')}<br>"
         f"<sub>{t('label_average', category='common')}: {regressions['mean_minutes']['slope']:+.4f} {unit_year} | "
@@ -548,7 +596,127 @@ def analyse_trendline_duree() -> None:
         yaxis_title=t("axis_minutes", category="common"),
         height=650,
         hovermode="closest",
+        meta=dict(
+            current_mean=minutes_by_year["mean_minutes"].iloc[-1],
+            current_median=minutes_by_year["median_minutes"].iloc[-1],
+            dispersion=dispersion_actuelle,
+            label_quantile=label_quantile,
+            regressions={
+                metric_col: {
+                    key: reg[key] for key in ("slope", "intercept", "r2", "p_value")
+                }
+                for metric_col, reg in regressions.items()
+            },
+        ),
+    )
+
+    return fig
+
+
+def analyse_trendline_duree() -> None:
+    """
+    Analyse WLS de l'évolution de la durée - Version style professionnel.
+    MÊME ANALYSE que l'original matplotlib, juste un meilleur rendu visuel.
+    Conserve la logique: 2 courbes (moyenne/médiane), 2 régressions WLS, zone IQR, bulles.
+    """
+
+    # Chargement des données
+    df = load_and_prepare_data()
+
+    # ========================================
+    # WIDGETS INTERACTIFS
+    # ========================================
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        # Filtre années
+        all_years = sorted(df["year"].unique().to_list())
+        full_range = (int(all_years[0]), int(all_years[-1]))
+        year_range = st.slider(
+            t("year_range"),
+            min_value=full_range[0],
+            max_value=full_range[1],
+            value=full_range,
+            key="slider_duree_years_v2",
+        )
+
+    with col2:
+        # Option bulles
+        show_bubbles = st.checkbox(t("show_proportional_bubbles"), value=True)
+
+    with col3:
+        # Quantiles personnalisables
+        quantile_choice = st.selectbox(
+            t("dispersion_interval"),
+            [
+                "Q25-Q75 (IQR classique)",
+                "Q10-Q90 (Large)",
+                "Q5-Q95 (Très large)",
+                "Q33-Q66 (Étroit)",
+            ],
+            index=0,
+        )
+
+        # Extraction des valeurs de quantiles
+        if "Q25-Q75" in quantile_choice:
+            q_low, q_high = 0.25, 0.75
+        elif "Q10-Q90" in quantile_choice:
+            q_low, q_high = 0.10, 0.90
+        elif "Q5-Q95" in quantile_choice:
+            q_low, q_high = 0.05, 0.95
+        else:  # Q33-Q66
+            q_low, q_high = 0.33, 0.66
+
+    # ========================================
+    # RÉGRESSIONS ET GRAPHIQUE (EN CACHE)
+    # ========================================
+
+    # Plage complète : None, clé de la vue par défaut pré-calculée
+    fig = cached_figure(
+        "trends_duration",
+        get_recipes_version(),
+        build_duration_figure,
+        year_range=None if tuple(year_range) == full_range else tuple(year_range),
+        show_bubbles=show_bubbles,
+        quantiles=(q_low, q_high),
     )
+    figure_data = figure_stats(fig)
+    regressions = figure_data["regressions"]
+    dispersion_actuelle = figure_data["dispersion"]
+    label_quantile = figure_data["label_quantile"]
+
+    # ========================================
+    # MÉTRIQUES EN BANNIÈRE
+    # ========================================
+
+    col_a, col_b, col_c, col_d, col_e = st.columns(5)
+
+    with col_a:
+        st.metric(t("current_average"), f"{figure_data['current_mean']:.1f} min")
+
+    with col_b:
+        st.metric(
+            t("current_median"),
+            f"{figure_data['current_median']:.1f} min",
+        )
+
+    with col_c:
+        trend_mean = regressions["mean_minutes"]["slope"]
+        st.metric(t("average_slope"), f"{trend_mean:+.4f} min/an")
+
+    with col_d:
+        trend_median = regressions["median_minutes"]["slope"]
+        st.metric(t("median_slope"), f"{trend_median:+.4f} min/an")
+
+    with col_e:
+        st.metric(
+            t("current_dispersion"),
+            f"{dispersion_actuelle:.1f} min",
+            help=f"Écart entre Q{int(q_high*100)} et Q{int(q_low*100)}",
+        )
+
+    st.markdown("---")
 
     # Affichage
     st.plotly_chart(fig, use_container_width=True)
@@ -1444,8 +1612,13 @@ def analyse_trendline_duree_old() -> None:
 # ============================================================================
 
 
-def analyse_trendline_complexite() -> None:
-    """Analyse de l'évolution de la complexité des recettes."""
+def build_complexity_figure() -> go.Figure:
+    """
+    Calcule les régressions de la complexité et construit leur figure (1×3).
+
+    Pente, R² et p-value du score de complexité (interprétation) sont
+    rangés dans layout.meta (voir figure_stats).
+    """
     df = load_and_prepare_data()
 
     # Agrégation
@@ -1608,17 +1781,30 @@ def analyse_trendline_complexite() -> None:
     fig.update_layout(
         height=500,
         hovermode="x unified",
+        meta={
+            key: regressions["mean_complexity"][key]
+            for key in ("slope", "r2", "p_value")
+        },
     )
 
+    return fig
+
+
+def analyse_trendline_complexite() -> None:
+    """Analyse de l'évolution de la complexité des recettes."""
+    fig = cached_figure(
+        "trends_complexity", get_recipes_version(), build_complexity_figure
+    )
     st.plotly_chart(fig, use_container_width=True)
 
     # Interprétation
+    regression = figure_stats(fig)
     complexity_interpretation = t(
         "complexity_regression_interpretation", category="trends"
     ).format(
-        slope=regressions["mean_complexity"]["slope"],
-        r2=regressions["mean_complexity"]["r2"],
-        pvalue=regressions["mean_complexity"]["p_value"],
+        slope=regression["slope"],
+        r2=regression["r2"],
+        pvalue=regression["p_value"],
     )
 
     # Add details
@@ -1636,8 +1822,8 @@ def analyse_trendline_complexite() -> None:
 # ============================================================================
 
 
-def analyse_trendline_nutrition() -> None:
-    """Analyse de l'évolution des valeurs nutritionnelles."""
+def build_nutrition_figure() -> go.Figure:
+    """Calcule les régressions nutritionnelles et construit leur figure (2×2)."""
     df = load_and_prepare_data()
 
     # Agrégation
@@ -1772,6 +1958,14 @@ def analyse_trendline_nutrition() -> None:
         hovermode="x unified",
     )
 
+    return fig
+
+
+def analyse_trendline_nutrition() -> None:
+    """Analyse de l'évolution des valeurs nutritionnelles."""
+    fig = cached_figure(
+        "trends_nutrition", get_recipes_version(), build_nutrition_figure
+    )
     st.plotly_chart(fig, use_container_width=True)
 
     # Interprétation
@@ -1783,8 +1977,8 @@ def analyse_trendline_nutrition() -> None:
 # ============================================================================
 
 
-def analyse_trendline_ingredients(top_n=10) -> None:
-    """Analyse de l'évolution des ingrédients."""
+def build_ingredients_figure(top_n: int = 10) -> go.Figure:
+    """Calcule les fréquences des ingrédients et construit leur figure (3×2)."""
     df = load_and_prepare_data()
 
     # Paramètres
@@ -1793,36 +1987,32 @@ def analyse_trendline_ingredients(top_n=10) -> None:
     TOP_N = top_n
     N_VARIATIONS = min(5, top_n)
 
-    # Exploser et normaliser les ingrédients
+    # Exploser les ingrédients (ids du vocabulaire, ou chaînes normalisées)
     df_ingredients = (
         df.select(["id", "year", "ingredients"])
         .explode("ingredients")
-        .with_columns(
-            [
-                pl.col("ingredients")
-                .str.to_lowercase()
-                .str.strip_chars()
-                .alias("ingredient_norm")
-            ]
-        )
+        .with_columns([term_key(df, "ingredients").alias("ingredient_norm")])
     )
 
-    # Fréquence globale
-    freq_global = (
+    # Fréquence globale (regroupement sur ids, décodage des seuls agrégats)
+    freq_global = decode_terms(
         df_ingredients.group_by("ingredient_norm")
         .agg(pl.len().alias("total_count"))
         .filter(pl.col("total_count") >= MIN_TOTAL_OCC)
-        .sort("total_count", descending=True)
-        .to_pandas()
-    )
+        .sort("total_count", descending=True),
+        "ingredient_norm",
+        "ingredients",
+    ).to_pandas()
     top_global = freq_global.head(TOP_N)
 
     # Fréquence par année
-    freq_year_ing = (
-        df_ingredients.group_by(["year", "ingredient_norm"])
-        .agg(pl.len().alias("count"))
-        .to_pandas()
-    )
+    freq_year_ing = decode_terms(
+        df_ingredients.group_by(["year", "ingredient_norm"]).agg(
+            pl.len().alias("count")
+        ),
+        "ingredient_norm",
+        "ingredients",
+    ).to_pandas()
 
     year_totals = df.group_by("year").agg(pl.len().alias("n_recipes")).to_pandas()
     freq_year_ing = freq_year_ing.merge(year_totals, on="year", how="left")
@@ -2040,6 +2230,17 @@ def analyse_trendline_ingredients(top_n=10) -> None:
     # Application du thème "Back to the Kitchen"
     chart_theme.apply_subplot_theme(fig, num_rows=3, num_cols=2)
 
+    return fig
+
+
+def analyse_trendline_ingredients(top_n=10) -> None:
+    """Analyse de l'évolution des ingrédients."""
+    fig = cached_figure(
+        "trends_ingredients",
+        get_recipes_version(),
+        build_ingredients_figure,
+        top_n=top_n,
+    )
     st.plotly_chart(fig, use_container_width=True)
 
     # Interprétation
@@ -2051,8 +2252,8 @@ def analyse_trendline_ingredients(top_n=10) -> None:
 # ============================================================================
 
 
-def analyse_trendline_tags(top_n=10) -> None:
-    """Analyse de l'évolution des tags."""
+def build_tags_figure(top_n: int = 10) -> go.Figure:
+    """Calcule les fréquences des tags et construit leur figure (3×2)."""
     df = load_and_prepare_data()
 
     # Paramètres
@@ -2061,29 +2262,30 @@ def analyse_trendline_tags(top_n=10) -> None:
     TOP_N = top_n
     N_VARIATIONS = min(5, top_n)
 
-    # Exploser et normaliser les tags
+    # Exploser les tags (ids du vocabulaire, ou chaînes normalisées)
     df_tags = (
         df.select(["id", "year", "tags"])
         .explode("tags")
-        .with_columns(
-            [pl.col("tags").str.to_lowercase().str.strip_chars().alias("tag_norm")]
-        )
+        .with_columns([term_key(df, "tags").alias("tag_norm")])
     )
 
-    # Fréquence globale
-    freq_global_tags = (
+    # Fréquence globale (regroupement sur ids, décodage des seuls agrégats)
+    freq_global_tags = decode_terms(
         df_tags.group_by("tag_norm")
         .agg(pl.len().alias("total_count"))
         .filter(pl.col("total_count") >= MIN_TOTAL_OCC)
-        .sort("total_count", descending=True)
-        .to_pandas()
-    )
+        .sort("total_count", descending=True),
+        "tag_norm",
+        "tags",
+    ).to_pandas()
     top_global_tags = freq_global_tags.head(TOP_N)
 
     # Fréquence par année
-    freq_year_tag = (
-        df_tags.group_by(["year", "tag_norm"]).agg(pl.len().alias("count")).to_pandas()
-    )
+    freq_year_tag = decode_terms(
+        df_tags.group_by(["year", "tag_norm"]).agg(pl.len().alias("count")),
+        "tag_norm",
+        "tags",
+    ).to_pandas()
 
     year_totals_tags = df.group_by("year").agg(pl.len().alias("n_recipes")).to_pandas()
     freq_year_tag = freq_year_tag.merge(year_totals_tags, on="year", how="left")
@@ -2303,6 +2505,14 @@ def analyse_trendline_tags(top_n=10) -> None:
     # Application du thème "Back to the Kitchen"
     chart_theme.apply_subplot_theme(fig, num_rows=3, num_cols=2)
 
+    return fig
+
+
+def analyse_trendline_tags(top_n=10) -> None:
+    """Analyse de l'évolution des tags."""
+    fig = cached_figure(
+        "trends_tags", get_recipes_version(), build_tags_figure, top_n=top_n
+    )
     st.plotly_chart(fig, use_container_width=True)
 
     # Interprétation
@@ -0,0 +1,453 @@
+"""
+Comportement des utilisateurs (activité, concentration, biais de notation).
+
+Ce module affiche les tables d'activité précalculées par l'ETL
+(mangetamain_data_utils.data_utils_users) : la page ne lit qu'une ligne par
+utilisateur et une ligne par mois, aucune interaction brute n'est parcourue
+au rendu. Les figures passent par utils.figure_cache, versionnées par
+get_users_version.
+
+Analyses disponibles:
+1. Distribution de l'activité (notes par utilisateur)
+2. Concentration sur les utilisateurs les plus actifs (Lorenz, Gini)
+3. Utilisateurs actifs et nouveaux par mois
+4. Biais de notation face aux autres utilisateurs
+"""
+
+import streamlit as st
+import polars as pl
+import numpy as np
+import plotly.graph_objects as go
+
+from analysis.concentration import gini, lorenz_curve, top_share
+from data.cached_loaders import (
+    get_monthly_active_users,
+    get_user_stats,
+    get_users_version,
+)
+from utils import chart_theme
+from utils.color_theme import ColorTheme
+from utils.figure_cache import cached_figure, figure_stats
+from utils.i18n_helper import t
+
+# Classes d'activité (bornes supérieures incluses, en nombre de notes)
+ACTIVITY_BREAKS = [1, 2, 5, 10, 20, 50, 100, 500]
+ACTIVITY_LABELS = [
+    "1",
+    "2",
+    "3-5",
+    "6-10",
+    "11-20",
+    "21-50",
+    "51-100",
+    "101-500",
+    "500+",
+]
+
+# Nombre minimal de notes pour interpréter le biais d'un utilisateur
+MIN_RATINGS_BIAS = 5
+
+
+def activity_distribution(users: pl.DataFrame) -> pl.DataFrame:
+    """
+    Répartition des utilisateurs et des notes par classe d'activité.
+
+    Args:
+        users: Table par utilisateur (n_ratings)
+
+    Returns:
+        DataFrame (activity, n_users, pct_users, pct_ratings), une ligne par
+        classe de ACTIVITY_LABELS, dans l'ordre
+    """
+    binned = (
+        users.select(
+            pl.col("n_ratings")
+            .cut(ACTIVITY_BREAKS, labels=ACTIVITY_LABELS)
+            .cast(pl.String)
+            .alias("activity"),
+            "n_ratings",
+        )
+        .group_by("activity")
+        .agg(pl.len().alias("n_users"), pl.col("n_ratings").sum().alias("ratings"))
+    )
+    return (
+        pl.DataFrame({"activity": ACTIVITY_LABELS})
+        .join(binned, on="activity", how="left")
+        .fill_null(0)
+        .select(
+            "activity",
+            "n_users",
+            (pl.col("n_users") / pl.col("n_users").sum() * 100).alias("pct_users"),
+            (pl.col("ratings") / pl.col("ratings").sum() * 100).alias("pct_ratings"),
+        )
+    )
+
+
+# ============================================================================
+# ANALYSE 1: DISTRIBUTION DE L'ACTIVITÉ
+# ============================================================================
+
+
+def build_activity_figure() -> go.Figure:
+    """Calcule la répartition par classe d'activité et construit sa figure."""
+    users = get_user_stats()
+    distribution = activity_distribution(users)
+
+    fig = go.Figure()
+    fig.add_trace(
+        go.Bar(
+            x=distribution["activity"].to_list(),
+            y=distribution["pct_users"].to_list(),
+            name=t("pct_users", category="users"),
+            marker=dict(color=ColorTheme.ORANGE_PRIMARY, line=dict(width=0)),
+            hovertemplate="%{x}: %{y:.1f}%<extra></extra>",
+        )
+    )
+    fig.add_trace(
+        go.Bar(
+            x=distribution["activity"].to_list(),
+            y=distribution["pct_ratings"].to_list(),
+            name=t("pct_ratings", category="users"),
+            marker=dict(color=ColorTheme.CHART_COLORS[1], line=dict(width=0)),
+            hovertemplate="%{x}: %{y:.1f}%<extra></extra>",
+        )
+    )
+    fig.update_xaxes(title_text=t("activity_axis", category="users"))
+    fig.update_yaxes(title_text="%")
+
+    chart_theme.apply_chart_theme(
+        fig, title=t("activity_chart_title", category="users")
+    )
+    fig.update_layout(barmode="group", height=450)
+
+    # Statistiques affichées par la page (voir figure_stats)
+    fig.update_layout(
+        meta=dict(
+            n_users=users.height,
+            median_ratings=users["n_ratings"].median(),
+            one_timers=float(distribution["pct_users"][0]),
+        )
+    )
+
+    return fig
+
+
+def analyse_users_activite() -> None:
+    """
+    Distribution du nombre de notes par utilisateur.
+
+    Graphique:
+    - Barres groupées par classe d'activité: % des utilisateurs, % des notes
+    """
+    # Figure et statistiques en cache (voir utils.figure_cache)
+    fig = cached_figure("users_activity", get_users_version(), build_activity_figure)
+    figure_data = figure_stats(fig)
+
+    st.plotly_chart(fig, use_container_width=True)
+
+    one_timers = figure_data["one_timers"]
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric(t("metric_users", category="users"), f"{figure_data['n_users']:,}")
+    with col2:
+        st.metric(
+            t("metric_median_ratings", category="users"),
+            f"{figure_data['median_ratings']:.0f}",
+        )
+    with col3:
+        st.metric(t("metric_one_timers", category="users"), f"{one_timers:.1f}%")
+
+    st.info(t("activity_interpretation", category="users").format(pct=one_timers))
+
+
+# ============================================================================
+# ANALYSE 2: CONCENTRATION (POWER USERS)
+# ============================================================================
+
+
+def build_concentration_figure() -> go.Figure:
+    """Calcule la concentration des notes (Lorenz, Gini) et construit sa figure."""
+    counts = get_user_stats()["n_ratings"].to_numpy()
+    population, share = lorenz_curve(counts, n_points=500)
+    gini_coef = gini(counts)
+    top_1 = top_share(counts, 0.01) * 100
+    top_10 = top_share(counts, 0.10) * 100
+
+    fig = go.Figure()
+    fig.add_trace(
+        go.Scatter(
+            x=[0, 100],
+            y=[0, 100],
+            mode="lines",
+            line=dict(color=ColorTheme.TEXT_SECONDARY, width=1.5, dash="dash"),
+            name=t("equality_line", category="users"),
+        )
+    )
+    fig.add_trace(
+        go.Scatter(
+            x=population * 100,
+            y=share * 100,
+            mode="lines",
+            fill="tozeroy",
+            fillcolor=ColorTheme.to_rgba(ColorTheme.ORANGE_PRIMARY, 0.2),
+            line=dict(color=ColorTheme.ORANGE_PRIMARY, width=3),
+            name=t("lorenz_curve", category="users"),
+            hovertemplate="%{x:.1f}% → %{y:.1f}%<extra></extra>",
+        )
+    )
+    fig.update_xaxes(title_text=t("lorenz_x_axis", category="users"), range=[0, 100])
+    fig.update_yaxes(title_text=t("lorenz_y_axis", category="users"), range=[0, 100])
+
+    chart_theme.apply_chart_theme(
+        fig, title=t("concentration_chart_title", category="users")
+    )
+    fig.update_layout(height=500)
+
+    # Statistiques affichées par la page (voir figure_stats)
+    fig.update_layout(meta=dict(gini=gini_coef, top_1=top_1, top_10=top_10))
+
+    return fig
+
+
+def analyse_users_concentration() -> None:
+    """
+    Concentration des notes sur les utilisateurs les plus actifs.
+
+    Graphique:
+    - Courbe de Lorenz (part cumulée des notes) et diagonale d'égalité
+    """
+    # Figure et statistiques en cache (voir utils.figure_cache)
+    fig = cached_figure(
+        "users_concentration", get_users_version(), build_concentration_figure
+    )
+    figure_data = figure_stats(fig)
+    gini_coef = figure_data["gini"]
+    top_1 = figure_data["top_1"]
+    top_10 = figure_data["top_10"]
+
+    st.plotly_chart(fig, use_container_width=True)
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Gini", f"{gini_coef:.3f}")
+    with col2:
+        st.metric(t("metric_top_1", category="users"), f"{top_1:.1f}%")
+    with col3:
+        st.metric(t("metric_top_10", category="users"), f"{top_10:.1f}%")
+
+    st.info(
+        t("concentration_interpretation", category="users").format(
+            top_1=top_1, top_10=top_10, gini=gini_coef
+        )
+    )
+
+
+# ============================================================================
+# ANALYSE 3: UTILISATEURS ACTIFS PAR MOIS
+# ============================================================================
+
+
+def build_monthly_figure() -> go.Figure:
+    """Lit les comptes mensuels d'utilisateurs et construit leur figure."""
+    monthly = get_monthly_active_users()
+
+    # Figure vide, sans statistiques : la page signale l'absence de données
+    if monthly.is_empty():
+        return go.Figure()
+
+    fig = go.Figure()
+    fig.add_trace(
+        go.Scatter(
+            x=monthly["month"].to_list(),
+            y=monthly["n_active_users"].to_list(),
+            mode="lines",
+            line=dict(color=ColorTheme.ORANGE_PRIMARY, width=2),
+            name=t("active_users", category="users"),
+        )
+    )
+    fig.add_trace(
+        go.Scatter(
+            x=monthly["month"].to_list(),
+            y=monthly["n_new_users"].to_list(),
+            mode="lines",
+            line=dict(color=ColorTheme.CHART_COLORS[1], width=2, dash="dot"),
+            name=t("new_users", category="users"),
+        )
+    )
+    fig.update_xaxes(title_text="Date")
+    fig.update_yaxes(title_text=t("users_axis", category="users"))
+
+    chart_theme.apply_chart_theme(fig, title=t("monthly_chart_title", category="users"))
+    fig.update_layout(height=450)
+
+    # Statistiques affichées par la page (voir figure_stats)
+    peak = monthly.row(int(monthly["n_active_users"].arg_max()), named=True)
+    fig.update_layout(
+        meta=dict(
+            peak_month=peak["month"].strftime("%Y-%m"),
+            peak_users=peak["n_active_users"],
+        )
+    )
+
+    return fig
+
+
+def analyse_users_mensuels() -> None:
+    """
+    Utilisateurs actifs et nouveaux utilisateurs par mois.
+
+    Graphique:
+    - Courbes mensuelles: utilisateurs actifs, nouveaux utilisateurs
+    """
+    # Figure et statistiques en cache (voir utils.figure_cache)
+    fig = cached_figure("users_monthly", get_users_version(), build_monthly_figure)
+    figure_data = figure_stats(fig)
+
+    if not figure_data:
+        st.warning(t("no_users", category="users"))
+        return
+
+    st.plotly_chart(fig, use_container_width=True)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric(t("metric_peak_month", category="users"), figure_data["peak_month"])
+    with col2:
+        st.metric(
+            t("metric_peak_users", category="users"),
+            f"{figure_data['peak_users']:,}",
+        )
+
+
+# ============================================================================
+# ANALYSE 4: BIAIS DE NOTATION
+# ============================================================================
+
+
+def build_bias_figure() -> go.Figure:
+    """Calcule l'histogramme des biais de notation et construit sa figure."""
+    bias = (
+        get_user_stats()
+        .filter(pl.col("n_ratings") >= MIN_RATINGS_BIAS)["rating_bias"]
+        .drop_nulls()
+        .to_numpy()
+    )
+
+    # Figure vide, sans statistiques : la page signale l'absence de données
+    if bias.size == 0:
+        return go.Figure()
+
+    # Histogramme précalculé : quelques dizaines de barres au lieu de
+    # toutes les valeurs envoyées au navigateur
+    counts, edges = np.histogram(np.clip(bias, -2, 1), bins=30, range=(-2, 1))
+    centers = (edges[:-1] + edges[1:]) / 2
+
+    fig = go.Figure()
+    fig.add_trace(
+        go.Bar(
+            x=centers,
+            y=counts,
+            width=edges[1] - edges[0],
+            marker=dict(color=ColorTheme.CHART_COLORS[2], line=dict(width=0)),
+            showlegend=False,
+            hovertemplate="%{x:+.2f}: %{y:,}<extra></extra>",
+        )
+    )
+    fig.add_vline(x=0, line=dict(color=ColorTheme.TEXT_PRIMARY, width=1.5, dash="dash"))
+    fig.update_xaxes(title_text=t("bias_axis", category="users"))
+    fig.update_yaxes(title_text=t("users_axis", category="users"))
+
+    chart_theme.apply_chart_theme(
+        fig,
+        title=t("bias_chart_title", category="users").format(n=MIN_RATINGS_BIAS),
+    )
+    fig.update_layout(height=450)
+
+    # Statistiques affichées par la page (voir figure_stats)
+    fig.update_layout(
+        meta=dict(
+            median_bias=float(np.median(bias)),
+            stricter=float((bias < 0).mean() * 100),
+        )
+    )
+
+    return fig
+
+
+def analyse_users_biais() -> None:
+    """
+    Biais de notation des utilisateurs réguliers face aux autres notes.
+
+    Graphique:
+    - Histogramme du biais moyen (note - moyenne des autres notes de la
+      recette), utilisateurs ayant au moins MIN_RATINGS_BIAS notes
+    """
+    # Figure et statistiques en cache (voir utils.figure_cache)
+    fig = cached_figure("users_bias", get_users_version(), build_bias_figure)
+    figure_data = figure_stats(fig)
+
+    if not figure_data:
+        st.warning(t("no_users", category="users"))
+        return
+
+    st.plotly_chart(fig, use_container_width=True)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric(
+            t("metric_median_bias", category="users"),
+            f"{figure_data['median_bias']:+.3f}",
+        )
+    with col2:
+        st.metric(
+            t("metric_stricter", category="users"), f"{figure_data['stricter']:.1f}%"
+        )
+
+    st.info(t("bias_interpretation", category="users"))
+
+
+def render_users_analysis() -> None:
+    """
+    Point d'entrée principal pour l'analyse du comportement des utilisateurs.
+
+    Format: 4 analyses successives sur les tables précalculées par l'ETL.
+    """
+    st.markdown(
+        f'<h1 style="margin-top: 0; padding-top: 0;">👥 {t("main_title", category="users")}</h1>',
+        unsafe_allow_html=True,
+    )
+    st.markdown(t("main_description", category="users"))
+
+    # Sans utilisateurs, la table mensuelle (déjà lue pour la version des
+    # figures) est vide : un seul avertissement, aucune figure construite
+    if get_monthly_active_users().is_empty():
+        st.warning(t("no_users", category="users"))
+        return
+
+    st.subheader(f"📊 {t('activity_title', category='users')}")
+    analyse_users_activite()
+    st.markdown("---")
+
+    st.subheader(f"🏆 {t('concentration_title', category='users')}")
+    analyse_users_concentration()
+    st.markdown("---")
+
+    st.subheader(f"📈 {t('monthly_title', category='users')}")
+    analyse_users_mensuels()
+    st.markdown("---")
+
+    st.subheader(f"⚖️ {t('bias_title', category='users')}")
+    analyse_users_biais()
+
+
+# ============================================================================
+# MÉTADONNÉES DU MODULE (pour integration_strategies.md)
+# ============================================================================
+
+MODULE_INFO = {
+    "name": "Comportement des utilisateurs",
+    "icon": "👥",
+    "description": "Activité, concentration et biais de notation des utilisateurs (tables ETL)",
+    "num_analyses": 4,
+    "status": "completed",
+}
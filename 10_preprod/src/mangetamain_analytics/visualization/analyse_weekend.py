@@ -1,7 +1,7 @@
 """
 Module d'analyse de l'effet weekend sur les recettes.
 
-Ce module contient 6 analyses principales explorant les différences
+Ce module contient 7 analyses principales explorant les différences
 entre recettes publiées en semaine vs. week-end.
 
 Analyses disponibles:
@@ -11,31 +11,45 @@ Analyses disponibles:
 4. Profil nutritionnel
 5. Ingrédients les plus variables
 6. Tags les plus variables
+7. Calendrier quotidien (table des comptages quotidiens précalculée)
 
 Date: 2025-10-24
 """
 
+from datetime import date, timedelta
+from typing import Any
+
 import streamlit as st
 import polars as pl
 import numpy as np
-from scipy import stats
-from scipy.stats import chi2_contingency
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+from analysis.change_points import series_version
+from analysis.contingency import presence_tests
+from analysis.sufficient_stats import group_moments, ttest_from_moments
+from analysis.term_frequencies import group_sizes, term_group_frequencies
+from data.cached_loaders import (
+    get_bootstrap_mean_diff,
+    get_daily_counts,
+    get_permutation_tests,
+    get_recipes_version,
+)
 from data.cached_loaders import get_recipes_clean as load_recipes_clean
+from data.manifest import recipes_headline
+from data.vocabulary import decode_terms
 from utils import chart_theme
+from utils.figure_cache import cached_figure, figure_stats
 from utils.color_theme import ColorTheme
-from utils.i18n_helper import t
+from utils.i18n_helper import t, translate_list
+from utils.sections import Section, render_sections
 
+# Taux de fausses découvertes toléré (q-values Benjamini-Hochberg)
+FDR_ALPHA = 0.05
 
-def analyse_weekend_volume() -> None:
-    """
-    📊 ANALYSE 1: Volume de recettes (Weekday vs Weekend)
 
-    Insight: Publication massives en semaine (+51% vs weekend).
-    Lundi = jour le plus actif (+45%), Samedi le moins actif (-49%).
-    """
+def build_volume_figure() -> go.Figure:
+    """Calcule les volumes semaine / week-end / jour et construit leur figure (1×3)."""
     df = load_recipes_clean()
 
     # --- Ajout colonne Weekday / Weekend ---
@@ -108,7 +122,7 @@ def analyse_weekend_volume() -> None:
         ((pl.col("n_recipes") - mean_all) / mean_all * 100).alias("deviation_pct")
     )
 
-    # 📊 MÉTRIQUES BANNIÈRE
+    # Statistiques de la bannière
     weekday_rpd = recipes_week_period.filter(pl.col("week_period") == "Weekday")[
         "recipes_per_day"
     ][0]
@@ -118,20 +132,6 @@ def analyse_weekend_volume() -> None:
     diff_pct = (weekday_rpd - weekend_rpd) / weekend_rpd * 100
     max_day = recipes_per_day.sort("n_recipes", descending=True).row(0, named=True)
 
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        st.metric("Semaine (moy/jour)", f"{weekday_rpd:,.0f}")
-    with col2:
-        st.metric("Week-end (moy/jour)", f"{weekend_rpd:,.0f}")
-    with col3:
-        st.metric(
-            t("difference"),
-            f"+{diff_pct:.1f}%",
-            delta=t("weekday_gt_weekend", category="weekend"),
-        )
-    with col4:
-        st.metric(f"Jour max: {max_day['jour']}", f"{max_day['n_recipes']:,}")
-
     # 🎨 VISUALISATION (3 panels)
     period_colors_btk = [
         ColorTheme.CHART_COLORS[1],
@@ -250,19 +250,57 @@ def analyse_weekend_volume() -> None:
     chart_theme.apply_subplot_theme(fig, num_rows=1, num_cols=3)
     fig.update_layout(height=500)
 
-    st.plotly_chart(fig, use_container_width=True)
+    # Statistiques affichées par la page (voir figure_stats)
+    fig.update_layout(
+        meta=dict(
+            weekday_rpd=weekday_rpd,
+            weekend_rpd=weekend_rpd,
+            diff_pct=diff_pct,
+            max_day=max_day,
+        )
+    )
 
-    # 📝 INTERPRÉTATION
-    st.info(t("volume_interpretation", category="weekend"))
+    return fig
 
 
-def analyse_weekend_duree() -> None:
+def analyse_weekend_volume() -> None:
     """
-    📊 ANALYSE 2: Durée des recettes (Weekday vs Weekend)
+    📊 ANALYSE 1: Volume de recettes (Weekday vs Weekend)
 
-    Insight: Durée quasi identique entre semaine et week-end (42.5 vs 42.4 min).
-    Pas d'effet week-end observable sur la durée.
+    Insight: Publication massives en semaine (+51% vs weekend).
+    Lundi = jour le plus actif (+45%), Samedi le moins actif (-49%).
     """
+    # Figure et statistiques en cache (voir utils.figure_cache)
+    fig = cached_figure("weekend_volume", get_recipes_version(), build_volume_figure)
+    figure_data = figure_stats(fig)
+    weekday_rpd = figure_data["weekday_rpd"]
+    weekend_rpd = figure_data["weekend_rpd"]
+    diff_pct = figure_data["diff_pct"]
+    max_day = figure_data["max_day"]
+
+    # 📊 MÉTRIQUES BANNIÈRE
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Semaine (moy/jour)", f"{weekday_rpd:,.0f}")
+    with col2:
+        st.metric("Week-end (moy/jour)", f"{weekend_rpd:,.0f}")
+    with col3:
+        st.metric(
+            t("difference"),
+            f"+{diff_pct:.1f}%",
+            delta=t("weekday_gt_weekend", category="weekend"),
+        )
+    with col4:
+        st.metric(f"Jour max: {max_day['jour']}", f"{max_day['n_recipes']:,}")
+
+    st.plotly_chart(fig, use_container_width=True)
+
+    # 📝 INTERPRÉTATION
+    st.info(t("volume_interpretation", category="weekend"))
+
+
+def build_duration_figure() -> go.Figure:
+    """Calcule les durées semaine / week-end et construit leur figure (1×2)."""
     df = load_recipes_clean()
 
     # Ajout colonne week_period
@@ -310,25 +348,13 @@ def analyse_weekend_duree() -> None:
         (pl.col("q75") - pl.col("q25")).alias("IQR")
     )
 
-    # 📊 MÉTRIQUES BANNIÈRE
+    # Statistiques de la bannière
     wd_row = minutes_by_period.filter(pl.col("week_period") == "Weekday").row(
         0, named=True
     )
     we_row = minutes_by_period.filter(pl.col("week_period") == "Weekend").row(
         0, named=True
     )
-    diff_abs = we_row["mean_minutes"] - wd_row["mean_minutes"]
-    diff_pct = (diff_abs / wd_row["mean_minutes"]) * 100
-
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        st.metric(t("weekday_average"), f"{wd_row['mean_minutes']:.1f} min")
-    with col2:
-        st.metric(t("weekend_average"), f"{we_row['mean_minutes']:.1f} min")
-    with col3:
-        st.metric(t("difference"), f"{diff_abs:+.1f} min", delta=f"{diff_pct:+.2f}%")
-    with col4:
-        st.metric("IQR Semaine", f"{wd_row['IQR']:.0f} min")
 
     # 🎨 VISUALISATION (2 panels)
     fig = make_subplots(
@@ -446,19 +472,47 @@ def analyse_weekend_duree() -> None:
     chart_theme.apply_subplot_theme(fig, num_rows=1, num_cols=2)
     fig.update_layout(height=500)
 
-    st.plotly_chart(fig, use_container_width=True)
+    # Statistiques affichées par la page (voir figure_stats)
+    fig.update_layout(meta=dict(weekday=wd_row, weekend=we_row))
 
-    # 📝 INTERPRÉTATION
-    st.info(t("duration_interpretation", category="weekend"))
+    return fig
 
 
-def analyse_weekend_complexite() -> None:
+def analyse_weekend_duree() -> None:
     """
-    📊 ANALYSE 3: Complexité (Weekday vs Weekend)
+    📊 ANALYSE 2: Durée des recettes (Weekday vs Weekend)
 
-    Insight: Complexité quasi identique entre semaine et week-end.
-    Scores, nombre d'étapes et d'ingrédients constants.
+    Insight: Durée quasi identique entre semaine et week-end (42.5 vs 42.4 min).
+    Pas d'effet week-end observable sur la durée.
     """
+    # Figure et statistiques en cache (voir utils.figure_cache)
+    fig = cached_figure(
+        "weekend_duration", get_recipes_version(), build_duration_figure
+    )
+    figure_data = figure_stats(fig)
+    wd_row, we_row = figure_data["weekday"], figure_data["weekend"]
+    diff_abs = we_row["mean_minutes"] - wd_row["mean_minutes"]
+    diff_pct = (diff_abs / wd_row["mean_minutes"]) * 100
+
+    # 📊 MÉTRIQUES BANNIÈRE
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric(t("weekday_average"), f"{wd_row['mean_minutes']:.1f} min")
+    with col2:
+        st.metric(t("weekend_average"), f"{we_row['mean_minutes']:.1f} min")
+    with col3:
+        st.metric(t("difference"), f"{diff_abs:+.1f} min", delta=f"{diff_pct:+.2f}%")
+    with col4:
+        st.metric("IQR Semaine", f"{wd_row['IQR']:.0f} min")
+
+    st.plotly_chart(fig, use_container_width=True)
+
+    # 📝 INTERPRÉTATION
+    st.info(t("duration_interpretation", category="weekend"))
+
+
+def build_complexity_figure() -> go.Figure:
+    """Calcule la complexité semaine / week-end et construit sa figure (1×3)."""
     df = load_recipes_clean()
 
     # Ajout colonne week_period
@@ -506,7 +560,7 @@ def analyse_weekend_complexite() -> None:
         .drop("order")
     )
 
-    # 📊 MÉTRIQUES BANNIÈRE
+    # Statistiques de la bannière
     wd_row = complexity_by_period.filter(pl.col("week_period") == "Weekday").row(
         0, named=True
     )
@@ -514,26 +568,6 @@ def analyse_weekend_complexite() -> None:
         0, named=True
     )
 
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric(
-            t("complexity_weekday", category="weekend"),
-            f"{wd_row['mean_complexity']:.2f}",
-            delta=f"{wd_row['mean_steps']:.1f} steps",
-        )
-    with col2:
-        st.metric(
-            t("complexity_weekend", category="weekend"),
-            f"{we_row['mean_complexity']:.2f}",
-            delta=f"{we_row['mean_steps']:.1f} steps",
-        )
-    with col3:
-        diff_pct = (
-            (we_row["mean_complexity"] - wd_row["mean_complexity"])
-            / wd_row["mean_complexity"]
-        ) * 100
-        st.metric(t("difference"), f"{diff_pct:+.2f}%")
-
     # 🎨 VISUALISATION (3 panels)
     fig = make_subplots(
         rows=1,
@@ -655,19 +689,55 @@ def analyse_weekend_complexite() -> None:
     chart_theme.apply_subplot_theme(fig, num_rows=1, num_cols=3)
     fig.update_layout(height=500)
 
-    st.plotly_chart(fig, use_container_width=True)
+    # Statistiques affichées par la page (voir figure_stats)
+    fig.update_layout(meta=dict(weekday=wd_row, weekend=we_row))
 
-    # 📝 INTERPRÉTATION
-    st.info(t("complexity_interpretation", category="weekend"))
+    return fig
 
 
-def analyse_weekend_nutrition() -> None:
+def analyse_weekend_complexite() -> None:
     """
-    📊 ANALYSE 4: Nutrition (Weekday vs Weekend)
+    📊 ANALYSE 3: Complexité (Weekday vs Weekend)
 
-    Insight: Profils nutritionnels globalement similaires.
-    Une seule différence significative: protéines (-3% le week-end).
+    Insight: Complexité quasi identique entre semaine et week-end.
+    Scores, nombre d'étapes et d'ingrédients constants.
     """
+    # Figure et statistiques en cache (voir utils.figure_cache)
+    fig = cached_figure(
+        "weekend_complexity", get_recipes_version(), build_complexity_figure
+    )
+    figure_data = figure_stats(fig)
+    wd_row, we_row = figure_data["weekday"], figure_data["weekend"]
+
+    # 📊 MÉTRIQUES BANNIÈRE
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric(
+            t("complexity_weekday", category="weekend"),
+            f"{wd_row['mean_complexity']:.2f}",
+            delta=f"{wd_row['mean_steps']:.1f} steps",
+        )
+    with col2:
+        st.metric(
+            t("complexity_weekend", category="weekend"),
+            f"{we_row['mean_complexity']:.2f}",
+            delta=f"{we_row['mean_steps']:.1f} steps",
+        )
+    with col3:
+        diff_pct = (
+            (we_row["mean_complexity"] - wd_row["mean_complexity"])
+            / wd_row["mean_complexity"]
+        ) * 100
+        st.metric(t("difference"), f"{diff_pct:+.2f}%")
+
+    st.plotly_chart(fig, use_container_width=True)
+
+    # 📝 INTERPRÉTATION
+    st.info(t("complexity_interpretation", category="weekend"))
+
+
+def build_nutrition_figure() -> go.Figure:
+    """Teste les écarts nutritionnels semaine / week-end et construit leur figure."""
     df = load_recipes_clean()
 
     # Ajout colonne week_period
@@ -717,17 +787,19 @@ def analyse_weekend_nutrition() -> None:
         ("Sodium (%)", "sodium_pct", "mean_sodium", 1),
     ]
 
-    results = []
+    # Tests t de Student à partir des effectifs, moyennes et variances par période
+    nutrient_cols = [col_polars for _, col_polars, _, _ in nutrients_list]
+    n, means, variances = group_moments(
+        df, "week_period", nutrient_cols, week_period_order
+    )
+    _, p_student = ttest_from_moments(
+        n[0], means[0], variances[0], n[1], means[1], variances[1]
+    )
 
-    for nutrient_name, col_polars, col_agg, decimals in nutrients_list:
-        weekday_vals = df.filter(pl.col("week_period") == "Weekday")[
-            col_polars
-        ].to_numpy()
-        weekend_vals = df.filter(pl.col("week_period") == "Weekend")[
-            col_polars
-        ].to_numpy()
+    results = []
 
-        t_stat, p_value = stats.ttest_ind(weekday_vals, weekend_vals, equal_var=True)
+    for i, (nutrient_name, col_polars, col_agg, decimals) in enumerate(nutrients_list):
+        p_value = float(p_student[i])
 
         wd_val = nutrition_by_period.filter(pl.col("week_period") == "Weekday")[
             col_agg
@@ -744,30 +816,30 @@ def analyse_weekend_nutrition() -> None:
                 "weekend": we_val,
                 "diff_pct": diff_pct,
                 "p_value": p_value,
-                "significant": bool(p_value < 0.05),
                 "decimals": decimals,
             }
         )
 
-    results_df = pl.DataFrame(results)
-
-    # 📊 MÉTRIQUES BANNIÈRE
-    signif_count = results_df.filter(pl.col("significant"))["nutrient"].len()
-    max_diff = results_df.sort(pl.col("diff_pct").abs(), descending=True).row(
-        0, named=True
+    # Tests par permutation et IC bootstrap (sans hypothèse de normalité), en cache
+    tested = df.select(["is_weekend", *nutrient_cols]).drop_nulls()
+    values = tested.select(nutrient_cols).to_numpy()
+    labels = tested["is_weekend"].cast(pl.Int8).to_numpy()
+    version = series_version(values, labels)
+    permutation = get_permutation_tests(
+        "weekend_nutrition", version, values, labels, (0, 1), tuple(nutrient_cols)
+    )
+    bootstrap = get_bootstrap_mean_diff(
+        "weekend_nutrition", version, values, labels, (0, 1), tuple(nutrient_cols)
     )
 
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric(t("nutrients_analyzed", category="common"), "6")
-    with col2:
-        st.metric(t("significant_differences", category="common"), f"{signif_count}")
-    with col3:
-        st.metric(
-            t("max_gap", category="weekend").format(nutrient=max_diff["nutrient"]),
-            f"{max_diff['diff_pct']:+.1f}%",
-            delta="p<0.05" if max_diff["significant"] else "NS",
-        )
+    # Significativité selon le test par permutation (distributions asymétriques)
+    results_df = pl.DataFrame(results).with_columns(
+        permutation["p_value"].alias("p_perm"),
+        (permutation["p_value"] < 0.05).alias("significant"),
+        bootstrap["diff"].alias("diff_abs"),
+        bootstrap["ci_low"],
+        bootstrap["ci_high"],
+    )
 
     # 🎨 VISUALISATION: Bar chart horizontal
     fig = go.Figure()
@@ -824,7 +896,7 @@ def analyse_weekend_nutrition() -> None:
     chart_theme.apply_chart_theme(fig)
     fig.update_layout(
         title={
-            "text": "Profil nutritionnel: Écarts Weekend vs Weekday<br><sub>(* = effet significatif, p < 0.05)</sub>",
+            "text": "Profil nutritionnel: Écarts Weekend vs Weekday<br><sub>(* = effet significatif, test par permutation p < 0.05)</sub>",
             "x": 0.5,
             "xanchor": "center",
             "font": {"size": 16, "color": ColorTheme.TEXT_PRIMARY},
@@ -832,19 +904,100 @@ def analyse_weekend_nutrition() -> None:
         height=500,
     )
 
+    # Statistiques affichées par la page (voir figure_stats)
+    fig.update_layout(meta=dict(results=results_df.to_dicts()))
+
+    return fig
+
+
+def analyse_weekend_nutrition() -> None:
+    """
+    📊 ANALYSE 4: Nutrition (Weekday vs Weekend)
+
+    Insight: Profils nutritionnels globalement similaires.
+    Une seule différence significative: protéines (-3% le week-end).
+    """
+    # Figure et statistiques en cache (voir utils.figure_cache)
+    fig = cached_figure(
+        "weekend_nutrition", get_recipes_version(), build_nutrition_figure
+    )
+    figure_data = figure_stats(fig)
+    results_df = pl.DataFrame(figure_data["results"])
+    signif_count = results_df.filter(pl.col("significant"))["nutrient"].len()
+    max_diff = results_df.sort(pl.col("diff_pct").abs(), descending=True).row(
+        0, named=True
+    )
+
+    # 📊 MÉTRIQUES BANNIÈRE
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric(t("nutrients_analyzed", category="common"), "6")
+    with col2:
+        st.metric(t("significant_differences", category="common"), f"{signif_count}")
+    with col3:
+        st.metric(
+            t("max_gap", category="weekend").format(nutrient=max_diff["nutrient"]),
+            f"{max_diff['diff_pct']:+.1f}%",
+            delta="p<0.05" if max_diff["significant"] else "NS",
+        )
+
     st.plotly_chart(fig, use_container_width=True)
 
+    with st.expander(t("permutation_expander", category="weekend")):
+        st.dataframe(
+            results_df.select(
+                pl.col("nutrient").alias(t("col_nutrient", category="weekend")),
+                pl.col("diff_abs").round(2).alias(t("col_diff", category="weekend")),
+                pl.col("ci_low").round(2).alias(t("col_ci_low", category="weekend")),
+                pl.col("ci_high").round(2).alias(t("col_ci_high", category="weekend")),
+                pl.col("p_value").round(4).alias(t("col_p_ttest", category="weekend")),
+                pl.col("p_perm").round(4).alias(t("col_p_perm", category="weekend")),
+            ),
+            use_container_width=True,
+            hide_index=True,
+        )
+        st.caption(t("permutation_caption", category="weekend"))
+
     # 📝 INTERPRÉTATION
     st.info(t("nutrition_interpretation", category="weekend"))
 
 
-def analyse_weekend_ingredients() -> None:
+def interpretation_terms(
+    filtered: pl.DataFrame, term_col: str, vocabulary: str, n: int = 5
+) -> dict[str, Any]:
     """
-    📊 ANALYSE 5: Ingrédients les plus variables (Weekday vs Weekend)
+    Termes cités dans l'interprétation, tirés du tableau filtré (q < FDR_ALPHA).
+
+    Args:
+        filtered: Termes retenus (colonne term_col et diff_abs en pp)
+        term_col: Colonne des termes (ids ou chaînes)
+        vocabulary: Vocabulaire de décodage ('ingredients' ou 'tags')
+        n: Nombre de termes cités de chaque côté
 
-    Insight: Écarts faibles (<0.4pp) sur ingrédients.
-    Week-end: +cinnamon, +canola oil. Semaine: +mozzarella, +chicken breasts.
+    Returns:
+        weekend, weekday (termes les plus en hausse de chaque côté) et
+        max_gap (plus grand écart absolu, en pp)
     """
+    decoded = decode_terms(filtered, term_col, vocabulary)
+
+    def listed(part: pl.DataFrame) -> str:
+        return ", ".join(f"`{term}`" for term in part[term_col]) or "—"
+
+    return {
+        "weekend": listed(
+            decoded.filter(pl.col("diff_abs") > 0)
+            .sort("diff_abs", descending=True)
+            .head(n)
+        ),
+        "weekday": listed(
+            decoded.filter(pl.col("diff_abs") < 0).sort("diff_abs").head(n)
+        ),
+        "max_gap": decoded["diff_abs"].abs().max(),
+    }
+
+
+def build_ingredients_figure() -> go.Figure:
+    """Teste les ingrédients semaine / week-end et construit la figure du top 20."""
     df = load_recipes_clean()
 
     # Ajout colonne week_period
@@ -857,61 +1010,25 @@ def analyse_weekend_ingredients() -> None:
 
     week_period_order = ["Weekday", "Weekend"]
 
-    # Extraction des ingrédients par période
-    ingredients_by_period = {}
-    n_recipes_by_period = {}
-
-    for period in week_period_order:
-        period_df = df.filter(pl.col("week_period") == period)
-        n_recipes_by_period[period] = period_df.height
-        ingredient_counts = (
-            period_df.select(pl.col("ingredients").explode())
-            .group_by("ingredients")
-            .agg(pl.count().alias("count"))
-        )
-        ingredients_by_period[period] = dict(
-            zip(
-                ingredient_counts["ingredients"].to_list(),
-                ingredient_counts["count"].to_list(),
-            )
-        )
-
-    all_ingredients = set().union(
-        *[set(ing.keys()) for ing in ingredients_by_period.values()]
+    # Fréquences (%) et effectifs ingrédient × période, en une passe
+    ingredients_freq = term_group_frequencies(
+        df, "ingredients", "week_period", week_period_order, term_alias="ingredient"
+    )
+    n_recipes_by_period = group_sizes(df, "week_period", week_period_order)
+    all_ingredients = ingredients_freq["ingredient"]
+
+    # Tests Chi-2 de tous les ingrédients en lot, q-values Benjamini-Hochberg
+    ingredients_freq = presence_tests(ingredients_freq, n_recipes_by_period)
+
+    ingredients_df = ingredients_freq.select(
+        "ingredient",
+        pl.col("Weekday").alias("weekday_freq"),
+        pl.col("Weekend").alias("weekend_freq"),
+        "mean_freq",
+        (pl.col("Weekend") - pl.col("Weekday")).alias("diff_abs"),
+        "p_value",
+        "q_value",
     )
-
-    # Tests statistiques Chi-2
-    ingredients_results = []
-    for ing in all_ingredients:
-        weekday_count = ingredients_by_period["Weekday"].get(ing, 0)
-        weekend_count = ingredients_by_period["Weekend"].get(ing, 0)
-        weekday_freq = (weekday_count / n_recipes_by_period["Weekday"]) * 100
-        weekend_freq = (weekend_count / n_recipes_by_period["Weekend"]) * 100
-
-        contingency = np.array(
-            [
-                [weekday_count, n_recipes_by_period["Weekday"] - weekday_count],
-                [weekend_count, n_recipes_by_period["Weekend"] - weekend_count],
-            ]
-        )
-
-        try:
-            chi2_stat, p_val, _, _ = chi2_contingency(contingency)
-        except Exception:
-            chi2_stat, p_val = 0, 1.0  # noqa: F841
-
-        ingredients_results.append(
-            {
-                "ingredient": ing,
-                "weekday_freq": weekday_freq,
-                "weekend_freq": weekend_freq,
-                "mean_freq": (weekday_freq + weekend_freq) / 2,
-                "diff_abs": weekend_freq - weekday_freq,
-                "p_value": p_val,
-            }
-        )
-
-    ingredients_df = pl.DataFrame(ingredients_results)
 
     # Filtrage strict
     FREQ_THRESHOLD = 1
@@ -920,29 +1037,16 @@ def analyse_weekend_ingredients() -> None:
     ingredients_filtered = ingredients_df.filter(
         (pl.col("mean_freq") >= FREQ_THRESHOLD)
         & (pl.col("diff_abs").abs() >= ABS_DIFF_THRESHOLD)
-        & (pl.col("p_value") < 0.05)
+        & (pl.col("q_value") < FDR_ALPHA)
     )
 
-    # 📊 MÉTRIQUES BANNIÈRE
-    total_ingredients = len(all_ingredients)
-    filtered_ingredients = len(ingredients_filtered)
-
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric(t("total_ingredients", category="common"), f"{total_ingredients:,}")
-    with col2:
-        st.metric(
-            t("variable_ingredients", category="common"), f"{filtered_ingredients}"
-        )
-    with col3:
-        pct_filtered = (filtered_ingredients / total_ingredients) * 100
-        st.metric("% variables", f"{pct_filtered:.1f}%")
-
-    # 🎨 VISUALISATION (Top 20)
+    # 🎨 VISUALISATION (Top 20, figure vide si aucun terme retenu)
+    fig = go.Figure()
     if len(ingredients_filtered) > 0:
         top_ingredients = ingredients_filtered.sort("diff_abs", descending=False).tail(
             20
         )
+        top_ingredients = decode_terms(top_ingredients, "ingredient", "ingredients")
 
         # Couleurs
         colors = [
@@ -950,8 +1054,6 @@ def analyse_weekend_ingredients() -> None:
             for x in top_ingredients["diff_abs"]
         ]
 
-        fig = go.Figure()
-
         fig.add_trace(
             go.Bar(
                 y=top_ingredients["ingredient"],
@@ -992,23 +1094,70 @@ def analyse_weekend_ingredients() -> None:
             height=max(500, len(top_ingredients) * 25),
         )
 
+    # Statistiques affichées par la page (voir figure_stats)
+    fig.update_layout(
+        meta=dict(
+            n_total=len(all_ingredients),
+            n_filtered=len(ingredients_filtered),
+            terms=(
+                interpretation_terms(ingredients_filtered, "ingredient", "ingredients")
+                if len(ingredients_filtered) > 0
+                else None
+            ),
+        )
+    )
+
+    return fig
+
+
+def analyse_weekend_ingredients() -> None:
+    """
+    📊 ANALYSE 5: Ingrédients les plus variables (Weekday vs Weekend)
+
+    Insight: Écarts faibles sur les ingrédients ; les ingrédients cités dans
+    l'interprétation sont ceux du tableau filtré (q < 0.05 BH).
+    """
+    # Figure et statistiques en cache (voir utils.figure_cache)
+    fig = cached_figure(
+        "weekend_ingredients", get_recipes_version(), build_ingredients_figure
+    )
+    figure_data = figure_stats(fig)
+
+    # 📊 MÉTRIQUES BANNIÈRE
+    total_ingredients = figure_data["n_total"]
+    filtered_ingredients = figure_data["n_filtered"]
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric(t("total_ingredients", category="common"), f"{total_ingredients:,}")
+    with col2:
+        st.metric(
+            t("variable_ingredients", category="common"), f"{filtered_ingredients}"
+        )
+    with col3:
+        pct_filtered = (filtered_ingredients / total_ingredients) * 100
+        st.metric("% variables", f"{pct_filtered:.1f}%")
+
+    # 🎨 VISUALISATION (Top 20)
+    if filtered_ingredients > 0:
         st.plotly_chart(fig, use_container_width=True)
 
         # 📝 INTERPRÉTATION
-        st.info(t("ingredients_interpretation", category="weekend"))
+        st.info(
+            t(
+                "ingredients_interpretation",
+                category="weekend",
+                **figure_data["terms"],
+            )
+        )
     else:
         st.warning(
-            "⚠️ Aucun ingrédient ne satisfait les critères de filtrage (freq ≥1%, |diff| ≥0.2pp, p<0.05)"
+            "⚠️ Aucun ingrédient ne satisfait les critères de filtrage (freq ≥1%, |diff| ≥0.2pp, q<0.05 BH)"
         )
 
 
-def analyse_weekend_tags() -> None:
-    """
-    📊 ANALYSE 6: Tags les plus variables (Weekday vs Weekend)
-
-    Insight: Écarts faibles (<0.5pp) sur tags.
-    Week-end: +vegetarian, +christmas, +breakfast. Semaine: +one-dish-meal, +beginner-cook.
-    """
+def build_tags_figure() -> go.Figure:
+    """Teste les tags semaine / week-end et construit la figure du top 20."""
     df = load_recipes_clean()
 
     # Ajout colonne week_period
@@ -1021,53 +1170,25 @@ def analyse_weekend_tags() -> None:
 
     week_period_order = ["Weekday", "Weekend"]
 
-    # Extraction des tags par période
-    tags_by_period = {}
-    n_recipes_by_period_tags = {}
-
-    for period in week_period_order:
-        period_df = df.filter(pl.col("week_period") == period)
-        n_recipes_by_period_tags[period] = period_df.height
-        tag_counts = (
-            period_df.select(pl.col("tags").explode())
-            .group_by("tags")
-            .agg(pl.count().alias("count"))
-        )
-        tags_by_period[period] = dict(
-            zip(tag_counts["tags"].to_list(), tag_counts["count"].to_list())
-        )
-
-    all_tags = set().union(*[set(tag.keys()) for tag in tags_by_period.values()])
-
-    # Tests statistiques Chi-2
-    tags_results = []
-    for tag in all_tags:
-        weekday_count = tags_by_period["Weekday"].get(tag, 0)
-        weekend_count = tags_by_period["Weekend"].get(tag, 0)
-        weekday_freq = (weekday_count / n_recipes_by_period_tags["Weekday"]) * 100
-        weekend_freq = (weekend_count / n_recipes_by_period_tags["Weekend"]) * 100
-
-        observed = [
-            [weekday_count, n_recipes_by_period_tags["Weekday"] - weekday_count],
-            [weekend_count, n_recipes_by_period_tags["Weekend"] - weekend_count],
-        ]
-        try:
-            chi2, p_value, _, _ = chi2_contingency(observed)
-        except Exception:
-            chi2, p_value = np.nan, np.nan  # noqa: F841
-
-        tags_results.append(
-            {
-                "tag": tag,
-                "weekday_freq": weekday_freq,
-                "weekend_freq": weekend_freq,
-                "mean_freq": (weekday_freq + weekend_freq) / 2,
-                "diff_abs": weekend_freq - weekday_freq,
-                "p_value": p_value,
-            }
-        )
-
-    tags_df = pl.DataFrame(tags_results)
+    # Fréquences (%) et effectifs tag × période, en une passe
+    tags_freq = term_group_frequencies(
+        df, "tags", "week_period", week_period_order, term_alias="tag"
+    )
+    n_recipes_by_period_tags = group_sizes(df, "week_period", week_period_order)
+    all_tags = tags_freq["tag"]
+
+    # Tests Chi-2 de tous les tags en lot, q-values Benjamini-Hochberg
+    tags_freq = presence_tests(tags_freq, n_recipes_by_period_tags)
+
+    tags_df = tags_freq.select(
+        "tag",
+        pl.col("Weekday").alias("weekday_freq"),
+        pl.col("Weekend").alias("weekend_freq"),
+        "mean_freq",
+        (pl.col("Weekend") - pl.col("Weekday")).alias("diff_abs"),
+        "p_value",
+        "q_value",
+    )
 
     # Filtrage strict
     FREQ_THRESHOLD = 1
@@ -1076,25 +1197,14 @@ def analyse_weekend_tags() -> None:
     tags_filtered = tags_df.filter(
         (pl.col("mean_freq") >= FREQ_THRESHOLD)
         & (pl.col("diff_abs").abs() >= ABS_DIFF_THRESHOLD)
-        & (pl.col("p_value") < 0.05)
+        & (pl.col("q_value") < FDR_ALPHA)
     )
 
-    # 📊 MÉTRIQUES BANNIÈRE
-    total_tags = len(all_tags)
-    filtered_tags = len(tags_filtered)
-
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("Tags totaux", f"{total_tags:,}")
-    with col2:
-        st.metric("Tags variables", f"{filtered_tags}")
-    with col3:
-        pct_filtered = (filtered_tags / total_tags) * 100
-        st.metric("% variables", f"{pct_filtered:.1f}%")
-
-    # 🎨 VISUALISATION (Top 20)
+    # 🎨 VISUALISATION (Top 20, figure vide si aucun terme retenu)
+    fig = go.Figure()
     if len(tags_filtered) > 0:
         top_tags = tags_filtered.sort("diff_abs", descending=False).tail(20)
+        top_tags = decode_terms(top_tags, "tag", "tags")
 
         # Couleurs
         colors = [
@@ -1102,8 +1212,6 @@ def analyse_weekend_tags() -> None:
             for x in top_tags["diff_abs"]
         ]
 
-        fig = go.Figure()
-
         fig.add_trace(
             go.Bar(
                 y=top_tags["tag"],
@@ -1144,50 +1252,306 @@ def analyse_weekend_tags() -> None:
             height=max(500, len(top_tags) * 25),
         )
 
+    # Statistiques affichées par la page (voir figure_stats)
+    fig.update_layout(
+        meta=dict(
+            n_total=len(all_tags),
+            n_filtered=len(tags_filtered),
+            terms=(
+                interpretation_terms(tags_filtered, "tag", "tags")
+                if len(tags_filtered) > 0
+                else None
+            ),
+        )
+    )
+
+    return fig
+
+
+def analyse_weekend_tags() -> None:
+    """
+    📊 ANALYSE 6: Tags les plus variables (Weekday vs Weekend)
+
+    Insight: Écarts faibles sur les tags ; les tags cités dans l'interprétation
+    sont ceux du tableau filtré (q < 0.05 BH).
+    """
+    # Figure et statistiques en cache (voir utils.figure_cache)
+    fig = cached_figure("weekend_tags", get_recipes_version(), build_tags_figure)
+    figure_data = figure_stats(fig)
+
+    # 📊 MÉTRIQUES BANNIÈRE
+    total_tags = figure_data["n_total"]
+    filtered_tags = figure_data["n_filtered"]
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Tags totaux", f"{total_tags:,}")
+    with col2:
+        st.metric("Tags variables", f"{filtered_tags}")
+    with col3:
+        pct_filtered = (filtered_tags / total_tags) * 100
+        st.metric("% variables", f"{pct_filtered:.1f}%")
+
+    # 🎨 VISUALISATION (Top 20)
+    if filtered_tags > 0:
         st.plotly_chart(fig, use_container_width=True)
 
         # 📝 INTERPRÉTATION
-        st.info(t("tags_interpretation", category="weekend"))
+        st.info(
+            t(
+                "tags_interpretation",
+                category="weekend",
+                **figure_data["terms"],
+            )
+        )
     else:
         st.warning(
-            "⚠️ Aucun tag ne satisfait les critères de filtrage (freq ≥1%, |diff| ≥0.2pp, p<0.05)"
+            "⚠️ Aucun tag ne satisfait les critères de filtrage (freq ≥1%, |diff| ≥0.2pp, q<0.05 BH)"
         )
 
 
-def render_weekend_analysis() -> None:
+# Métriques de la table quotidienne affichables dans le calendrier
+CALENDAR_METRICS = ["n_recipes", "n_interactions", "mean_rating"]
+
+DAY_SHORT_KEYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+MONTH_SHORT_KEYS = [
+    "jan",
+    "feb",
+    "mar",
+    "apr",
+    "may_short",
+    "jun",
+    "jul",
+    "aug",
+    "sep",
+    "oct",
+    "nov",
+    "dec",
+]
+
+
+def calendar_grid(daily: pl.DataFrame, value_col: str, year: int) -> tuple:
     """
-    Point d'entrée principal pour les analyses d'effet week-end.
+    Dispose une année de valeurs quotidiennes en grille jour × semaine.
+
+    Args:
+        daily: Table quotidienne (colonnes date et value_col)
+        value_col: Colonne à afficher
+        year: Année à disposer
 
-    Format: Page continue affichant toutes les analyses d'un coup (comme Tendances).
+    Returns:
+        (z, dates, month_weeks) : matrice 7 × n_semaines (NaN hors de
+        l'année ou sans valeur), dates correspondantes (None hors année) et
+        indice de semaine du 1er de chaque mois
     """
-    st.markdown(
-        f'<h1 style="margin-top: 0; padding-top: 0;">📆 {t("main_title", category="weekend")}</h1>',
-        unsafe_allow_html=True,
+    first = date(year, 1, 1)
+    offset = first.weekday()  # colonne 0 commence le lundi précédant le 1er janvier
+    n_days = (date(year, 12, 31) - first).days + 1
+    n_weeks = (offset + n_days + 6) // 7
+
+    z = np.full((7, n_weeks), np.nan)
+    dates = np.full((7, n_weeks), None, dtype=object)
+    year_days = daily.filter(pl.col("date").dt.year() == year)
+    cells = np.array(
+        [(d - first).days + offset for d in year_days["date"].to_list()], dtype=int
     )
+    values = year_days[value_col].cast(pl.Float64).fill_null(np.nan).to_numpy()
+    z[cells % 7, cells // 7] = values
 
-    st.markdown(t("main_description", category="weekend"))
+    for i in range(n_days):
+        cell = i + offset
+        dates[cell % 7, cell // 7] = (first + timedelta(days=i)).isoformat()
 
-    # Affichage de toutes les analyses en continu (comme page Tendances)
+    month_weeks = [
+        ((date(year, m, 1) - first).days + offset) // 7 for m in range(1, 13)
+    ]
+    return z, dates, month_weeks
 
-    st.subheader(f"📊 {t('volume_title', category='weekend')}")
-    analyse_weekend_volume()
-    st.markdown("---")
 
-    st.subheader(f"⏱️ {t('duration_title', category='weekend')}")
-    analyse_weekend_duree()
-    st.markdown("---")
+def create_calendar_heatmap(
+    daily: pl.DataFrame, value_col: str, year: int
+) -> go.Figure:
+    """
+    Crée une heatmap calendrier (une case par jour, style contributions GitHub).
 
-    st.subheader(f"🔧 {t('complexity_title', category='weekend')}")
-    analyse_weekend_complexite()
-    st.markdown("---")
+    Args:
+        daily: Table quotidienne précalculée (voir get_daily_counts)
+        value_col: Métrique affichée (n_recipes, n_interactions, mean_rating)
+        year: Année à visualiser
 
-    st.subheader(f"🥗 {t('nutrition_title', category='weekend')}")
-    analyse_weekend_nutrition()
-    st.markdown("---")
+    Returns:
+        Figure Plotly heatmap calendrier
+    """
+    z, dates, month_weeks = calendar_grid(daily, value_col, year)
+    label = t(f"calendar_metric_{value_col}", category="weekend")
+
+    fig = go.Figure(
+        go.Heatmap(
+            z=z,
+            customdata=dates,
+            x=list(range(z.shape[1])),
+            y=translate_list(DAY_SHORT_KEYS, "days"),
+            colorscale=[
+                [0, ColorTheme.SECONDARY_BACKGROUND],
+                [0.5, ColorTheme.ORANGE_LIGHT],
+                [1, ColorTheme.ORANGE_SECONDARY],
+            ],
+            xgap=2,
+            ygap=2,
+            hovertemplate=f"%{{customdata}}<br>{label}: %{{z}}<extra></extra>",
+            colorbar=dict(
+                title=dict(
+                    text=label,
+                    side="right",
+                    font=dict(color=ColorTheme.TEXT_PRIMARY),
+                ),
+                tickfont=dict(color=ColorTheme.TEXT_PRIMARY),
+            ),
+        )
+    )
 
-    st.subheader(f"🥘 {t('ingredients_title', category='weekend')}")
-    analyse_weekend_ingredients()
-    st.markdown("---")
+    chart_theme.apply_chart_theme(
+        fig, title=t("calendar_chart_title", category="weekend", year=year)
+    )
+    fig.update_xaxes(
+        tickmode="array",
+        tickvals=month_weeks,
+        ticktext=translate_list(MONTH_SHORT_KEYS, "months"),
+        showgrid=False,
+    )
+    fig.update_yaxes(autorange="reversed", showgrid=False)
+    fig.update_layout(height=300)
+    return fig
+
+
+def build_calendar_figure(year: int, value_col: str) -> go.Figure:
+    """Lit la table quotidienne de l'année et construit son calendrier."""
+    return create_calendar_heatmap(get_daily_counts(year), value_col, year)
+
+
+def analyse_weekend_calendrier() -> None:
+    """
+    📅 ANALYSE 7: Calendrier quotidien
+
+    Lit la table des comptages quotidiens précalculée dans l'ETL : afficher
+    une année ne charge que ses ~365 lignes, sans parcourir les données brutes.
+    Les années proposées viennent du manifeste des recettes (quelques Ko).
+    """
+    headline = recipes_headline()
+    years = list(range(headline.last_year, headline.first_year - 1, -1))
+
+    col_year, col_metric = st.columns([1, 3])
+    with col_year:
+        year = st.selectbox(
+            t("calendar_year", category="weekend"), years, key="weekend_calendar_year"
+        )
+    with col_metric:
+        value_col = st.radio(
+            t("calendar_metric", category="weekend"),
+            CALENDAR_METRICS,
+            format_func=lambda c: t(f"calendar_metric_{c}", category="weekend"),
+            horizontal=True,
+            key="weekend_calendar_metric",
+        )
+
+    daily = get_daily_counts(year)
+    values = daily[value_col].drop_nulls()
+
+    # 📊 MÉTRIQUES BANNIÈRE
+    fmt = "{:.2f}" if value_col == "mean_rating" else "{:,.0f}"
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric(
+            t("calendar_active_days", category="weekend"),
+            f"{(values > 0).sum():,}",
+        )
+    with col2:
+        st.metric(
+            t("calendar_daily_mean", category="weekend"),
+            fmt.format(values.mean()) if values.len() else "-",
+        )
+    with col3:
+        if values.len():
+            top = daily.sort(value_col, descending=True, nulls_last=True).row(
+                0, named=True
+            )
+            st.metric(
+                t(
+                    "calendar_peak_day",
+                    category="weekend",
+                    day=top["date"].strftime("%d/%m/%Y"),
+                ),
+                fmt.format(top[value_col]),
+            )
 
-    st.subheader(f"🏷️ {t('tags_title', category='weekend')}")
-    analyse_weekend_tags()
+    # Figure en cache, versionnée par le contenu de la table de l'année
+    fig = cached_figure(
+        "weekend_calendar",
+        series_version(
+            daily["date"].to_physical().to_numpy(),
+            daily[value_col].cast(pl.Float64).to_numpy(),
+        ),
+        build_calendar_figure,
+        year=year,
+        value_col=value_col,
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.info(t("calendar_interpretation", category="weekend"))
+
+
+def render_weekend_analysis() -> None:
+    """
+    Point d'entrée principal pour les analyses d'effet week-end.
+
+    Format: Page continue, une section par analyse ; seule la première est
+    calculée d'office, les autres à l'ouverture (voir utils.sections).
+    """
+    st.markdown(
+        f'<h1 style="margin-top: 0; padding-top: 0;">📆 {t("main_title", category="weekend")}</h1>',
+        unsafe_allow_html=True,
+    )
+
+    st.markdown(t("main_description", category="weekend"))
+
+    # Sections isolées (fragments), calculées à l'ouverture au-delà de la première
+    render_sections(
+        "weekend",
+        [
+            Section(
+                "volume",
+                f"📊 {t('volume_title', category='weekend')}",
+                analyse_weekend_volume,
+            ),
+            Section(
+                "duration",
+                f"⏱️ {t('duration_title', category='weekend')}",
+                analyse_weekend_duree,
+            ),
+            Section(
+                "complexity",
+                f"🔧 {t('complexity_title', category='weekend')}",
+                analyse_weekend_complexite,
+            ),
+            Section(
+                "nutrition",
+                f"🥗 {t('nutrition_title', category='weekend')}",
+                analyse_weekend_nutrition,
+            ),
+            Section(
+                "ingredients",
+                f"🥘 {t('ingredients_title', category='weekend')}",
+                analyse_weekend_ingredients,
+            ),
+            Section(
+                "tags",
+                f"🏷️ {t('tags_title', category='weekend')}",
+                analyse_weekend_tags,
+            ),
+            Section(
+                "calendar",
+                f"📅 {t('calendar_title', category='weekend')}",
+                analyse_weekend_calendrier,
+            ),
+        ],
+    )
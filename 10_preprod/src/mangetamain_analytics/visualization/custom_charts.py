@@ -5,6 +5,8 @@ import pandas as pd
 import plotly.express as px
 from typing import Optional
 
+from utils.chart_payload import lean_figure
+
 
 def create_correlation_heatmap(conn, table_name: str) -> None:
     """Crée une heatmap de corrélation."""
@@ -90,7 +92,7 @@ def create_time_series_plot(
             y=value_col,
             title=f"Évolution de {value_col} dans le temps",
         )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(lean_figure(fig), use_container_width=True)
 
     except Exception as e:
         st.error(f"Erreur: {e}")
@@ -120,7 +122,7 @@ def create_custom_scatter_plot(
             title=f"{y_col} vs {x_col}",
             opacity=0.7,
         )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(lean_figure(fig), use_container_width=True)
 
         # Calculer la corrélation
         correlation = data_df[x_col].corr(data_df[y_col])
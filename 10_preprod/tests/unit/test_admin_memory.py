@@ -0,0 +1,48 @@
+"""Tests unitaires pour la page d'administration mémoire."""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Ajout du chemin vers le module
+sys.path.insert(0, str(Path(__file__).parents[2] / "src" / "mangetamain_analytics"))
+
+import utils.memory as memory
+from utils.memory import BoundedCache, register_cache, record_session
+from visualization.admin_memory import cache_rows, render_memory_admin
+
+
+@patch("visualization.admin_memory.st")
+def test_render_memory_admin(mock_st, monkeypatch):
+    """Vérifie les totaux affichés et le vidage des caches."""
+    monkeypatch.setattr(memory, "_registry", {})
+    monkeypatch.setattr(memory, "_sessions", {})
+    cache = register_cache(BoundedCache("recipes", max_bytes=100 * memory.MB))
+    cache.put("all", "frame", nbytes=3 * memory.MB)
+    cache.get("all")
+    record_session({"page": "trends"}, session_id="abcdef123456")
+
+    mock_st.columns.side_effect = lambda n: [MagicMock() for _ in range(n)]
+    mock_st.button.return_value = True
+
+    render_memory_admin()
+
+    metrics = {c.args[0]: c.args[1] for c in mock_st.metric.call_args_list}
+    assert "3.0" in "".join(str(v) for v in metrics.values())
+    assert mock_st.dataframe.call_count == 2
+    sessions = mock_st.dataframe.call_args_list[1].args[0]
+    assert list(sessions[0].values())[0] == "abcdef12"
+    assert cache.stats()["entries"] == 0
+    mock_st.rerun.assert_called_once()
+
+
+def test_cache_rows_hit_rate(monkeypatch):
+    """Vérifie le taux de succès (tiret sans lecture)."""
+    monkeypatch.setattr(memory, "_registry", {})
+    cache = register_cache(BoundedCache("figures", max_bytes=memory.MB))
+
+    assert list(cache_rows()[0].values())[4] == "-"
+    cache.put("a", b"x", nbytes=1)
+    cache.get("a")
+    cache.get("b")
+    assert list(cache_rows()[0].values())[4] == "50%"
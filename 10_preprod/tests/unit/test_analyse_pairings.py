@@ -0,0 +1,145 @@
+"""Tests unitaires pour le module analyse_pairings.
+
+Teste l'affichage du réseau d'associations d'ingrédients précalculé.
+"""
+
+import sys
+from pathlib import Path
+import pytest
+from unittest.mock import Mock, MagicMock, patch
+import polars as pl
+
+# Ajout du chemin vers le module
+sys.path.insert(0, str(Path(__file__).parents[2] / "src" / "mangetamain_analytics"))
+
+from visualization.analyse_pairings import (
+    get_ingredient_choices,
+    analyse_pairings_voisins,
+    analyse_pairings_saisons,
+    render_pairings_analysis,
+)
+
+
+@pytest.fixture
+def mock_pairs_data():
+    """Fixture : liste d'arêtes au format produit par l'ETL."""
+    rows = []
+    edges = [
+        ("egg", "milk", 20, 1.33, 1),
+        ("egg", "salt", 20, 0.89, 2),
+        ("milk", "egg", 20, 1.33, 1),
+        ("salt", "pepper", 20, 1.33, 1),
+        ("salt", "egg", 20, 0.89, 2),
+        ("pepper", "salt", 20, 1.33, 1),
+    ]
+    for season, shift in [
+        ("All", 0.0),
+        ("Winter", 0.5),
+        ("Spring", -0.2),
+        ("Summer", 1.0),
+        ("Autumn", -1.0),
+    ]:
+        for ingredient, neighbor, n, lift, rank in edges:
+            rows.append(
+                {
+                    "ingredient": ingredient,
+                    "neighbor": neighbor,
+                    "season": season,
+                    "n_recipes": n,
+                    "support": 0.5,
+                    "lift": lift,
+                    "shift": shift,
+                    "rank": rank,
+                }
+            )
+    return pl.DataFrame(rows)
+
+
+def setup_st_mocks(mock_st):
+    """Configure tous les mocks Streamlit nécessaires."""
+    mock_st.plotly_chart = Mock()
+    mock_st.columns = Mock(side_effect=lambda n: [MagicMock() for _ in range(n)])
+    mock_st.metric = Mock()
+    mock_st.markdown = Mock()
+    mock_st.selectbox = Mock(side_effect=lambda label, options, **kw: options[0])
+    return mock_st
+
+
+def test_get_ingredient_choices(mock_pairs_data):
+    """Vérifie le tri des ingrédients du plus au moins connecté."""
+    choices = get_ingredient_choices(mock_pairs_data)
+
+    assert choices == ["egg", "salt", "milk", "pepper"]
+
+
+@patch("visualization.analyse_pairings.st")
+def test_analyse_pairings_voisins(mock_st, mock_pairs_data):
+    """Vérifie l'affichage des voisins classés par rang."""
+    setup_st_mocks(mock_st)
+
+    analyse_pairings_voisins(mock_pairs_data, "egg")
+
+    mock_st.plotly_chart.assert_called_once()
+    fig = mock_st.plotly_chart.call_args[0][0]
+    assert list(fig.data[0].y) == ["milk", "salt"]
+
+
+@patch("visualization.analyse_pairings.st")
+def test_analyse_pairings_voisins_unknown(mock_st, mock_pairs_data):
+    """Vérifie l'avertissement pour un ingrédient sans arête."""
+    setup_st_mocks(mock_st)
+
+    analyse_pairings_voisins(mock_pairs_data, "saffron")
+
+    mock_st.warning.assert_called_once()
+    mock_st.plotly_chart.assert_not_called()
+
+
+@patch("visualization.analyse_pairings.st")
+def test_analyse_pairings_saisons(mock_st, mock_pairs_data):
+    """Vérifie la heatmap voisins × saisons en pourcentage."""
+    setup_st_mocks(mock_st)
+
+    analyse_pairings_saisons(mock_pairs_data, "egg")
+
+    fig = mock_st.plotly_chart.call_args[0][0]
+    heatmap = fig.data[0]
+    assert len(heatmap.x) == 4
+    assert heatmap.z[0].tolist() == [50.0, -20.0, 100.0, -100.0]
+
+
+@patch("visualization.analyse_pairings.st")
+def test_analyse_pairings_saisons_unknown(mock_st, mock_pairs_data):
+    """Vérifie l'avertissement sans données saisonnières."""
+    setup_st_mocks(mock_st)
+
+    analyse_pairings_saisons(mock_pairs_data.filter(pl.col("season") == "All"), "egg")
+
+    mock_st.warning.assert_called_once()
+
+
+@patch("visualization.analyse_pairings.st")
+@patch("visualization.analyse_pairings.load_ingredient_pairs")
+def test_render_pairings_analysis(mock_load, mock_st, mock_pairs_data):
+    """Vérifie que la page ne lit que les arêtes précalculées."""
+    mock_load.return_value = mock_pairs_data
+    setup_st_mocks(mock_st)
+
+    render_pairings_analysis()
+
+    mock_load.assert_called_once()
+    mock_st.selectbox.assert_called_once()
+    assert mock_st.plotly_chart.call_count == 2
+
+
+@patch("visualization.analyse_pairings.st")
+@patch("visualization.analyse_pairings.load_ingredient_pairs")
+def test_render_pairings_analysis_empty(mock_load, mock_st, mock_pairs_data):
+    """Vérifie l'avertissement quand la liste d'arêtes est vide."""
+    mock_load.return_value = mock_pairs_data.clear()
+    setup_st_mocks(mock_st)
+
+    render_pairings_analysis()
+
+    mock_st.warning.assert_called_once()
+    mock_st.selectbox.assert_not_called()
@@ -8,18 +8,37 @@ from pathlib import Path
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 import polars as pl
+import numpy as np
 import pandas as pd
+from scipy.stats import f_oneway, spearmanr
 
 # Ajout du chemin vers le module
 sys.path.insert(0, str(Path(__file__).parents[2] / "src" / "mangetamain_analytics"))
 
+from analysis.sufficient_stats import rating_histograms
 from visualization.analyse_ratings import (
     analyse_ratings_validation_ponderee,
     analyse_ratings_tendance_temporelle,
     analyse_ratings_distribution,
     analyse_ratings_seasonality_1,
     analyse_ratings_seasonality_2,
+    analyse_ratings_complexite,
+    monthly_rating_ci,
+    rating_by_complexity,
+    rating_correlations,
 )
+from utils.figure_cache import FigureCache
+
+
+@pytest.fixture(autouse=True)
+def figure_cache():
+    """Fixture : cache de figures vierge, version des données fixe (sans S3)."""
+    FigureCache.reset_shared()
+    with patch(
+        "visualization.analyse_ratings.get_interactions_version", return_value="test"
+    ):
+        yield FigureCache.shared()
+    FigureCache.reset_shared()
 
 
 @pytest.fixture
@@ -53,6 +72,27 @@ def mock_monthly_stats():
     return pd.DataFrame(data)
 
 
+@pytest.fixture
+def mock_monthly_histograms():
+    """Fixture : histogrammes de notes 1-5 des 100 mois de mock_monthly_stats."""
+    dates = pd.date_range("2010-01-01", periods=100, freq="MS")
+    return pl.DataFrame(
+        {
+            "year": dates.year,
+            "month": dates.month,
+            "count_1": [2] * 100,
+            "count_2": [3] * 100,
+            "count_3": [10] * 100,
+            "count_4": [25 + i for i in range(100)],
+            "count_5": [60 + 2 * i for i in range(100)],
+        }
+    ).with_columns(
+        pl.sum_horizontal(pl.col("^count_.*$")).alias("n_interactions"),
+        pl.lit(50).alias("n_users"),
+        pl.lit(40).alias("n_recipes"),
+    )
+
+
 def setup_st_mocks(mock_st):
     """Configure tous les mocks Streamlit nécessaires."""
     mock_st.plotly_chart = Mock()
@@ -87,28 +127,67 @@ def test_analyse_ratings_validation_ponderee(
     mock_st.plotly_chart.assert_called()
 
 
+@patch("visualization.analyse_ratings.get_rating_histograms")
 @patch("visualization.analyse_ratings.st")
 @patch("visualization.analyse_ratings.load_ratings_for_longterm_analysis")
 def test_analyse_ratings_tendance_temporelle(
-    mock_load_ratings, mock_st, mock_monthly_stats
+    mock_load_ratings,
+    mock_st,
+    mock_histograms,
+    mock_monthly_stats,
+    mock_monthly_histograms,
 ):
     """Test de la fonction analyse_ratings_tendance_temporelle."""
     # Return tuple (df, metadata) as expected by the function
     mock_load_ratings.return_value = (mock_monthly_stats, {"count": 100})
+    mock_histograms.return_value = mock_monthly_histograms
     setup_st_mocks(mock_st)
 
     analyse_ratings_tendance_temporelle()
 
     mock_load_ratings.assert_called_once()
+    mock_histograms.assert_called_once_with(("year", "month"))
     mock_st.plotly_chart.assert_called()
 
 
+@patch("visualization.analyse_ratings.get_rating_histograms")
 @patch("visualization.analyse_ratings.st")
 @patch("visualization.analyse_ratings.load_ratings_for_longterm_analysis")
-def test_analyse_ratings_distribution(mock_load_ratings, mock_st, mock_monthly_stats):
+def test_analyse_ratings_tendance_mann_kendall(
+    mock_load_ratings,
+    mock_st,
+    mock_histograms,
+    mock_monthly_stats,
+    mock_monthly_histograms,
+):
+    """Vérifie le tableau Mann-Kendall calculé en un lot sur les 3 séries."""
+    mock_load_ratings.return_value = (mock_monthly_stats, {"count": 100})
+    mock_histograms.return_value = mock_monthly_histograms
+    setup_st_mocks(mock_st)
+
+    analyse_ratings_tendance_temporelle()
+
+    table, correlations = (c[0][0] for c in mock_st.dataframe.call_args_list)
+    assert table.height == 3
+    # Volume strictement croissant dans la fixture
+    assert table.row(2)[-1] in ("Hausse", "Increasing")
+    assert correlations.columns[1:] == ["Spearman", "Pearson", "Kendall"]
+
+
+@patch("visualization.analyse_ratings.get_rating_histograms")
+@patch("visualization.analyse_ratings.st")
+@patch("visualization.analyse_ratings.load_ratings_for_longterm_analysis")
+def test_analyse_ratings_distribution(
+    mock_load_ratings,
+    mock_st,
+    mock_histograms,
+    mock_monthly_stats,
+    mock_monthly_histograms,
+):
     """Test de la fonction analyse_ratings_distribution."""
     # Return tuple (df, metadata) as expected by the function
     mock_load_ratings.return_value = (mock_monthly_stats, {"count": 100})
+    mock_histograms.return_value = mock_monthly_histograms
     setup_st_mocks(mock_st)
 
     analyse_ratings_distribution()
@@ -117,31 +196,177 @@ def test_analyse_ratings_distribution(mock_load_ratings, mock_st, mock_monthly_s
     mock_st.plotly_chart.assert_called()
 
 
+@patch("visualization.analyse_ratings.get_rating_histograms")
 @patch("visualization.analyse_ratings.st")
-@patch("visualization.analyse_ratings.load_clean_interactions")
+@patch("visualization.analyse_ratings.load_ratings_for_longterm_analysis")
+def test_analyse_ratings_tendance_cached(
+    mock_load_ratings,
+    mock_st,
+    mock_histograms,
+    mock_monthly_stats,
+    mock_monthly_histograms,
+):
+    """Vérifie qu'une vue répétée relit figure, métriques et tableaux du cache."""
+    mock_load_ratings.return_value = (mock_monthly_stats, {"count": 100})
+    mock_histograms.return_value = mock_monthly_histograms
+    setup_st_mocks(mock_st)
+
+    analyse_ratings_tendance_temporelle()
+    first_metrics = mock_st.metric.call_args_list[:]
+    first_tables = [c[0][0] for c in mock_st.dataframe.call_args_list]
+    mock_st.metric.reset_mock()
+    mock_st.dataframe.reset_mock()
+    analyse_ratings_tendance_temporelle()
+
+    mock_load_ratings.assert_called_once()
+    assert mock_st.metric.call_args_list == first_metrics
+    for first, again in zip(
+        first_tables, (c[0][0] for c in mock_st.dataframe.call_args_list)
+    ):
+        assert first.equals(again)
+
+
+@patch("visualization.analyse_ratings.st")
+@patch("visualization.analyse_ratings.load_ratings_for_longterm_analysis")
+def test_analyse_ratings_validation_empty(mock_load_ratings, mock_st):
+    """Vérifie le message d'absence de données (figure vide, sans statistiques)."""
+    mock_load_ratings.return_value = (pd.DataFrame(), {})
+    setup_st_mocks(mock_st)
+
+    analyse_ratings_validation_ponderee()
+
+    mock_st.error.assert_called_once()
+    mock_st.plotly_chart.assert_not_called()
+
+
+def test_monthly_rating_ci(mock_monthly_histograms):
+    """Vérifie des IC mensuels encadrant la moyenne, NaN hors histogrammes."""
+    dates = pd.Series(pd.date_range("2009-12-01", periods=3, freq="MS"))
+
+    with patch(
+        "visualization.analyse_ratings.get_rating_histograms",
+        return_value=mock_monthly_histograms,
+    ):
+        ci_low, ci_high = monthly_rating_ci(dates)
+
+    counts = mock_monthly_histograms.select(pl.col("^count_.*$")).to_numpy()[:2]
+    means = counts @ np.arange(1, 6) / counts.sum(axis=1)
+    assert np.isnan(ci_low[0]) and np.isnan(ci_high[0])
+    assert (ci_low[1:] < means).all() and (means < ci_high[1:]).all()
+
+
+def test_rating_correlations(mock_monthly_stats):
+    """Vérifie une ligne par variable, Spearman à poids égaux = scipy."""
+    weights = np.ones(len(mock_monthly_stats))
+
+    result = rating_correlations(mock_monthly_stats, weights)
+
+    assert result["variable"].to_list() == [
+        "n_interactions",
+        "month_index",
+        "std_rating",
+    ]
+    reference = spearmanr(
+        mock_monthly_stats["mean_rating"], mock_monthly_stats["n_interactions"]
+    )
+    assert result["spearman"][0] == pytest.approx(reference.statistic)
+    # Volume croissant avec le temps : mêmes rangs
+    assert result["kendall"][0] == pytest.approx(result["kendall"][1])
+
+
+@patch("visualization.analyse_ratings.st")
+@patch("visualization.analyse_ratings.get_rating_histograms")
 def test_analyse_ratings_seasonality_1(
-    mock_load_interactions, mock_st, mock_interactions_data
+    mock_histograms, mock_st, mock_interactions_data
 ):
     """Test de la fonction analyse_ratings_seasonality_1."""
-    mock_load_interactions.return_value = mock_interactions_data
+    mock_histograms.return_value = rating_histograms(mock_interactions_data, ["season"])
     setup_st_mocks(mock_st)
 
     analyse_ratings_seasonality_1()
 
-    mock_load_interactions.assert_called_once()
+    mock_histograms.assert_called_once_with(("season",))
     mock_st.plotly_chart.assert_called()
 
 
 @patch("visualization.analyse_ratings.st")
-@patch("visualization.analyse_ratings.load_clean_interactions")
+@patch("visualization.analyse_ratings.get_rating_histograms")
 def test_analyse_ratings_seasonality_2(
-    mock_load_interactions, mock_st, mock_interactions_data
+    mock_histograms, mock_st, mock_interactions_data
 ):
     """Test de la fonction analyse_ratings_seasonality_2."""
-    mock_load_interactions.return_value = mock_interactions_data
+    mock_histograms.return_value = rating_histograms(mock_interactions_data, ["season"])
     setup_st_mocks(mock_st)
 
     analyse_ratings_seasonality_2()
 
-    mock_load_interactions.assert_called_once()
+    mock_histograms.assert_called_once_with(("season",))
+    mock_st.plotly_chart.assert_called()
+
+
+@patch("visualization.analyse_ratings.st")
+@patch("visualization.analyse_ratings.get_rating_histograms")
+def test_analyse_ratings_seasonality_2_matches_raw_anova(
+    mock_histograms, mock_st, mock_interactions_data
+):
+    """Vérifie que l'ANOVA sur l'agrégat égale celle sur les notes brutes."""
+    mock_histograms.return_value = rating_histograms(mock_interactions_data, ["season"])
+    setup_st_mocks(mock_st)
+
+    analyse_ratings_seasonality_2()
+
+    groups = [
+        mock_interactions_data.filter(pl.col("season") == s)["rating"].to_numpy()
+        for s in ["Spring", "Summer", "Autumn", "Winter"]
+    ]
+    reference = f_oneway(*groups)
+    metrics = {c.args[0]: c.args[1] for c in mock_st.metric.call_args_list}
+    assert metrics["ANOVA F-stat"] == f"{reference.statistic:.3f}"
+
+
+@pytest.fixture
+def mock_recipe_stats():
+    """Table par recette : les recettes complexes sont mieux notées."""
+    rng = np.random.default_rng(1)
+    n = 200
+    complexity = rng.uniform(0, 10, n)
+    counts = {
+        f"count_{k}": rng.integers(0, 5, n) + (k == 5) * (complexity * 2).astype(int)
+        for k in range(1, 6)
+    }
+    total = sum(counts.values())
+    mean = sum(k * counts[f"count_{k}"] for k in range(1, 6)) / total
+    return pl.DataFrame(
+        {
+            "recipe_id": np.arange(n),
+            "complexity_score": complexity,
+            "n_interactions": total,
+            "mean_rating": mean,
+            **counts,
+        }
+    )
+
+
+def test_rating_by_complexity(mock_recipe_stats):
+    """Vérifie des classes d'effectifs égaux, ordonnées par complexité."""
+    bins = rating_by_complexity(mock_recipe_stats, n_bins=10)
+
+    assert bins["complexity_bin"].to_list() == list(range(1, 11))
+    assert bins["n_recipes"].to_list() == [20] * 10
+    assert (bins["complexity_max"][:-1] <= bins["complexity_min"][1:]).all()
+    assert bins["count_5"].sum() == mock_recipe_stats["count_5"].sum()
+
+
+@patch("visualization.analyse_ratings.st")
+@patch("visualization.analyse_ratings.get_recipe_stats")
+def test_analyse_ratings_complexite(mock_stats, mock_st, mock_recipe_stats):
+    """Test de la fonction analyse_ratings_complexite."""
+    mock_stats.return_value = mock_recipe_stats
+    setup_st_mocks(mock_st)
+
+    analyse_ratings_complexite()
+
+    mock_stats.assert_called_once_with(None, None, 5)
     mock_st.plotly_chart.assert_called()
+    metrics = {c.args[0]: c.args[1] for c in mock_st.metric.call_args_list}
+    assert float(metrics["Spearman ρ"]) > 0.5
@@ -3,10 +3,14 @@
 Teste les fonctions d'analyse de saisonnalité.
 """
 
+import base64
 import sys
+from datetime import date
 from pathlib import Path
 import pytest
 from unittest.mock import Mock, MagicMock, patch
+import numpy as np
+import pandas as pd
 import polars as pl
 
 # Ajout du chemin vers le module
@@ -19,7 +23,27 @@ from visualization.analyse_seasonality import (
     analyse_seasonality_nutrition,
     analyse_seasonality_ingredients,
     analyse_seasonality_tags,
+    analyse_seasonality_decomposition,
 )
+from utils.figure_cache import FigureCache
+
+
+@pytest.fixture(autouse=True)
+def figure_cache():
+    """Fixture : cache de figures vierge, versions des données fixes (sans S3)."""
+    FigureCache.reset_shared()
+    with (
+        patch(
+            "visualization.analyse_seasonality.get_recipes_version",
+            return_value="test",
+        ),
+        patch(
+            "visualization.analyse_seasonality.get_interactions_version",
+            return_value="test",
+        ),
+    ):
+        yield FigureCache.shared()
+    FigureCache.reset_shared()
 
 
 @pytest.fixture
@@ -45,6 +69,15 @@ def mock_recipes_data():
     return pl.DataFrame(data)
 
 
+def trace_values(values) -> list:
+    """Valeurs d'une trace relue du cache (tableau typé base64 décodé)."""
+    if isinstance(values, dict) and "bdata" in values:
+        return np.frombuffer(
+            base64.b64decode(values["bdata"]), dtype=values["dtype"]
+        ).tolist()
+    return list(values)
+
+
 def setup_st_mocks(mock_st):
     """Configure tous les mocks Streamlit nécessaires."""
     mock_st.plotly_chart = Mock()
@@ -70,6 +103,25 @@ def test_analyse_seasonality_volume(mock_load_recipes, mock_st, mock_recipes_dat
     mock_st.plotly_chart.assert_called()
 
 
+@patch("visualization.analyse_seasonality.st")
+@patch("visualization.analyse_seasonality.load_recipes_clean")
+def test_analyse_seasonality_volume_cached(
+    mock_load_recipes, mock_st, mock_recipes_data
+):
+    """Vérifie qu'une vue répétée relit figure et métriques sans recalcul."""
+    mock_load_recipes.return_value = mock_recipes_data
+    setup_st_mocks(mock_st)
+
+    analyse_seasonality_volume()
+    first_metrics = mock_st.metric.call_args_list[:]
+    mock_st.metric.reset_mock()
+    analyse_seasonality_volume()
+
+    mock_load_recipes.assert_called_once()
+    assert mock_st.metric.call_args_list == first_metrics
+    assert first_metrics[0].args == ("📊 Total recettes", "1,000")
+
+
 @patch("visualization.analyse_seasonality.st")
 @patch("visualization.analyse_seasonality.load_recipes_clean")
 def test_analyse_seasonality_duree(mock_load_recipes, mock_st, mock_recipes_data):
@@ -131,3 +183,80 @@ def test_analyse_seasonality_tags(mock_load_recipes, mock_st, mock_recipes_data)
     analyse_seasonality_tags()
 
     mock_load_recipes.assert_called_once()
+
+
+@pytest.fixture
+def mock_submitted_recipes():
+    """Fixture : 4 ans de soumissions avec pic de recettes chaque décembre."""
+    rows = []
+    for i in range(48):
+        month_start = date(2000 + i // 12, i % 12 + 1, 1)
+        rows += [month_start] * (30 if month_start.month == 12 else 10 + i // 12)
+    return pl.DataFrame({"submitted": rows})
+
+
+@patch("visualization.analyse_seasonality.st")
+@patch("visualization.analyse_seasonality.get_stl_decomposition")
+@patch("visualization.analyse_seasonality.load_recipes_clean")
+def test_analyse_seasonality_decomposition(
+    mock_load_recipes, mock_stl, mock_st, mock_submitted_recipes
+):
+    """Vérifie la décomposition des soumissions mensuelles via le cache STL."""
+    from analysis.decomposition import stl_decompose
+
+    mock_load_recipes.return_value = mock_submitted_recipes
+    mock_stl.side_effect = lambda name, version, values, times: stl_decompose(
+        values, times
+    )
+    setup_st_mocks(mock_st)
+    mock_st.radio = Mock(return_value="recipes")
+
+    analyse_seasonality_decomposition()
+
+    assert mock_stl.call_args[0][0] == "recipes_monthly"
+    assert len(mock_stl.call_args[0][2]) == 48
+    assert mock_st.plotly_chart.call_count == 2
+    components_fig = mock_st.plotly_chart.call_args_list[0][0][0]
+    assert len(components_fig.data) == 4
+    amplitude_fig = mock_st.plotly_chart.call_args_list[1][0][0]
+    assert trace_values(amplitude_fig.data[0].x) == [2000, 2001, 2002, 2003]
+
+
+@patch("visualization.analyse_seasonality.st")
+@patch("visualization.analyse_seasonality.get_rating_histograms")
+def test_analyse_seasonality_decomposition_interactions(mock_histograms, mock_st):
+    """Vérifie la série des interactions mensuelles (mois manquants à 0)."""
+    months = np.arange(36)
+    monthly = pl.DataFrame(
+        {
+            "year": 2005 + months // 12,
+            "month": months % 12 + 1,
+            "n_interactions": (1000 + 200 * np.cos(months * np.pi / 6)).astype(int),
+        }
+    ).filter(pl.int_range(pl.len()) != 5)
+    mock_histograms.return_value = monthly
+    setup_st_mocks(mock_st)
+    mock_st.radio = Mock(return_value="interactions")
+
+    analyse_seasonality_decomposition()
+
+    mock_histograms.assert_called_with(("year", "month"))
+    components_fig = mock_st.plotly_chart.call_args_list[0][0][0]
+    assert len(components_fig.data[0].x) == 36
+    assert trace_values(components_fig.data[0].y)[5] == 0
+
+
+@patch("visualization.analyse_seasonality.st")
+@patch("visualization.analyse_seasonality.load_recipes_clean")
+def test_analyse_seasonality_decomposition_unavailable(
+    mock_load_recipes, mock_st, mock_recipes_data
+):
+    """Vérifie l'avertissement sans date de soumission."""
+    mock_load_recipes.return_value = mock_recipes_data
+    setup_st_mocks(mock_st)
+    mock_st.radio = Mock(return_value="recipes")
+
+    analyse_seasonality_decomposition()
+
+    mock_st.warning.assert_called_once()
+    mock_st.plotly_chart.assert_not_called()
@@ -4,6 +4,7 @@ Teste les fonctions d'analyse de tendances temporelles (version 2).
 """
 
 import sys
+from datetime import date
 from pathlib import Path
 import pytest
 from unittest.mock import Mock, MagicMock, patch
@@ -21,7 +22,21 @@ from visualization.analyse_trendlines_v2 import (
     analyse_trendline_nutrition,
     analyse_trendline_ingredients,
     analyse_trendline_tags,
+    compute_volume_segments,
 )
+from utils.figure_cache import FigureCache
+
+
+@pytest.fixture(autouse=True)
+def figure_cache():
+    """Fixture : cache de figures vierge, version des données fixe (sans S3)."""
+    FigureCache.reset_shared()
+    with patch(
+        "visualization.analyse_trendlines_v2.get_recipes_version",
+        return_value="test",
+    ):
+        yield FigureCache.shared()
+    FigureCache.reset_shared()
 
 
 @pytest.fixture
@@ -80,10 +95,46 @@ def test_analyse_trendline_volume(mock_load_data, mock_st, mock_recipes_data):
 
     analyse_trendline_volume()
 
-    mock_load_data.assert_called_once()
+    mock_load_data.assert_called()
     mock_st.plotly_chart.assert_called()
 
 
+def test_compute_volume_segments_monthly():
+    """Vérifie la série mensuelle (mois vides à 0) et la rupture détectée."""
+    submitted = [date(2000 + i // 12, i % 12 + 1, 1) for i in range(48)]
+    # 5 recettes/mois pendant 2 ans puis 40/mois ; mars 2000 sans recette
+    rows = [d for i, d in enumerate(submitted) for _ in range(5 if i < 24 else 40)]
+    df = pl.DataFrame({"submitted": rows}).filter(
+        pl.col("submitted") != date(2000, 3, 1)
+    )
+    df = df.with_columns(pl.col("submitted").dt.year().alias("year"))
+
+    segments = compute_volume_segments(df)
+
+    assert segments["start"].to_list() == [date(2000, 1, 1), date(2002, 1, 1)]
+    assert segments["position"].to_list() == [2000.0, 2002.0]
+    assert segments["n_points"].sum() == 48
+
+
+@patch("visualization.analyse_trendlines_v2.st")
+@patch("visualization.analyse_trendlines_v2.load_and_prepare_data")
+def test_analyse_trendline_volume_change_points(
+    mock_load_data, mock_st, mock_recipes_data
+):
+    """Vérifie les lignes de rupture sur le graphique des volumes annuels."""
+    # 10 recettes/an de 1999 à 2006 puis 200/an de 2007 à 2018
+    years = [y for y in range(1999, 2019) for _ in range(10 if y < 2007 else 200)]
+    mock_load_data.return_value = pl.DataFrame({"year": years})
+    setup_st_mocks(mock_st)
+
+    analyse_trendline_volume()
+
+    fig = mock_st.plotly_chart.call_args[0][0]
+    vlines = [shape.x0 for shape in fig.layout.shapes if shape.x0 == shape.x1]
+    # 2007 = 9e barre (indice 8) : ligne entre les barres 7 et 8
+    assert vlines == [7.5]
+
+
 @patch("visualization.analyse_trendlines_v2.st")
 @patch("visualization.analyse_trendlines_v2.load_and_prepare_data")
 def test_analyse_trendline_duree(mock_load_data, mock_st, mock_recipes_data):
@@ -93,10 +144,29 @@ def test_analyse_trendline_duree(mock_load_data, mock_st, mock_recipes_data):
 
     analyse_trendline_duree()
 
-    mock_load_data.assert_called_once()
+    mock_load_data.assert_called()
     mock_st.plotly_chart.assert_called()
 
 
+@patch("visualization.analyse_trendlines_v2.st")
+@patch("visualization.analyse_trendlines_v2.load_and_prepare_data")
+def test_analyse_trendline_duree_cached(mock_load_data, mock_st, mock_recipes_data):
+    """Vérifie qu'une vue répétée relit figure et pentes sans régression."""
+    mock_load_data.return_value = mock_recipes_data
+    setup_st_mocks(mock_st)
+
+    analyse_trendline_duree()
+    slopes = [c for c in mock_st.metric.call_args_list if "min/an" in c.args[1]]
+    mock_st.metric.reset_mock()
+    with patch("visualization.analyse_trendlines_v2.sm.WLS") as mock_wls:
+        analyse_trendline_duree()
+
+    mock_wls.assert_not_called()
+    # Le curseur d'années relit les recettes, la figure vient du cache
+    assert mock_load_data.call_count == 3
+    assert [c for c in mock_st.metric.call_args_list if "min/an" in c.args[1]] == slopes
+
+
 @patch("visualization.analyse_trendlines_v2.st")
 @patch("visualization.analyse_trendlines_v2.load_and_prepare_data")
 def test_analyse_trendline_duree_old_intervals(
@@ -175,3 +245,48 @@ def test_analyse_trendline_tags(mock_load_data, mock_st, mock_recipes_data):
 
     mock_load_data.assert_called_once()
     mock_st.plotly_chart.assert_called()
+
+
+@patch("data.vocabulary.get_vocabulary")
+@patch("visualization.analyse_trendlines_v2.st")
+@patch("visualization.analyse_trendlines_v2.load_and_prepare_data")
+def test_analyse_trendline_ingredients_encoded(
+    mock_load_data, mock_st, mock_get_vocabulary, mock_recipes_data
+):
+    """Test avec colonnes encodées List[UInt32] : décodage des seuls agrégats."""
+    mock_load_data.return_value = mock_recipes_data.with_columns(
+        pl.lit([0, 1, 2], dtype=pl.List(pl.UInt32)).alias("ingredients"),
+        pl.lit([0, 1, 2], dtype=pl.List(pl.UInt32)).alias("tags"),
+    )
+    mock_get_vocabulary.return_value = pl.DataFrame(
+        {
+            "id": pl.Series([0, 1, 2], dtype=pl.UInt32),
+            "term": ["olive oil", "pepper", "salt"],
+        }
+    )
+    setup_st_mocks(mock_st)
+
+    analyse_trendline_ingredients()
+    analyse_trendline_tags()
+
+    mock_st.plotly_chart.assert_called()
+    fig = mock_st.plotly_chart.call_args_list[0][0][0]
+    labels = {str(y) for trace in fig.data if trace.y is not None for y in trace.y}
+    assert "salt" in labels
+
+
+@patch("visualization.analyse_trendlines_v2.st")
+@patch("visualization.analyse_trendlines_v2.load_and_prepare_data")
+def test_analyse_trendline_tags_cached(mock_load_data, mock_st, mock_recipes_data):
+    """Vérifie qu'une vue répétée relit la figure sans recharger les données."""
+    mock_load_data.return_value = mock_recipes_data
+    setup_st_mocks(mock_st)
+
+    analyse_trendline_tags(top_n=5)
+    analyse_trendline_tags(top_n=5)
+
+    mock_load_data.assert_called_once()
+    assert mock_st.plotly_chart.call_count == 2
+    first, second = (c[0][0] for c in mock_st.plotly_chart.call_args_list)
+    assert [trace.name for trace in second.data] == [trace.name for trace in first.data]
+    assert second.layout.height == first.layout.height
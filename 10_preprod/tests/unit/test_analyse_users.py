@@ -0,0 +1,166 @@
+"""Tests unitaires pour le module analyse_users.
+
+Teste la page de comportement des utilisateurs sur les tables précalculées.
+"""
+
+import base64
+import sys
+from datetime import date
+from pathlib import Path
+import pytest
+from unittest.mock import Mock, MagicMock, patch
+import numpy as np
+import polars as pl
+
+# Ajout du chemin vers le module
+sys.path.insert(0, str(Path(__file__).parents[2] / "src" / "mangetamain_analytics"))
+
+from visualization.analyse_users import (
+    ACTIVITY_LABELS,
+    activity_distribution,
+    analyse_users_biais,
+    analyse_users_mensuels,
+    render_users_analysis,
+)
+from utils.figure_cache import FigureCache
+
+
+@pytest.fixture(autouse=True)
+def figure_cache():
+    """Fixture : cache de figures vierge, version des données fixe (sans S3)."""
+    FigureCache.reset_shared()
+    with patch("visualization.analyse_users.get_users_version", return_value="test"):
+        yield FigureCache.shared()
+    FigureCache.reset_shared()
+
+
+@pytest.fixture
+def mock_user_stats():
+    """Fixture : table par utilisateur au format produit par l'ETL."""
+    n_ratings = [1] * 60 + [3] * 30 + [40] * 9 + [800]
+    return pl.DataFrame(
+        {
+            "user_id": list(range(100)),
+            "first_date": [date(2005, 1, 1)] * 100,
+            "last_date": [date(2006, 1, 1)] * 100,
+            "tenure_days": [365] * 100,
+            "n_ratings": n_ratings,
+            "mean_rating": [4.5] * 100,
+            "rating_bias": [
+                None if n == 1 else -0.2 + (i % 5) * 0.1
+                for i, n in enumerate(n_ratings)
+            ],
+        }
+    ).with_columns(pl.col("n_ratings").cast(pl.UInt32))
+
+
+@pytest.fixture
+def mock_monthly_users():
+    """Fixture : comptes mensuels d'utilisateurs actifs."""
+    return pl.DataFrame(
+        {
+            "month": [date(2005, m, 1) for m in range(1, 13)],
+            "n_active_users": [10, 20, 50, 40, 30, 30, 20, 10, 10, 5, 5, 5],
+            "n_new_users": [10, 15, 35, 10, 5, 5, 2, 1, 1, 0, 0, 0],
+            "n_interactions": [100] * 12,
+        }
+    )
+
+
+def setup_st_mocks(mock_st):
+    """Configure tous les mocks Streamlit nécessaires."""
+    mock_st.plotly_chart = Mock()
+    mock_st.columns = Mock(side_effect=lambda n: [MagicMock() for _ in range(n)])
+    mock_st.metric = Mock()
+    mock_st.markdown = Mock()
+    mock_st.subheader = Mock()
+    mock_st.info = Mock()
+    return mock_st
+
+
+def test_activity_distribution(mock_user_stats):
+    """Vérifie les classes d'activité, y compris vides, et les parts."""
+    distribution = activity_distribution(mock_user_stats)
+
+    assert distribution["activity"].to_list() == ACTIVITY_LABELS
+    assert distribution["n_users"].to_list() == [60, 0, 30, 0, 0, 9, 0, 0, 1]
+    assert distribution["pct_users"].sum() == pytest.approx(100)
+    # 800 notes sur 60 + 90 + 360 + 800 = 1310
+    assert distribution["pct_ratings"][-1] == pytest.approx(800 / 1310 * 100)
+
+
+@patch("visualization.analyse_users.st")
+@patch("visualization.analyse_users.get_user_stats")
+def test_analyse_users_biais_ignores_occasional_users(
+    mock_users, mock_st, mock_user_stats
+):
+    """Vérifie que seuls les utilisateurs réguliers entrent dans l'histogramme."""
+    mock_users.return_value = mock_user_stats
+    setup_st_mocks(mock_st)
+
+    analyse_users_biais()
+
+    fig = mock_st.plotly_chart.call_args[0][0]
+    # Figure relue du cache : effectifs en tableau typé (dtype, bdata)
+    counts = np.frombuffer(
+        base64.b64decode(fig.data[0].y["bdata"]), dtype=fig.data[0].y["dtype"]
+    )
+    assert counts.sum() == 10
+
+
+@patch("visualization.analyse_users.st")
+@patch("visualization.analyse_users.get_monthly_active_users")
+def test_analyse_users_mensuels_empty(mock_monthly, mock_st, mock_monthly_users):
+    """Vérifie l'avertissement si la table mensuelle est vide."""
+    mock_monthly.return_value = mock_monthly_users.clear()
+    setup_st_mocks(mock_st)
+
+    analyse_users_mensuels()
+
+    mock_st.warning.assert_called_once()
+    mock_st.plotly_chart.assert_not_called()
+    mock_st.metric.assert_not_called()
+
+
+@patch("visualization.analyse_users.st")
+@patch("visualization.analyse_users.get_monthly_active_users")
+@patch("visualization.analyse_users.get_user_stats")
+def test_render_users_analysis(
+    mock_users, mock_monthly, mock_st, mock_user_stats, mock_monthly_users
+):
+    """Vérifie le rendu complet à partir des seules tables précalculées."""
+    mock_users.return_value = mock_user_stats
+    mock_monthly.return_value = mock_monthly_users
+    setup_st_mocks(mock_st)
+
+    render_users_analysis()
+
+    assert mock_st.plotly_chart.call_count == 4
+    metrics = {c.args[0]: c.args[1] for c in mock_st.metric.call_args_list}
+    assert "2005-03" in metrics.values()
+    assert metrics["Gini"].startswith("0.")
+
+    # Vue répétée : figures et métriques relues du cache, tables non relues
+    mock_users.reset_mock()
+    mock_st.metric.reset_mock()
+    render_users_analysis()
+
+    mock_users.assert_not_called()
+    assert {c.args[0]: c.args[1] for c in mock_st.metric.call_args_list} == metrics
+
+
+@patch("visualization.analyse_users.st")
+@patch("visualization.analyse_users.get_monthly_active_users")
+@patch("visualization.analyse_users.get_user_stats")
+def test_render_users_analysis_empty(mock_users, mock_monthly, mock_st):
+    """Vérifie l'avertissement si les tables utilisateurs sont vides."""
+    mock_users.return_value = pl.DataFrame({"n_ratings": []})
+    mock_monthly.return_value = pl.DataFrame(
+        {"month": [], "n_active_users": [], "n_new_users": []}
+    )
+    setup_st_mocks(mock_st)
+
+    render_users_analysis()
+
+    mock_st.warning.assert_called_once()
+    mock_st.plotly_chart.assert_not_called()
@@ -4,14 +4,17 @@ Teste les fonctions d'analyse weekend vs weekday.
 """
 
 import sys
+from datetime import date
 from pathlib import Path
 import pytest
 from unittest.mock import Mock, MagicMock, patch
+import numpy as np
 import polars as pl
 
 # Ajout du chemin vers le module
 sys.path.insert(0, str(Path(__file__).parents[2] / "src" / "mangetamain_analytics"))
 
+from data.manifest import HeadlineMetrics
 from visualization.analyse_weekend import (
     analyse_weekend_volume,
     analyse_weekend_duree,
@@ -19,7 +22,22 @@ from visualization.analyse_weekend import (
     analyse_weekend_nutrition,
     analyse_weekend_ingredients,
     analyse_weekend_tags,
+    analyse_weekend_calendrier,
+    calendar_grid,
+    create_calendar_heatmap,
 )
+from utils.figure_cache import FigureCache
+
+
+@pytest.fixture(autouse=True)
+def figure_cache():
+    """Fixture : cache de figures vierge, version des données fixe (sans S3)."""
+    FigureCache.reset_shared()
+    with patch(
+        "visualization.analyse_weekend.get_recipes_version", return_value="test"
+    ):
+        yield FigureCache.shared()
+    FigureCache.reset_shared()
 
 
 @pytest.fixture
@@ -70,6 +88,23 @@ def test_analyse_weekend_volume(mock_load_recipes, mock_st, mock_recipes_data):
     mock_st.plotly_chart.assert_called()
 
 
+@patch("visualization.analyse_weekend.st")
+@patch("visualization.analyse_weekend.load_recipes_clean")
+def test_analyse_weekend_volume_cached(mock_load_recipes, mock_st, mock_recipes_data):
+    """Vérifie qu'une vue répétée relit figure et métriques depuis le cache."""
+    mock_load_recipes.return_value = mock_recipes_data
+    setup_st_mocks(mock_st)
+
+    analyse_weekend_volume()
+    first_metrics = mock_st.metric.call_args_list[:]
+    mock_st.metric.reset_mock()
+    analyse_weekend_volume()
+
+    mock_load_recipes.assert_called_once()
+    assert mock_st.metric.call_args_list == first_metrics
+    assert mock_st.plotly_chart.call_count == 2
+
+
 @patch("visualization.analyse_weekend.st")
 @patch("visualization.analyse_weekend.load_recipes_clean")
 def test_analyse_weekend_duree(mock_load_recipes, mock_st, mock_recipes_data):
@@ -109,6 +144,28 @@ def test_analyse_weekend_nutrition(mock_load_recipes, mock_st, mock_recipes_data
     mock_st.plotly_chart.assert_called()
 
 
+@patch("visualization.analyse_weekend.st")
+@patch("visualization.analyse_weekend.load_recipes_clean")
+def test_analyse_weekend_nutrition_permutation(
+    mock_load_recipes, mock_st, mock_recipes_data
+):
+    """Vérifie que la significativité repose sur le test par permutation."""
+    # Protéines nettement plus élevées le week-end, autres nutriments identiques
+    mock_load_recipes.return_value = mock_recipes_data.with_columns(
+        (pl.col("protein_pct") + pl.col("is_weekend").cast(pl.Int64) * 10).alias(
+            "protein_pct"
+        )
+    )
+    setup_st_mocks(mock_st)
+
+    analyse_weekend_nutrition()
+
+    table = mock_st.dataframe.call_args[0][0]
+    p_perm = table.to_series(-1).to_list()
+    assert p_perm[1] == pytest.approx(1 / 1000)
+    assert len(p_perm) == 6
+
+
 @patch("visualization.analyse_weekend.st")
 @patch("visualization.analyse_weekend.load_recipes_clean")
 def test_analyse_weekend_ingredients(mock_load_recipes, mock_st, mock_recipes_data):
@@ -133,3 +190,111 @@ def test_analyse_weekend_tags(mock_load_recipes, mock_st, mock_recipes_data):
     analyse_weekend_tags()
 
     mock_load_recipes.assert_called_once()
+
+
+@patch("visualization.analyse_weekend.decode_terms", side_effect=lambda df, *_: df)
+@patch("visualization.analyse_weekend.st")
+@patch("visualization.analyse_weekend.load_recipes_clean")
+def test_analyse_weekend_ingredients_fdr_filter(
+    mock_load_recipes, mock_st, mock_decode, mock_recipes_data
+):
+    """Vérifie que seul l'ingrédient réellement lié au week-end est retenu."""
+    ingredients = [
+        (
+            ["salt", "cinnamon"]
+            if i % 2 == 0
+            else ["salt", "pepper" if i % 4 == 1 else "egg"]
+        )
+        for i in range(1000)
+    ]
+    mock_load_recipes.return_value = mock_recipes_data.with_columns(
+        pl.Series("ingredients", ingredients)
+    )
+    setup_st_mocks(mock_st)
+
+    analyse_weekend_ingredients()
+
+    fig = mock_st.plotly_chart.call_args[0][0]
+    assert set(fig.data[0].y) == {"cinnamon", "pepper", "egg"}
+    assert "salt" not in fig.data[0].y
+
+    # Interprétation : termes cités tirés du tableau filtré
+    interpretation = mock_st.info.call_args[0][0]
+    weekend_line, weekday_line = interpretation.split("\n")[-4:-2]
+    assert "`cinnamon`" in weekend_line
+    assert "`pepper`" in weekday_line and "`egg`" in weekday_line
+    assert "`salt`" not in interpretation
+
+
+@pytest.fixture
+def mock_daily_counts():
+    """Fixture : table quotidienne de l'année 2009 (1er janvier = jeudi)."""
+    dates = pl.date_range(date(2009, 1, 1), date(2009, 12, 31), "1d", eager=True)
+    n = len(dates)
+    return pl.DataFrame(
+        {
+            "date": dates,
+            "year": [2009] * n,
+            "n_recipes": [i % 7 for i in range(n)],
+            "n_interactions": [10 + i % 5 for i in range(n)],
+            "mean_rating": [None if i % 10 == 0 else 4.0 for i in range(n)],
+        }
+    )
+
+
+def test_calendar_grid(mock_daily_counts):
+    """Vérifie la disposition jour × semaine d'une année."""
+    z, dates, month_weeks = calendar_grid(mock_daily_counts, "n_recipes", 2009)
+
+    assert z.shape == (7, 53)
+    # Lundi-mercredi de la première semaine hors de l'année
+    assert np.isnan(z[:3, 0]).all()
+    assert dates[3, 0] == "2009-01-01"
+    assert z[3, 0] == 0
+    assert z[4, 0] == 1
+    assert np.count_nonzero(~np.isnan(z)) == 365
+    assert month_weeks[0] == 0
+    assert month_weeks[1] == 4  # 1er février 2009 : dimanche de la 5e colonne
+
+
+def test_create_calendar_heatmap_null_ratings(mock_daily_counts):
+    """Vérifie que les jours sans note restent vides."""
+    fig = create_calendar_heatmap(mock_daily_counts, "mean_rating", 2009)
+
+    z = np.array(fig.data[0].z, dtype=float)
+    assert np.isnan(z[3, 0])
+    assert np.nanmax(z) == 4.0
+    assert len(fig.layout.xaxis.ticktext) == 12
+
+
+@patch("visualization.analyse_weekend.st")
+@patch("visualization.analyse_weekend.get_daily_counts")
+@patch("visualization.analyse_weekend.recipes_headline")
+def test_analyse_weekend_calendrier(
+    mock_headline, mock_daily, mock_st, mock_daily_counts
+):
+    """Vérifie que le calendrier ne charge que l'année sélectionnée."""
+    setup_st_mocks(mock_st)
+    mock_st.columns = Mock(
+        side_effect=lambda spec: [
+            MagicMock() for _ in range(spec if isinstance(spec, int) else len(spec))
+        ]
+    )
+    mock_headline.return_value = HeadlineMetrics(3, 2008, 2009)
+    mock_st.selectbox.return_value = 2009
+    mock_st.radio.return_value = "n_recipes"
+    mock_daily.return_value = mock_daily_counts
+
+    analyse_weekend_calendrier()
+
+    assert mock_st.selectbox.call_args[0][1] == [2009, 2008]
+    # Table de l'année lue par la page (métriques) et par la figure
+    assert {call.args for call in mock_daily.call_args_list} == {(2009,)}
+    mock_headline.assert_called_once_with()
+    mock_st.plotly_chart.assert_called_once()
+    assert mock_st.metric.call_count == 3
+
+    # Vue répétée : figure relue du cache, seule la page relit la table
+    mock_daily.reset_mock()
+    analyse_weekend_calendrier()
+    mock_daily.assert_called_once_with(2009)
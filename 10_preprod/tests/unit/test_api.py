@@ -0,0 +1,226 @@
+"""Tests unitaires pour le package api (résultats et serveur HTTP).
+
+Vérifie les résultats calculés sur des données synthétiques, les réponses
+JSON et Arrow, l'ETag (304 sans calcul) et la ligne de commande.
+"""
+
+import io
+import json
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import polars as pl
+import pytest
+from tornado.testing import AsyncHTTPTestCase
+
+# Ajout du chemin vers le module
+sys.path.insert(0, str(Path(__file__).parents[2] / "src" / "mangetamain_analytics"))
+
+from api.results import (
+    RESULTS,
+    AnalysisResult,
+    ResultSpec,
+    ratings_seasonal,
+    seasonality_nutrition,
+    trends_volume,
+    weekend_nutrition,
+)
+from api.server import ARROW_MEDIA_TYPE, code_version, make_app
+from data.cached_loaders import get_interactions_version, get_recipes_version
+from data.loaders import DataLoadError
+from serve_api import main
+
+
+def make_recipes(n: int = 800, seed: int = 0) -> pl.DataFrame:
+    """Recettes synthétiques : week-end plus protéiné, été plus sucré."""
+    rng = np.random.default_rng(seed)
+    is_weekend = rng.integers(0, 2, n)
+    season = rng.choice(["Winter", "Spring", "Summer", "Autumn"], n)
+    return pl.DataFrame(
+        {
+            "year": rng.integers(2000, 2010, n),
+            "is_weekend": is_weekend,
+            "season": season,
+            "calories": rng.gamma(2.0, 200.0, n),
+            "protein_pct": rng.normal(20, 5, n) + 5 * is_weekend,
+            "total_fat_pct": rng.normal(30, 5, n),
+            "sat_fat_pct": rng.normal(10, 3, n),
+            "sugar_pct": rng.normal(15, 5, n) + 10 * (season == "Summer"),
+            "sodium_pct": rng.normal(12, 4, n),
+        }
+    )
+
+
+def test_weekend_and_seasonality_results():
+    """Vérifie les tests semaine / week-end et par saison."""
+    with patch("api.results.get_recipes_clean", return_value=make_recipes()):
+        weekend = weekend_nutrition()
+        seasons = seasonality_nutrition()
+
+    tests = weekend.tables["tests"].to_pandas().set_index("variable")
+    assert tests.loc["protein_pct", "p_perm"] < 0.01
+    assert tests.loc["protein_pct", "ci_low"] > 0
+    assert tests.loc["calories", "p_perm"] > 0.01
+    assert weekend.statistics["n_weekday"] + weekend.statistics["n_weekend"] == 800
+
+    assert seasons.tables["means"]["season"].to_list() == [
+        "Winter",
+        "Spring",
+        "Summer",
+        "Autumn",
+    ]
+    assert seasons.tables["means"]["n_recipes"].sum() == 800
+    permutation = seasons.tables["permutation"].to_pandas().set_index("variable")
+    assert permutation.loc["sugar_pct", "p_value"] < 0.01
+
+
+def test_ratings_and_trends_results():
+    """Vérifie l'ANOVA des notes par saison et la tendance du volume."""
+    histograms = pl.DataFrame(
+        {
+            "season": ["Winter", "Summer", "Spring", "Autumn"],
+            **{f"count_{k}": [10, 5, 8, 9] for k in range(1, 5)},
+            "count_5": [100, 300, 120, 110],
+        }
+    )
+    with patch("api.results.get_rating_histograms", return_value=histograms):
+        ratings = ratings_seasonal()
+
+    seasons = ratings.tables["seasons"]
+    assert seasons["season"].to_list() == ["Spring", "Summer", "Autumn", "Winter"]
+    assert seasons["n_ratings"].to_list() == [152, 320, 146, 140]
+    assert ratings.statistics["anova"]["p_value"] < 0.05
+
+    years = np.repeat(np.arange(2000, 2012), np.arange(12) * 10 + 5)
+    with patch(
+        "visualization.analyse_trendlines_v2.load_and_prepare_data",
+        return_value=pl.DataFrame({"year": years}),
+    ):
+        trends = trends_volume()
+
+    assert trends.tables["per_year"].height == 12
+    assert trends.statistics["linear"]["slope"] == pytest.approx(10.0)
+    assert trends.statistics["mann_kendall"]["trend"] == "increasing"
+    assert "segments" in trends.tables
+
+
+def test_result_versions():
+    """Vérifie les entrées de chaque résultat et l'empreinte des interactions."""
+    assert RESULTS["weekend_nutrition"].versions == (get_recipes_version,)
+    assert RESULTS["ratings_seasonal"].versions == (get_interactions_version,)
+    spec = ResultSpec(MagicMock(), "Démo", (lambda: "a", lambda: "b"))
+    assert spec.dataset_version() == "a+b"
+
+    monthly = pl.DataFrame(
+        {"year": [2005, 2005], "month": [1, 2]}
+        | {f"count_{k}": [k, 2 * k] for k in range(1, 6)}
+    )
+    with patch("data.cached_loaders.get_rating_histograms", return_value=monthly):
+        version = get_interactions_version()
+    with patch(
+        "data.cached_loaders.get_rating_histograms",
+        return_value=monthly.with_columns(count_5=pl.lit(0)),
+    ):
+        assert get_interactions_version() != version
+    assert len(version) == 16
+
+    assert code_version() == code_version()
+    assert len(code_version()) == 16
+
+
+TABLES = {
+    "means": pl.DataFrame({"season": ["Winter", "Summer"], "mean": [1.5, np.nan]}),
+    "tests": pl.DataFrame({"variable": ["calories"], "p_value": [0.01]}),
+}
+
+
+class TestApiServer(AsyncHTTPTestCase):
+    """Routes HTTP de l'API, résultats et version des données simulés."""
+
+    def setUp(self):
+        self.compute = MagicMock(
+            return_value=AnalysisResult(TABLES, {"anova": {"F": np.float64(2.5)}})
+        )
+        self.version = MagicMock(return_value="abc123")
+        patch("api.server.get_recipes_version", self.version).start()
+        self.code = patch("api.server.code_version", return_value="code1").start()
+        patch.dict(
+            "api.server.RESULTS",
+            {"demo": ResultSpec(self.compute, "Démo", (self.version,))},
+            clear=True,
+        ).start()
+        self.addCleanup(patch.stopall)
+        super().setUp()
+
+    def get_app(self):
+        return make_app()
+
+    def test_index(self):
+        """Vérifie la liste des résultats et la version des données."""
+        response = self.fetch("/api/v1/results")
+        body = json.loads(response.body)
+        assert body["dataset_version"] == "abc123"
+        assert body["results"][0]["url"] == "/api/v1/results/demo"
+
+    def test_json_result_and_etag(self):
+        """Vérifie le JSON strict puis le 304 sans calcul."""
+        response = self.fetch("/api/v1/results/demo")
+        assert response.code == 200
+        body = json.loads(response.body)
+        assert body["tables"]["means"] == [
+            {"season": "Winter", "mean": 1.5},
+            {"season": "Summer", "mean": None},
+        ]
+        assert body["statistics"] == {"anova": {"F": 2.5}}
+        etag = response.headers["Etag"]
+
+        cached = self.fetch("/api/v1/results/demo", headers={"If-None-Match": etag})
+        assert cached.code == 304
+        assert self.compute.call_count == 1
+
+        self.version.return_value = "def456"
+        fresh = self.fetch("/api/v1/results/demo", headers={"If-None-Match": etag})
+        assert fresh.code == 200
+        assert fresh.headers["Etag"] != etag
+
+        # Nouveau déploiement : même version des données, autre code
+        etag = fresh.headers["Etag"]
+        self.code.return_value = "code2"
+        deployed = self.fetch("/api/v1/results/demo", headers={"If-None-Match": etag})
+        assert deployed.code == 200
+        assert deployed.headers["Etag"] != etag
+
+    def test_arrow_result(self):
+        """Vérifie le flux Arrow d'une table, par paramètre ou en-tête Accept."""
+        response = self.fetch("/api/v1/results/demo?format=arrow&table=tests")
+        assert response.headers["Content-Type"] == ARROW_MEDIA_TYPE
+        assert pl.read_ipc_stream(io.BytesIO(response.body)).equals(TABLES["tests"])
+
+        response = self.fetch(
+            "/api/v1/results/demo", headers={"Accept": ARROW_MEDIA_TYPE}
+        )
+        assert pl.read_ipc_stream(io.BytesIO(response.body)).equals(TABLES["means"])
+
+    def test_errors(self):
+        """Vérifie les erreurs 400, 404 et 503 en JSON."""
+        assert self.fetch("/api/v1/results/unknown").code == 404
+        assert self.fetch("/api/v1/results/demo?format=csv").code == 400
+        missing = self.fetch("/api/v1/results/demo?format=arrow&table=nope")
+        assert missing.code == 404
+        assert "means" in json.loads(missing.body)["error"]
+
+        self.compute.side_effect = DataLoadError("S3", "timeout")
+        assert self.fetch("/api/v1/results/demo").code == 503
+
+
+def test_main_exit_codes():
+    """Vérifie les codes de sortie de la ligne de commande."""
+    with patch("serve_api.asyncio.run", side_effect=KeyboardInterrupt) as run:
+        assert main(["--port", "9000"]) == 0
+        run.call_args[0][0].close()
+
+    with patch("serve_api.asyncio.run", side_effect=OSError("port occupé")) as run:
+        assert main([]) == 1
+        run.call_args[0][0].close()
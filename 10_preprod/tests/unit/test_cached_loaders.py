@@ -157,24 +157,23 @@ class TestCachedLoadersExceptions:
     - "exceptions.DataLoadError: Échec chargement depuis S3 (ratings)"
     """
 
-    @pytest.mark.skip(
-        reason="st.cache_data wrappe l'exception - test d'intégration complexe"
-    )
     @patch("mangetamain_data_utils.data_utils_recipes.load_recipes_clean")
     def test_get_recipes_raises_dataload_error_on_s3_failure(self, mock_load):
         """Vérifie que DataLoadError est levée si S3 échoue pour recipes.
 
-        NOTE: Test skippé car st.cache_data wrappe l'exception.
-        Les tracebacks montrent que DataLoadError est bien levée:
-        E   exceptions.DataLoadError: Échec chargement depuis S3 (recipes):
-            Échec chargement recettes: S3 bucket not accessible
+        Les recettes sont mémorisées par memory_cache, qui ne wrappe pas
+        l'exception (contrairement à st.cache_data).
         """
         mock_load.side_effect = Exception("S3 bucket not accessible")
         from data.cached_loaders import get_recipes_clean
-
-        get_recipes_clean.clear()
-
-        with pytest.raises(DataLoadError) as exc_info:
+        from data.loaders import DataLoadError
+
+        with (
+            patch(
+                "data.cached_loaders.get_recipes_manifest_hash", return_value="s3-down"
+            ),
+            pytest.raises(DataLoadError) as exc_info,
+        ):
             get_recipes_clean()
 
         assert exc_info.value.source == "S3 (recipes)"
@@ -235,3 +234,27 @@ class TestCachedLoadersExceptions:
         assert isinstance(error, DataLoadError)
         assert isinstance(error, MangetamainError)
         assert isinstance(error, Exception)
+
+
+def test_get_users_version():
+    """Vérifie que la version des tables utilisateurs suit les comptes mensuels."""
+    from datetime import date
+
+    from data.cached_loaders import get_users_version
+
+    monthly = pl.DataFrame(
+        {
+            "month": [date(2005, 1, 1), date(2005, 2, 1)],
+            "n_active_users": [10, 20],
+            "n_new_users": [10, 5],
+        }
+    )
+    with patch("data.cached_loaders.get_monthly_active_users", return_value=monthly):
+        version = get_users_version()
+        assert get_users_version() == version
+    with patch(
+        "data.cached_loaders.get_monthly_active_users",
+        return_value=monthly.with_columns(n_new_users=pl.lit(0)),
+    ):
+        assert get_users_version() != version
+    assert len(version) == 16
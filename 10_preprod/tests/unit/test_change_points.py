@@ -0,0 +1,118 @@
+"""Tests unitaires pour le module analysis.change_points.
+
+Vérifie l'optimalité de la segmentation PELT contre une programmation
+dynamique exhaustive et le résumé des segments.
+"""
+
+import sys
+from datetime import date
+from pathlib import Path
+import numpy as np
+import pytest
+
+# Ajout du chemin vers le module
+sys.path.insert(0, str(Path(__file__).parents[2] / "src" / "mangetamain_analytics"))
+
+from analysis.change_points import (
+    default_penalty,
+    detect_change_points,
+    pelt,
+    segments_frame,
+    series_version,
+)
+
+
+def segmentation_cost(x, ends, penalty):
+    """Coût pénalisé d'une segmentation donnée."""
+    starts = [0] + list(ends[:-1])
+    rss = sum(((x[s:e] - x[s:e].mean()) ** 2).sum() for s, e in zip(starts, ends))
+    return rss + penalty * (len(ends) - 1)
+
+
+def optimal_cost(x, penalty, min_size):
+    """Coût optimal par programmation dynamique exhaustive (O(n²))."""
+    n = len(x)
+    best = np.full(n + 1, np.inf)
+    best[0] = -penalty
+    for end in range(min_size, n + 1):
+        for start in [0] + list(range(min_size, end - min_size + 1)):
+            seg = x[start:end]
+            cost = best[start] + ((seg - seg.mean()) ** 2).sum() + penalty
+            best[end] = min(best[end], cost)
+    return best[n]
+
+
+@pytest.fixture
+def regime_series():
+    """Fixture : trois régimes de niveau bruités."""
+    rng = np.random.default_rng(1)
+    return np.concatenate(
+        [rng.normal(0, 1, 50), rng.normal(4, 1, 40), rng.normal(1, 1, 60)]
+    )
+
+
+def test_recovers_regimes(regime_series):
+    """Vérifie la détection des deux ruptures avec la pénalité par défaut."""
+    assert pelt(regime_series) == [50, 90, 150]
+
+
+@pytest.mark.parametrize("penalty,min_size", [(1.0, 2), (3.0, 3), (10.0, 5)])
+def test_exact_optimum(penalty, min_size):
+    """Vérifie que l'élagage conserve l'optimum exact."""
+    rng = np.random.default_rng(7)
+    x = rng.normal(size=40)
+    x[15:] += 2
+
+    ends = pelt(x, penalty=penalty, min_size=min_size)
+
+    assert segmentation_cost(x, ends, penalty) == pytest.approx(
+        optimal_cost(x, penalty, min_size)
+    )
+    lengths = np.diff([0] + ends)
+    assert lengths.min() >= min_size
+
+
+def test_short_series():
+    """Vérifie qu'une série trop courte forme un seul segment."""
+    assert pelt([1.0, 5.0, 1.0], min_size=2) == [3]
+
+
+def test_missing_values_rejected():
+    """Vérifie le refus des valeurs manquantes."""
+    with pytest.raises(ValueError):
+        pelt([1.0, np.nan] * 10)
+
+
+def test_default_penalty_constant_series():
+    """Vérifie une pénalité positive même sans variabilité."""
+    assert default_penalty(np.ones(20)) > 0
+    assert default_penalty(np.ones(1)) == 0.0
+
+
+def test_segments_frame_with_times():
+    """Vérifie bornes, effectifs et moyennes des segments."""
+    times = [date(2000, m, 1) for m in range(1, 7)]
+    segments = segments_frame([1, 1, 1, 4, 4, 4], [3, 6], times)
+
+    assert segments["segment"].to_list() == [1, 2]
+    assert segments["start"].to_list() == [date(2000, 1, 1), date(2000, 4, 1)]
+    assert segments["end"].to_list() == [date(2000, 3, 1), date(2000, 6, 1)]
+    assert segments["n_points"].to_list() == [3, 3]
+    assert segments["mean"].to_list() == [1.0, 4.0]
+
+
+def test_detect_change_points(regime_series):
+    """Vérifie la chaîne complète série → segments."""
+    segments = detect_change_points(regime_series, times=range(1000, 1150))
+
+    assert segments["start"].to_list() == [1000, 1050, 1090]
+    assert segments["mean"][1] == pytest.approx(4, abs=0.5)
+
+
+def test_series_version():
+    """Vérifie que l'empreinte suit le contenu des séries."""
+    a = np.arange(10.0)
+
+    assert series_version(a) == series_version(a.copy())
+    assert series_version(a) != series_version(a + 1)
+    assert len(series_version(a, a)) == 16
@@ -0,0 +1,101 @@
+"""Tests unitaires pour le module utils.chart_payload.
+
+Vérifie la réduction LTTB, le passage en WebGL, l'encodage en tableaux
+typés et la taille du JSON envoyé au navigateur.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+import pytest
+from plotly.subplots import make_subplots
+
+# Ajout du chemin vers le module
+sys.path.insert(0, str(Path(__file__).parents[2] / "src" / "mangetamain_analytics"))
+
+from utils.chart_payload import lean_figure, lttb_indices
+
+
+def test_lttb_keeps_endpoints_and_peaks():
+    """Vérifie les extrémités, le pic isolé et l'ordre des indices."""
+    x = np.arange(10_000, dtype=float)
+    y = np.sin(x / 100)
+    y[777] = 5.0
+
+    keep = lttb_indices(x, y, 100)
+
+    assert len(keep) == 100
+    assert keep[0] == 0 and keep[-1] == 9_999
+    assert 777 in keep
+    assert np.all(np.diff(keep) > 0)
+    assert list(lttb_indices(x[:10], y[:10], 50)) == list(range(10))
+
+    with pytest.raises(ValueError):
+        lttb_indices(x, y[:10], 100)
+
+
+def test_lean_figure_downsamples_lines_to_webgl():
+    """Vérifie la réduction d'une courbe datée, le WebGL et la taille du JSON."""
+    n = 50_000
+    dates = pd.date_range("2000-01-01", periods=n, freq="h")
+    values = np.cos(np.arange(n) / 300)
+    fig = make_subplots(rows=1, cols=2)
+    fig.add_trace(
+        go.Scatter(x=dates, y=values.tolist(), mode="lines", line_shape="spline"),
+        row=1,
+        col=2,
+    )
+    before = len(pio.to_json(fig))
+
+    lean_figure(fig, max_points=1_000)
+
+    trace = fig.data[0]
+    assert trace.type == "scattergl"
+    assert trace.xaxis == "x2"
+    assert len(trace.x) == len(trace.y) == 1_000
+    assert trace.x[0] == dates[0] and trace.x[-1] == dates[-1]
+    assert '"bdata"' in pio.to_json(fig)
+    assert len(pio.to_json(fig)) * 10 < before
+
+
+def test_lean_figure_markers_keep_point_attributes_aligned():
+    """Vérifie que textes et tailles suivent les points d'un nuage réduit."""
+    rng = np.random.default_rng(0)
+    x = rng.random(5_000)
+    y = rng.random(5_000)
+    fig = go.Figure(
+        go.Scatter(
+            x=x,
+            y=y,
+            mode="markers",
+            text=[f"{v:.6f}" for v in y],
+            marker=dict(size=(y * 10).tolist(), color="orange"),
+        )
+    )
+
+    lean_figure(fig, max_points=500)
+
+    trace = fig.data[0]
+    assert len(trace.x) == 500
+    assert [float(v) for v in trace.text] == pytest.approx(list(trace.y), abs=1e-6)
+    assert np.allclose(trace.marker.size, np.asarray(trace.y) * 10)
+    assert trace.marker.color == "orange"
+
+
+def test_lean_figure_leaves_small_and_filled_traces():
+    """Vérifie que bandes remplies, courbes non triées et barres gardent leurs points."""
+    n = 3_000
+    band = go.Scatter(x=list(range(n)), y=[1.0] * n, fill="toself")
+    unsorted = go.Scatter(x=np.arange(n)[::-1], y=np.arange(n), mode="lines")
+    bars = go.Bar(x=["a", "b"], y=[1_000_000, 2])
+    fig = go.Figure([band, unsorted, bars])
+
+    lean_figure(fig, max_points=100)
+
+    assert [len(trace.x) for trace in fig.data] == [n, n, 2]
+    assert [trace.type for trace in fig.data] == ["scattergl", "scattergl", "bar"]
+    assert fig.data[2].y.dtype == np.int32
@@ -0,0 +1,58 @@
+"""Tests unitaires pour le module analysis.concentration.
+
+Vérifie la courbe de Lorenz, le coefficient de Gini et la part du top.
+"""
+
+import sys
+from pathlib import Path
+import numpy as np
+import pytest
+
+# Ajout du chemin vers le module
+sys.path.insert(0, str(Path(__file__).parents[2] / "src" / "mangetamain_analytics"))
+
+from analysis.concentration import gini, lorenz_curve, top_share
+
+
+def test_lorenz_curve():
+    """Vérifie les extrémités et les parts cumulées triées."""
+    population, share = lorenz_curve([3, 1, 0, 4])
+
+    np.testing.assert_allclose(population, [0, 0.25, 0.5, 0.75, 1])
+    np.testing.assert_allclose(share, [0, 0, 0.125, 0.5, 1])
+
+
+def test_lorenz_curve_downsampled():
+    """Vérifie le sous-échantillonnage pour l'affichage."""
+    values = np.random.default_rng(0).pareto(1.5, size=10_000)
+
+    population, share = lorenz_curve(values, n_points=100)
+
+    assert len(population) == 101
+    assert population[0] == 0 and population[-1] == 1
+    assert share[-1] == pytest.approx(1)
+    assert (np.diff(share) >= 0).all()
+
+
+def test_gini():
+    """Vérifie Gini : 0 pour l'égalité, (n-1)/n pour un seul actif."""
+    assert gini([5, 5, 5, 5]) == pytest.approx(0)
+    assert gini([0, 0, 0, 10]) == pytest.approx(0.75)
+
+    values = np.random.default_rng(1).integers(1, 100, size=500)
+    mean_abs_diff = np.abs(values[:, None] - values[None, :]).mean()
+    assert gini(values) == pytest.approx(mean_abs_diff / (2 * values.mean()))
+
+
+def test_top_share():
+    """Vérifie la part des plus actifs et les entrées invalides."""
+    values = [1] * 99 + [101]
+
+    assert top_share(values, 0.01) == pytest.approx(0.505)
+    assert top_share(values, 1) == pytest.approx(1)
+    with pytest.raises(ValueError):
+        top_share(values, 0)
+    with pytest.raises(ValueError):
+        gini([])
+    with pytest.raises(ValueError):
+        lorenz_curve([0, 0])
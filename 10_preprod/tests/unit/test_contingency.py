@@ -0,0 +1,106 @@
+"""Tests unitaires pour le module analysis.contingency.
+
+Vérifie le Chi-2 vectorisé sur des tables présence/absence (2 × 2 et 4 × 2)
+contre scipy, et la correction de Benjamini-Hochberg.
+"""
+
+import sys
+from pathlib import Path
+import numpy as np
+import polars as pl
+import pytest
+from scipy.stats import chi2_contingency
+from statsmodels.stats.multitest import multipletests
+
+# Ajout du chemin vers le module
+sys.path.insert(0, str(Path(__file__).parents[2] / "src" / "mangetamain_analytics"))
+
+from analysis.contingency import benjamini_hochberg, presence_chi2, presence_tests
+
+
+def scipy_reference(counts, totals):
+    """Chi-2 ligne à ligne via scipy (référence de la boucle historique)."""
+    results = []
+    for row in counts:
+        table = [[c, n - c] for c, n in zip(row, totals)]
+        stat, p_value, _, _ = chi2_contingency(table)
+        results.append((stat, p_value))
+    return np.array(results)
+
+
+@pytest.mark.parametrize(
+    "totals",
+    [[5000, 2000], [1200, 900, 1500, 1100]],
+    ids=["weekend_2x2", "seasons_4x2"],
+)
+def test_presence_chi2_matches_scipy(totals):
+    """Vérifie l'égalité avec chi2_contingency (Yates inclus en 2 × 2)."""
+    rng = np.random.default_rng(0)
+    counts = np.column_stack([rng.integers(1, n // 3, size=200) for n in totals])
+
+    stat, p_values = presence_chi2(counts, totals)
+
+    expected = scipy_reference(counts, totals)
+    np.testing.assert_allclose(stat, expected[:, 0], rtol=1e-10)
+    np.testing.assert_allclose(p_values, expected[:, 1], rtol=1e-8, atol=1e-300)
+
+
+def test_presence_chi2_without_correction():
+    """Vérifie le Chi-2 de Pearson sans correction de continuité."""
+    stat, _ = presence_chi2([[30, 10]], [100, 100], correction=False)
+
+    reference, _, _, _ = chi2_contingency([[30, 70], [10, 90]], correction=False)
+    assert stat[0] == pytest.approx(reference)
+
+
+def test_presence_chi2_degenerate_tables():
+    """Vérifie NaN pour un terme absent, omniprésent ou un groupe vide."""
+    stat, p_values = presence_chi2([[0, 0], [100, 50], [5, 0]], [100, 50])
+    assert np.isnan(stat[:2]).all()
+    assert np.isnan(p_values[:2]).all()
+    assert not np.isnan(stat[2])
+
+    stat, _ = presence_chi2([[3, 0]], [10, 0])
+    assert np.isnan(stat[0])
+
+
+def test_presence_chi2_shape_mismatch():
+    """Vérifie le refus d'effectifs incompatibles avec les groupes."""
+    with pytest.raises(ValueError):
+        presence_chi2([[1, 2, 3]], [10, 10])
+
+
+def test_benjamini_hochberg_matches_statsmodels():
+    """Vérifie les q-values contre statsmodels (fdr_bh)."""
+    p_values = np.random.default_rng(1).uniform(size=500) ** 3
+
+    _, reference, _, _ = multipletests(p_values, method="fdr_bh")
+
+    np.testing.assert_allclose(benjamini_hochberg(p_values), reference)
+
+
+def test_benjamini_hochberg_ignores_nan():
+    """Vérifie que les tests manquants ne comptent pas dans la correction."""
+    q = benjamini_hochberg([0.01, np.nan, 0.04])
+
+    assert np.isnan(q[1])
+    np.testing.assert_allclose(q[[0, 2]], [0.02, 0.04])
+    assert np.isnan(benjamini_hochberg([np.nan])).all()
+
+
+def test_presence_tests_columns():
+    """Vérifie l'ajout de chi2, p_value et q_value à une table terme × groupe."""
+    frequencies = pl.DataFrame(
+        {
+            "tag": ["a", "b", "c"],
+            "count_Weekday": [500, 50, 0],
+            "count_Weekend": [100, 20, 0],
+        }
+    )
+
+    result = presence_tests(frequencies, {"Weekday": 1000, "Weekend": 400})
+
+    assert result.columns[-3:] == ["chi2", "p_value", "q_value"]
+    assert result["p_value"][0] < 1e-10
+    assert np.isnan(result["p_value"][2])
+    assert (result["q_value"].drop_nans() >= result["p_value"].drop_nans()).all()
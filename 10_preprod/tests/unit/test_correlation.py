@@ -0,0 +1,80 @@
+"""Tests unitaires pour le module analysis.correlation.
+
+Vérifie les matrices de corrélation pondérées contre scipy (poids égaux) et
+contre le calcul par paire via np.cov (poids quelconques).
+"""
+
+import sys
+from pathlib import Path
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.stats import kendalltau, pearsonr, spearmanr
+
+# Ajout du chemin vers le module
+sys.path.insert(0, str(Path(__file__).parents[2] / "src" / "mangetamain_analytics"))
+
+import analysis.correlation as correlation
+from analysis.correlation import weighted_correlation
+
+
+@pytest.fixture
+def data():
+    """Fixture : 4 variables dont une discrète (ex-aequo), poids aléatoires."""
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(150, 4))
+    values[:, 2] = values[:, 0] + rng.normal(scale=0.5, size=150)
+    values[:, 3] = np.round(2 * values[:, 1] + rng.normal(size=150))
+    return values, rng.random(150) + 0.1
+
+
+@pytest.mark.parametrize(
+    "method, reference",
+    [("pearson", pearsonr), ("spearman", spearmanr), ("kendall", kendalltau)],
+)
+def test_unweighted_matches_scipy(data, method, reference):
+    """Vérifie chaque paire contre scipy à poids égaux."""
+    values, _ = data
+
+    matrix = weighted_correlation(values, method=method)
+
+    for i in range(4):
+        for j in range(4):
+            expected = reference(values[:, i], values[:, j]).statistic
+            assert matrix[i, j] == pytest.approx(expected, rel=1e-9)
+
+
+def test_weighted_spearman_matches_pairwise_cov(data):
+    """Vérifie Spearman pondéré contre les rangs moyens et np.cov(aweights)."""
+    values, weights = data
+    ranks = pd.DataFrame(values).rank(method="average").to_numpy()
+
+    matrix = weighted_correlation(values, weights)
+
+    cov = np.cov(ranks[:, 1], ranks[:, 3], aweights=weights)
+    expected = cov[0, 1] / np.sqrt(cov[0, 0] * cov[1, 1])
+    assert matrix[1, 3] == pytest.approx(expected, rel=1e-9)
+    assert np.allclose(matrix, matrix.T)
+    assert np.allclose(np.diag(matrix), 1.0)
+
+
+def test_weighted_kendall_blocks(data, monkeypatch):
+    """Vérifie que le découpage en blocs de lignes ne change pas le résultat."""
+    values, weights = data
+    full = weighted_correlation(values, weights, "kendall")
+
+    monkeypatch.setattr(correlation, "_KENDALL_PAIR_BUDGET", 1000)
+    blocked = weighted_correlation(values, weights, "kendall")
+
+    np.testing.assert_allclose(blocked, full, rtol=1e-12)
+
+
+def test_weighted_correlation_validation():
+    """Vérifie les erreurs : méthode, dimensions, poids."""
+    values = np.arange(10.0).reshape(5, 2)
+    with pytest.raises(ValueError, match="Méthode inconnue"):
+        weighted_correlation(values, method="distance")
+    with pytest.raises(ValueError, match="poids"):
+        weighted_correlation(values, np.ones(4))
+    with pytest.raises(ValueError, match="positifs"):
+        weighted_correlation(values, -np.ones(5))
@@ -0,0 +1,97 @@
+"""Tests unitaires pour les modules analysis.decomposition et analysis.time_series.
+
+Vérifie la décomposition STL des séries mensuelles et la construction de
+séries mensuelles complètes.
+"""
+
+import sys
+from datetime import date
+from pathlib import Path
+import numpy as np
+import polars as pl
+import pytest
+
+# Ajout du chemin vers le module
+sys.path.insert(0, str(Path(__file__).parents[2] / "src" / "mangetamain_analytics"))
+
+from analysis.decomposition import (
+    seasonal_amplitude_by_year,
+    seasonal_strength,
+    stl_decompose,
+)
+from analysis.time_series import complete_months, monthly_counts
+
+
+def month_starts(n, start_year=2000):
+    """Premiers jours de n mois consécutifs."""
+    return [date(start_year + i // 12, i % 12 + 1, 1) for i in range(n)]
+
+
+@pytest.fixture
+def seasonal_series():
+    """Fixture : 5 ans de tendance linéaire + cycle annuel croissant, pic en juillet."""
+    months = np.arange(60)
+    amplitude = 10 + 2 * (months // 12)
+    values = 100 + months + amplitude * np.cos(2 * np.pi * (months - 6) / 12)
+    return values, month_starts(60)
+
+
+def test_stl_components_sum_to_observed(seasonal_series):
+    """Vérifie observé = tendance + saisonnalité + résidu."""
+    values, times = seasonal_series
+    components = stl_decompose(values, times)
+
+    assert components.columns == ["time", "observed", "trend", "seasonal", "resid"]
+    total = components["trend"] + components["seasonal"] + components["resid"]
+    np.testing.assert_allclose(total.to_numpy(), values)
+    assert components["time"][0] == date(2000, 1, 1)
+
+
+def test_stl_too_short():
+    """Vérifie le refus d'une série de moins de deux périodes."""
+    with pytest.raises(ValueError):
+        stl_decompose(np.ones(20))
+
+
+def test_seasonal_strength(seasonal_series):
+    """Vérifie une force proche de 1 pour un cycle pur, 0 sans cycle."""
+    values, times = seasonal_series
+
+    assert seasonal_strength(stl_decompose(values, times)) > 0.9
+    flat = stl_decompose(np.full(60, 5.0), times)
+    assert seasonal_strength(flat) == 0.0
+
+
+def test_seasonal_amplitude_by_year(seasonal_series):
+    """Vérifie le pic en juillet et l'amplitude croissante d'année en année."""
+    values, times = seasonal_series
+    # Dernière année incomplète : exclue
+    components = stl_decompose(values[:54], times[:54])
+
+    amplitude = seasonal_amplitude_by_year(components)
+
+    assert amplitude["year"].to_list() == [2000, 2001, 2002, 2003]
+    assert set(amplitude["peak_month"]) == {7}
+    assert amplitude["amplitude"][-1] > amplitude["amplitude"][0]
+    assert amplitude["relative_amplitude"][0] == pytest.approx(
+        amplitude["amplitude"][0] / components["trend"][:12].mean() * 100
+    )
+
+
+def test_monthly_counts_fills_empty_months():
+    """Vérifie le comptage mensuel avec mois vides à 0."""
+    df = pl.DataFrame(
+        {"submitted": [date(2000, 1, 5), date(2000, 1, 20), date(2000, 3, 2), None]}
+    )
+
+    counts = monthly_counts(df, "submitted", "n_recipes")
+
+    assert counts["period"].to_list() == month_starts(3)
+    assert counts["n_recipes"].to_list() == [2, 0, 1]
+
+
+def test_complete_months_empty():
+    """Vérifie qu'une série vide reste vide."""
+    empty = pl.DataFrame(schema={"period": pl.Date, "n": pl.UInt32})
+
+    assert complete_months(empty).is_empty()
@@ -0,0 +1,167 @@
+"""Tests unitaires pour le module utils.figure_cache.
+
+Vérifie les clés (analyse, paramètres, version), la relecture des figures
+sérialisées, la traduction des libellés différés et l'éviction LRU bornée en
+octets.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+import numpy as np
+import plotly.graph_objects as go
+import pytest
+
+# Ajout du chemin vers le module
+sys.path.insert(0, str(Path(__file__).parents[2] / "src" / "mangetamain_analytics"))
+
+from utils.figure_cache import (
+    FigureCache,
+    cached_figure,
+    deserialize_figure,
+    figure_key,
+    figure_stats,
+    serialize_figure,
+)
+from utils.i18n_helper import t
+
+
+def make_figure(n: int = 10, title: str = "test") -> go.Figure:
+    """Figure simple de n points."""
+    return go.Figure(
+        go.Scatter(x=list(range(n)), y=[i * 1.5 for i in range(n)]),
+        layout=dict(title=title),
+    )
+
+
+@pytest.fixture(autouse=True)
+def shared_cache():
+    """Fixture : cache partagé vierge pour chaque test."""
+    FigureCache.reset_shared()
+    yield FigureCache.shared()
+    FigureCache.reset_shared()
+
+
+def test_figure_key_ignores_param_order():
+    """Vérifie que l'ordre des paramètres ne change pas la clé."""
+    assert figure_key("a", "v1", x=1, y=2) == figure_key("a", "v1", y=2, x=1)
+    assert figure_key("a", "v1", x=1) != figure_key("a", "v1", x=2)
+    assert figure_key("a", "v1") != figure_key("a", "v2")
+
+
+def test_put_get_roundtrip():
+    """Vérifie qu'une figure relue est identique à la figure mémorisée."""
+    cache = FigureCache()
+    fig = make_figure(title="Calories")
+
+    size = cache.put(("a",), serialize_figure(fig))
+    restored = deserialize_figure(cache.get(("a",)), "fr")
+
+    assert size > 0
+    assert restored.to_dict() == fig.to_dict()
+    assert cache.get(("b",)) is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_eviction_least_recently_used():
+    """Vérifie l'éviction de l'entrée la moins récemment lue."""
+    payload = serialize_figure(make_figure())
+    cache = FigureCache(max_bytes=int(len(payload) * 2.5))
+
+    cache.put(("a",), payload)
+    cache.put(("b",), payload)
+    cache.get(("a",))
+    cache.put(("c",), payload)
+
+    assert cache.get(("b",)) is None
+    assert cache.get(("a",)) is not None
+    assert cache.get(("c",)) is not None
+    assert cache.stats()["bytes"] <= cache.max_bytes
+
+
+def test_oversized_figure_not_stored():
+    """Vérifie qu'une figure plus grande que la limite n'est pas mémorisée."""
+    cache = FigureCache(max_bytes=10)
+
+    cache.put(("a",), serialize_figure(make_figure()))
+
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["bytes"] == 0
+
+
+def test_replace_and_clear():
+    """Vérifie le remplacement d'une clé et le vidage du cache."""
+    cache = FigureCache()
+    cache.put(("a",), serialize_figure(make_figure(n=5)))
+    cache.put(("a",), serialize_figure(make_figure(n=50)))
+
+    assert cache.stats()["entries"] == 1
+    assert len(deserialize_figure(cache.get(("a",)), "fr").data[0].x) == 50
+
+    cache.clear()
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["bytes"] == 0
+
+
+@patch("utils.figure_cache.get_current_language")
+def test_cached_figure_builds_once_per_key(mock_language):
+    """Vérifie que build n'est appelé qu'une fois par (paramètres, version)."""
+    mock_language.return_value = "fr"
+    build = MagicMock(side_effect=lambda top_n: make_figure(n=top_n))
+
+    first = cached_figure("trends", "v1", build, top_n=5)
+    second = cached_figure("trends", "v1", build, top_n=5)
+    assert build.call_count == 1
+    assert second.to_dict() == first.to_dict()
+
+    cached_figure("trends", "v1", build, top_n=8)
+    cached_figure("trends", "v2", build, top_n=5)
+    assert build.call_count == 3
+
+
+@patch("utils.figure_cache.get_current_language")
+def test_cached_figure_relabels_without_rebuild(mock_language):
+    """Vérifie qu'un changement de langue traduit les libellés sans recalcul."""
+
+    def build_figure(top_n):
+        fig = make_figure(n=top_n)
+        fig.update_layout(
+            title=t("ingredients_most_frequent", category="trends").format(n=top_n)
+        )
+        fig.update_xaxes(title_text=t("axis_year"))
+        return fig
+
+    build = MagicMock(side_effect=build_figure)
+
+    mock_language.return_value = "fr"
+    fig_fr = cached_figure("trends", "v1", build, top_n=7)
+    mock_language.return_value = "en"
+    fig_en = cached_figure("trends", "v1", build, top_n=7)
+
+    assert build.call_count == 1
+    assert fig_fr.layout.xaxis.title.text == "Année"
+    assert fig_fr.layout.title.text == "Top 7 ingrédients les plus fréquents"
+    assert fig_en.layout.xaxis.title.text == "Year"
+    assert fig_en.layout.title.text == "Top 7 most frequent ingredients"
+
+
+@patch("utils.figure_cache.get_current_language")
+def test_figure_stats_cached_with_figure(mock_language):
+    """Vérifie que les statistiques de layout.meta suivent la figure en cache."""
+    mock_language.return_value = "fr"
+
+    def build_figure():
+        fig = make_figure()
+        fig.update_layout(meta=dict(slope=np.float64(-0.25), r2=np.nan, n=[3, 4]))
+        return fig
+
+    build = MagicMock(side_effect=build_figure)
+    cached_figure("trends", "v1", build)
+    stats = figure_stats(cached_figure("trends", "v1", build))
+
+    assert build.call_count == 1
+    assert stats["slope"] == -0.25
+    assert np.isnan(stats["r2"])
+    assert stats["n"] == [3, 4]
+    assert figure_stats(make_figure()) == {}
@@ -0,0 +1,55 @@
+"""Tests unitaires pour les libellés différés de utils.i18n_helper.
+
+Vérifie que t() produit des jetons indépendants de la langue dans
+deferred_labels() et que localize_labels() les traduit.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Ajout du chemin vers le module
+sys.path.insert(0, str(Path(__file__).parents[2] / "src" / "mangetamain_analytics"))
+
+from utils.i18n_helper import deferred_labels, localize_labels, t, translate_list
+
+
+def test_deferred_labels_return_tokens():
+    """Vérifie les jetons produits par t() et translate_list()."""
+    with deferred_labels():
+        assert t("axis_year") == "[[common.axis_year]]"
+        assert translate_list(["autumn"], "seasons") == ["[[seasons.autumn]]"]
+        assert t("missing_key") == "[common.missing_key]"
+
+    assert "[[" not in t("axis_year")
+
+
+def test_deferred_label_keeps_format_fields():
+    """Vérifie qu'un .format() appliqué au jeton est conservé."""
+    with deferred_labels():
+        token = t("ingredients_most_frequent", category="trends").format(n=12)
+        direct = t("ingredients_most_frequent", category="trends", n=12)
+
+    assert token == direct == "[[trends.ingredients_most_frequent|n=12]]"
+    assert localize_labels(token, "en") == "Top 12 most frequent ingredients"
+    assert localize_labels(token, "fr") == "Top 12 ingrédients les plus fréquents"
+
+
+def test_deferred_label_keeps_format_spec():
+    """Vérifie que la spécification de format ({r2:.4f}) est appliquée."""
+    with deferred_labels():
+        token = t("legend_regression_wls", category="weekend").format(r2=0.123456789)
+
+    assert token == "[[weekend.legend_regression_wls|r2=0.1235]]"
+    assert localize_labels(token, "en") == "WLS Regression (R²=0.1235)"
+    assert localize_labels(token, "fr") == "Régression WLS (R²=0.1235)"
+
+
+def test_localize_labels_json_escape():
+    """Vérifie la traduction des jetons dans un JSON sérialisé."""
+    with deferred_labels():
+        payload = json.dumps({"title": f"{t('axis_year')} 2018"})
+
+    assert json.loads(localize_labels(payload, "fr", json_escape=True)) == {
+        "title": "Année 2018"
+    }
@@ -0,0 +1,84 @@
+"""Budget de temps d'import de l'application (démarrage à froid).
+
+Importe main.py dans un processus neuf avec ``python -X importtime`` et
+vérifie que les dépendances lourdes des pages d'analyse ne sont pas chargées
+au démarrage, et que l'import complet reste sous le budget.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).parents[2] / "src"
+APP_DIR = SRC_DIR / "mangetamain_analytics"
+
+# Budget d'import de main.py (secondes, streamlit compris) ; ~0,5 s mesuré
+# avec les imports différés contre ~2,6 s auparavant
+STARTUP_BUDGET_S = 2.0
+
+# Dépendances réservées aux pages d'analyse, importées à leur ouverture
+HEAVY_MODULES = (
+    "pandas",
+    "polars",
+    "pyarrow",
+    "scipy",
+    "statsmodels",
+    "matplotlib",
+    "duckdb",
+    "plotly.express",
+    "plotly.subplots",
+    "mangetamain_data_utils",
+)
+
+
+def import_profile(module: str, cwd: Path) -> dict[str, int]:
+    """
+    Profil d'import d'un module dans un processus neuf.
+
+    Args:
+        module: Module importé
+        cwd: Répertoire de travail (main.py y crée logs/)
+
+    Returns:
+        Dict {module importé: temps cumulé (µs)}
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([str(SRC_DIR), str(APP_DIR)])
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        profile[name.strip()] = int(cumulative)
+    return profile
+
+
+def test_main_does_not_import_heavy_modules(tmp_path):
+    """Vérifie que les dépendances lourdes sont chargées à la demande."""
+    profile = import_profile("main", tmp_path)
+
+    loaded = [
+        name
+        for name in profile
+        if any(name == m or name.startswith(m + ".") for m in HEAVY_MODULES)
+    ]
+    assert not loaded, f"Importés au démarrage : {sorted(loaded)[:10]}"
+    assert not any(name.startswith("visualization.") for name in profile)
+
+
+def test_main_import_within_budget(tmp_path):
+    """Vérifie le temps d'import de main.py."""
+    profile = import_profile("main", tmp_path)
+
+    assert profile["main"] / 1e6 < STARTUP_BUDGET_S
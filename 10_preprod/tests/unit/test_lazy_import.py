@@ -0,0 +1,32 @@
+"""Tests unitaires pour le module utils.lazy_import.
+
+Vérifie qu'une fonction différée n'importe son module qu'au premier appel.
+"""
+
+import sys
+from pathlib import Path
+
+# Ajout du chemin vers le module
+sys.path.insert(0, str(Path(__file__).parents[2] / "src" / "mangetamain_analytics"))
+
+from utils.lazy_import import lazy_function
+
+
+def test_lazy_function_imports_on_first_call(tmp_path, monkeypatch):
+    """Vérifie l'import au premier appel et la délégation des arguments."""
+    (tmp_path / "lazy_page_module.py").write_text(
+        "CALLS = []\n"
+        "def render(n, label='x'):\n"
+        "    CALLS.append((n, label))\n"
+        "    return n * 2\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "lazy_page_module", raising=False)
+
+    render = lazy_function("lazy_page_module", "render")
+    assert render.__name__ == "render"
+    assert "lazy_page_module" not in sys.modules
+
+    assert render(3, label="y") == 6
+    assert render(1) == 2
+    assert sys.modules["lazy_page_module"].CALLS == [(3, "y"), (1, "x")]
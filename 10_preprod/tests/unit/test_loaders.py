@@ -158,6 +158,189 @@ class TestDataLoaderRatings:
             assert "Module introuvable" in exc_info.value.detail
 
 
+class TestDataLoaderPairings:
+    """Tests pour le chargement des associations d'ingrédients."""
+
+    @patch("mangetamain_data_utils.data_utils_pairings.load_ingredient_pairs")
+    def test_load_ingredient_pairs_success(self, mock_load, loader):
+        """Vérifie que load_ingredient_pairs retourne les arêtes précalculées."""
+        mock_load.return_value = pl.DataFrame(
+            {"ingredient": ["egg", "milk"], "neighbor": ["milk", "egg"]}
+        )
+
+        result = loader.load_ingredient_pairs()
+
+        assert len(result) == 2
+        mock_load.assert_called_once()
+
+    @patch("mangetamain_data_utils.data_utils_pairings.load_ingredient_pairs")
+    def test_load_ingredient_pairs_raises_dataload_error_on_s3_failure(
+        self, mock_load, loader
+    ):
+        """Vérifie que DataLoadError est levée si S3 échoue."""
+        mock_load.side_effect = Exception("File not found")
+
+        with pytest.raises(DataLoadError) as exc_info:
+            loader.load_ingredient_pairs()
+
+        assert exc_info.value.source == "S3 (pairings)"
+        assert "File not found" in str(exc_info.value)
+
+    def test_load_ingredient_pairs_raises_dataload_error_on_import_error(self, loader):
+        """Vérifie que DataLoadError est levée si le module est introuvable."""
+        with patch("builtins.__import__", side_effect=ImportError("Module not found")):
+            with pytest.raises(DataLoadError) as exc_info:
+                loader.load_ingredient_pairs()
+
+            assert exc_info.value.source == "module mangetamain_data_utils"
+
+
+class TestDataLoaderVocabulary:
+    """Tests pour le chargement des vocabulaires ingrédients / tags."""
+
+    @patch("mangetamain_data_utils.data_utils_recipes.load_vocabulary")
+    def test_load_vocabulary_success(self, mock_load, loader):
+        """Vérifie que load_vocabulary retourne le vocabulaire demandé."""
+        mock_load.return_value = pl.DataFrame({"id": [0, 1], "term": ["a", "b"]})
+
+        result = loader.load_vocabulary("tags")
+
+        assert len(result) == 2
+        mock_load.assert_called_once_with("tags")
+
+    @patch("mangetamain_data_utils.data_utils_recipes.load_vocabulary")
+    def test_load_vocabulary_raises_dataload_error_on_s3_failure(
+        self, mock_load, loader
+    ):
+        """Vérifie que DataLoadError est levée si S3 échoue."""
+        mock_load.side_effect = Exception("File not found")
+
+        with pytest.raises(DataLoadError) as exc_info:
+            loader.load_vocabulary("ingredients")
+
+        assert exc_info.value.source == "S3 (vocab ingredients)"
+
+    def test_load_vocabulary_raises_dataload_error_on_import_error(self, loader):
+        """Vérifie que DataLoadError est levée si le module est introuvable."""
+        with patch("builtins.__import__", side_effect=ImportError("Module not found")):
+            with pytest.raises(DataLoadError) as exc_info:
+                loader.load_vocabulary("tags")
+
+            assert exc_info.value.source == "module mangetamain_data_utils"
+
+
+class TestDataLoaderDailyCounts:
+    """Tests pour le chargement des comptages quotidiens."""
+
+    @patch("mangetamain_data_utils.data_utils_daily.load_daily_counts")
+    def test_load_daily_counts_success(self, mock_load, loader):
+        """Vérifie que load_daily_counts transmet l'année demandée."""
+        mock_load.return_value = pl.DataFrame({"year": [2009, 2009]})
+
+        result = loader.load_daily_counts(2009)
+
+        assert len(result) == 2
+        mock_load.assert_called_once_with(2009)
+
+    @patch("mangetamain_data_utils.data_utils_daily.load_daily_counts")
+    def test_load_daily_counts_raises_dataload_error_on_s3_failure(
+        self, mock_load, loader
+    ):
+        """Vérifie que DataLoadError est levée si S3 échoue."""
+        mock_load.side_effect = Exception("File not found")
+
+        with pytest.raises(DataLoadError) as exc_info:
+            loader.load_daily_counts()
+
+        assert exc_info.value.source == "S3 (daily counts)"
+
+    def test_load_daily_counts_raises_dataload_error_on_import_error(self, loader):
+        """Vérifie que DataLoadError est levée si le module est introuvable."""
+        with patch("builtins.__import__", side_effect=ImportError("Module not found")):
+            with pytest.raises(DataLoadError) as exc_info:
+                loader.load_daily_counts()
+
+            assert exc_info.value.source == "module mangetamain_data_utils"
+
+
+class TestDataLoaderCleanInteractions:
+    """Tests pour le chargement des interactions nettoyées."""
+
+    @patch("mangetamain_data_utils.data_utils_ratings.load_clean_interactions")
+    def test_load_clean_interactions_success(self, mock_load, loader):
+        """Vérifie que load_clean_interactions retourne les interactions."""
+        mock_load.return_value = pl.DataFrame({"rating": [4, 5, 3]})
+
+        result = loader.load_clean_interactions()
+
+        assert len(result) == 3
+        mock_load.assert_called_once()
+
+    @patch("mangetamain_data_utils.data_utils_ratings.load_clean_interactions")
+    def test_load_clean_interactions_raises_dataload_error_on_s3_failure(
+        self, mock_load, loader
+    ):
+        """Vérifie que DataLoadError est levée si S3 échoue."""
+        mock_load.side_effect = Exception("File not found")
+
+        with pytest.raises(DataLoadError) as exc_info:
+            loader.load_clean_interactions()
+
+        assert exc_info.value.source == "S3 (interactions)"
+
+
+class TestDataLoaderUsers:
+    """Tests pour le chargement des tables d'activité des utilisateurs."""
+
+    @patch("mangetamain_data_utils.data_utils_users.load_user_stats")
+    def test_load_user_stats_success(self, mock_load, loader):
+        """Vérifie que load_user_stats retourne la table par utilisateur."""
+        mock_load.return_value = pl.DataFrame({"user_id": [1, 2]})
+
+        result = loader.load_user_stats()
+
+        assert len(result) == 2
+        mock_load.assert_called_once()
+
+    @patch("mangetamain_data_utils.data_utils_users.load_monthly_active_users")
+    def test_load_monthly_active_users_raises_dataload_error_on_s3_failure(
+        self, mock_load, loader
+    ):
+        """Vérifie que DataLoadError est levée si S3 échoue."""
+        mock_load.side_effect = Exception("File not found")
+
+        with pytest.raises(DataLoadError) as exc_info:
+            loader.load_monthly_active_users()
+
+        assert exc_info.value.source == "S3 (monthly active users)"
+
+
+class TestDataLoaderRecipeStats:
+    """Tests pour le chargement de la table par recette."""
+
+    @patch("mangetamain_data_utils.data_utils_recipe_stats.load_recipe_stats")
+    def test_load_recipe_stats_forwards_top_k(self, mock_load, loader):
+        """Vérifie que le classement top-k est transmis à l'ETL."""
+        mock_load.return_value = pl.DataFrame({"recipe_id": [1, 2]})
+
+        result = loader.load_recipe_stats("mean_rating", k=2, min_interactions=10)
+
+        assert len(result) == 2
+        mock_load.assert_called_once_with("mean_rating", 2, 10)
+
+    @patch("mangetamain_data_utils.data_utils_recipe_stats.load_recipe_stats")
+    def test_load_recipe_stats_raises_dataload_error_on_s3_failure(
+        self, mock_load, loader
+    ):
+        """Vérifie que DataLoadError est levée si S3 échoue."""
+        mock_load.side_effect = Exception("File not found")
+
+        with pytest.raises(DataLoadError) as exc_info:
+            loader.load_recipe_stats()
+
+        assert exc_info.value.source == "S3 (recipe stats)"
+
+
 class TestDataLoaderExceptionIntegration:
     """Tests d'intégration pour la gestion des exceptions."""
 
@@ -186,3 +369,29 @@ class TestDataLoaderExceptionIntegration:
             assert hasattr(exc_info.value, "detail")
             assert exc_info.value.source == "S3 (recipes)"
             assert "Test error" in exc_info.value.detail
+
+
+class TestDataLoaderManifest:
+    """Tests pour le chargement du manifeste des recettes."""
+
+    @patch("mangetamain_data_utils.data_utils_manifest.load_manifest")
+    def test_load_recipes_manifest_reads_final_recipes(self, mock_load, loader):
+        """Vérifie que le manifeste du Parquet final est demandé."""
+        mock_load.return_value = {"rows": 3, "content_hash": "abc"}
+
+        result = loader.load_recipes_manifest()
+
+        assert result["rows"] == 3
+        mock_load.assert_called_once_with("s3://mangetamain/final_recipes.parquet")
+
+    @patch("mangetamain_data_utils.data_utils_manifest.load_manifest")
+    def test_load_recipes_manifest_raises_dataload_error_on_s3_failure(
+        self, mock_load, loader
+    ):
+        """Vérifie que DataLoadError est levée si S3 échoue."""
+        mock_load.side_effect = Exception("File not found")
+
+        with pytest.raises(DataLoadError) as exc_info:
+            loader.load_recipes_manifest()
+
+        assert exc_info.value.source == "S3 (manifest)"
@@ -0,0 +1,112 @@
+"""Tests unitaires pour le module data.manifest.
+
+Vérifie les chiffres clés tirés du manifeste de l'ETL, les valeurs de repli
+et l'usage de l'empreinte comme version des recettes.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import polars as pl
+
+# Ajout du chemin vers le module
+sys.path.insert(0, str(Path(__file__).parents[2] / "src" / "mangetamain_analytics"))
+
+from data import cached_loaders
+from data.loaders import DataLoadError
+from data.manifest import (
+    FALLBACK_METRICS,
+    HeadlineMetrics,
+    headline_metrics,
+    recipes_headline,
+)
+
+MANIFEST = {
+    "rows": 231637,
+    "content_hash": "0123456789abcdef",
+    "columns": {"year": {"dtype": "Int64", "null_count": 0, "min": 1999, "max": 2018}},
+    "date_ranges": {"submitted": ["1999-08-06", "2018-12-04"]},
+}
+
+
+def test_headline_metrics_from_manifest():
+    """Vérifie le nombre de recettes, la période et le nombre d'années."""
+    metrics = headline_metrics(MANIFEST)
+
+    assert metrics == HeadlineMetrics(n_recipes=231637, first_year=1999, last_year=2018)
+    assert metrics.period == "1999-2018"
+    assert metrics.n_years == 20
+
+
+def test_headline_metrics_uses_date_range_then_fallback():
+    """Vérifie la plage de dates sans colonne year, puis les valeurs de repli."""
+    by_dates = headline_metrics(
+        {"rows": 10, "date_ranges": {"submitted": ["2001-01-02", "2005-07-01"]}}
+    )
+    assert by_dates.period == "2001-2005"
+
+    assert headline_metrics({}) == FALLBACK_METRICS
+
+
+@patch("data.manifest.get_recipes_manifest")
+def test_recipes_headline_fallback(mock_manifest):
+    """Vérifie les valeurs de repli si le manifeste est indisponible."""
+    mock_manifest.return_value = MANIFEST
+    assert recipes_headline().n_recipes == 231637
+
+    mock_manifest.side_effect = DataLoadError(source="S3 (manifest)", detail="x")
+    assert recipes_headline() == FALLBACK_METRICS
+
+
+def clear_recipes_caches():
+    """Vide les caches du manifeste et des recettes."""
+    cached_loaders.get_recipes_manifest.clear()
+    cached_loaders.get_recipes_manifest_hash.clear()
+    cached_loaders.load_versioned_recipes.clear()
+
+
+def test_recipes_version_from_manifest(monkeypatch):
+    """Vérifie que l'empreinte du manifeste sert de version, sans charger les données."""
+    loader = MagicMock()
+    loader.load_recipes_manifest.return_value = MANIFEST
+    monkeypatch.setattr(cached_loaders, "_loader", loader)
+    clear_recipes_caches()
+
+    assert cached_loaders.get_recipes_version() == "0123456789abcdef"
+    loader.load_recipes.assert_not_called()
+
+    loader.load_recipes_manifest.side_effect = DataLoadError(
+        source="S3 (manifest)", detail="x"
+    )
+    loader.load_recipes.return_value = pl.DataFrame(
+        {"id": [1, 2], "year": [2000, 2001]}
+    )
+    clear_recipes_caches()
+
+    version = cached_loaders.get_recipes_version()
+    assert len(version) == 16 and version != "0123456789abcdef"
+    clear_recipes_caches()
+
+
+def test_recipes_keyed_on_manifest_hash(monkeypatch):
+    """Vérifie qu'une nouvelle publication change données et version ensemble."""
+    loader = MagicMock()
+    loader.load_recipes_manifest.return_value = MANIFEST
+    loader.load_recipes.return_value = pl.DataFrame({"id": [1], "year": [2000]})
+    monkeypatch.setattr(cached_loaders, "_loader", loader)
+    clear_recipes_caches()
+
+    first = cached_loaders.get_recipes_clean()
+    assert cached_loaders.get_recipes_clean() is first
+    assert loader.load_recipes.call_count == 1
+
+    # Nouvelle publication, prise en compte à l'expiration du manifeste
+    loader.load_recipes_manifest.return_value = {**MANIFEST, "content_hash": "fedcba"}
+    loader.load_recipes.return_value = pl.DataFrame({"id": [1, 2], "year": [2000] * 2})
+    cached_loaders.get_recipes_manifest.clear()
+    cached_loaders.get_recipes_manifest_hash.clear()
+
+    assert cached_loaders.get_recipes_version() == "fedcba"
+    assert cached_loaders.get_recipes_clean().height == 2
+    clear_recipes_caches()
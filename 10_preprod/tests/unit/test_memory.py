@@ -0,0 +1,159 @@
+"""Tests unitaires pour le module utils.memory.
+
+Vérifie l'estimation des tailles, l'éviction LRU bornée en octets,
+l'expiration, le décorateur memory_cache et le suivi des sessions.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+import numpy as np
+import pandas as pd
+import polars as pl
+
+# Ajout du chemin vers le module
+sys.path.insert(0, str(Path(__file__).parents[2] / "src" / "mangetamain_analytics"))
+
+import utils.memory as memory
+from utils.memory import (
+    BoundedCache,
+    admin_allowed,
+    env_megabytes,
+    estimate_bytes,
+    memory_cache,
+    process_rss_bytes,
+    record_session,
+    registered_caches,
+    session_stats,
+)
+
+
+def test_estimate_bytes_dataframes():
+    """Vérifie les tailles Polars, pandas, NumPy et conteneurs."""
+    values = np.arange(1000, dtype=np.int64)
+
+    assert estimate_bytes(values) == 8000
+    assert estimate_bytes(pl.DataFrame({"a": values})) >= 8000
+    assert estimate_bytes(pd.DataFrame({"a": values})) >= 8000
+    assert estimate_bytes({"df": values, "x": [values, values]}) > 24000
+    assert estimate_bytes(b"abc") > 3
+
+
+def test_env_megabytes(monkeypatch):
+    """Vérifie la lecture des limites en Mo et la valeur par défaut."""
+    monkeypatch.setenv("APP_TEST_MAX_MB", "2.5")
+    assert env_megabytes("APP_TEST_MAX_MB", 1) == int(2.5 * memory.MB)
+
+    monkeypatch.setenv("APP_TEST_MAX_MB", "beaucoup")
+    assert env_megabytes("APP_TEST_MAX_MB", 1) == memory.MB
+    assert process_rss_bytes() > 0
+
+
+def test_admin_allowed(monkeypatch):
+    """Vérifie que la page d'administration exige le jeton du serveur."""
+    monkeypatch.delenv("APP_ADMIN_TOKEN", raising=False)
+    assert not admin_allowed("1")
+    assert not admin_allowed(None)
+
+    monkeypatch.setenv("APP_ADMIN_TOKEN", "s3cret")
+    assert admin_allowed("s3cret")
+    assert not admin_allowed("1")
+    assert not admin_allowed("")
+
+
+def test_bounded_cache_evicts_least_recently_used():
+    """Vérifie l'éviction par taille de l'entrée la moins récemment lue."""
+    cache = BoundedCache("test", max_bytes=250)
+
+    cache.put("a", "A", nbytes=100)
+    cache.put("b", "B", nbytes=100)
+    cache.get("a")
+    cache.put("c", "C", nbytes=100)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert cache.get("c") == "C"
+    stats = cache.stats()
+    assert stats["bytes"] == 200
+    assert stats["evictions"] == 1
+
+    cache.put("huge", "H", nbytes=1000)
+    assert cache.get("huge") is None
+
+
+def test_bounded_cache_ttl():
+    """Vérifie l'expiration des entrées."""
+    cache = BoundedCache("test", max_bytes=1000, ttl=10)
+
+    with patch("utils.memory.time.monotonic", return_value=100.0):
+        cache.put("a", "A", nbytes=10)
+    with patch("utils.memory.time.monotonic", return_value=105.0):
+        assert cache.get("a") == "A"
+    with patch("utils.memory.time.monotonic", return_value=111.0):
+        assert cache.get("a") is None
+    assert cache.stats()["bytes"] == 0
+
+
+def test_memory_cache_decorator():
+    """Vérifie la clé (paramètres sans _), le partage et l'inscription."""
+    calls = []
+
+    @memory_cache("test_frames", max_bytes=10 * memory.MB)
+    def load(year, _conn=None, columns=("a",)):
+        calls.append(year)
+        return pl.DataFrame({"year": [year]})
+
+    first = load(2005, _conn="c1")
+    assert load(2005, _conn="c2") is first
+    load(year=2006)
+    load(2005, columns=("a", "b"))
+
+    assert calls == [2005, 2006, 2005]
+    assert load.cache in registered_caches()
+    load.clear()
+    assert load.cache.stats()["entries"] == 0
+
+
+def test_memory_cache_spinner():
+    """Vérifie que le message s'affiche seulement pendant un calcul."""
+
+    @memory_cache("test_spinner", spinner="Chargement...")
+    def load(year):
+        return pl.DataFrame({"year": [year]})
+
+    with patch("streamlit.spinner") as spinner:
+        load(2005)
+        load(2005)
+
+    spinner.assert_called_once_with("Chargement...")
+
+
+def test_data_loaders_are_accounted():
+    """Vérifie que les gros chargements sont dans la comptabilité mémoire."""
+    import data.cached_loaders  # noqa: F401
+
+    names = {cache.name for cache in registered_caches()}
+    assert {
+        "recipes",
+        "interactions",
+        "recipe_stats",
+        "daily_counts",
+        "rating_histograms",
+    } <= names
+
+
+def test_record_session(monkeypatch):
+    """Vérifie la mesure par session, l'alerte et l'oubli des inactives."""
+    monkeypatch.setattr(memory, "_sessions", {})
+    monkeypatch.setattr(memory, "SESSION_MAX_BYTES", 5000)
+
+    small = record_session({"page": "trends"}, session_id="session-a")
+    big = record_session({"df": np.zeros(1000)}, session_id="session-b")
+
+    assert record_session({"page": "x"}) is None
+    assert not small.over_budget
+    assert big.over_budget
+    assert [u.session_id for u in session_stats()] == ["session-b", "session-a"]
+
+    with patch("utils.memory.time.time", return_value=big.seen_at + 7200):
+        assert session_stats() == []
@@ -0,0 +1,131 @@
+"""Tests unitaires pour le module analysis.resampling.
+
+Vérifie les tests par permutation (2 groupes et k groupes), leur
+reproductibilité séquentielle / parallèle et les IC bootstrap.
+"""
+
+import sys
+from pathlib import Path
+import numpy as np
+import pytest
+from scipy.stats import f_oneway, ttest_ind
+
+# Ajout du chemin vers le module
+sys.path.insert(0, str(Path(__file__).parents[2] / "src" / "mangetamain_analytics"))
+
+import analysis.resampling as resampling
+from analysis.resampling import (
+    bootstrap_mean_diff,
+    encode_groups,
+    histogram_bootstrap_means,
+    permutation_tests,
+)
+
+
+@pytest.fixture
+def two_groups():
+    """Fixture : 2 variables asymétriques, effet réel sur la première seulement."""
+    rng = np.random.default_rng(42)
+    labels = np.where(rng.random(2000) < 0.3, "Weekend", "Weekday")
+    values = rng.lognormal(size=(2000, 2))
+    values[labels == "Weekend", 0] += 0.5
+    return values, labels
+
+
+def test_encode_groups():
+    """Vérifie le codage des groupes dans l'ordre demandé."""
+    codes, groups = encode_groups(["b", "a", "b"], ["b", "a"])
+
+    assert codes.tolist() == [0, 1, 0]
+    assert groups == ["b", "a"]
+    with pytest.raises(ValueError):
+        encode_groups(["a", "c"], ["a", "b"])
+    with pytest.raises(ValueError):
+        encode_groups(["a", "a"])
+
+
+def test_two_group_permutation(two_groups):
+    """Vérifie statistique, orientation et p-values proches du test t."""
+    values, labels = two_groups
+
+    result = permutation_tests(
+        values, labels, ["Weekday", "Weekend"], ["a", "b"], n_permutations=999
+    )
+
+    weekend = labels == "Weekend"
+    assert result["variable"].to_list() == ["a", "b"]
+    assert result["statistic"][0] == pytest.approx(
+        values[weekend, 0].mean() - values[~weekend, 0].mean()
+    )
+    assert result["p_value"][0] == pytest.approx(1 / 1000)
+    reference = ttest_ind(values[weekend, 1], values[~weekend, 1]).pvalue
+    assert result["p_value"][1] == pytest.approx(reference, abs=0.05)
+
+
+def test_k_group_permutation_matches_anova():
+    """Vérifie la statistique F et une p-value cohérente avec l'ANOVA."""
+    rng = np.random.default_rng(3)
+    labels = rng.integers(0, 4, size=1500)
+    values = rng.normal(size=1500) + 0.1 * labels
+
+    result = permutation_tests(values, labels, n_permutations=999)
+
+    anova = f_oneway(*[values[labels == g] for g in range(4)])
+    assert result["statistic"][0] == pytest.approx(anova.statistic)
+    assert result["p_value"][0] == pytest.approx(max(anova.pvalue, 1 / 1000), abs=0.02)
+
+
+def test_permutation_reproducible_across_workers(two_groups, monkeypatch):
+    """Vérifie des p-values identiques en séquentiel et sur pool de processus."""
+    values, labels = two_groups
+    monkeypatch.setattr(resampling, "_BLOCK_BUDGET", 20_000)
+
+    sequential = permutation_tests(values, labels, n_permutations=200, seed=7, n_jobs=1)
+    monkeypatch.setattr(resampling, "PARALLEL_MIN_WORK", 0)
+    parallel = permutation_tests(values, labels, n_permutations=200, seed=7, n_jobs=2)
+
+    assert sequential.equals(parallel)
+
+
+def test_permutation_rejects_nan(two_groups):
+    """Vérifie le refus de valeurs manquantes et d'étiquettes incohérentes."""
+    values, labels = two_groups
+    values[0, 0] = np.nan
+
+    with pytest.raises(ValueError):
+        permutation_tests(values, labels)
+    with pytest.raises(ValueError):
+        permutation_tests(values[1:, 1], labels)
+
+
+def test_bootstrap_mean_diff(two_groups):
+    """Vérifie un IC qui encadre la différence et exclut 0 pour l'effet réel."""
+    values, labels = two_groups
+
+    result = bootstrap_mean_diff(values, labels, ["Weekday", "Weekend"], seed=1)
+
+    row = result.row(0, named=True)
+    assert row["ci_low"] < row["diff"] < row["ci_high"]
+    assert row["ci_low"] > 0
+    assert result["ci_low"][1] < 0 < result["ci_high"][1]
+    with pytest.raises(ValueError):
+        bootstrap_mean_diff(values[:, 0], np.arange(len(values)) % 3)
+
+
+def test_histogram_bootstrap_means():
+    """Vérifie les IC multinomiaux contre un bootstrap sur les notes brutes."""
+    histograms = np.array([[5, 5, 20, 70, 100], [0, 0, 0, 0, 0], [1, 0, 2, 3, 40]])
+
+    result = histogram_bootstrap_means(histograms, [1, 2, 3, 4, 5], seed=0)
+
+    ratings = np.repeat([1, 2, 3, 4, 5], histograms[0])
+    rng = np.random.default_rng(1)
+    raw = [rng.choice(ratings, len(ratings)).mean() for _ in range(2000)]
+    low, high = np.percentile(raw, [2.5, 97.5])
+    assert result["mean"][0] == pytest.approx(ratings.mean())
+    assert result["ci_low"][0] == pytest.approx(low, abs=0.03)
+    assert result["ci_high"][0] == pytest.approx(high, abs=0.03)
+    assert result.row(1) == (None, None, None)
+    assert result["ci_low"][2] < result["mean"][2] < result["ci_high"][2]
+    with pytest.raises(ValueError):
+        histogram_bootstrap_means(histograms, [1, 2, 3])
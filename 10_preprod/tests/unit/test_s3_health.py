@@ -0,0 +1,100 @@
+"""Tests unitaires pour le module utils.s3_health.
+
+Vérifie la sonde S3 (disponibilité, latence, erreurs) et le thread de fond
+avec un client simulé, sans accès réseau.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+import pytest
+
+# Ajout du chemin vers le module
+sys.path.insert(0, str(Path(__file__).parents[2] / "src" / "mangetamain_analytics"))
+
+from exceptions import ConfigurationError
+import utils.s3_health as s3_health
+from utils.s3_health import S3HealthMonitor, S3Status, create_s3_client
+
+
+@pytest.fixture
+def client():
+    """Fixture : client S3 simulé, bucket non vide."""
+    mock_client = MagicMock()
+    mock_client.list_objects_v2.return_value = {"Contents": [{"Key": "a"}]}
+    return mock_client
+
+
+def test_status_pending_before_first_probe(client):
+    """Vérifie l'état initial sans appel réseau."""
+    monitor = S3HealthMonitor(client_factory=lambda: client)
+
+    assert monitor.status() == S3Status()
+    assert monitor.status().pending
+    client.list_objects_v2.assert_not_called()
+
+
+def test_probe_records_latency_and_reuses_client(client):
+    """Vérifie la latence mesurée et un client construit une seule fois."""
+    factory = MagicMock(return_value=client)
+    monitor = S3HealthMonitor(client_factory=factory)
+
+    monitor.probe()
+    status = monitor.probe()
+
+    assert status.ready
+    assert status.latency_ms >= 0
+    assert monitor.status() is status
+    factory.assert_called_once()
+    client.list_objects_v2.assert_called_with(Bucket="mangetamain", MaxKeys=1)
+
+
+def test_probe_failure_rebuilds_client(client):
+    """Vérifie l'état d'erreur puis la reconstruction du client."""
+    client.list_objects_v2.side_effect = [ConnectionError("timeout"), {}]
+    factory = MagicMock(return_value=client)
+    monitor = S3HealthMonitor(client_factory=factory)
+
+    failed = monitor.probe()
+    empty = monitor.probe()
+
+    assert not failed.ready and not failed.pending
+    assert "timeout" in failed.error
+    assert not empty.ready and empty.error is None
+    assert factory.call_count == 2
+
+
+def test_background_thread_probes(client):
+    """Vérifie que le thread sonde sans bloquer l'appelant."""
+    monitor = S3HealthMonitor(client_factory=lambda: client, interval=0.01)
+
+    monitor.start()
+    try:
+        for _ in range(200):
+            if client.list_objects_v2.call_count >= 2:
+                break
+            monitor._stop.wait(0.01)
+    finally:
+        monitor.stop(timeout=1)
+
+    assert client.list_objects_v2.call_count >= 2
+    assert monitor.status().ready
+    assert not monitor._thread.is_alive()
+
+
+def test_shared_monitor_is_singleton(monkeypatch, client):
+    """Vérifie un seul moniteur par processus."""
+    monkeypatch.setattr(S3HealthMonitor, "start", lambda self: None)
+    S3HealthMonitor.reset_shared()
+    try:
+        assert S3HealthMonitor.shared() is S3HealthMonitor.shared()
+    finally:
+        S3HealthMonitor.reset_shared()
+
+
+def test_create_client_without_credentials(monkeypatch, tmp_path):
+    """Vérifie ConfigurationError si aucun fichier de credentials n'existe."""
+    monkeypatch.setattr(s3_health, "CREDENTIALS_PATHS", [tmp_path / "missing"])
+
+    with pytest.raises(ConfigurationError):
+        create_s3_client()
@@ -0,0 +1,65 @@
+"""Tests unitaires pour le module utils.sections.
+
+Vérifie le rendu immédiat des premières sections et le calcul différé des
+suivantes tant que leur interrupteur n'est pas activé.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+import pytest
+
+# Ajout du chemin vers le module
+sys.path.insert(0, str(Path(__file__).parents[2] / "src" / "mangetamain_analytics"))
+
+import utils.sections as sections_module
+from utils.sections import Section, render_sections
+
+
+@pytest.fixture(autouse=True)
+def unwrapped_fragment(monkeypatch):
+    """Hors runtime Streamlit, un fragment n'exécute rien : corps non décoré."""
+    monkeypatch.setattr(
+        sections_module,
+        "_render_section",
+        sections_module._render_section.__wrapped__,
+    )
+
+
+@pytest.fixture
+def sections():
+    """Fixture : trois sections dont le rendu est simulé."""
+    return [Section(key, f"Titre {key}", MagicMock()) for key in ("a", "b", "c")]
+
+
+@patch("utils.sections.st")
+def test_only_eager_sections_computed(mock_st, sections):
+    """Vérifie que les sections fermées ne sont pas calculées."""
+    mock_st.toggle.return_value = False
+
+    render_sections("page", sections)
+
+    sections[0].render.assert_called_once()
+    sections[1].render.assert_not_called()
+    sections[2].render.assert_not_called()
+    assert [c.args[0] for c in mock_st.subheader.call_args_list] == [
+        "Titre a",
+        "Titre b",
+        "Titre c",
+    ]
+    keys = [c.kwargs["key"] for c in mock_st.toggle.call_args_list]
+    assert keys == ["section_page_b", "section_page_c"]
+
+
+@patch("utils.sections.st")
+def test_opened_sections_computed(mock_st, sections):
+    """Vérifie le rendu des sections ouvertes et le nombre de séparateurs."""
+    mock_st.toggle.return_value = True
+
+    render_sections("page", sections, eager=2)
+
+    for section in sections:
+        section.render.assert_called_once()
+    mock_st.toggle.assert_called_once()
+    assert mock_st.markdown.call_count == 2
+    assert mock_st.container.call_count == 3
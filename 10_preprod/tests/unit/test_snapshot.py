@@ -0,0 +1,170 @@
+"""Tests unitaires pour le module utils.snapshot.
+
+Vérifie la construction parallèle des instantanés (figures, bundles JSON et
+HTML en FR/EN), leur relecture par cached_figure et la ligne de commande.
+"""
+
+import inspect
+import json
+import sys
+from importlib import import_module
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Ajout du chemin vers le module
+sys.path.insert(0, str(Path(__file__).parents[2] / "src" / "mangetamain_analytics"))
+
+import utils.snapshot as snapshot
+from build_snapshots import main
+from utils.figure_cache import FigureCache, cached_figure
+from utils.snapshot import SnapshotFigure, build_snapshots, read_snapshot
+
+PAGE_MODULE = """
+import plotly.graph_objects as go
+from utils.i18n_helper import t
+
+def build(top_n=3):
+    return go.Figure(
+        go.Bar(x=list(range(top_n)), y=list(range(top_n))),
+        layout=dict(title=t("main_title", category="trends")),
+    )
+"""
+
+FIGURES = (
+    SnapshotFigure(
+        "trends", "test_trends", "snapshot_page_module", "build", (("top_n", 3),)
+    ),
+    SnapshotFigure("ratings", "test_ratings", "snapshot_page_module", "build"),
+)
+
+
+@pytest.fixture
+def page_module(tmp_path, monkeypatch):
+    """Module de page importable dans les processus de construction."""
+    modules = tmp_path / "modules"
+    modules.mkdir()
+    (modules / "snapshot_page_module.py").write_text(PAGE_MODULE)
+    monkeypatch.syspath_prepend(str(modules))
+    FigureCache.reset_shared()
+    yield
+    FigureCache.reset_shared()
+
+
+def test_build_snapshots_writes_bundles(tmp_path, page_module):
+    """Vérifie les figures, bundles FR/EN et l'index, une page par processus."""
+    root = tmp_path / "snapshots"
+
+    built = build_snapshots(root, dataset_version="v1", workers=2, figures=FIGURES)
+
+    assert built == {"trends": ["test_trends"], "ratings": ["test_ratings"]}
+    assert read_snapshot(FIGURES[0].key("v1"), root) is not None
+    assert read_snapshot(FIGURES[0].key("v2"), root) is None
+
+    fr = json.loads((root / "v1" / "json" / "fr" / "test_trends.json").read_text())
+    en = json.loads((root / "v1" / "json" / "en" / "test_trends.json").read_text())
+    assert fr["layout"]["title"]["text"].startswith("Analyses des tendances")
+    assert en["layout"]["title"]["text"].startswith("Long-term Trend")
+
+    page = (root / "v1" / "html" / "fr" / "ratings.html").read_text()
+    assert "<title>Analyses Ratings</title>" in page
+    assert "cdn.plot.ly" in page
+    index = json.loads((root / "v1" / "index.json").read_text())
+    assert index["languages"] == ["fr", "en"]
+
+
+def test_build_snapshots_dataset_versions(tmp_path, page_module):
+    """Vérifie que chaque page est écrite sous la version de ses données."""
+    root = tmp_path / "snapshots"
+    figures = (FIGURES[0], FIGURES[1]._replace(dataset="interactions"))
+    versions = {"recipes": "r1", "interactions": "i1"}
+
+    with patch("utils.snapshot.current_version", side_effect=versions.get) as current:
+        build_snapshots(root, workers=2, figures=figures)
+
+    assert current.call_count == 2
+    assert read_snapshot(figures[0].key("r1"), root) is not None
+    assert read_snapshot(figures[1].key("i1"), root) is not None
+    assert (root / "i1" / "html" / "en" / "ratings.html").exists()
+    assert json.loads((root / "r1" / "index.json").read_text())["pages"] == {
+        "trends": ["test_trends"]
+    }
+    assert json.loads((root / "i1" / "index.json").read_text())["pages"] == {
+        "ratings": ["test_ratings"]
+    }
+
+    mixed = (FIGURES[0], FIGURES[0]._replace(analysis="other", dataset="users"))
+    with pytest.raises(ValueError):
+        build_snapshots(root, dataset_version="v1", figures=mixed)
+
+
+def test_snapshot_figures_match_builders():
+    """Vérifie que chaque vue déclarée désigne un constructeur et ses paramètres."""
+    pages = {}
+    for spec in snapshot.SNAPSHOT_FIGURES:
+        build = getattr(import_module(spec.module), spec.builder)
+        inspect.signature(build).bind(**dict(spec.params))
+        assert spec.dataset in snapshot.DATASET_VERSIONS
+        pages.setdefault(spec.page, set()).add(spec.dataset)
+
+    assert set(pages) == {"trends", "seasonality", "weekend", "ratings", "users"}
+    assert all(len(datasets) == 1 for datasets in pages.values())
+    analyses = [spec.analysis for spec in snapshot.SNAPSHOT_FIGURES]
+    assert len(analyses) == len(set(analyses))
+
+
+def test_cached_figure_serves_snapshot(tmp_path, page_module, monkeypatch):
+    """Vérifie que la vue par défaut est relue sans calcul, pas les autres."""
+    root = tmp_path / "snapshots"
+    build_snapshots(root, dataset_version="v1", workers=1, figures=FIGURES[:1])
+    monkeypatch.setattr(snapshot, "SNAPSHOT_DIR", root)
+    build = MagicMock(wraps=import_module("snapshot_page_module").build)
+
+    with patch("utils.figure_cache.get_current_language", return_value="en"):
+        fig = cached_figure("test_trends", "v1", build, top_n=3)
+        assert fig.layout.title.text.startswith("Long-term Trend")
+        build.assert_not_called()
+
+        cached_figure("test_trends", "v1", build, top_n=5)
+        build.assert_called_once_with(top_n=5)
+
+
+def test_corrupt_snapshot_is_a_miss(tmp_path, page_module, monkeypatch):
+    """Vérifie qu'un instantané tronqué est recalculé au lieu d'échouer."""
+    root = tmp_path / "snapshots"
+    build_snapshots(root, dataset_version="v1", workers=1, figures=FIGURES[:1])
+    path = snapshot.snapshot_file(FIGURES[0].key("v1"), root)
+    path.write_bytes(path.read_bytes()[:20])
+    monkeypatch.setattr(snapshot, "SNAPSHOT_DIR", root)
+    build = MagicMock(wraps=import_module("snapshot_page_module").build)
+
+    with patch("utils.figure_cache.get_current_language", return_value="en"):
+        fig = cached_figure("test_trends", "v1", build, top_n=3)
+
+    build.assert_called_once_with(top_n=3)
+    assert fig.layout.title.text.startswith("Long-term Trend")
+
+
+def test_write_is_atomic(tmp_path):
+    """Vérifie le remplacement du fichier sans fichier temporaire restant."""
+    path = tmp_path / "v1" / "index.json"
+    snapshot._write(path, "ancien")
+    with patch("utils.snapshot.os.replace", side_effect=OSError("disque plein")):
+        with pytest.raises(OSError):
+            snapshot._write(path, "nouveau")
+
+    assert path.read_text() == "ancien"
+    snapshot._write(path, b"nouveau")
+    assert path.read_bytes() == b"nouveau"
+    assert [p.name for p in path.parent.iterdir()] == ["index.json"]
+
+
+def test_main_exit_codes():
+    """Vérifie les codes de sortie de la ligne de commande."""
+    with patch("build_snapshots.build_snapshots", return_value={"trends": ["a"]}) as b:
+        assert main(["--output", "out", "--workers", "2"]) == 0
+        b.assert_called_once_with(Path("out"), None, 2)
+
+    with patch("build_snapshots.build_snapshots", side_effect=RuntimeError("S3")):
+        assert main([]) == 1
@@ -0,0 +1,166 @@
+"""Tests unitaires pour le module analysis.sufficient_stats.
+
+Vérifie que les tests t, l'ANOVA et Kruskal-Wallis calculés à partir des
+moments ou des histogrammes par groupe coïncident avec scipy sur les
+données brutes.
+"""
+
+import sys
+from pathlib import Path
+import numpy as np
+import polars as pl
+import pytest
+from scipy.stats import f_oneway, kruskal, ttest_ind
+
+# Ajout du chemin vers le module
+sys.path.insert(0, str(Path(__file__).parents[2] / "src" / "mangetamain_analytics"))
+
+from analysis.sufficient_stats import (
+    anova_from_moments,
+    group_moments,
+    histogram_columns,
+    histogram_moments,
+    kruskal_from_histogram,
+    rating_histograms,
+    ttest_from_moments,
+)
+
+
+@pytest.fixture
+def nutrition():
+    """Fixture : 2 nutriments asymétriques, semaine / week-end."""
+    rng = np.random.default_rng(0)
+    period = np.where(rng.random(3000) < 0.3, "Weekend", "Weekday")
+    return pl.DataFrame(
+        {
+            "week_period": period,
+            "calories": rng.lognormal(5, 1, size=3000),
+            "protein_pct": rng.gamma(2, 10, size=3000) + 3 * (period == "Weekend"),
+        }
+    )
+
+
+@pytest.fixture
+def ratings():
+    """Fixture : notes entières 1-5 par saison, avec beaucoup d'ex-aequo."""
+    rng = np.random.default_rng(1)
+    seasons = ["Spring", "Summer", "Autumn", "Winter"]
+    probas = [
+        [0.02, 0.03, 0.10, 0.25, 0.60],
+        [0.03, 0.03, 0.12, 0.27, 0.55],
+        [0.02, 0.02, 0.09, 0.25, 0.62],
+        [0.02, 0.03, 0.10, 0.24, 0.61],
+    ]
+    frames = [
+        pl.DataFrame(
+            {
+                "season": [season] * n,
+                "rating": rng.choice([1, 2, 3, 4, 5], size=n, p=p),
+                "user_id": rng.integers(0, 500, size=n),
+                "recipe_id": rng.integers(0, 300, size=n),
+            }
+        )
+        for season, p, n in zip(seasons, probas, [900, 1100, 1000, 800])
+    ]
+    return pl.concat(frames), seasons
+
+
+def season_histogram(df: pl.DataFrame, seasons: list[str]) -> np.ndarray:
+    """Histogramme saison × note, comme les pages (rating_histograms)."""
+    return (
+        pl.DataFrame({"season": seasons})
+        .join(rating_histograms(df, ["season"]), on="season", how="left")
+        .fill_null(0)
+        .select(histogram_columns())
+        .to_numpy()
+        .astype(np.float64)
+    )
+
+
+@pytest.mark.parametrize("equal_var", [True, False], ids=["student", "welch"])
+def test_ttest_from_moments_matches_scipy(nutrition, equal_var):
+    """Vérifie l'égalité avec ttest_ind sur les colonnes brutes."""
+    cols = ["calories", "protein_pct"]
+    n, mean, var = group_moments(nutrition, "week_period", cols, ["Weekday", "Weekend"])
+
+    t_stat, p_values = ttest_from_moments(
+        n[0], mean[0], var[0], n[1], mean[1], var[1], equal_var=equal_var
+    )
+
+    for i, col in enumerate(cols):
+        reference = ttest_ind(
+            nutrition.filter(pl.col("week_period") == "Weekday")[col].to_numpy(),
+            nutrition.filter(pl.col("week_period") == "Weekend")[col].to_numpy(),
+            equal_var=equal_var,
+        )
+        assert t_stat[i] == pytest.approx(reference.statistic, rel=1e-9)
+        assert p_values[i] == pytest.approx(reference.pvalue, rel=1e-6)
+
+
+def test_group_moments_ignores_nulls():
+    """Vérifie l'ordre des groupes et l'exclusion des valeurs manquantes."""
+    df = pl.DataFrame({"g": ["b", "a", "b", "b"], "x": [1.0, 2.0, None, 3.0]})
+
+    n, mean, var = group_moments(df, "g", ["x"], ["b", "a", "c"])
+
+    assert n[:, 0].tolist() == [2, 1, 0]
+    assert mean[0, 0] == pytest.approx(2.0)
+    assert var[0, 0] == pytest.approx(2.0)
+    assert np.isnan(mean[2, 0])
+
+
+def test_anova_from_histogram_matches_scipy(ratings):
+    """Vérifie l'ANOVA sur histogramme contre f_oneway sur les notes brutes."""
+    df, seasons = ratings
+    levels = [1, 2, 3, 4, 5]
+
+    f_stat, p_value = anova_from_moments(
+        *histogram_moments(season_histogram(df, seasons), levels)
+    )
+
+    groups = [df.filter(pl.col("season") == s)["rating"].to_numpy() for s in seasons]
+    reference = f_oneway(*groups)
+    assert f_stat == pytest.approx(reference.statistic, rel=1e-9)
+    assert p_value == pytest.approx(reference.pvalue, rel=1e-6)
+
+
+def test_kruskal_from_histogram_matches_scipy(ratings):
+    """Vérifie Kruskal-Wallis (rangs moyens, correction des ex-aequo)."""
+    df, seasons = ratings
+
+    h_stat, p_value = kruskal_from_histogram(season_histogram(df, seasons))
+
+    groups = [df.filter(pl.col("season") == s)["rating"].to_numpy() for s in seasons]
+    reference = kruskal(*groups)
+    assert h_stat == pytest.approx(reference.statistic, rel=1e-9)
+    assert p_value == pytest.approx(reference.pvalue, rel=1e-6)
+
+
+def test_rating_histograms_by_period():
+    """Vérifie les effectifs par note et les comptes distincts par période."""
+    df = pl.DataFrame(
+        {
+            "year": [2010, 2010, 2010, 2011],
+            "month": [1, 1, 2, 1],
+            "rating": [5, 5, 1, 3],
+            "user_id": [1, 2, 1, 1],
+            "recipe_id": [10, 10, 11, 12],
+        }
+    )
+
+    result = rating_histograms(df, ["year", "month"])
+
+    assert result.columns == [
+        "year",
+        "month",
+        "count_1",
+        "count_2",
+        "count_3",
+        "count_4",
+        "count_5",
+        "n_interactions",
+        "n_users",
+        "n_recipes",
+    ]
+    assert result.row(0) == (2010, 1, 0, 0, 0, 0, 2, 2, 2, 1)
+    assert result["n_interactions"].sum() == 4
@@ -0,0 +1,98 @@
+"""Tests unitaires pour le module analysis.term_frequencies.
+
+Vérifie la matrice terme × groupe calculée en une passe (fréquences,
+effectifs et métriques de variabilité).
+"""
+
+import sys
+from pathlib import Path
+import pytest
+import polars as pl
+
+# Ajout du chemin vers le module
+sys.path.insert(0, str(Path(__file__).parents[2] / "src" / "mangetamain_analytics"))
+
+from analysis.term_frequencies import group_sizes, term_group_frequencies
+
+
+@pytest.fixture
+def recipes_df():
+    """Fixture : 4 recettes sur 2 saisons, un doublon dans une liste."""
+    return pl.DataFrame(
+        {
+            "ingredients": [
+                ["salt", "egg", "salt"],
+                ["salt"],
+                ["egg", "milk"],
+                None,
+            ],
+            "season": ["Winter", "Winter", "Summer", "Summer"],
+            "month": [1, 2, 7, 7],
+        }
+    )
+
+
+def test_group_sizes(recipes_df):
+    """Vérifie les effectifs par groupe, y compris un groupe absent."""
+    sizes = group_sizes(recipes_df, "season", ["Winter", "Spring", "Summer"])
+
+    assert sizes == {"Winter": 2, "Spring": 0, "Summer": 2}
+
+
+def test_frequencies_and_counts(recipes_df):
+    """Vérifie fréquences de présence (doublons ignorés) et effectifs bruts."""
+    result = term_group_frequencies(
+        recipes_df,
+        "ingredients",
+        "season",
+        ["Winter", "Summer"],
+        term_alias="ingredient",
+    ).sort("ingredient")
+
+    assert result["ingredient"].to_list() == ["egg", "milk", "salt"]
+    assert result["Winter"].to_list() == [50.0, 0.0, 100.0]
+    assert result["Summer"].to_list() == [50.0, 50.0, 0.0]
+    assert result["count_Winter"].to_list() == [1, 0, 2]
+
+
+def test_variability_metrics(recipes_df):
+    """Vérifie moyenne, écart-type, CV et étendue entre groupes."""
+    result = term_group_frequencies(
+        recipes_df, "ingredients", "season", ["Winter", "Summer"]
+    )
+    salt = result.filter(pl.col("ingredients") == "salt").row(0, named=True)
+    egg = result.filter(pl.col("ingredients") == "egg").row(0, named=True)
+
+    assert salt["mean_freq"] == pytest.approx(50.0)
+    assert salt["std"] == pytest.approx(70.7107, rel=1e-4)
+    assert salt["cv"] == pytest.approx(141.421, rel=1e-4)
+    assert salt["range"] == pytest.approx(100.0)
+    assert egg["std"] == 0.0
+
+
+def test_missing_group_column_is_zero(recipes_df):
+    """Vérifie qu'un groupe sans recette donne des fréquences nulles."""
+    result = term_group_frequencies(
+        recipes_df, "ingredients", "season", ["Winter", "Spring", "Summer"]
+    )
+
+    assert result["Spring"].to_list() == [0.0] * result.height
+    assert result["count_Spring"].sum() == 0
+
+
+def test_numeric_groups_and_encoded_terms():
+    """Vérifie des groupes numériques (mois) et des termes encodés en ids."""
+    df = pl.DataFrame(
+        {
+            "tags": [[0, 1], [1], [1, 2]],
+            "month": [1, 1, 12],
+        },
+        schema={"tags": pl.List(pl.UInt32), "month": pl.Int8},
+    )
+
+    result = term_group_frequencies(df, "tags", "month").sort("tags")
+
+    assert result.columns[:3] == ["tags", "1", "12"]
+    assert result["tags"].to_list() == [0, 1, 2]
+    assert result["1"].to_list() == [50.0, 100.0, 0.0]
+    assert result["12"].to_list() == [0.0, 100.0, 100.0]
@@ -0,0 +1,143 @@
+"""Tests unitaires pour le module analysis.trend_tests.
+
+Compare le moteur vectorisé Mann-Kendall / pente de Sen aux implémentations
+scipy série par série.
+"""
+
+import sys
+from pathlib import Path
+import numpy as np
+import polars as pl
+import pytest
+from scipy.stats import kendalltau, norm, theilslopes
+
+# Ajout du chemin vers le module
+sys.path.insert(0, str(Path(__file__).parents[2] / "src" / "mangetamain_analytics"))
+
+from analysis import trend_tests as trend_module
+from analysis.trend_tests import trend_tests
+
+
+def brute_force_s(x):
+    """Statistique S de référence par double boucle."""
+    x = x[~np.isnan(x)]
+    return sum(
+        np.sign(x[j] - x[i]) for i in range(len(x)) for j in range(i + 1, len(x))
+    )
+
+
+@pytest.fixture
+def random_series():
+    """Fixture : 40 séries de 60 points, avec tendances, ex-aequo et trous."""
+    rng = np.random.default_rng(42)
+    values = rng.normal(size=(40, 60))
+    values[:10] += np.linspace(0, 3, 60)
+    values[10:20] -= np.linspace(0, 3, 60)
+    values[20:30] = np.round(values[20:30])
+    values[30, [5, 17, 42]] = np.nan
+    return values
+
+
+def test_statistic_matches_brute_force(random_series):
+    """Vérifie S et n série par série, valeurs manquantes comprises."""
+    result = trend_tests(random_series)
+
+    expected = [brute_force_s(row) for row in random_series]
+    assert result["s"].to_list() == expected
+    assert result["n"][30] == 57
+
+
+def test_tau_matches_scipy_without_ties(random_series):
+    """Vérifie tau = tau-b de scipy quand il n'y a pas d'ex-aequo."""
+    result = trend_tests(random_series[:20])
+
+    for i, row in enumerate(random_series[:20]):
+        tau, _ = kendalltau(np.arange(60), row)
+        assert result["tau"][i] == pytest.approx(tau)
+
+
+def test_tie_correction():
+    """Vérifie la variance corrigée des ex-aequo et la p-value associée."""
+    row = np.array([1.0, 2.0, 2.0, 3.0, 3.0, 3.0, 4.0, 5.0])
+    result = trend_tests(row).row(0, named=True)
+
+    n = 8
+    ties = 2 * 1 * 9 + 3 * 2 * 11
+    var_s = (n * (n - 1) * (2 * n + 5) - ties) / 18
+    assert result["var_s"] == pytest.approx(var_s)
+    z = (result["s"] - 1) / np.sqrt(var_s)
+    assert result["z"] == pytest.approx(z)
+    assert result["p_value"] == pytest.approx(2 * norm.sf(z))
+
+
+def test_sen_slope_matches_scipy(random_series):
+    """Vérifie pente et ordonnée de Sen contre scipy.stats.theilslopes."""
+    times = np.arange(60) * 2.5
+    result = trend_tests(random_series, times=times)
+
+    for i in (0, 15, 25, 30):
+        row = random_series[i]
+        mask = ~np.isnan(row)
+        expected = theilslopes(row[mask], times[mask])
+        assert result["slope"][i] == pytest.approx(expected[0])
+        assert result["intercept"][i] == pytest.approx(expected[1])
+
+
+def test_trend_labels(random_series):
+    """Vérifie le classement hausse / baisse / pas de tendance."""
+    result = trend_tests(random_series, labels=[f"s{i}" for i in range(40)])
+
+    assert result["series"][0] == "s0"
+    assert set(result["trend"][:10]) == {"increasing"}
+    assert set(result["trend"][10:20]) == {"decreasing"}
+    assert result.filter(pl.col("trend") == "no trend").height > 0
+
+
+def test_short_series_undefined():
+    """Vérifie les séries de moins de 3 points : résultats nuls."""
+    result = trend_tests(np.array([[1.0, np.nan, 2.0], [1.0, 2.0, 3.0]]))
+
+    assert result["p_value"][0] is None
+    assert result["slope"][0] is None
+    assert result["trend"][0] == "no trend"
+    assert result["slope"][1] == pytest.approx(1.0)
+
+
+def test_chunks_match_single_pass(random_series):
+    """Vérifie que le découpage en blocs ne change pas les résultats."""
+    single = trend_tests(random_series)
+    chunked = trend_tests(random_series, chunk_size=7)
+
+    assert chunked.equals(single)
+
+
+def test_sen_pair_budget(random_series, monkeypatch):
+    """Vérifie le calcul des pentes par sous-blocs bornés en mémoire."""
+    expected = trend_tests(random_series)
+    monkeypatch.setattr(trend_module, "_SEN_PAIR_BUDGET", 100)
+
+    assert trend_tests(random_series).equals(expected)
+
+
+def test_process_pool(random_series, monkeypatch):
+    """Vérifie la répartition des blocs sur le pool de processus."""
+    expected = trend_tests(random_series, n_jobs=1)
+    monkeypatch.setattr(trend_module, "PARALLEL_MIN_SERIES", 10)
+
+    result = trend_tests(random_series, chunk_size=10, n_jobs=2)
+
+    assert result.equals(expected)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"times": [0.0, 1.0]},
+        {"times": [0.0, 2.0, 1.0]},
+        {"labels": ["a"]},
+    ],
+)
+def test_invalid_arguments(kwargs):
+    """Vérifie la validation des abscisses et des libellés."""
+    with pytest.raises(ValueError):
+        trend_tests(np.ones((2, 3)), **kwargs)
@@ -0,0 +1,87 @@
+"""Tests unitaires pour le module vocabulary.
+
+Teste les helpers des colonnes liste encodées par dictionnaire.
+"""
+
+import sys
+from pathlib import Path
+import pytest
+from unittest.mock import patch
+import polars as pl
+
+# Ajout du chemin vers le module
+sys.path.insert(0, str(Path(__file__).parents[2] / "src" / "mangetamain_analytics"))
+
+from data.vocabulary import decode_terms, is_encoded, term_key
+
+
+@pytest.fixture
+def mock_vocabulary():
+    """Fixture : vocabulaire au format produit par l'ETL."""
+    return pl.DataFrame(
+        {
+            "id": pl.Series([0, 1, 2], dtype=pl.UInt32),
+            "term": ["egg", "pepper", "salt"],
+            "n_recipes": pl.Series([2, 2, 1], dtype=pl.UInt32),
+            "first_year": pl.Series([1999, 2001, 2001], dtype=pl.Int32),
+        }
+    )
+
+
+class TestIsEncoded:
+    """Tests pour is_encoded."""
+
+    def test_list_of_ids(self):
+        """Vérifie la détection d'une colonne List[UInt32]."""
+        df = pl.DataFrame(
+            {"ingredients": [[0, 1]]}, schema={"ingredients": pl.List(pl.UInt32)}
+        )
+        assert is_encoded(df, "ingredients")
+        assert is_encoded(df.explode("ingredients"), "ingredients")
+
+    def test_list_of_strings(self):
+        """Vérifie qu'une colonne List[String] n'est pas considérée encodée."""
+        df = pl.DataFrame({"ingredients": [["salt"]]})
+        assert not is_encoded(df, "ingredients")
+
+
+class TestTermKey:
+    """Tests pour term_key."""
+
+    def test_ids_unchanged(self):
+        """Vérifie que les ids sont utilisés tels quels."""
+        df = pl.DataFrame({"tags": [3, 1]}, schema={"tags": pl.UInt32})
+        assert df.select(term_key(df, "tags"))["tags"].to_list() == [3, 1]
+
+    def test_strings_normalized(self):
+        """Vérifie la normalisation des chaînes non encodées."""
+        df = pl.DataFrame({"tags": [" Easy", "DINNER "]})
+        assert df.select(term_key(df, "tags"))["tags"].to_list() == [
+            "easy",
+            "dinner",
+        ]
+
+
+class TestDecodeTerms:
+    """Tests pour decode_terms."""
+
+    @patch("data.vocabulary.get_vocabulary")
+    def test_decode_preserves_order(self, mock_get, mock_vocabulary):
+        """Vérifie le décodage des ids et la conservation de l'ordre."""
+        mock_get.return_value = mock_vocabulary
+        agg = pl.DataFrame({"ingredient": [2, 0], "count": [10, 5]})
+
+        result = decode_terms(agg, "ingredient", "ingredients")
+
+        mock_get.assert_called_once_with("ingredients")
+        assert result.columns == ["ingredient", "count"]
+        assert result["ingredient"].to_list() == ["salt", "egg"]
+        assert result["count"].to_list() == [10, 5]
+
+    @patch("data.vocabulary.get_vocabulary")
+    def test_strings_untouched(self, mock_get):
+        """Vérifie qu'un agrégat déjà en chaînes n'est pas modifié."""
+        agg = pl.DataFrame({"tag": ["easy"], "count": [1]})
+
+        assert decode_terms(agg, "tag", "tags").equals(agg)
+        mock_get.assert_not_called()
@@ -13,5 +13,10 @@ avec un simple :
 from .data_utils_common import *
 from .data_utils_ratings import *
 from .data_utils_recipes import *
+from .data_utils_pairings import *
+from .data_utils_daily import *
+from .data_utils_users import *
+from .data_utils_recipe_stats import *
+from .data_utils_manifest import *
 
-print("✅ _data_utils module chargé (common + ratings + recipes)")
+print("✅ _data_utils module chargé (common + ratings + recipes + pairings + daily + users + recipe_stats + manifest)")
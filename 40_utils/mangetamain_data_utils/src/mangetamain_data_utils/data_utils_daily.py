@@ -0,0 +1,111 @@
+from .data_utils_common import *
+from .data_utils_ratings import load_interactions_raw
+from .data_utils_recipes import load_recipes_clean, save_recipes_to_s3
+
+# =============================================================================
+# 📅 TABLE DES COMPTAGES QUOTIDIENS
+# =============================================================================
+
+DAILY_COUNTS_S3_PATH = "s3://mangetamain/daily_counts.parquet"
+
+
+def compute_daily_counts(
+    recipes: pl.DataFrame,
+    interactions: pl.DataFrame,
+    recipe_date_col: str = "submitted",
+    interaction_date_col: str = "date",
+) -> pl.DataFrame:
+    """
+    Agrège recettes et interactions jour par jour.
+
+    Le calendrier est complet entre le premier et le dernier jour observé :
+    les jours sans activité ont des comptes à 0 et une note moyenne nulle.
+
+    Args:
+        recipes: Recettes nettoyées (colonne date de soumission)
+        interactions: Interactions (colonnes date et rating)
+        recipe_date_col: Colonne date des recettes
+        interaction_date_col: Colonne date des interactions
+
+    Returns:
+        DataFrame (date, year, n_recipes, n_interactions, mean_rating), une
+        ligne par jour, trié par date
+    """
+    recipes_daily = (
+        recipes.drop_nulls(recipe_date_col)
+        .group_by(pl.col(recipe_date_col).cast(pl.Date).alias("date"))
+        .agg(pl.len().alias("n_recipes"))
+    )
+    interactions_daily = (
+        interactions.drop_nulls(interaction_date_col)
+        .group_by(pl.col(interaction_date_col).cast(pl.Date).alias("date"))
+        .agg(
+            pl.len().alias("n_interactions"),
+            pl.col("rating").mean().alias("mean_rating"),
+        )
+    )
+
+    observed = pl.concat([recipes_daily["date"], interactions_daily["date"]])
+    calendar = pl.DataFrame(
+        {"date": pl.date_range(observed.min(), observed.max(), "1d", eager=True)}
+    )
+
+    return (
+        calendar.join(recipes_daily, on="date", how="left")
+        .join(interactions_daily, on="date", how="left")
+        .select(
+            "date",
+            pl.col("date").dt.year().cast(pl.Int16).alias("year"),
+            pl.col("n_recipes").fill_null(0).cast(pl.UInt32),
+            pl.col("n_interactions").fill_null(0).cast(pl.UInt32),
+            pl.col("mean_rating").cast(pl.Float32),
+        )
+        .sort("date")
+    )
+
+
+def build_daily_counts(save_to_s3: bool = False) -> pl.DataFrame:
+    """
+    Pipeline complet : agrège une fois les données brutes en table quotidienne.
+
+    Args:
+        save_to_s3: Si True, sauvegarde la table sur S3
+
+    Returns:
+        Table quotidienne (voir compute_daily_counts)
+    """
+    print("📅 Calcul de la table des comptages quotidiens...")
+    daily = compute_daily_counts(load_recipes_clean(), load_interactions_raw())
+    print(
+        f"✅ {daily.height:,} jours ({daily['date'].min()} → {daily['date'].max()})"
+    )
+
+    if save_to_s3:
+        save_recipes_to_s3(daily, DAILY_COUNTS_S3_PATH, format="parquet")
+
+    return daily
+
+
+def load_daily_counts(year: Optional[int] = None) -> pl.DataFrame:
+    """
+    Charge la table quotidienne depuis S3, éventuellement pour une seule année.
+
+    Le filtre sur 'year' est poussé dans la lecture Parquet : afficher une
+    année ne lit que ses ~365 lignes.
+
+    Args:
+        year: Année à charger (toutes si None)
+
+    Returns:
+        pl.DataFrame: (date, year, n_recipes, n_interactions, mean_rating)
+    """
+    conn = get_s3_duckdb_connection()
+    sql = f"SELECT * FROM read_parquet('{DAILY_COUNTS_S3_PATH}')"
+    if year is None:
+        df = conn.execute(sql + " ORDER BY date").pl()
+    else:
+        df = conn.execute(sql + " WHERE year = ? ORDER BY date", [int(year)]).pl()
+    conn.close()
+
+    print(f"✅ Comptages quotidiens chargés depuis S3 : {df.shape[0]:,} jours")
+    return df
@@ -0,0 +1,212 @@
+from .data_utils_common import *
+import hashlib
+import json
+from datetime import datetime, timezone
+
+# =============================================================================
+# 🧾 MANIFESTE DES FICHIERS PARQUET (MÉTADONNÉES SANS LECTURE DES DONNÉES)
+# =============================================================================
+
+# Le manifeste est publié à côté du Parquet :
+# s3://mangetamain/final_recipes.parquet -> s3://mangetamain/final_recipes.manifest.json
+MANIFEST_SUFFIX = ".manifest.json"
+
+# Version du format du manifeste (à incrémenter si les clés changent)
+MANIFEST_VERSION = 1
+
+# Longueur de l'empreinte publiée (comme series_version côté application)
+HASH_LENGTH = 16
+
+
+def manifest_path(s3_path: str) -> str:
+    """
+    Chemin du manifeste associé à un fichier Parquet.
+
+    Args:
+        s3_path: Chemin du Parquet (ex: 's3://mangetamain/final_recipes.parquet')
+
+    Returns:
+        Chemin du manifeste (ex: 's3://mangetamain/final_recipes.manifest.json')
+    """
+    base = s3_path[: -len(".parquet")] if s3_path.endswith(".parquet") else s3_path
+    return base + MANIFEST_SUFFIX
+
+
+def _json_value(value) -> Optional[Union[int, float, str, bool]]:
+    """Valeur min/max sérialisable (dates et horodatages en ISO 8601)."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def _is_ordered(dtype: pl.DataType) -> bool:
+    """Type dont le min/max a un sens (numérique, temporel, booléen)."""
+    return dtype.is_numeric() or dtype.is_temporal() or dtype == pl.Boolean
+
+
+def compute_manifest(df: pl.DataFrame, parquet_bytes: bytes) -> Dict[str, any]:
+    """
+    Construit le manifeste d'un DataFrame au moment de son écriture en Parquet.
+
+    Les statistiques sont calculées sur le DataFrame déjà en mémoire (aucune
+    relecture) ; l'empreinte porte sur les octets du Parquet publié et change
+    donc avec son contenu.
+
+    Args:
+        df: DataFrame sauvegardé
+        parquet_bytes: Contenu du fichier Parquet écrit
+
+    Returns:
+        Dict (version, rows, bytes, content_hash, created_at, hash_source,
+        columns: {nom: {dtype, null_count, min, max}}, date_ranges: {nom: [min, max]})
+    """
+    ordered = [name for name, dtype in df.schema.items() if _is_ordered(dtype)]
+    bounds = (
+        df.select(
+            *[pl.col(c).min().alias(f"{c}__min") for c in ordered],
+            *[pl.col(c).max().alias(f"{c}__max") for c in ordered],
+        ).row(0, named=True)
+        if ordered
+        else {}
+    )
+    nulls = df.null_count().row(0, named=True) if df.width else {}
+
+    columns = {}
+    for name, dtype in df.schema.items():
+        stats = {"dtype": str(dtype), "null_count": int(nulls.get(name, 0))}
+        if name in ordered:
+            stats["min"] = _json_value(bounds[f"{name}__min"])
+            stats["max"] = _json_value(bounds[f"{name}__max"])
+        columns[name] = stats
+
+    return {
+        "version": MANIFEST_VERSION,
+        "rows": df.height,
+        "bytes": len(parquet_bytes),
+        "content_hash": hashlib.sha1(parquet_bytes).hexdigest()[:HASH_LENGTH],
+        "hash_source": "content",
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "columns": columns,
+        "date_ranges": {
+            name: [columns[name]["min"], columns[name]["max"]]
+            for name, dtype in df.schema.items()
+            if dtype.is_temporal()
+        },
+    }
+
+
+def _footer_value(value: Optional[str], duckdb_type: Optional[str]):
+    """Convertit une statistique de pied de page (texte) selon son type DuckDB."""
+    if value is None:
+        return None
+    if duckdb_type in ("TINYINT", "SMALLINT", "INTEGER", "BIGINT", "UTINYINT",
+                       "USMALLINT", "UINTEGER", "UBIGINT", "HUGEINT"):
+        return int(value)
+    if duckdb_type in ("FLOAT", "DOUBLE") or (duckdb_type or "").startswith("DECIMAL"):
+        return float(value)
+    if duckdb_type == "BOOLEAN":
+        return value.lower() == "true"
+    # Dates et horodatages : le texte ISO se compare dans l'ordre chronologique
+    return value.replace(" ", "T") if duckdb_type and duckdb_type.startswith("TIMESTAMP") else value
+
+
+def manifest_from_footer(s3_path: str, conn=None) -> Dict[str, any]:
+    """
+    Reconstruit le manifeste à partir du pied de page du Parquet.
+
+    Seules les métadonnées sont lues (nombre de lignes, taille, statistiques
+    min/max/nulls par groupe de lignes) : utile pour les fichiers publiés
+    avant l'écriture des manifestes. L'empreinte porte alors sur ces
+    métadonnées (hash_source='footer').
+
+    Args:
+        s3_path: Chemin du Parquet
+        conn: Connexion DuckDB (défaut: get_s3_duckdb_connection())
+
+    Returns:
+        Dict au format de compute_manifest
+    """
+    own_conn = conn is None
+    conn = get_s3_duckdb_connection() if own_conn else conn
+    try:
+        file_meta = conn.execute(
+            "SELECT num_rows, file_size_bytes, created_by FROM parquet_file_metadata(?)",
+            [s3_path],
+        ).fetchone()
+        schema = dict(
+            conn.execute(
+                "SELECT name, duckdb_type FROM parquet_schema(?) WHERE duckdb_type IS NOT NULL",
+                [s3_path],
+            ).fetchall()
+        )
+        row_groups = conn.execute(
+            """
+            SELECT path_in_schema, stats_min_value, stats_max_value, stats_null_count
+            FROM parquet_metadata(?)
+            ORDER BY row_group_id, column_id
+            """,
+            [s3_path],
+        ).fetchall()
+    finally:
+        if own_conn:
+            conn.close()
+
+    num_rows, file_size, created_by = file_meta
+    columns = {}
+    for path, min_value, max_value, null_count in row_groups:
+        # Colonnes liste : 'tags, list, element' -> 'tags' (sans min/max)
+        name = path.split(", ")[0]
+        dtype = schema.get(name) if ", " not in path else "LIST"
+        stats = columns.setdefault(name, {"dtype": dtype, "null_count": 0})
+        stats["null_count"] += int(null_count or 0)
+        if dtype == "LIST" or dtype == "VARCHAR":
+            continue
+        for key, value, pick in (("min", min_value, min), ("max", max_value, max)):
+            value = _footer_value(value, dtype)
+            if value is not None:
+                stats[key] = value if key not in stats else pick(stats[key], value)
+
+    signature = json.dumps([num_rows, file_size, created_by, row_groups], default=str)
+    return {
+        "version": MANIFEST_VERSION,
+        "rows": int(num_rows),
+        "bytes": int(file_size),
+        "content_hash": hashlib.sha1(signature.encode()).hexdigest()[:HASH_LENGTH],
+        "hash_source": "footer",
+        "created_at": None,
+        "columns": columns,
+        "date_ranges": {
+            name: [stats.get("min"), stats.get("max")]
+            for name, stats in columns.items()
+            if stats["dtype"] and stats["dtype"].startswith(("DATE", "TIMESTAMP"))
+        },
+    }
+
+
+def load_manifest(s3_path: str) -> Dict[str, any]:
+    """
+    Charge le manifeste d'un Parquet publié sur S3.
+
+    Lit le fichier .manifest.json écrit par save_recipes_to_s3 ; à défaut,
+    le manifeste est reconstruit depuis le pied de page du Parquet. Dans les
+    deux cas, aucune donnée n'est lue.
+
+    Args:
+        s3_path: Chemin du Parquet (ex: 's3://mangetamain/final_recipes.parquet')
+
+    Returns:
+        Dict au format de compute_manifest
+    """
+    conn = get_s3_duckdb_connection()
+    try:
+        rows = conn.execute(
+            "SELECT content FROM read_text(?)", [manifest_path(s3_path)]
+        ).fetchall()
+        if rows:
+            return json.loads(rows[0][0])
+        print(f"⚠️ Manifeste absent pour {s3_path}, lecture du pied de page Parquet")
+        return manifest_from_footer(s3_path, conn=conn)
+    finally:
+        conn.close()
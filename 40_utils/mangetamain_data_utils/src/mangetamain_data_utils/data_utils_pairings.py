@@ -0,0 +1,244 @@
+from .data_utils_common import *
+from .data_utils_recipes import load_recipes_clean, load_vocabulary, save_recipes_to_s3
+from scipy import sparse
+
+# =============================================================================
+# 🥕 RÉSEAU D'ASSOCIATIONS D'INGRÉDIENTS ("what goes with what")
+# =============================================================================
+
+PAIRINGS_S3_PATH = "s3://mangetamain/ingredient_pairs.parquet"
+PAIRINGS_ALL_SEASONS = "All"
+PAIRINGS_SEASON_ORDER = ["Winter", "Spring", "Summer", "Autumn"]
+
+
+def build_ingredient_matrix(
+    df: pl.DataFrame,
+    col_name: str = "ingredients",
+    vocabulary: Optional[pl.DataFrame] = None,
+) -> Tuple[sparse.csr_matrix, List[str]]:
+    """
+    Construit la matrice d'incidence creuse recettes × ingrédients.
+
+    Chaque ingrédient n'est compté qu'une fois par recette (présence/absence).
+    La colonne peut être encodée (List[UInt32], ids du vocabulaire) : les ids
+    servent alors directement d'indices de colonnes.
+
+    Args:
+        df: DataFrame avec une colonne liste d'ingrédients
+        col_name: Nom de la colonne liste
+        vocabulary: Vocabulaire (id, term), requis si la colonne est encodée
+
+    Returns:
+        (matrice CSR binaire n_recettes × n_ingrédients, termes indexés par colonne)
+    """
+    exploded = (
+        df.select(pl.int_range(pl.len(), dtype=pl.UInt32).alias("_row"), pl.col(col_name))
+        .explode(col_name)
+        .drop_nulls(col_name)
+    )
+
+    if df.schema[col_name].inner.is_integer():
+        if vocabulary is None:
+            raise ValueError(f"Colonne {col_name} encodée : vocabulaire requis")
+        terms = vocabulary.sort("id")["term"].to_list()
+        exploded = exploded.unique(subset=["_row", col_name]).with_columns(
+            pl.col(col_name).cast(pl.UInt32).alias("_col")
+        )
+    else:
+        exploded = exploded.filter(pl.col(col_name).str.len_chars() > 0).unique(
+            subset=["_row", col_name]
+        )
+        vocabulary_terms = exploded[col_name].unique().sort()
+        codes = pl.DataFrame(
+            {
+                col_name: vocabulary_terms,
+                "_col": pl.int_range(len(vocabulary_terms), dtype=pl.UInt32, eager=True),
+            }
+        )
+        exploded = exploded.join(codes, on=col_name, how="left")
+        terms = vocabulary_terms.to_list()
+
+    matrix = sparse.csr_matrix(
+        (
+            np.ones(exploded.height, dtype=np.int32),
+            (exploded["_row"].to_numpy(), exploded["_col"].to_numpy()),
+        ),
+        shape=(df.height, len(terms)),
+    )
+    return matrix, terms
+
+
+def _cooccurrence_upper(matrix: sparse.csr_matrix, min_support: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Paires (i < j) co-occurrentes au moins `min_support` fois via le produit Xᵀ·X."""
+    cooc = sparse.triu(matrix.T @ matrix, k=1).tocoo()
+    keep = cooc.data >= min_support
+    return cooc.row[keep], cooc.col[keep], cooc.data[keep]
+
+
+def compute_ingredient_pairs(
+    df: pl.DataFrame,
+    min_support: int = 20,
+    top_k: int = 15,
+    season_col: str = "season",
+    vocabulary: Optional[pl.DataFrame] = None,
+) -> pl.DataFrame:
+    """
+    Calcule la liste d'arêtes du réseau d'associations d'ingrédients.
+
+    Les co-occurrences sont obtenues par un unique produit creux Xᵀ·X sur la
+    matrice recettes × ingrédients. Les paires sous `min_support` recettes sont
+    écartées, puis chaque ingrédient conserve ses `top_k` voisins classés par
+    lift. Les arêtes retenues sont ensuite recomptées saison par saison pour
+    mesurer le glissement saisonnier de chaque association.
+
+    Args:
+        df: Recettes nettoyées (colonnes 'ingredients' et optionnellement 'season')
+        min_support: Nombre minimum de recettes contenant la paire
+        top_k: Nombre de voisins conservés par ingrédient
+        season_col: Colonne saison (ignorée si absente)
+        vocabulary: Vocabulaire (id, term) si 'ingredients' est encodée en ids
+
+    Returns:
+        DataFrame long (ingredient, neighbor, season, n_recipes, support, lift,
+        shift, rank). La saison 'All' porte les valeurs globales ; `shift` est
+        l'écart relatif du support saisonnier au support global.
+    """
+    matrix, terms = build_ingredient_matrix(df, vocabulary=vocabulary)
+    n_recipes = matrix.shape[0]
+    ingredient_counts = np.asarray(matrix.sum(axis=0)).ravel()
+
+    rows, cols, counts = _cooccurrence_upper(matrix, min_support)
+    # Calcul en float64 : en int32, counts * n_recipes déborde dès ~12k paires
+    lift = (
+        counts.astype(np.float64) * n_recipes
+        / (ingredient_counts[rows].astype(np.float64) * ingredient_counts[cols])
+    )
+
+    # Arêtes dans les deux sens pour classer les voisins de chaque ingrédient
+    edges = pl.DataFrame(
+        {
+            "_a": np.concatenate([rows, cols]).astype(np.uint32),
+            "_b": np.concatenate([cols, rows]).astype(np.uint32),
+            "n_recipes": np.concatenate([counts, counts]).astype(np.uint32),
+            "lift": np.concatenate([lift, lift]).astype(np.float32),
+        }
+    )
+    edges = (
+        edges.with_columns(
+            pl.col("lift")
+            .rank(method="ordinal", descending=True)
+            .over("_a")
+            .cast(pl.UInt16)
+            .alias("rank")
+        )
+        .filter(pl.col("rank") <= top_k)
+        .with_columns(
+            (pl.col("n_recipes") / n_recipes).cast(pl.Float32).alias("support"),
+            pl.lit(PAIRINGS_ALL_SEASONS).alias("season"),
+            pl.lit(0.0, dtype=pl.Float32).alias("shift"),
+        )
+    )
+
+    frames = [edges]
+    if season_col in df.columns:
+        a_idx = edges["_a"].to_numpy()
+        b_idx = edges["_b"].to_numpy()
+        global_support = edges["support"].to_numpy()
+        seasons = df[season_col].to_numpy()
+
+        for season in PAIRINGS_SEASON_ORDER:
+            mask = seasons == season
+            n_season = int(mask.sum())
+            if n_season == 0:
+                continue
+            sub = matrix[mask]
+            season_counts = np.asarray(sub.sum(axis=0)).ravel()
+            season_cooc = (sub.T @ sub).tocsr()
+            pair_counts = np.asarray(season_cooc[a_idx, b_idx]).ravel()
+
+            support = pair_counts / n_season
+            denom = season_counts[a_idx].astype(np.float64) * season_counts[b_idx]
+            season_lift = np.divide(
+                pair_counts.astype(np.float64) * n_season,
+                denom,
+                out=np.zeros(len(pair_counts), dtype=np.float64),
+                where=denom > 0,
+            )
+            frames.append(
+                edges.with_columns(
+                    pl.Series("n_recipes", pair_counts, dtype=pl.UInt32),
+                    pl.Series("support", support, dtype=pl.Float32),
+                    pl.Series("lift", season_lift, dtype=pl.Float32),
+                    pl.lit(season).alias("season"),
+                    pl.Series("shift", support / global_support - 1.0, dtype=pl.Float32),
+                )
+            )
+
+    names = pl.DataFrame(
+        {
+            "_idx": pl.int_range(len(terms), dtype=pl.UInt32, eager=True),
+            "name": pl.Series(terms, dtype=pl.String),
+        }
+    )
+    return (
+        pl.concat(frames)
+        .join(names.rename({"_idx": "_a", "name": "ingredient"}), on="_a", how="left")
+        .join(names.rename({"_idx": "_b", "name": "neighbor"}), on="_b", how="left")
+        .select("ingredient", "neighbor", "season", "n_recipes", "support", "lift", "shift", "rank")
+        .sort("ingredient", "season", "rank")
+    )
+
+
+def build_ingredient_pairs(
+    limit: Optional[int] = None,
+    min_support: int = 20,
+    top_k: int = 15,
+    save_to_s3: bool = False,
+) -> pl.DataFrame:
+    """
+    Pipeline complet : charge les recettes nettoyées et précalcule les arêtes.
+
+    Args:
+        limit: Nombre maximum de recettes à charger (optionnel)
+        min_support: Nombre minimum de recettes contenant la paire
+        top_k: Nombre de voisins conservés par ingrédient
+        save_to_s3: Si True, sauvegarde la liste d'arêtes sur S3
+
+    Returns:
+        Liste d'arêtes (voir compute_ingredient_pairs)
+    """
+    print("🥕 Calcul du réseau d'associations d'ingrédients...")
+    df_recipes = load_recipes_clean(limit)
+    vocabulary = (
+        load_vocabulary("ingredients")
+        if df_recipes.schema["ingredients"].inner.is_integer()
+        else None
+    )
+    pairs = compute_ingredient_pairs(
+        df_recipes, min_support=min_support, top_k=top_k, vocabulary=vocabulary
+    )
+    print(
+        f"✅ {pairs.filter(pl.col('season') == PAIRINGS_ALL_SEASONS).height:,} arêtes "
+        f"(min_support={min_support}, top_k={top_k})"
+    )
+
+    if save_to_s3:
+        save_recipes_to_s3(pairs, PAIRINGS_S3_PATH, format="parquet")
+
+    return pairs
+
+
+def load_ingredient_pairs() -> pl.DataFrame:
+    """
+    Charge la liste d'arêtes précalculée depuis le fichier Parquet sur S3.
+
+    Returns:
+        pl.DataFrame: Arêtes (ingredient, neighbor, season, n_recipes, support,
+        lift, shift, rank)
+    """
+    conn = get_s3_duckdb_connection()
+    df = conn.execute(f"SELECT * FROM read_parquet('{PAIRINGS_S3_PATH}')").pl()
+    conn.close()
+
+    print(f"✅ Associations d'ingrédients chargées depuis S3 : {df.shape[0]:,} arêtes")
+    return df
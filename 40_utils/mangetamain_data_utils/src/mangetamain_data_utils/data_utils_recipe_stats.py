@@ -0,0 +1,159 @@
+from .data_utils_common import *
+from .data_utils_ratings import load_interactions_raw
+from .data_utils_recipes import load_recipes_clean, save_recipes_to_s3
+
+# =============================================================================
+# 🍳 STATISTIQUES PAR RECETTE (POPULARITÉ, NOTES)
+# =============================================================================
+
+RECIPE_STATS_S3_PATH = "s3://mangetamain/recipe_stats.parquet"
+
+# Colonnes de final_recipes recopiées dans la table (si présentes)
+RECIPE_COLUMNS = ("name", "minutes", "n_steps", "n_ingredients", "complexity_score")
+
+# Niveaux de note des interactions (ratings à 0 exclus au chargement)
+RATING_LEVELS = (1, 2, 3, 4, 5)
+
+# Statistiques de notes par recette (mêmes colonnes dans la table DuckDB
+# recipe_stats de models_database)
+RATING_STATS_METRICS = (
+    "n_interactions",
+    "mean_rating",
+    "median_rating",
+    "first_date",
+    "last_date",
+    *[f"count_{level}" for level in RATING_LEVELS],
+)
+
+# Colonnes utilisables pour un classement top-k
+RECIPE_STATS_METRICS = (*RATING_STATS_METRICS, *RECIPE_COLUMNS[1:])
+
+
+def compute_recipe_stats(
+    recipes: pl.DataFrame, interactions: pl.DataFrame, date_col: str = "date"
+) -> pl.DataFrame:
+    """
+    Agrège les interactions recette par recette, jointes à final_recipes.
+
+    Toutes les recettes nettoyées ont une ligne : celles sans interaction ont
+    des comptes à 0 et des notes nulles. Les interactions portant sur des
+    recettes écartées au nettoyage sont ignorées.
+
+    Args:
+        recipes: Recettes nettoyées (id et colonnes de RECIPE_COLUMNS)
+        interactions: Interactions (recipe_id, date, rating)
+        date_col: Colonne date des interactions
+
+    Returns:
+        DataFrame (recipe_id, colonnes de RECIPE_COLUMNS, n_interactions,
+        mean_rating, median_rating, count_1..count_5, first_date, last_date),
+        une ligne par recette, trié par recipe_id
+    """
+    stats = (
+        interactions.drop_nulls(date_col)
+        .group_by("recipe_id")
+        .agg(
+            pl.len().alias("n_interactions"),
+            pl.col("rating").mean().alias("mean_rating"),
+            pl.col("rating").median().alias("median_rating"),
+            *[
+                (pl.col("rating") == level).sum().alias(f"count_{level}")
+                for level in RATING_LEVELS
+            ],
+            pl.col(date_col).min().cast(pl.Date).alias("first_date"),
+            pl.col(date_col).max().cast(pl.Date).alias("last_date"),
+        )
+    )
+    counts = ["n_interactions", *[f"count_{level}" for level in RATING_LEVELS]]
+
+    return (
+        recipes.select(
+            pl.col("id").alias("recipe_id"),
+            *[c for c in RECIPE_COLUMNS if c in recipes.columns],
+        )
+        .join(
+            stats.cast({"recipe_id": recipes.schema["id"]}),
+            on="recipe_id",
+            how="left",
+        )
+        .with_columns(
+            *[pl.col(c).fill_null(0).cast(pl.UInt32) for c in counts],
+            pl.col("mean_rating").cast(pl.Float32),
+            pl.col("median_rating").cast(pl.Float32),
+        )
+        .sort("recipe_id")
+    )
+
+
+def build_recipe_stats(save_to_s3: bool = False) -> pl.DataFrame:
+    """
+    Pipeline complet : agrège une fois les interactions en table par recette.
+
+    Args:
+        save_to_s3: Si True, sauvegarde la table sur S3
+
+    Returns:
+        Table par recette (voir compute_recipe_stats)
+    """
+    print("🍳 Calcul des statistiques par recette...")
+    stats = compute_recipe_stats(load_recipes_clean(), load_interactions_raw())
+    rated = stats.filter(pl.col("n_interactions") > 0).height
+    print(f"✅ {stats.height:,} recettes, dont {rated:,} notées")
+
+    if save_to_s3:
+        save_recipes_to_s3(stats, RECIPE_STATS_S3_PATH, format="parquet")
+
+    return stats
+
+
+def load_recipe_stats(
+    order_by: Optional[str] = None,
+    k: Optional[int] = None,
+    min_interactions: int = 0,
+    descending: bool = True,
+) -> pl.DataFrame:
+    """
+    Charge la table par recette depuis S3, éventuellement réduite au top-k.
+
+    Le filtre, le tri et la limite sont exécutés par DuckDB sur le Parquet :
+    un top 100 ne transfère que 100 lignes.
+
+    Args:
+        order_by: Colonne de classement (une de RECIPE_STATS_METRICS), ou
+            None pour l'ordre des recipe_id
+        k: Nombre de recettes retournées (toutes si None)
+        min_interactions: Nombre minimal d'interactions (ex. pour classer
+            par note moyenne sans recettes notées une seule fois)
+        descending: Classement décroissant (les plus populaires d'abord)
+
+    Returns:
+        pl.DataFrame: Table par recette (voir compute_recipe_stats)
+
+    Raises:
+        ValueError: Si order_by n'est pas une colonne classable
+    """
+    if order_by is None:
+        order = "recipe_id"
+    elif order_by in RECIPE_STATS_METRICS:
+        order = f"{order_by} {'DESC' if descending else 'ASC'} NULLS LAST, recipe_id"
+    else:
+        raise ValueError(
+            f"Colonne de classement inconnue: {order_by} "
+            f"(attendu: {', '.join(RECIPE_STATS_METRICS)})"
+        )
+
+    sql = (
+        f"SELECT * FROM read_parquet('{RECIPE_STATS_S3_PATH}') "
+        f"WHERE n_interactions >= ? ORDER BY {order}"
+    )
+    params = [int(min_interactions)]
+    if k is not None:
+        sql += " LIMIT ?"
+        params.append(int(k))
+
+    conn = get_s3_duckdb_connection()
+    df = conn.execute(sql, params).pl()
+    conn.close()
+
+    print(f"✅ Statistiques par recette chargées depuis S3 : {df.shape[0]:,} recettes")
+    return df
@@ -1,4 +1,9 @@
 from .data_utils_common import *
+from .data_utils_manifest import compute_manifest, manifest_path
+import json
+
+# Parquet final des recettes nettoyées (manifeste : final_recipes.manifest.json)
+RECIPES_S3_PATH = "s3://mangetamain/final_recipes.parquet"
 
 # =============================================================================
 # �📦 CHARGEMENT DES DONNÉES
@@ -44,7 +49,7 @@ def load_recipes_clean(limit: Optional[int] = None) -> pl.DataFrame:
     conn = get_s3_duckdb_connection()
     
     # Lire directement le fichier Parquet final
-    sql = "SELECT * FROM read_parquet('s3://mangetamain/final_recipes.parquet')"
+    sql = f"SELECT * FROM read_parquet('{RECIPES_S3_PATH}')"
     
     if limit:
         sql += f" LIMIT {limit}"
@@ -69,6 +74,9 @@ def save_recipes_to_s3(df: pl.DataFrame, s3_path: str, format: str = "parquet")
         >>> df_clean = clean_recipes(df_raw)
         >>> save_recipes_to_s3(df_clean, 's3://mangetamain/final_recipes.parquet')
         ✅ Sauvegardé vers s3://mangetamain/final_recipes.parquet (123,456 lignes)
+
+    Au format parquet, le manifeste (voir data_utils_manifest) est publié à
+    côté du fichier : s3://mangetamain/final_recipes.manifest.json
     """
     import boto3
     from io import BytesIO
@@ -115,6 +123,15 @@ def save_recipes_to_s3(df: pl.DataFrame, s3_path: str, format: str = "parquet")
         buffer.seek(0)
         s3_client.put_object(Bucket=bucket, Key=key, Body=buffer.getvalue())
         
+        # Manifeste (lignes, bornes, empreinte) publié à côté du Parquet
+        manifest = compute_manifest(df, buffer.getvalue())
+        s3_client.put_object(
+            Bucket=bucket,
+            Key=manifest_path(key),
+            Body=json.dumps(manifest, ensure_ascii=False).encode("utf-8"),
+            ContentType="application/json",
+        )
+        
     elif format.lower() == "csv":
         # Écrire CSV en mémoire puis uploader
         buffer = BytesIO()
@@ -167,6 +184,28 @@ def _parse_list_column(df: pl.DataFrame, col_name: str, clean_quotes: bool = Tru
     return df_parsed
 
 
+def _normalize_terms(df: pl.DataFrame, col_name: str) -> pl.DataFrame:
+    """
+    Normalise les éléments d'une colonne liste (minuscules, espaces retirés).
+    
+    Args:
+        df: DataFrame Polars
+        col_name: Nom de la colonne liste à normaliser
+        
+    Returns:
+        DataFrame avec la colonne normalisée (éléments vides retirés)
+    """
+    if col_name not in df.columns:
+        return df
+    
+    return df.with_columns([
+        pl.col(col_name)
+        .list.eval(pl.element().str.to_lowercase().str.strip_chars())
+        .list.eval(pl.element().filter(pl.element().str.len_chars() > 0))
+        .alias(col_name)
+    ])
+
+
 def _extract_nutrition_fields(df: pl.DataFrame, validate: bool = True) -> pl.DataFrame:
     """
     Format attendu: [calories, total_fat_pct, sugar_pct, sodium_pct, 
@@ -449,6 +488,10 @@ def clean_recipes(df: pl.DataFrame) -> pl.DataFrame:
     df = _parse_list_column(df, "ingredients", clean_quotes=True)
     df = _parse_list_column(df, "steps")
     
+    # 5b. Normaliser les termes une fois pour toutes (minuscules, espaces)
+    df = _normalize_terms(df, "tags")
+    df = _normalize_terms(df, "ingredients")
+    
     # 6. Extraire les champs nutrition avec validation
     df = _extract_nutrition_fields(df, validate=True)
     
@@ -610,6 +653,210 @@ def enrich_recipes(df: pl.DataFrame) -> pl.DataFrame:
     
     return df
 
+# =============================================================================
+# 🔤 VOCABULAIRES - ENCODAGE DICTIONNAIRE DES INGRÉDIENTS / TAGS
+# =============================================================================
+
+VOCABULARY_COLUMNS = ("ingredients", "tags")
+VOCABULARY_S3_PATHS = {
+    "ingredients": "s3://mangetamain/vocab_ingredients.parquet",
+    "tags": "s3://mangetamain/vocab_tags.parquet",
+}
+_VOCABULARY_SCHEMA = {
+    "id": pl.UInt32,
+    "term": pl.String,
+    "n_recipes": pl.UInt32,
+    "first_year": pl.Int32,
+}
+
+
+def build_vocabulary(
+    df: pl.DataFrame,
+    col_name: str,
+    year_col: str = "year",
+    existing: Optional[pl.DataFrame] = None,
+) -> pl.DataFrame:
+    """
+    Construit le vocabulaire global d'une colonne liste de chaînes.
+    
+    Les ids sont stables : les termes déjà présents dans `existing` gardent
+    leur id, les nouveaux termes sont ajoutés à la suite, triés par année
+    d'apparition puis alphabétiquement. Un terme absent des nouvelles
+    données reste dans le vocabulaire avec une fréquence nulle.
+    
+    Args:
+        df: DataFrame avec la colonne liste (List[String]) et l'année
+        col_name: Nom de la colonne liste ('ingredients' ou 'tags')
+        year_col: Colonne année pour la première apparition (optionnelle)
+        existing: Vocabulaire précédent (id, term, n_recipes, first_year)
+        
+    Returns:
+        DataFrame (id UInt32, term, n_recipes UInt32, first_year Int32) trié par id
+    """
+    year_expr = pl.col(year_col) if year_col in df.columns else pl.lit(None)
+    stats = (
+        df.select(pl.col(col_name).list.unique(), year_expr.cast(pl.Int32).alias("first_year"))
+        .explode(col_name)
+        .drop_nulls(col_name)
+        .group_by(col_name)
+        .agg(
+            pl.len().cast(pl.UInt32).alias("n_recipes"),
+            pl.col("first_year").min(),
+        )
+        .rename({col_name: "term"})
+    )
+    
+    if existing is None:
+        existing = pl.DataFrame(schema=_VOCABULARY_SCHEMA)
+    
+    known = (
+        existing.select("id", "term", pl.col("first_year").alias("_prev_year"))
+        .join(stats, on="term", how="left")
+        .with_columns(
+            pl.col("n_recipes").fill_null(0),
+            pl.min_horizontal("_prev_year", "first_year").alias("first_year"),
+        )
+        .drop("_prev_year")
+    )
+    
+    next_id = int(existing["id"].max()) + 1 if existing.height > 0 else 0
+    new_terms = (
+        stats.join(existing.select("term"), on="term", how="anti")
+        .sort(["first_year", "term"], nulls_last=True)
+        .with_columns(
+            (pl.int_range(pl.len(), dtype=pl.UInt32) + next_id).alias("id")
+        )
+    )
+    
+    return (
+        pl.concat([known, new_terms], how="diagonal")
+        .select([pl.col(name).cast(dtype) for name, dtype in _VOCABULARY_SCHEMA.items()])
+        .sort("id")
+    )
+
+
+def encode_list_column(df: pl.DataFrame, col_name: str, vocabulary: pl.DataFrame) -> pl.DataFrame:
+    """
+    Remplace une colonne List[String] par les ids du vocabulaire (List[UInt32]).
+    
+    Args:
+        df: DataFrame avec la colonne liste de chaînes
+        col_name: Nom de la colonne liste
+        vocabulary: Vocabulaire (id, term) issu de build_vocabulary
+        
+    Returns:
+        DataFrame avec la colonne encodée (termes inconnus retirés)
+    """
+    if col_name not in df.columns:
+        return df
+    
+    return df.with_columns([
+        pl.col(col_name)
+        .list.eval(
+            pl.element().replace_strict(
+                old=vocabulary["term"],
+                new=vocabulary["id"],
+                default=None,
+                return_dtype=pl.UInt32,
+            )
+        )
+        .list.drop_nulls()
+        .alias(col_name)
+    ])
+
+
+def decode_list_column(df: pl.DataFrame, col_name: str, vocabulary: pl.DataFrame) -> pl.DataFrame:
+    """
+    Opération inverse d'encode_list_column : ids List[UInt32] -> termes List[String].
+    
+    Args:
+        df: DataFrame avec la colonne liste d'ids
+        col_name: Nom de la colonne liste
+        vocabulary: Vocabulaire (id, term)
+        
+    Returns:
+        DataFrame avec la colonne décodée
+    """
+    if col_name not in df.columns:
+        return df
+    
+    return df.with_columns([
+        pl.col(col_name)
+        .list.eval(
+            pl.element().replace_strict(
+                old=vocabulary["id"],
+                new=vocabulary["term"],
+                default=None,
+                return_dtype=pl.String,
+            )
+        )
+        .alias(col_name)
+    ])
+
+
+def encode_vocabularies(
+    df: pl.DataFrame,
+    existing: Optional[Dict[str, pl.DataFrame]] = None,
+) -> Tuple[pl.DataFrame, Dict[str, pl.DataFrame]]:
+    """
+    Construit les vocabulaires ingrédients/tags et encode les colonnes liste.
+    
+    Args:
+        df: Recettes nettoyées et enrichies (colonnes liste de chaînes + 'year')
+        existing: Vocabulaires précédents par colonne, pour conserver les ids
+        
+    Returns:
+        (DataFrame avec colonnes List[UInt32], {colonne: vocabulaire})
+    """
+    existing = existing or {}
+    vocabularies = {}
+    
+    for col_name in VOCABULARY_COLUMNS:
+        if col_name not in df.columns:
+            continue
+        vocabularies[col_name] = build_vocabulary(
+            df, col_name, existing=existing.get(col_name)
+        )
+        df = encode_list_column(df, col_name, vocabularies[col_name])
+        print(f"   ✓ Vocabulaire {col_name} : {vocabularies[col_name].height:,} termes")
+    
+    return df, vocabularies
+
+
+def load_vocabulary(col_name: str) -> pl.DataFrame:
+    """
+    Charge un vocabulaire (ingredients ou tags) depuis son fichier Parquet sur S3.
+    
+    Args:
+        col_name: 'ingredients' ou 'tags'
+        
+    Returns:
+        pl.DataFrame: Vocabulaire (id, term, n_recipes, first_year)
+    """
+    if col_name not in VOCABULARY_S3_PATHS:
+        raise ValueError(f"Vocabulaire inconnu: {col_name}. Utilisez {list(VOCABULARY_S3_PATHS)}")
+    
+    conn = get_s3_duckdb_connection()
+    df = conn.execute(
+        f"SELECT * FROM read_parquet('{VOCABULARY_S3_PATHS[col_name]}') ORDER BY id"
+    ).pl()
+    conn.close()
+    
+    print(f"✅ Vocabulaire {col_name} chargé depuis S3 : {df.shape[0]:,} termes")
+    return df
+
+
+def _load_existing_vocabularies() -> Dict[str, pl.DataFrame]:
+    """Charge les vocabulaires déjà publiés sur S3 (vide si absents) pour garder des ids stables."""
+    existing = {}
+    for col_name in VOCABULARY_COLUMNS:
+        try:
+            existing[col_name] = load_vocabulary(col_name)
+        except Exception as e:
+            print(f"   ℹ️  Pas de vocabulaire {col_name} existant ({e}) : ids recréés")
+    return existing
+
+
 # =============================================================================
 # 🚀 PIPELINE COMPLET
 # =============================================================================
@@ -617,6 +864,8 @@ def enrich_recipes(df: pl.DataFrame) -> pl.DataFrame:
 def load_clean_recipes(limit: Optional[int] = None, save_to_s3: bool = False) -> pl.DataFrame:
     """
     Pipeline complet : charge, nettoie et enrichit les recettes en une seule commande.
+    Les colonnes 'ingredients' et 'tags' sont encodées en ids List[UInt32]
+    (vocabulaires publiés à côté du Parquet final).
     Sauvegarde automatiquement le résultat sur S3.
 
     Args: 
@@ -638,12 +887,19 @@ def load_clean_recipes(limit: Optional[int] = None, save_to_s3: bool = False) ->
     print("\n3️⃣ Enrichissement des features...")
     df_final = enrich_recipes(df_clean)
     
-    # 4️⃣ Sauvegarde sur S3
+    # 4️⃣ Encodage dictionnaire des ingrédients / tags (ids stables)
+    print("\n4️⃣ Encodage des vocabulaires...")
+    existing = _load_existing_vocabularies() if save_to_s3 else None
+    df_final, vocabularies = encode_vocabularies(df_final, existing=existing)
+    
+    # 5️⃣ Sauvegarde sur S3
     if save_to_s3:
-        print("\n4️⃣ Sauvegarde sur S3...")
-        s3_path = "s3://mangetamain/final_recipes.parquet"
+        print("\n5️⃣ Sauvegarde sur S3...")
+        s3_path = RECIPES_S3_PATH
         save_recipes_to_s3(df_final, s3_path, format="parquet")
         print(f"💾 Dataset final sauvegardé : {s3_path}")
+        for col_name, vocabulary in vocabularies.items():
+            save_recipes_to_s3(vocabulary, VOCABULARY_S3_PATHS[col_name], format="parquet")
     
     print("\n✅ Pipeline complet terminé !")
     return df_final
@@ -0,0 +1,179 @@
+from .data_utils_common import *
+from .data_utils_ratings import load_interactions_raw
+from .data_utils_recipes import save_recipes_to_s3
+
+# =============================================================================
+# 👥 TABLES D'ACTIVITÉ DES UTILISATEURS
+# =============================================================================
+
+USER_STATS_S3_PATH = "s3://mangetamain/user_stats.parquet"
+MONTHLY_ACTIVE_USERS_S3_PATH = "s3://mangetamain/monthly_active_users.parquet"
+
+
+def compute_user_stats(
+    interactions: pl.DataFrame, date_col: str = "date"
+) -> pl.DataFrame:
+    """
+    Agrège les interactions utilisateur par utilisateur.
+
+    Le biais de notation compare chaque note à la moyenne des autres notes
+    de la même recette (moyenne « leave-one-out ») : un biais négatif
+    signale un utilisateur plus sévère que les autres sur les mêmes
+    recettes. Les recettes notées par ce seul utilisateur sont ignorées.
+
+    Args:
+        interactions: Interactions (user_id, recipe_id, date, rating)
+        date_col: Colonne date des interactions
+
+    Returns:
+        DataFrame (user_id, first_date, last_date, tenure_days, n_ratings,
+        mean_rating, rating_bias), une ligne par utilisateur, trié par user_id
+    """
+    df = interactions.drop_nulls(date_col).with_columns(
+        pl.col(date_col).cast(pl.Date).alias("date")
+    )
+
+    # Moyenne des autres notes de la recette : (somme - note) / (n - 1)
+    recipe_sum = pl.col("rating").sum().over("recipe_id")
+    recipe_n = pl.len().over("recipe_id")
+    df = df.with_columns(
+        pl.when(recipe_n > 1)
+        .then(pl.col("rating") - (recipe_sum - pl.col("rating")) / (recipe_n - 1))
+        .alias("bias")
+    )
+
+    return (
+        df.group_by("user_id")
+        .agg(
+            pl.col("date").min().alias("first_date"),
+            pl.col("date").max().alias("last_date"),
+            pl.len().alias("n_ratings"),
+            pl.col("rating").mean().alias("mean_rating"),
+            pl.col("bias").mean().alias("rating_bias"),
+        )
+        .select(
+            "user_id",
+            "first_date",
+            "last_date",
+            (pl.col("last_date") - pl.col("first_date"))
+            .dt.total_days()
+            .cast(pl.Int32)
+            .alias("tenure_days"),
+            pl.col("n_ratings").cast(pl.UInt32),
+            pl.col("mean_rating").cast(pl.Float32),
+            pl.col("rating_bias").cast(pl.Float32),
+        )
+        .sort("user_id")
+    )
+
+
+def compute_monthly_active_users(
+    interactions: pl.DataFrame, date_col: str = "date"
+) -> pl.DataFrame:
+    """
+    Compte les utilisateurs actifs et nouveaux de chaque mois.
+
+    Le calendrier est complet entre le premier et le dernier mois observé :
+    les mois sans activité ont des comptes à 0.
+
+    Args:
+        interactions: Interactions (user_id, date)
+        date_col: Colonne date des interactions
+
+    Returns:
+        DataFrame (month, n_active_users, n_new_users, n_interactions), une
+        ligne par mois (1er jour du mois), trié par mois
+    """
+    df = interactions.drop_nulls(date_col).select(
+        "user_id", pl.col(date_col).cast(pl.Date).dt.truncate("1mo").alias("month")
+    )
+
+    active = df.group_by("month").agg(
+        pl.col("user_id").n_unique().alias("n_active_users"),
+        pl.len().alias("n_interactions"),
+    )
+    new = (
+        df.group_by("user_id")
+        .agg(pl.col("month").min())
+        .group_by("month")
+        .agg(pl.len().alias("n_new_users"))
+    )
+
+    calendar = pl.DataFrame(
+        {
+            "month": pl.date_range(
+                df["month"].min(), df["month"].max(), "1mo", eager=True
+            )
+        }
+    )
+
+    return (
+        calendar.join(active, on="month", how="left")
+        .join(new, on="month", how="left")
+        .select(
+            "month",
+            pl.col("n_active_users").fill_null(0).cast(pl.UInt32),
+            pl.col("n_new_users").fill_null(0).cast(pl.UInt32),
+            pl.col("n_interactions").fill_null(0).cast(pl.UInt32),
+        )
+        .sort("month")
+    )
+
+
+def build_user_tables(save_to_s3: bool = False) -> Tuple[pl.DataFrame, pl.DataFrame]:
+    """
+    Pipeline complet : agrège une fois les interactions en tables utilisateurs.
+
+    Args:
+        save_to_s3: Si True, sauvegarde les deux tables sur S3
+
+    Returns:
+        (user_stats, monthly_active_users), voir compute_user_stats et
+        compute_monthly_active_users
+    """
+    print("👥 Calcul des tables d'activité des utilisateurs...")
+    interactions = load_interactions_raw()
+    users = compute_user_stats(interactions)
+    monthly = compute_monthly_active_users(interactions)
+    print(f"✅ {users.height:,} utilisateurs, {monthly.height:,} mois")
+
+    if save_to_s3:
+        save_recipes_to_s3(users, USER_STATS_S3_PATH, format="parquet")
+        save_recipes_to_s3(monthly, MONTHLY_ACTIVE_USERS_S3_PATH, format="parquet")
+
+    return users, monthly
+
+
+def load_user_stats() -> pl.DataFrame:
+    """
+    Charge la table par utilisateur depuis S3.
+
+    Returns:
+        pl.DataFrame: (user_id, first_date, last_date, tenure_days, n_ratings,
+        mean_rating, rating_bias)
+    """
+    conn = get_s3_duckdb_connection()
+    df = conn.execute(
+        f"SELECT * FROM read_parquet('{USER_STATS_S3_PATH}') ORDER BY user_id"
+    ).pl()
+    conn.close()
+
+    print(f"✅ Statistiques utilisateurs chargées depuis S3 : {df.shape[0]:,} utilisateurs")
+    return df
+
+
+def load_monthly_active_users() -> pl.DataFrame:
+    """
+    Charge les comptes mensuels d'utilisateurs actifs depuis S3.
+
+    Returns:
+        pl.DataFrame: (month, n_active_users, n_new_users, n_interactions)
+    """
+    conn = get_s3_duckdb_connection()
+    df = conn.execute(
+        f"SELECT * FROM read_parquet('{MONTHLY_ACTIVE_USERS_S3_PATH}') ORDER BY month"
+    ).pl()
+    conn.close()
+
+    print(f"✅ Utilisateurs actifs mensuels chargés depuis S3 : {df.shape[0]:,} mois")
+    return df
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Tests unitaires pour data_utils_daily"""
+
+from datetime import date, datetime
+
+import pytest
+import polars as pl
+from unittest.mock import MagicMock, patch
+
+from mangetamain_data_utils.data_utils_daily import (
+    DAILY_COUNTS_S3_PATH,
+    build_daily_counts,
+    compute_daily_counts,
+    load_daily_counts,
+)
+
+
+@pytest.fixture
+def recipes_df():
+    """Recettes soumises sur 3 jours distincts"""
+    return pl.DataFrame({
+        'submitted': [date(2008, 12, 30), date(2008, 12, 30), date(2009, 1, 2), None],
+    })
+
+
+@pytest.fixture
+def interactions_df():
+    """Interactions horodatées avec notes"""
+    return pl.DataFrame({
+        'date': [
+            datetime(2008, 12, 31, 10), datetime(2008, 12, 31, 18),
+            datetime(2009, 1, 2, 9), datetime(2009, 1, 3, 12),
+        ],
+        'rating': [4, 5, 3, 5],
+    })
+
+
+class TestComputeDailyCounts:
+    """Tests pour compute_daily_counts"""
+
+    def test_schema(self, recipes_df, interactions_df):
+        """Test schéma compact de la table quotidienne"""
+        daily = compute_daily_counts(recipes_df, interactions_df)
+
+        assert daily.columns == ['date', 'year', 'n_recipes', 'n_interactions', 'mean_rating']
+        assert daily.schema['n_recipes'] == pl.UInt32
+        assert daily.schema['mean_rating'] == pl.Float32
+
+    def test_complete_calendar(self, recipes_df, interactions_df):
+        """Test calendrier continu, jours vides à 0"""
+        daily = compute_daily_counts(recipes_df, interactions_df)
+
+        assert daily['date'].to_list() == [
+            date(2008, 12, 30), date(2008, 12, 31), date(2009, 1, 1),
+            date(2009, 1, 2), date(2009, 1, 3),
+        ]
+        assert daily['year'].to_list() == [2008, 2008, 2009, 2009, 2009]
+        assert daily['n_recipes'].to_list() == [2, 0, 0, 1, 0]
+        assert daily['n_interactions'].to_list() == [0, 2, 0, 1, 1]
+
+    def test_mean_rating(self, recipes_df, interactions_df):
+        """Test note moyenne du jour, nulle sans interaction"""
+        daily = compute_daily_counts(recipes_df, interactions_df)
+
+        assert daily['mean_rating'][1] == pytest.approx(4.5)
+        assert daily['mean_rating'][0] is None
+        assert daily['mean_rating'][2] is None
+
+
+class TestDailyCountsIO:
+    """Tests pour build_daily_counts et load_daily_counts"""
+
+    @patch('mangetamain_data_utils.data_utils_daily.save_recipes_to_s3')
+    @patch('mangetamain_data_utils.data_utils_daily.load_interactions_raw')
+    @patch('mangetamain_data_utils.data_utils_daily.load_recipes_clean')
+    def test_build_saves_to_s3(self, mock_recipes, mock_interactions, mock_save,
+                               recipes_df, interactions_df):
+        """Test pipeline complet avec sauvegarde S3"""
+        mock_recipes.return_value = recipes_df
+        mock_interactions.return_value = interactions_df
+
+        daily = build_daily_counts(save_to_s3=True)
+
+        assert daily.height == 5
+        mock_save.assert_called_once()
+        assert mock_save.call_args[0][1] == DAILY_COUNTS_S3_PATH
+
+    @patch('mangetamain_data_utils.data_utils_daily.get_s3_duckdb_connection')
+    def test_load_single_year(self, mock_conn):
+        """Test filtre sur l'année poussé dans la requête"""
+        expected = pl.DataFrame({'date': [date(2009, 1, 1)], 'year': [2009]})
+        conn = MagicMock()
+        conn.execute.return_value.pl.return_value = expected
+        mock_conn.return_value = conn
+
+        result = load_daily_counts(2009)
+
+        assert result.equals(expected)
+        sql, params = conn.execute.call_args[0]
+        assert DAILY_COUNTS_S3_PATH in sql
+        assert 'WHERE year = ?' in sql
+        assert params == [2009]
+        conn.close.assert_called_once()
+
+    @patch('mangetamain_data_utils.data_utils_daily.get_s3_duckdb_connection')
+    def test_load_all_years(self, mock_conn):
+        """Test lecture complète sans filtre"""
+        conn = MagicMock()
+        conn.execute.return_value.pl.return_value = pl.DataFrame()
+        mock_conn.return_value = conn
+
+        load_daily_counts()
+
+        assert 'WHERE' not in conn.execute.call_args[0][0]
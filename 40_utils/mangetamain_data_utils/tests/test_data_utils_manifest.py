@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Tests unitaires pour data_utils_manifest"""
+
+import json
+import sys
+from datetime import date
+from io import BytesIO
+
+import duckdb
+import pytest
+import polars as pl
+from unittest.mock import MagicMock, patch
+
+from mangetamain_data_utils.data_utils_manifest import (
+    compute_manifest,
+    load_manifest,
+    manifest_from_footer,
+    manifest_path,
+)
+from mangetamain_data_utils.data_utils_recipes import save_recipes_to_s3
+
+
+@pytest.fixture
+def recipes_df():
+    """4 recettes sur 2 années, une sans date et une liste de tags"""
+    return pl.DataFrame({
+        'id': [30, 10, 20, 40],
+        'name': ['tarte', 'soupe', 'salade', 'gratin'],
+        'year': [2005, 1999, 2018, 2010],
+        'submitted': [date(2005, 3, 1), date(1999, 8, 6), date(2018, 12, 4), None],
+        'calories': [400.0, 150.0, None, 320.5],
+        'tags': [[1, 2], [3], [], [2]],
+    })
+
+
+def _parquet_bytes(df):
+    buffer = BytesIO()
+    df.write_parquet(buffer)
+    return buffer.getvalue()
+
+
+class TestManifestPath:
+    """Tests pour manifest_path"""
+
+    def test_parquet_suffix(self):
+        """Test le manifeste remplace l'extension .parquet"""
+        assert manifest_path('s3://mangetamain/final_recipes.parquet') == (
+            's3://mangetamain/final_recipes.manifest.json'
+        )
+        assert manifest_path('vocab/tags.parquet') == 'vocab/tags.manifest.json'
+
+
+class TestComputeManifest:
+    """Tests pour compute_manifest"""
+
+    def test_metrics(self, recipes_df):
+        """Test lignes, bornes, nulls et plages de dates"""
+        payload = _parquet_bytes(recipes_df)
+        manifest = compute_manifest(recipes_df, payload)
+
+        assert manifest['rows'] == 4
+        assert manifest['bytes'] == len(payload)
+        assert manifest['hash_source'] == 'content'
+        assert len(manifest['content_hash']) == 16
+        assert manifest['columns']['year'] == {
+            'dtype': 'Int64', 'null_count': 0, 'min': 1999, 'max': 2018,
+        }
+        assert manifest['columns']['calories']['null_count'] == 1
+        assert 'min' not in manifest['columns']['name']
+        assert 'min' not in manifest['columns']['tags']
+        assert manifest['date_ranges'] == {'submitted': ['1999-08-06', '2018-12-04']}
+        json.dumps(manifest)
+
+    def test_hash_follows_content(self, recipes_df):
+        """Test l'empreinte ne change qu'avec le contenu du Parquet"""
+        first = compute_manifest(recipes_df, _parquet_bytes(recipes_df))
+        same = compute_manifest(recipes_df, _parquet_bytes(recipes_df))
+        other_df = recipes_df.head(3)
+        other = compute_manifest(other_df, _parquet_bytes(other_df))
+
+        assert first['content_hash'] == same['content_hash']
+        assert first['content_hash'] != other['content_hash']
+
+
+class TestManifestFromFooter:
+    """Tests pour manifest_from_footer"""
+
+    def test_matches_computed_manifest(self, recipes_df, tmp_path):
+        """Test le pied de page donne les mêmes lignes et bornes"""
+        path = str(tmp_path / 'recipes.parquet')
+        recipes_df.write_parquet(path)
+
+        manifest = manifest_from_footer(path, conn=duckdb.connect())
+
+        assert manifest['rows'] == 4
+        assert manifest['hash_source'] == 'footer'
+        assert manifest['columns']['year']['min'] == 1999
+        assert manifest['columns']['year']['max'] == 2018
+        assert manifest['columns']['calories']['null_count'] == 1
+        assert manifest['columns']['tags']['dtype'] == 'LIST'
+        assert manifest['date_ranges'] == {'submitted': ['1999-08-06', '2018-12-04']}
+
+
+class TestManifestIO:
+    """Tests pour load_manifest et l'écriture par save_recipes_to_s3"""
+
+    @patch('mangetamain_data_utils.data_utils_manifest.get_s3_duckdb_connection')
+    def test_load_manifest_prefers_json(self, mock_conn, recipes_df, tmp_path):
+        """Test le manifeste publié est lu, sinon le pied de page"""
+        path = str(tmp_path / 'recipes.parquet')
+        recipes_df.write_parquet(path)
+        mock_conn.side_effect = lambda: duckdb.connect()
+
+        assert load_manifest(path)['hash_source'] == 'footer'
+
+        (tmp_path / 'recipes.manifest.json').write_text(
+            json.dumps({'rows': 4, 'content_hash': 'abc'})
+        )
+        assert load_manifest(path) == {'rows': 4, 'content_hash': 'abc'}
+
+    @patch('mangetamain_data_utils.data_utils_recipes.get_s3_credentials_path')
+    def test_save_writes_manifest(self, mock_creds, recipes_df, tmp_path):
+        """Test le manifeste est publié à côté du Parquet"""
+        creds = tmp_path / 'credentials'
+        creds.write_text('[s3fast]\naws_access_key_id = k\naws_secret_access_key = s\n')
+        mock_creds.return_value = creds
+        client = MagicMock()
+
+        with patch.dict(sys.modules, {'boto3': MagicMock(client=lambda *a, **k: client)}):
+            save_recipes_to_s3(recipes_df, 's3://mangetamain/final_recipes.parquet')
+
+        keys = [c.kwargs['Key'] for c in client.put_object.call_args_list]
+        assert keys == ['final_recipes.parquet', 'final_recipes.manifest.json']
+        manifest = json.loads(client.put_object.call_args_list[1].kwargs['Body'])
+        parquet = client.put_object.call_args_list[0].kwargs['Body']
+        assert manifest['rows'] == 4
+        assert manifest == {**compute_manifest(recipes_df, parquet), 'created_at': manifest['created_at']}
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""Tests unitaires pour data_utils_pairings"""
+
+import pytest
+import polars as pl
+from unittest.mock import MagicMock, patch
+
+from mangetamain_data_utils.data_utils_pairings import (
+    PAIRINGS_S3_PATH,
+    build_ingredient_matrix,
+    build_ingredient_pairs,
+    compute_ingredient_pairs,
+    load_ingredient_pairs,
+)
+
+
+@pytest.fixture
+def recipes_df():
+    """Recettes minimales avec ingrédients et saison"""
+    return pl.DataFrame({
+        'ingredients': [
+            ['salt', 'pepper', 'egg'],
+            ['salt', 'pepper'],
+            ['egg', 'milk', 'salt'],
+            ['milk', 'egg'],
+        ] * 10,
+        'season': ['Winter', 'Summer', 'Winter', 'Spring'] * 10,
+    })
+
+
+class TestBuildIngredientMatrix:
+    """Tests pour build_ingredient_matrix"""
+
+    def test_shape_and_vocabulary(self, recipes_df):
+        """Test dimensions et vocabulaire trié"""
+        matrix, vocabulary = build_ingredient_matrix(recipes_df)
+
+        assert vocabulary == ['egg', 'milk', 'pepper', 'salt']
+        assert matrix.shape == (40, 4)
+        assert matrix.sum() == 100
+
+    def test_duplicates_and_empty_ignored(self):
+        """Test présence/absence : doublons, chaînes vides et nulls ignorés"""
+        df = pl.DataFrame({'ingredients': [['salt', 'salt', ''], None, ['egg']]})
+        matrix, vocabulary = build_ingredient_matrix(df)
+
+        assert vocabulary == ['egg', 'salt']
+        assert matrix.shape == (3, 2)
+        assert matrix.toarray().tolist() == [[0, 1], [0, 0], [1, 0]]
+
+
+class TestComputeIngredientPairs:
+    """Tests pour compute_ingredient_pairs"""
+
+    def test_schema(self, recipes_df):
+        """Test schéma compact de la liste d'arêtes"""
+        pairs = compute_ingredient_pairs(recipes_df, min_support=5, top_k=2)
+
+        assert pairs.columns == [
+            'ingredient', 'neighbor', 'season', 'n_recipes',
+            'support', 'lift', 'shift', 'rank',
+        ]
+        assert pairs.schema['n_recipes'] == pl.UInt32
+        assert pairs.schema['lift'] == pl.Float32
+
+    def test_global_counts_and_lift(self, recipes_df):
+        """Test comptage des co-occurrences et calcul du lift"""
+        pairs = compute_ingredient_pairs(recipes_df, min_support=5, top_k=5)
+        row = pairs.filter(
+            (pl.col('ingredient') == 'egg')
+            & (pl.col('neighbor') == 'milk')
+            & (pl.col('season') == 'All')
+        ).row(0, named=True)
+
+        assert row['n_recipes'] == 20
+        assert row['support'] == pytest.approx(0.5)
+        # lift = 20 * 40 / (30 * 20)
+        assert row['lift'] == pytest.approx(4 / 3, rel=1e-5)
+        assert row['rank'] == 1
+
+    def test_lift_without_int32_overflow(self):
+        """Test lift d'une paire dont count * n_recipes dépasse 2^31"""
+        n_recipes, n_pair = 178_265, 20_000
+        df = pl.DataFrame({
+            'ingredients': [['egg', 'milk']] * n_pair + [['salt']] * (n_recipes - n_pair),
+            'season': ['Winter'] * n_recipes,
+        })
+        pairs = compute_ingredient_pairs(df, min_support=5, top_k=5)
+        lifts = pairs.filter(
+            (pl.col('ingredient') == 'egg') & (pl.col('neighbor') == 'milk')
+        ).sort('season')['lift'].to_list()
+
+        # lift = 20000 * 178265 / (20000 * 20000), global et pour Winter
+        assert lifts == pytest.approx([n_recipes / n_pair] * 2, rel=1e-5)
+
+    def test_symmetric_edges(self, recipes_df):
+        """Test arêtes présentes dans les deux sens"""
+        pairs = compute_ingredient_pairs(recipes_df, min_support=5, top_k=5)
+        overall = pairs.filter(pl.col('season') == 'All')
+
+        forward = set(zip(overall['ingredient'], overall['neighbor']))
+        backward = set(zip(overall['neighbor'], overall['ingredient']))
+        assert forward == backward
+
+    def test_min_support_filter(self, recipes_df):
+        """Test filtrage des paires sous le support minimum"""
+        pairs = compute_ingredient_pairs(recipes_df, min_support=15, top_k=5)
+        overall = pairs.filter(pl.col('season') == 'All')
+
+        assert overall['n_recipes'].min() >= 15
+        assert ('pepper', 'egg') not in set(zip(overall['ingredient'], overall['neighbor']))
+
+    def test_top_k(self, recipes_df):
+        """Test nombre maximum de voisins par ingrédient"""
+        pairs = compute_ingredient_pairs(recipes_df, min_support=1, top_k=1)
+        overall = pairs.filter(pl.col('season') == 'All')
+
+        assert overall.group_by('ingredient').len()['len'].max() == 1
+
+    def test_season_shift(self, recipes_df):
+        """Test recomptage saisonnier et écart relatif au support global"""
+        pairs = compute_ingredient_pairs(recipes_df, min_support=5, top_k=5)
+        egg_milk = pairs.filter(
+            (pl.col('ingredient') == 'egg') & (pl.col('neighbor') == 'milk')
+        )
+        by_season = dict(zip(egg_milk['season'], egg_milk['shift']))
+
+        assert set(by_season) == {'All', 'Winter', 'Spring', 'Summer'}
+        assert by_season['All'] == 0.0
+        assert by_season['Spring'] == pytest.approx(1.0)
+        assert by_season['Summer'] == pytest.approx(-1.0)
+
+    def test_encoded_column(self, recipes_df):
+        """Test colonne encodée List[UInt32] : mêmes arêtes qu'en chaînes"""
+        vocabulary = pl.DataFrame({
+            'id': pl.Series([0, 1, 2, 3], dtype=pl.UInt32),
+            'term': ['egg', 'milk', 'pepper', 'salt'],
+        })
+        encoded = recipes_df.with_columns(
+            pl.col('ingredients').list.eval(
+                pl.element().replace_strict(
+                    old=vocabulary['term'], new=vocabulary['id'], return_dtype=pl.UInt32
+                )
+            )
+        )
+
+        expected = compute_ingredient_pairs(recipes_df, min_support=5)
+        result = compute_ingredient_pairs(encoded, min_support=5, vocabulary=vocabulary)
+
+        assert result.equals(expected)
+
+    def test_encoded_column_requires_vocabulary(self, recipes_df):
+        """Test colonne encodée sans vocabulaire"""
+        encoded = pl.DataFrame({'ingredients': [[0, 1]]}, schema={'ingredients': pl.List(pl.UInt32)})
+
+        with pytest.raises(ValueError):
+            build_ingredient_matrix(encoded)
+
+    def test_without_season_column(self, recipes_df):
+        """Test sans colonne saison : uniquement les valeurs globales"""
+        pairs = compute_ingredient_pairs(recipes_df.drop('season'), min_support=5)
+
+        assert pairs['season'].unique().to_list() == ['All']
+
+
+class TestPairingsIO:
+    """Tests pour build_ingredient_pairs et load_ingredient_pairs"""
+
+    @patch('mangetamain_data_utils.data_utils_pairings.save_recipes_to_s3')
+    @patch('mangetamain_data_utils.data_utils_pairings.load_recipes_clean')
+    def test_build_saves_to_s3(self, mock_load, mock_save, recipes_df):
+        """Test pipeline complet avec sauvegarde S3"""
+        mock_load.return_value = recipes_df
+
+        pairs = build_ingredient_pairs(min_support=5, save_to_s3=True)
+
+        assert pairs.height > 0
+        mock_save.assert_called_once()
+        assert mock_save.call_args[0][1] == PAIRINGS_S3_PATH
+
+    @patch('mangetamain_data_utils.data_utils_pairings.load_vocabulary')
+    @patch('mangetamain_data_utils.data_utils_pairings.load_recipes_clean')
+    def test_build_loads_vocabulary_when_encoded(self, mock_load, mock_vocab):
+        """Test chargement du vocabulaire pour une colonne encodée"""
+        mock_load.return_value = pl.DataFrame(
+            {'ingredients': [[0, 1]] * 5}, schema={'ingredients': pl.List(pl.UInt32)}
+        )
+        mock_vocab.return_value = pl.DataFrame({
+            'id': pl.Series([0, 1], dtype=pl.UInt32), 'term': ['egg', 'milk'],
+        })
+
+        pairs = build_ingredient_pairs(min_support=5)
+
+        mock_vocab.assert_called_once_with('ingredients')
+        assert pairs['ingredient'].to_list() == ['egg', 'milk']
+
+    @patch('mangetamain_data_utils.data_utils_pairings.get_s3_duckdb_connection')
+    def test_load_from_s3(self, mock_conn):
+        """Test lecture du Parquet précalculé"""
+        expected = pl.DataFrame({'ingredient': ['egg'], 'neighbor': ['milk']})
+        conn = MagicMock()
+        conn.execute.return_value.pl.return_value = expected
+        mock_conn.return_value = conn
+
+        result = load_ingredient_pairs()
+
+        assert result.equals(expected)
+        assert PAIRINGS_S3_PATH in conn.execute.call_args[0][0]
+        conn.close.assert_called_once()
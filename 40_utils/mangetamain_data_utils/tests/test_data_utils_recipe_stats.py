@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Tests unitaires pour data_utils_recipe_stats"""
+
+from datetime import date, datetime
+
+import pytest
+import polars as pl
+from unittest.mock import MagicMock, patch
+
+from mangetamain_data_utils.data_utils_recipe_stats import (
+    RECIPE_STATS_S3_PATH,
+    build_recipe_stats,
+    compute_recipe_stats,
+    load_recipe_stats,
+)
+
+
+@pytest.fixture
+def recipes_df():
+    """3 recettes nettoyées, dont une jamais notée"""
+    return pl.DataFrame({
+        'id': [30, 10, 20],
+        'name': ['tarte', 'soupe', 'salade'],
+        'minutes': [60, 20, 10],
+        'n_steps': [8, 4, 2],
+        'n_ingredients': [9, 5, 4],
+        'complexity_score': [14.6, 9.5, 6.4],
+        'calories': [400.0, 150.0, 90.0],
+    })
+
+
+@pytest.fixture
+def interactions_df():
+    """Interactions sur 2 recettes + une recette écartée au nettoyage"""
+    return pl.DataFrame({
+        'user_id': [1, 2, 3, 1, 2, 4],
+        'recipe_id': [10, 10, 10, 20, 99, 20],
+        'date': [
+            datetime(2009, 1, 5), datetime(2010, 6, 1), datetime(2008, 3, 2),
+            datetime(2011, 2, 1), datetime(2011, 2, 1), None,
+        ],
+        'rating': [5, 3, 5, 4, 1, 2],
+    })
+
+
+class TestComputeRecipeStats:
+    """Tests pour compute_recipe_stats"""
+
+    def test_schema(self, recipes_df, interactions_df):
+        """Test une ligne par recette nettoyée, jointe à final_recipes"""
+        stats = compute_recipe_stats(recipes_df, interactions_df)
+
+        assert stats.columns == [
+            'recipe_id', 'name', 'minutes', 'n_steps', 'n_ingredients',
+            'complexity_score', 'n_interactions', 'mean_rating', 'median_rating',
+            'count_1', 'count_2', 'count_3', 'count_4', 'count_5',
+            'first_date', 'last_date',
+        ]
+        assert stats['recipe_id'].to_list() == [10, 20, 30]
+        assert stats.schema['n_interactions'] == pl.UInt32
+        assert stats.schema['mean_rating'] == pl.Float32
+
+    def test_rating_statistics(self, recipes_df, interactions_df):
+        """Test effectifs, moyenne, médiane, histogramme et dates"""
+        stats = compute_recipe_stats(recipes_df, interactions_df)
+        soupe = stats.row(0, named=True)
+
+        assert soupe['n_interactions'] == 3
+        assert soupe['mean_rating'] == pytest.approx(13 / 3)
+        assert soupe['median_rating'] == 5
+        assert [soupe[f'count_{i}'] for i in range(1, 6)] == [0, 0, 1, 0, 2]
+        assert soupe['first_date'] == date(2008, 3, 2)
+        assert soupe['last_date'] == date(2010, 6, 1)
+
+    def test_unrated_recipe(self, recipes_df, interactions_df):
+        """Test recette sans interaction : comptes à 0, notes nulles"""
+        stats = compute_recipe_stats(recipes_df, interactions_df)
+        tarte = stats.row(2, named=True)
+
+        assert tarte['n_interactions'] == 0
+        assert tarte['count_5'] == 0
+        assert tarte['mean_rating'] is None
+        # Interaction à date nulle exclue
+        assert stats['n_interactions'][1] == 1
+
+
+class TestRecipeStatsIO:
+    """Tests pour build_recipe_stats et load_recipe_stats"""
+
+    @patch('mangetamain_data_utils.data_utils_recipe_stats.save_recipes_to_s3')
+    @patch('mangetamain_data_utils.data_utils_recipe_stats.load_interactions_raw')
+    @patch('mangetamain_data_utils.data_utils_recipe_stats.load_recipes_clean')
+    def test_build_saves_to_s3(self, mock_recipes, mock_interactions, mock_save,
+                               recipes_df, interactions_df):
+        """Test pipeline complet avec sauvegarde"""
+        mock_recipes.return_value = recipes_df
+        mock_interactions.return_value = interactions_df
+
+        stats = build_recipe_stats(save_to_s3=True)
+
+        assert stats.height == 3
+        assert mock_save.call_args[0][1] == RECIPE_STATS_S3_PATH
+
+    @patch('mangetamain_data_utils.data_utils_recipe_stats.get_s3_duckdb_connection')
+    def test_load_top_k(self, mock_conn):
+        """Test top-k poussé dans la requête DuckDB"""
+        conn = MagicMock()
+        conn.execute.return_value.pl.return_value = pl.DataFrame({'recipe_id': [10]})
+        mock_conn.return_value = conn
+
+        load_recipe_stats(order_by='mean_rating', k=100, min_interactions=10)
+
+        sql, params = conn.execute.call_args[0]
+        assert RECIPE_STATS_S3_PATH in sql
+        assert 'ORDER BY mean_rating DESC' in sql
+        assert 'LIMIT ?' in sql
+        assert params == [10, 100]
+        conn.close.assert_called_once()
+
+    def test_load_rejects_unknown_metric(self):
+        """Test colonne de classement inconnue (pas d'injection SQL)"""
+        with pytest.raises(ValueError, match='Colonne de classement'):
+            load_recipe_stats(order_by='rating; DROP TABLE x')
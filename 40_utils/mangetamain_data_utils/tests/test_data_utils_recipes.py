@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Tests unitaires pour data_utils_recipes (vocabulaires ingrédients / tags)"""
+
+import pytest
+import polars as pl
+from unittest.mock import MagicMock, patch
+
+from mangetamain_data_utils.data_utils_recipes import (
+    VOCABULARY_S3_PATHS,
+    _load_existing_vocabularies,
+    _normalize_terms,
+    build_vocabulary,
+    decode_list_column,
+    encode_list_column,
+    encode_vocabularies,
+    load_vocabulary,
+)
+
+
+@pytest.fixture
+def recipes_df():
+    """Recettes minimales avec listes de chaînes et année"""
+    return pl.DataFrame({
+        'ingredients': [['salt', 'pepper', 'salt'], ['egg'], ['pepper', 'egg']],
+        'tags': [['easy'], ['dinner'], []],
+        'year': [2001, 1999, 2005],
+    })
+
+
+class TestNormalizeTerms:
+    """Tests pour _normalize_terms"""
+
+    def test_lowercase_and_strip(self):
+        """Test minuscules, espaces et éléments vides"""
+        df = pl.DataFrame({'tags': [['Easy ', ' DINNER', '  ']]})
+        result = _normalize_terms(df, 'tags')
+
+        assert result['tags'].to_list() == [['easy', 'dinner']]
+
+    def test_missing_column(self):
+        """Test colonne absente : DataFrame inchangé"""
+        df = pl.DataFrame({'id': [1]})
+        assert _normalize_terms(df, 'tags').equals(df)
+
+
+class TestBuildVocabulary:
+    """Tests pour build_vocabulary"""
+
+    def test_ids_frequencies_first_year(self, recipes_df):
+        """Test ids ordonnés par première apparition, fréquence par recette"""
+        vocab = build_vocabulary(recipes_df, 'ingredients')
+
+        assert vocab.schema == pl.Schema({
+            'id': pl.UInt32, 'term': pl.String,
+            'n_recipes': pl.UInt32, 'first_year': pl.Int32,
+        })
+        assert vocab['term'].to_list() == ['egg', 'pepper', 'salt']
+        assert vocab['id'].to_list() == [0, 1, 2]
+        # 'salt' apparaît deux fois dans la même recette : compté une fois
+        assert vocab['n_recipes'].to_list() == [2, 2, 1]
+        assert vocab['first_year'].to_list() == [1999, 2001, 2001]
+
+    def test_stable_ids_with_existing(self, recipes_df):
+        """Test ids existants conservés, nouveaux termes ajoutés à la suite"""
+        previous = build_vocabulary(recipes_df, 'ingredients')
+        new_df = pl.DataFrame({'ingredients': [['milk', 'egg']], 'year': [2010]})
+
+        vocab = build_vocabulary(new_df, 'ingredients', existing=previous)
+
+        assert vocab['term'].to_list() == ['egg', 'pepper', 'salt', 'milk']
+        assert vocab['id'].to_list() == [0, 1, 2, 3]
+        assert vocab['n_recipes'].to_list() == [1, 0, 0, 1]
+        assert vocab['first_year'].to_list() == [1999, 2001, 2001, 2010]
+
+    def test_without_year(self, recipes_df):
+        """Test sans colonne année : first_year nul"""
+        vocab = build_vocabulary(recipes_df.drop('year'), 'tags')
+
+        assert vocab['term'].to_list() == ['dinner', 'easy']
+        assert vocab['first_year'].null_count() == 2
+
+
+class TestEncodeDecode:
+    """Tests pour encode_list_column / decode_list_column / encode_vocabularies"""
+
+    def test_round_trip(self, recipes_df):
+        """Test encodage List[UInt32] puis décodage identique"""
+        vocab = build_vocabulary(recipes_df, 'ingredients')
+        encoded = encode_list_column(recipes_df, 'ingredients', vocab)
+
+        assert encoded.schema['ingredients'] == pl.List(pl.UInt32)
+        assert encoded['ingredients'].to_list() == [[2, 1, 2], [0], [1, 0]]
+
+        decoded = decode_list_column(encoded, 'ingredients', vocab)
+        assert decoded['ingredients'].to_list() == recipes_df['ingredients'].to_list()
+
+    def test_unknown_terms_dropped(self, recipes_df):
+        """Test termes hors vocabulaire retirés à l'encodage"""
+        vocab = build_vocabulary(recipes_df, 'ingredients')
+        df = pl.DataFrame({'ingredients': [['egg', 'saffron']]})
+
+        assert encode_list_column(df, 'ingredients', vocab)['ingredients'].to_list() == [[0]]
+
+    def test_missing_column(self, recipes_df):
+        """Test colonne absente : DataFrame inchangé"""
+        vocab = build_vocabulary(recipes_df, 'ingredients')
+        df = pl.DataFrame({'id': [1]})
+
+        assert encode_list_column(df, 'ingredients', vocab).equals(df)
+        assert decode_list_column(df, 'ingredients', vocab).equals(df)
+
+    def test_encode_vocabularies(self, recipes_df):
+        """Test encodage des deux colonnes en une passe"""
+        encoded, vocabularies = encode_vocabularies(recipes_df)
+
+        assert set(vocabularies) == {'ingredients', 'tags'}
+        assert encoded.schema['ingredients'] == pl.List(pl.UInt32)
+        assert encoded.schema['tags'] == pl.List(pl.UInt32)
+        assert encoded['tags'].to_list() == [[1], [0], []]
+
+
+class TestVocabularyIO:
+    """Tests pour load_vocabulary et _load_existing_vocabularies"""
+
+    @patch('mangetamain_data_utils.data_utils_recipes.get_s3_duckdb_connection')
+    def test_load_vocabulary(self, mock_conn):
+        """Test lecture du Parquet de vocabulaire"""
+        expected = pl.DataFrame({'id': [0], 'term': ['egg']})
+        conn = MagicMock()
+        conn.execute.return_value.pl.return_value = expected
+        mock_conn.return_value = conn
+
+        result = load_vocabulary('ingredients')
+
+        assert result.equals(expected)
+        assert VOCABULARY_S3_PATHS['ingredients'] in conn.execute.call_args[0][0]
+
+    def test_load_vocabulary_unknown(self):
+        """Test vocabulaire inconnu"""
+        with pytest.raises(ValueError):
+            load_vocabulary('steps')
+
+    @patch('mangetamain_data_utils.data_utils_recipes.load_vocabulary')
+    def test_load_existing_vocabularies_missing(self, mock_load):
+        """Test vocabulaires absents sur S3 : ids recréés"""
+        mock_load.side_effect = [pl.DataFrame({'id': [0]}), Exception('404')]
+
+        existing = _load_existing_vocabularies()
+
+        assert list(existing) == ['ingredients']
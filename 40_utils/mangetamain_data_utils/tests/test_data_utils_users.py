@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Tests unitaires pour data_utils_users"""
+
+from datetime import date, datetime
+
+import pytest
+import polars as pl
+from unittest.mock import MagicMock, patch
+
+from mangetamain_data_utils.data_utils_users import (
+    MONTHLY_ACTIVE_USERS_S3_PATH,
+    USER_STATS_S3_PATH,
+    build_user_tables,
+    compute_monthly_active_users,
+    compute_user_stats,
+    load_monthly_active_users,
+    load_user_stats,
+)
+
+
+@pytest.fixture
+def interactions_df():
+    """3 utilisateurs, 3 recettes, interactions sur 3 mois (février vide)"""
+    return pl.DataFrame({
+        'user_id': [1, 2, 1, 3, 2, 1],
+        'recipe_id': [10, 10, 11, 10, 12, 12],
+        'date': [
+            datetime(2009, 1, 5), datetime(2009, 1, 20), datetime(2009, 3, 2),
+            datetime(2009, 3, 15), datetime(2009, 3, 30), None,
+        ],
+        'rating': [5, 3, 4, 4, 2, 5],
+    })
+
+
+class TestComputeUserStats:
+    """Tests pour compute_user_stats"""
+
+    def test_schema(self, interactions_df):
+        """Test schéma compact de la table par utilisateur"""
+        users = compute_user_stats(interactions_df)
+
+        assert users.columns == [
+            'user_id', 'first_date', 'last_date', 'tenure_days',
+            'n_ratings', 'mean_rating', 'rating_bias',
+        ]
+        assert users.schema['n_ratings'] == pl.UInt32
+        assert users.schema['rating_bias'] == pl.Float32
+        assert users['user_id'].to_list() == [1, 2, 3]
+
+    def test_activity(self, interactions_df):
+        """Test dates, ancienneté et nombre de notes (dates nulles exclues)"""
+        users = compute_user_stats(interactions_df)
+        user_1 = users.row(0, named=True)
+
+        assert user_1['first_date'] == date(2009, 1, 5)
+        assert user_1['last_date'] == date(2009, 3, 2)
+        assert user_1['tenure_days'] == 56
+        assert user_1['n_ratings'] == 2
+        assert user_1['mean_rating'] == pytest.approx(4.5)
+
+    def test_rating_bias_leave_one_out(self, interactions_df):
+        """Test biais face aux autres notes de la recette, recettes isolées ignorées"""
+        users = compute_user_stats(interactions_df)
+
+        # Recette 10 notée 5, 3 et 4 : user 1 → 5 - 3.5, user 3 → 4 - 4
+        assert users['rating_bias'][0] == pytest.approx(1.5)
+        assert users['rating_bias'][1] == pytest.approx(-1.5)
+        assert users['rating_bias'][2] == pytest.approx(0.0)
+
+
+class TestComputeMonthlyActiveUsers:
+    """Tests pour compute_monthly_active_users"""
+
+    def test_complete_calendar(self, interactions_df):
+        """Test calendrier mensuel continu, mois vides à 0"""
+        monthly = compute_monthly_active_users(interactions_df)
+
+        assert monthly.columns == ['month', 'n_active_users', 'n_new_users', 'n_interactions']
+        assert monthly['month'].to_list() == [date(2009, 1, 1), date(2009, 2, 1), date(2009, 3, 1)]
+        assert monthly['n_active_users'].to_list() == [2, 0, 3]
+        assert monthly['n_new_users'].to_list() == [2, 0, 1]
+        assert monthly['n_interactions'].to_list() == [2, 0, 3]
+
+
+class TestUserTablesIO:
+    """Tests pour build_user_tables et les chargements S3"""
+
+    @patch('mangetamain_data_utils.data_utils_users.save_recipes_to_s3')
+    @patch('mangetamain_data_utils.data_utils_users.load_interactions_raw')
+    def test_build_saves_to_s3(self, mock_interactions, mock_save, interactions_df):
+        """Test pipeline complet avec sauvegarde des deux tables"""
+        mock_interactions.return_value = interactions_df
+
+        users, monthly = build_user_tables(save_to_s3=True)
+
+        assert users.height == 3
+        assert monthly.height == 3
+        paths = [c[0][1] for c in mock_save.call_args_list]
+        assert paths == [USER_STATS_S3_PATH, MONTHLY_ACTIVE_USERS_S3_PATH]
+
+    @pytest.mark.parametrize('loader, path', [
+        (load_user_stats, USER_STATS_S3_PATH),
+        (load_monthly_active_users, MONTHLY_ACTIVE_USERS_S3_PATH),
+    ])
+    @patch('mangetamain_data_utils.data_utils_users.get_s3_duckdb_connection')
+    def test_load_reads_parquet(self, mock_conn, loader, path):
+        """Test lecture du Parquet précalculé"""
+        expected = pl.DataFrame({'user_id': [1]})
+        conn = MagicMock()
+        conn.execute.return_value.pl.return_value = expected
+        mock_conn.return_value = conn
+
+        result = loader()
+
+        assert result.equals(expected)
+        assert path in conn.execute.call_args[0][0]
+        conn.close.assert_called_once()